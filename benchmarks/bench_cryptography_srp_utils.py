@@ -0,0 +1,41 @@
+import os
+import sys
+import secrets
+from timeit import timeit
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from cryptography.srp_utils import (
+    SRPUtils,
+    SRP_PRIME_N,
+    SRP_GENERATOR_G,
+    PRIVATE_EPHEMERAL_BITS
+)
+
+
+def bench_generator_pow(iterations: int = 200):
+    """Compare naive pow() against the fixed-base table for g^b mod N"""
+    exponents = [secrets.randbits(PRIVATE_EPHEMERAL_BITS) for _ in range(iterations)]
+
+    naive = timeit(lambda: [pow(SRP_GENERATOR_G, b, SRP_PRIME_N) for b in exponents], number=1)
+    table = timeit(lambda: [SRPUtils._generator_pow(b) for b in exponents], number=1)
+
+    print(f"g^b mod N, {iterations} iterations")
+    print(f"  pow():        {naive / iterations * 1e3:8.3f} ms/op")
+    print(f"  fixed-base:   {table / iterations * 1e3:8.3f} ms/op")
+    print(f"  speedup:      {naive / table:8.2f}x")
+
+
+def bench_generate_ephemeral(iterations: int = 200):
+    """Time full server ephemeral generation"""
+    verifier = pow(SRP_GENERATOR_G, secrets.randbits(256), SRP_PRIME_N).to_bytes(512, "big")
+
+    elapsed = timeit(lambda: SRPUtils.generate_ephemeral(verifier), number=iterations)
+
+    print(f"generate_ephemeral, {iterations} iterations")
+    print(f"  {elapsed / iterations * 1e3:8.3f} ms/op")
+
+
+if __name__ == '__main__':
+    bench_generator_pow()
+    bench_generate_ephemeral()
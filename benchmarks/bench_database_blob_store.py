@@ -0,0 +1,96 @@
+import os
+import sys
+import random
+import shutil
+import secrets
+import tempfile
+from pathlib import Path
+from time import perf_counter
+from typing import Callable, Dict, List
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from sqlalchemy import text
+
+from database import DatabaseSetup, Base, User, BlobStore
+from utils.db_utils_data import DBUtilsData
+
+
+def _time(call: Callable[[], object], iterations: int) -> float:
+    """Milliseconds per call"""
+    started = perf_counter()
+    for _ in range(iterations):
+        call()
+    return (perf_counter() - started) / iterations * 1e3
+
+
+def _create_vault(entries: int, entry_size: int) -> int:
+    """Create one user holding entries of entry_size bytes, stored inline"""
+    with DatabaseSetup.get_db_session() as session:
+        user = User(
+            username_hash=b'bench_hash',
+            srp_salt=b'bench_srp_salt',
+            srp_verifier=b'bench_srp_verifier',
+            master_key_salt=b'bench_master_key_salt',
+            password_change=False
+        )
+        session.add(user)
+        session.flush()
+        user_id = user.id
+
+    for start in range(0, entries, DBUtilsData.MAX_BATCH_SIZE):
+        batch = min(DBUtilsData.MAX_BATCH_SIZE, entries - start)
+        DBUtilsData.create_many(user_id, [(secrets.token_bytes(64), secrets.token_bytes(entry_size)) for _ in range(batch)])
+    return user_id
+
+
+def _data_pages() -> int:
+    """Pages of the data table, read in full by every scan for names and public ids"""
+    with DatabaseSetup.get_db_session() as session:
+        return session.execute(text("SELECT COUNT(*) FROM dbstat WHERE name = 'data'")).scalar()
+
+
+def _measure(user_id: int, public_ids: List[str]) -> Dict[str, float]:
+    """Time the list and get paths of DBUtilsData"""
+    sample = random.Random(0)
+    return {
+        "get_list": _time(lambda: DBUtilsData.get_list(user_id), 3),
+        "get_page": _time(lambda: DBUtilsData.get_page(user_id, 500), 50),
+        "get_entry": _time(lambda: DBUtilsData.get_entry(user_id, sample.choice(public_ids)), 500),
+        "get_entries": _time(lambda: DBUtilsData.get_entries(user_id, sample.sample(public_ids, 100)), 50)
+    }
+
+
+def bench_blob_storage(entries: int = 100_000, entry_size: int = 2048):
+    """Compare list and get latency with entry data stored inline and in the blob table"""
+    directory = Path(tempfile.mkdtemp())
+    try:
+        DatabaseSetup.init_db(directory / "bench_vault.db", Base, {"journal_mode": "WAL", "synchronous": "NORMAL"})
+        user_id = _create_vault(entries, entry_size)
+        public_ids = list(DBUtilsData.get_list(user_id)[2])
+
+        DatabaseSetup.vacuum()
+        inline = _measure(user_id, public_ids)
+        inline_pages = _data_pages()
+
+        started = perf_counter()
+        BlobStore.migrate("table")
+        DatabaseSetup.vacuum()
+        migration = perf_counter() - started
+        BlobStore.configure("table")
+        table = _measure(user_id, public_ids)
+        table_pages = _data_pages()
+
+        print(f"{entries} entries of {entry_size} bytes, migrated to the blob table in {migration:.1f} s")
+        print(f"  {'':12}  {'inline':>12}  {'table':>12}  {'speedup':>8}")
+        print(f"  {'data pages':12}  {inline_pages:12}  {table_pages:12}  {inline_pages / table_pages:7.2f}x")
+        for name in inline:
+            print(f"  {name:12}  {inline[name]:9.3f} ms  {table[name]:9.3f} ms  {inline[name] / table[name]:7.2f}x")
+    finally:
+        BlobStore._reset()
+        DatabaseSetup.close_db()
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    bench_blob_storage()
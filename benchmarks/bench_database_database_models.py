@@ -0,0 +1,106 @@
+import os
+import sys
+import shutil
+import secrets
+import tempfile
+import tracemalloc
+from pathlib import Path
+from time import perf_counter
+from typing import Callable, Tuple
+
+from sqlalchemy.orm import defaultload
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from database import DatabaseSetup, Base, User
+from utils.db_utils_data import DBUtilsData
+
+
+def _measure(call: Callable[[], object], iterations: int) -> Tuple[float, float]:
+    """
+    Time a call, and trace its peak memory
+
+    Returns:
+        (float) Milliseconds per call
+        (float) Peak traced memory of one call, in MiB
+    """
+    started = perf_counter()
+    for _ in range(iterations):
+        call()
+    elapsed = (perf_counter() - started) / iterations
+
+    tracemalloc.start()
+    call()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed * 1e3, peak / (1 << 20)
+
+
+def _create_vault(directory: Path, entries: int, entry_size: int) -> Tuple[int, str]:
+    """Create a vault with one user holding entries of entry_size bytes"""
+    DatabaseSetup.init_db(directory / "bench_vault.db", Base)
+
+    with DatabaseSetup.get_db_session() as session:
+        user = User(
+            username_hash=b'bench_hash',
+            srp_salt=b'bench_srp_salt',
+            srp_verifier=b'bench_srp_verifier',
+            master_key_salt=b'bench_master_key_salt',
+            password_change=False
+        )
+        session.add(user)
+        session.flush()
+        user_id = user.id
+
+    for start in range(0, entries, DBUtilsData.MAX_BATCH_SIZE):
+        batch = min(DBUtilsData.MAX_BATCH_SIZE, entries - start)
+        DBUtilsData.create_many(user_id, [(secrets.token_bytes(64), secrets.token_bytes(entry_size)) for _ in range(batch)])
+
+    _, _, public_ids = DBUtilsData.get_list(user_id)
+    return user_id, next(iter(public_ids))
+
+
+def bench_secure_data_collection(user_id: int, iterations: int = 5):
+    """Compare loading a user's entries, as DBUtilsPassword.complete does, with the blobs deferred and eager"""
+    def load(*options):
+        def call():
+            with DatabaseSetup.get_db_session() as session:
+                user = session.query(User).options(*options).filter(User.id == user_id).one()
+                return [secure_data.public_id for secure_data in user.secure_data]
+        return call
+
+    deferred = _measure(load(), iterations)
+    eager = _measure(load(defaultload(User.secure_data).undefer_group("entry").undefer_group("new_entry")), iterations)
+
+    print(f"user.secure_data, {iterations} iterations")
+    print(f"  eager:        {eager[0]:8.3f} ms/op  {eager[1]:8.2f} MiB peak")
+    print(f"  deferred:     {deferred[0]:8.3f} ms/op  {deferred[1]:8.2f} MiB peak")
+    print(f"  speedup:      {eager[0] / deferred[0]:8.2f}x")
+
+
+def bench_ownership_check(user_id: int, public_id: str, iterations: int = 2000):
+    """Compare the ownership check of edit, delete and update with the blobs deferred and eager"""
+    def check(group):
+        def call():
+            with DatabaseSetup.get_db_session() as session:
+                return DBUtilsData._owned_entry(session, user_id, public_id, group=group)
+        return call
+
+    deferred = _measure(check(None), iterations)
+    eager = _measure(check("entry"), iterations)
+
+    print(f"_owned_entry, {iterations} iterations")
+    print(f"  eager:        {eager[0]:8.3f} ms/op  {eager[1]:8.2f} MiB peak")
+    print(f"  deferred:     {deferred[0]:8.3f} ms/op  {deferred[1]:8.2f} MiB peak")
+    print(f"  speedup:      {eager[0] / deferred[0]:8.2f}x")
+
+
+if __name__ == '__main__':
+    directory = Path(tempfile.mkdtemp())
+    try:
+        user_id, public_id = _create_vault(directory, entries=2000, entry_size=32 * 1024)
+        bench_secure_data_collection(user_id)
+        bench_ownership_check(user_id, public_id)
+    finally:
+        DatabaseSetup.close_db()
+        shutil.rmtree(directory, ignore_errors=True)
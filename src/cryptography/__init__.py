@@ -1 +1,2 @@
-from .srp_utils import SRPUtils
\ No newline at end of file
+from .ephemeral_pool import EphemeralPool
+from .srp_utils import SRPUtils, SRPSteps
\ No newline at end of file
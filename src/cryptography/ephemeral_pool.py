@@ -0,0 +1,179 @@
+from time import perf_counter
+from collections import deque
+from typing import Optional, Tuple, Dict, Callable, Deque
+from threading import Lock, Event, Thread
+
+from logging import getLogger
+logger = getLogger("api")
+
+
+class EphemeralPool():
+    """
+    Background refilled pool of precomputed server ephemerals (b, g^b mod N)
+
+    Each pair is handed out exactly once, and removed from the pool as it is taken.
+    """
+
+    _size: int = 0
+    _low_water: int = 0
+    _generate: Optional[Callable[[], Tuple[int, int]]] = None
+    _pairs: Deque[Tuple[int, int]] = deque()
+    _lock = Lock()
+    _refill = Event()
+    _stopping = Event()
+    _thread: Optional[Thread] = None
+
+    _hits: int = 0
+    _misses: int = 0
+    _refills: int = 0
+    _refill_failures: int = 0
+    _refill_seconds: float = 0.0
+    _last_refill_seconds: float = 0.0
+
+
+    @classmethod
+    def start(
+        cls,
+        size: int,
+        low_water: int,
+        generate: Callable[[], Tuple[int, int]]
+    ):
+        """
+        Begin filling the pool in the background, with a size of 0 leaving it disabled
+
+        Args:
+            size (int):         Number of pairs to hold when full
+            low_water (int):    Number of pairs below which the pool is refilled
+            generate (func):    Function producing a new (b, g^b mod N) pair
+        """
+        if size < 0 or low_water < 0 or low_water > size:
+            raise ValueError(f"Invalid ephemeral pool settings: {size}, {low_water}")
+        if cls._thread is not None:
+            raise RuntimeError("Ephemeral pool already started.")
+
+        cls._size = size
+        cls._low_water = low_water
+        cls._generate = generate
+        if size == 0:
+            return
+
+        cls._stopping.clear()
+        cls._refill.set()
+        cls._thread = Thread(target=cls._run, name="ephemeral-pool", daemon=True)
+        cls._thread.start()
+        logger.info("Ephemeral pool started with %s entries.", size)
+
+
+    @classmethod
+    def stop(cls):
+        """Stop the background refill, and discard all pooled ephemerals"""
+        thread = cls._thread
+        if thread is not None:
+            cls._stopping.set()
+            cls._refill.set()
+            thread.join()
+            cls._thread = None
+
+        with cls._lock:
+            cls._pairs.clear()
+        cls._size = 0
+        cls._low_water = 0
+
+
+    @classmethod
+    def _reset(cls):
+        cls.stop()
+        cls._generate = None
+        cls._hits = 0
+        cls._misses = 0
+        cls._refills = 0
+        cls._refill_failures = 0
+        cls._refill_seconds = 0.0
+        cls._last_refill_seconds = 0.0
+
+
+    @classmethod
+    def _run(cls):
+        while True:
+            cls._refill.wait()
+            if cls._stopping.is_set():
+                return
+            cls._refill.clear()
+            cls._fill()
+
+
+    @classmethod
+    def _fill(cls):
+        assert cls._generate
+        started = perf_counter()
+        generated = 0
+
+        while not cls._stopping.is_set():
+            with cls._lock:
+                if len(cls._pairs) >= cls._size:
+                    break
+            try:
+                pair = cls._generate()
+            except Exception:
+                # End this refill, leaving the thread to wait for the next low water take
+                logger.exception("Ephemeral pool refill failed after %s entries.", generated)
+                with cls._lock:
+                    cls._refill_failures += 1
+                break
+            with cls._lock:
+                cls._pairs.append(pair)
+            generated += 1
+
+        if generated:
+            elapsed = perf_counter() - started
+            with cls._lock:
+                cls._refills += 1
+                cls._refill_seconds += elapsed
+                cls._last_refill_seconds = elapsed
+            logger.debug("Ephemeral pool refilled with %s entries in %.3f seconds.", generated, elapsed)
+
+
+    @classmethod
+    def take(cls) -> Optional[Tuple[int, int]]:
+        """
+        Take a precomputed ephemeral pair from the pool
+
+        Returns:
+            ((int, int))    (b, g^b mod N), or None if the pool is empty or disabled
+        """
+        if cls._thread is None:
+            return None
+
+        with cls._lock:
+            if cls._pairs:
+                pair = cls._pairs.popleft()
+                cls._hits += 1
+            else:
+                pair = None
+                cls._misses += 1
+            remaining = len(cls._pairs)
+
+        if remaining <= cls._low_water:
+            cls._refill.set()
+
+        return pair
+
+
+    @classmethod
+    def metrics(cls) -> Dict[str, float]:
+        """
+        Get the pool usage metrics
+
+        Returns:
+            (dict)  Pool metrics, keyed by metric name
+        """
+        with cls._lock:
+            return {
+                "available": len(cls._pairs),
+                "hits": cls._hits,
+                "misses": cls._misses,
+                "refills": cls._refills,
+                "refill_failures": cls._refill_failures,
+                "refill_seconds_total": cls._refill_seconds,
+                "refill_seconds_last": cls._last_refill_seconds
+            }
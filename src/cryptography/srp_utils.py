@@ -1,22 +1,331 @@
-from typing import Tuple, Dict, Any
+import hmac
+import secrets
+from hashlib import sha256
+from typing import Tuple, List, Optional, Callable, Generator, TypeVar, Any
+from multiprocessing import get_context
+from concurrent.futures import Future, ProcessPoolExecutor
 
+from logging import getLogger
+logger = getLogger("api")
+
+from .ephemeral_pool import EphemeralPool
+
+
+# RFC 5054 4096-bit group (Appendix A)
+SRP_PRIME_N = int(
+    "FFFFFFFFFFFFFFFFC90FDAA22168C234C4C6628B80DC1CD129024E088A67CC74"
+    "020BBEA63B139B22514A08798E3404DDEF9519B3CD3A431B302B0A6DF25F1437"
+    "4FE1356D6D51C245E485B576625E7EC6F44C42E9A637ED6B0BFF5CB6F406B7ED"
+    "EE386BFB5A899FA5AE9F24117C4B1FE649286651ECE45B3DC2007CB8A163BF05"
+    "98DA48361C55D39A69163FA8FD24CF5F83655D23DCA3AD961C62F356208552BB"
+    "9ED529077096966D670C354E4ABC9804F1746C08CA18217C32905E462E36CE3B"
+    "E39E772C180E86039B2783A2EC07A28FB5C55DF06F4C52C9DE2BCBF695581718"
+    "3995497CEA956AE515D2261898FA051015728E5A8AAAC42DAD33170D04507A33"
+    "A85521ABDF1CBA64ECFB850458DBEF0A8AEA71575D060C7DB3970F85A6E1E4C7"
+    "ABF5AE8CDB0933D71E8C94E04A25619DCEE3D2261AD2EE6BF12FFA06D98A0864"
+    "D87602733EC86A64521F2B18177B200CBBE117577A615D6C770988C0BAD946E2"
+    "08E24FA074E5AB3143DB5BFCE0FD108E4B82D120A92108011A723C12A787E6D7"
+    "88719A10BDBA5B2699C327186AF4E23C1A946834B6150BDA2583E9CA2AD44CE8"
+    "DBBBC2DB04DE8EF92E8EFC141FBECAA6287C59474E6BC05D99B2964FA090C3A2"
+    "233BA186515BE7ED1F612970CEE2D7AFB81BDD762170481CD0069127D5B05AA9"
+    "93B4EA988D8FDDC186FFB7DC90A6C08F4DF435C934063199FFFFFFFFFFFFFFFF",
+    16
+)
+SRP_GENERATOR_G = 5
+
+SRP_PRIME_BYTES = (SRP_PRIME_N.bit_length() + 7) // 8
+PRIVATE_EPHEMERAL_BITS = 320
+WINDOW_BITS = 6
+
+T = TypeVar("T")
+
+# Steps of a handler, yielding the SRP futures it waits on and receiving their results
+SRPSteps = Generator[Future, Any, T]
+
+
+def _to_bytes(value: int) -> bytes:
+    """Encode an integer as a big-endian value, padded to the length of N"""
+    return value.to_bytes(SRP_PRIME_BYTES, "big")
+
+
+def _hash(*values: bytes) -> bytes:
+    return sha256(b''.join(values)).digest()
+
+
+def _build_fixed_base_table(base: int, exponent_bits: int, window_bits: int) -> List[List[int]]:
+    """
+    Precompute base^(digit * 2^(window_bits * position)) mod N for every window position
+
+    Returns:
+        ([[int]])   Table indexed by window position, then window digit
+    """
+    table = []
+    window_base = base
+    for _ in range((exponent_bits + window_bits - 1) // window_bits):
+        row = [1]
+        for _ in range((1 << window_bits) - 1):
+            row.append((row[-1] * window_base) % SRP_PRIME_N)
+        table.append(row)
+        window_base = (row[-1] * window_base) % SRP_PRIME_N
+    return table
+
+
+# SRP-6a multiplier, k = H(N || PAD(g))
+SRP_MULTIPLIER_K = int.from_bytes(_hash(_to_bytes(SRP_PRIME_N), _to_bytes(SRP_GENERATOR_G)), "big")
+
+_GENERATOR_TABLE = _build_fixed_base_table(SRP_GENERATOR_G, PRIVATE_EPHEMERAL_BITS, WINDOW_BITS)
 
-# TODO - Placeholder class. Requires completion.
 
 class SRPUtils():
 
+    _executor: Optional[ProcessPoolExecutor] = None
+
+
+    @staticmethod
+    def start_offload(
+        workers: int
+    ):
+        """
+        Run big integer SRP math in a dedicated process pool, with 0 workers leaving it inline
+
+        Workers are spawned rather than forked, so they never inherit the
+        server's memory (pooled ephemerals, session keys or database state).
+        """
+        if workers < 0:
+            raise ValueError(f"Invalid SRP offload worker count: {workers}")
+        if SRPUtils._executor is not None:
+            raise RuntimeError("SRP offload already started.")
+        if workers == 0:
+            return
+
+        SRPUtils._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=get_context("spawn")
+        )
+        logger.info("SRP offload started with %s workers.", workers)
+
+
+    @staticmethod
+    def stop_offload():
+        """Stop the SRP process pool, returning to inline computation"""
+        executor = SRPUtils._executor
+        SRPUtils._executor = None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+    @staticmethod
+    def _submit(
+        function: Callable[..., Any],
+        *args: Any
+    ) -> Future:
+        """
+        Run the function in the process pool, or inline if offload is not started
+
+        Returns:
+            (Future)    Future for the result of the function
+        """
+        executor = SRPUtils._executor
+        if executor is not None:
+            return executor.submit(function, *args)
+
+        future: Future = Future()
+        try:
+            future.set_result(function(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+
+    @staticmethod
+    def run_steps(
+        steps: SRPSteps[T]
+    ) -> T:
+        """
+        Run the steps to completion, blocking the calling thread on each SRP future
+
+        The threaded server gives each RPC its own worker thread for its whole
+        lifetime, so blocking here is by design. The async server instead runs
+        the steps with AsyncExecutors.run_srp, which awaits the futures.
+
+        Returns:
+            (T) The value returned by the steps
+        """
+        value: Any = None
+        error: Optional[BaseException] = None
+        while True:
+            try:
+                future = steps.throw(error) if error is not None else steps.send(value)
+            except StopIteration as stop:
+                return stop.value
+
+            try:
+                value, error = future.result(), None
+            except Exception as e:
+                value, error = None, e
+
+
+    @staticmethod
+    def _generator_pow(
+        exponent: int
+    ) -> int:
+        """
+        Compute g^exponent mod N using the precomputed fixed-base table
+
+        Every window row is multiplied in, zero digits using the identity
+        entry, so the number of multiplications does not depend on the
+        secret exponent.
+
+        Returns:
+            (int) g^exponent mod N
+        """
+        if exponent.bit_length() > PRIVATE_EPHEMERAL_BITS:
+            return pow(SRP_GENERATOR_G, exponent, SRP_PRIME_N)
+
+        mask = (1 << WINDOW_BITS) - 1
+        result = 1
+        for row in _GENERATOR_TABLE:
+            result = (result * row[exponent & mask]) % SRP_PRIME_N
+            exponent >>= WINDOW_BITS
+        return result
+
+
+    @staticmethod
+    def _generate_private_ephemeral(
+    ) -> Tuple[int, int]:
+        private_b = 0
+        while private_b == 0:
+            private_b = secrets.randbits(PRIVATE_EPHEMERAL_BITS)
+
+        return private_b, SRPUtils._generator_pow(private_b)
+
+
+    @staticmethod
+    def submit_generate_private_ephemeral(
+    ) -> Future:
+        """
+        Generate the verifier independent part of the server ephemeral, without waiting
+
+        Returns:
+            (Future)    Future for (b, g^b mod N)
+        """
+        return SRPUtils._submit(SRPUtils._generate_private_ephemeral)
+
+
+    @staticmethod
+    def generate_private_ephemeral(
+    ) -> Tuple[int, int]:
+        """
+        Generate the verifier independent part of the server ephemeral, blocking until done
+
+        Used by the ephemeral pool's background refill thread.
+
+        Returns:
+            (int) Private Ephemeral (b)
+            (int) g^b mod N
+        """
+        return SRPUtils.submit_generate_private_ephemeral().result()
+
+
+    @staticmethod
+    def _combine_ephemeral(
+        verifier: int,
+        pair: Tuple[int, int]
+    ) -> Tuple[bytes, bytes]:
+        private_b, generator_b = pair
+        public_b = (SRP_MULTIPLIER_K * verifier + generator_b) % SRP_PRIME_N
+
+        return _to_bytes(public_b), private_b.to_bytes(PRIVATE_EPHEMERAL_BITS // 8, "big")
+
+
+    @staticmethod
+    def submit_generate_ephemeral(
+        srp_verifier_v: bytes
+    ) -> Future:
+        """
+        Generate the ephemeral values, without waiting
+
+        Uses a pooled pair if one is available, otherwise generates one.
+
+        Returns:
+            (Future)    Future for (B, b)
+        """
+        verifier = int.from_bytes(srp_verifier_v, "big")
+        future: Future = Future()
+
+        pair = EphemeralPool.take()
+        if pair is not None:
+            future.set_result(SRPUtils._combine_ephemeral(verifier, pair))
+            return future
+
+        def combine(generated: Future):
+            try:
+                future.set_result(SRPUtils._combine_ephemeral(verifier, generated.result()))
+            except Exception as e:
+                future.set_exception(e)
+
+        SRPUtils.submit_generate_private_ephemeral().add_done_callback(combine)
+        return future
+
+
     @staticmethod
     def generate_ephemeral(
         srp_verifier_v: bytes
     ) -> Tuple[bytes, bytes]:
         """
-        Generate the ephemeral values
+        Generate the ephemeral values, blocking until done
 
         Returns:
             (bytes) Public Ephemeral (B)
             (bytes) Private Ephemeral (b)
         """
-        return b'', b''
+        return SRPUtils.submit_generate_ephemeral(srp_verifier_v).result()
+
+
+    @staticmethod
+    def _compute_session_key(
+        eph_val_a: bytes,
+        eph_public_b: bytes,
+        eph_private_b: bytes,
+        srp_verifier_v: bytes
+    ) -> bytes:
+        val_a = int.from_bytes(eph_val_a, "big") % SRP_PRIME_N
+        public_b = int.from_bytes(eph_public_b, "big") % SRP_PRIME_N
+        private_b = int.from_bytes(eph_private_b, "big")
+        verifier = int.from_bytes(srp_verifier_v, "big")
+
+        if val_a == 0 or private_b == 0:
+            return b''
+
+        scrambler_u = int.from_bytes(_hash(_to_bytes(val_a), _to_bytes(public_b)), "big")
+        if scrambler_u == 0:
+            return b''
+
+        secret_s = pow((val_a * pow(verifier, scrambler_u, SRP_PRIME_N)) % SRP_PRIME_N, private_b, SRP_PRIME_N)
+
+        return _hash(_to_bytes(secret_s))
+
+
+    @staticmethod
+    def submit_compute_session_key(
+        eph_val_a: bytes,
+        eph_public_b: bytes,
+        eph_private_b: bytes,
+        srp_verifier_v: bytes
+    ) -> Future:
+        """
+        Compute the session key from its values, without waiting
+
+        Returns:
+            (Future)    Future for the session key (K)
+        """
+        return SRPUtils._submit(
+            SRPUtils._compute_session_key,
+            eph_val_a,
+            eph_public_b,
+            eph_private_b,
+            srp_verifier_v
+        )
 
 
     @staticmethod
@@ -27,12 +336,17 @@ class SRPUtils():
         srp_verifier_v: bytes
     ) -> bytes:
         """
-        Compute the session key from its values
+        Compute the session key from its values, blocking until done
 
         Returns:
-            (bytes) The session key (K)
+            (bytes) The session key (K), or empty if the values are unsafe
         """
-        return b''
+        return SRPUtils.submit_compute_session_key(
+            eph_val_a,
+            eph_public_b,
+            eph_private_b,
+            srp_verifier_v
+        ).result()
 
 
     @staticmethod
@@ -49,4 +363,14 @@ class SRPUtils():
             (bool) True if verified, false otherwise
             (bytes) Server Proof (M2)
         """
-        return True, b''
+        if not session_key_k:
+            return False, b''
+
+        val_a = _to_bytes(int.from_bytes(eph_val_a, "big") % SRP_PRIME_N)
+        public_b = _to_bytes(int.from_bytes(eph_public_b, "big") % SRP_PRIME_N)
+
+        expected_m1 = _hash(val_a, public_b, session_key_k)
+        if not hmac.compare_digest(expected_m1, proof_val_m1):
+            return False, b''
+
+        return True, _hash(val_a, proof_val_m1, session_key_k)
@@ -1,2 +1,4 @@
-from .database_setup import DatabaseSetup
-from .database_models import Base, User, AuthEphemeral, LoginSession, SecureData
\ No newline at end of file
+from .database_setup import DatabaseSetup, SQLITE_PRAGMAS, POOL_SETTINGS
+from .query_stats import QueryStats, track_queries
+from .database_models import Base, User, AuthEphemeral, LoginSession, SecureData, SecureBlob
+from .blob_store import BlobStore, BLOB_STORAGE_MODES
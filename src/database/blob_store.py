@@ -0,0 +1,196 @@
+from sqlalchemy import select, insert, update, delete, exists
+from sqlalchemy.orm import Session
+
+from logging import getLogger
+logger = getLogger("database")
+
+from .database_setup import DatabaseSetup
+from .database_models import SecureData, SecureBlob
+
+
+BLOB_STORAGE_MODES = ("inline", "table")
+
+
+class BlobStore():
+    """
+    Where the encrypted entry data of SecureData is stored
+
+    Inline, entry_data is stored in the data table. In table mode it is
+    stored in the blob table keyed by data.id, and left empty in the data
+    table, so rows of the data table stay small and scans for names and
+    public ids read far fewer pages.
+
+    new_entry_data stays in the data table in either mode, as it is only
+    set while a password change is under way.
+    """
+
+    _separate: bool = False
+
+
+    @staticmethod
+    def configure(
+        mode: str
+    ):
+        """
+        Set the blob storage mode
+
+        Args:
+            mode (str):     inline, or table to store entry data in the blob table
+        """
+        if mode not in BLOB_STORAGE_MODES:
+            raise ValueError(f"Unknown blob storage mode: {mode}")
+
+        BlobStore._separate = mode == "table"
+        logger.debug("Blob storage mode set to %s.", mode)
+
+
+    @staticmethod
+    def _reset():
+        BlobStore._separate = False
+
+
+    @staticmethod
+    def separate() -> bool:
+        """
+        Check whether entry data is stored in the blob table
+
+        Returns:
+            (bool)  True in table mode, false if stored inline
+        """
+        return BlobStore._separate
+
+
+    @staticmethod
+    def mode() -> str:
+        """
+        Get the blob storage mode
+
+        Returns:
+            (str)   inline or table
+        """
+        return "table" if BlobStore._separate else "inline"
+
+
+    @staticmethod
+    def verify():
+        """
+        Check the open database stores entry data in the configured mode
+
+        A vault in the other mode, or part way through a migration, would
+        otherwise read back empty entries.
+        """
+        with DatabaseSetup.get_db_session() as session:
+            if BlobStore._separate:
+                mismatched = session.scalars(
+                    select(SecureData.id)
+                    .where(~exists().where(SecureBlob.data_id == SecureData.id))
+                    .limit(1)
+                ).first()
+            else:
+                mismatched = session.scalars(select(SecureBlob.data_id).limit(1)).first()
+
+        if mismatched is not None:
+            raise RuntimeError(f"Blob storage mismatch: Database entry data is not stored in the configured "
+                               f"'{BlobStore.mode()}' mode. Run migrate_blob_storage.py to migrate it.")
+
+
+    @staticmethod
+    def migrate(
+        mode: str,
+        chunk_size: int = 1000
+    ) -> int:
+        """
+        Move the entry data of the open database into the given mode
+
+        Entries are moved in one transaction per chunk, each moving and
+        clearing the same rows, so an interrupted migration is consistent
+        and resumes where it stopped when run again.
+
+        Args:
+            mode (str):         The mode to migrate to
+            chunk_size (int):   Entries moved in each transaction
+
+        Returns:
+            (int)   The number of entries moved
+        """
+        if mode not in BLOB_STORAGE_MODES:
+            raise ValueError(f"Unknown blob storage mode: {mode}")
+        if chunk_size < 1:
+            raise ValueError(f"Invalid migration chunk size: {chunk_size}")
+
+        moved = 0
+        while True:
+            with DatabaseSetup.get_db_session() as session:
+                if mode == "table":
+                    count = BlobStore._move_to_table(session, chunk_size)
+                else:
+                    count = BlobStore._move_inline(session, chunk_size)
+
+            moved += count
+            if count:
+                logger.debug("Moved %s entries to %s blob storage.", moved, mode)
+            if count < chunk_size:
+                break
+
+        logger.info("Blob storage migrated to %s mode, %s entries moved.", mode, moved)
+        return moved
+
+
+    @staticmethod
+    def _move_to_table(
+        session: Session,
+        chunk_size: int
+    ) -> int:
+        ids = session.scalars(
+            select(SecureData.id)
+            .where(~exists().where(SecureBlob.data_id == SecureData.id))
+            .order_by(SecureData.id)
+            .limit(chunk_size)
+        ).all()
+        if not ids:
+            return 0
+
+        session.execute(
+            insert(SecureBlob).from_select(
+                ["data_id", "entry_data"],
+                select(SecureData.id, SecureData.entry_data).where(SecureData.id.in_(ids))
+            )
+        )
+        session.execute(
+            update(SecureData)
+            .where(SecureData.id.in_(ids))
+            .values(entry_data=b'')
+            .execution_options(synchronize_session=False)
+        )
+        return len(ids)
+
+
+    @staticmethod
+    def _move_inline(
+        session: Session,
+        chunk_size: int
+    ) -> int:
+        ids = session.scalars(
+            select(SecureBlob.data_id)
+            .order_by(SecureBlob.data_id)
+            .limit(chunk_size)
+        ).all()
+        if not ids:
+            return 0
+
+        session.execute(
+            update(SecureData)
+            .where(SecureData.id.in_(ids))
+            .values(entry_data=(
+                select(SecureBlob.entry_data)
+                .where(SecureBlob.data_id == SecureData.id)
+                .scalar_subquery()
+            ))
+            .execution_options(synchronize_session=False)
+        )
+        session.execute(
+            delete(SecureBlob)
+            .where(SecureBlob.data_id.in_(ids))
+            .execution_options(synchronize_session=False)
+        )
+        return len(ids)
@@ -2,9 +2,11 @@ import uuid
 from typing import Optional, List
 from datetime import datetime
 
-from sqlalchemy import String, Integer, DateTime, Boolean, ForeignKey, LargeBinary
+from sqlalchemy import String, Integer, DateTime, Boolean, ForeignKey, LargeBinary, Index
 from sqlalchemy.orm import declarative_base, Mapped, mapped_column, relationship
 
+from .dialects import random_public_id, store_uncompressed
+
 Base = declarative_base()
 
 
@@ -32,12 +34,12 @@ class AuthEphemeral(Base):
     __tablename__ = "auth"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    public_id: Mapped[str] = mapped_column(String, unique=True, nullable=False, index=True, default=lambda: uuid.uuid4().hex)
-    user_id: Mapped[int] = mapped_column(ForeignKey("user.id"))
+    public_id: Mapped[str] = mapped_column(String, unique=True, nullable=False, index=True, default=lambda: uuid.uuid4().hex, server_default=random_public_id())
+    user_id: Mapped[int] = mapped_column(ForeignKey("user.id"), index=True)
 
     eph_private_b: Mapped[bytes] = mapped_column(LargeBinary)
     eph_public_b: Mapped[bytes] = mapped_column(LargeBinary)
-    expiry_time: Mapped[datetime] = mapped_column(DateTime)
+    expiry_time: Mapped[datetime] = mapped_column(DateTime, index=True)
     password_change: Mapped[bool] = mapped_column(Boolean)
 
     user: Mapped["User"] = relationship("User", back_populates="auth_ephemerals")
@@ -47,15 +49,15 @@ class LoginSession(Base):
     __tablename__ = "login"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    public_id: Mapped[str] = mapped_column(String, unique=True, nullable=False, index=True, default=lambda: uuid.uuid4().hex)
-    user_id: Mapped[int] = mapped_column(ForeignKey("user.id"))
+    public_id: Mapped[str] = mapped_column(String, unique=True, nullable=False, index=True, default=lambda: uuid.uuid4().hex, server_default=random_public_id())
+    user_id: Mapped[int] = mapped_column(ForeignKey("user.id"), index=True)
 
     session_key: Mapped[bytes] = mapped_column(LargeBinary, unique=True, index=True)
     request_count: Mapped[int] = mapped_column(Integer)
     last_used: Mapped[datetime] = mapped_column(DateTime)
 
     maximum_requests: Mapped[int] = mapped_column(Integer, nullable=True)
-    expiry_time: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+    expiry_time: Mapped[datetime] = mapped_column(DateTime, nullable=True, index=True)
     password_change: Mapped[bool] = mapped_column(Boolean)
 
     user: Mapped["User"] = relationship("User", back_populates="login_sessions")
@@ -63,15 +65,35 @@ class LoginSession(Base):
 
 class SecureData(Base):
     __tablename__ = "data"
+    __table_args__ = (
+        # Also serves lookups on user_id alone
+        Index("ix_data_user_id_public_id", "user_id", "public_id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    public_id: Mapped[str] = mapped_column(String, unique=True, nullable=False, index=True, default=lambda: uuid.uuid4().hex)
+    public_id: Mapped[str] = mapped_column(String, unique=True, nullable=False, index=True, default=lambda: uuid.uuid4().hex, server_default=random_public_id())
     user_id: Mapped[int] = mapped_column(ForeignKey("user.id"))
 
-    entry_name: Mapped[bytes] = mapped_column(LargeBinary)
-    entry_data: Mapped[bytes] = mapped_column(LargeBinary)
+    # Encrypted payloads are deferred, and only loaded by the paths returning them
+    entry_name: Mapped[bytes] = mapped_column(LargeBinary, deferred=True, deferred_group="entry")
+    entry_data: Mapped[bytes] = mapped_column(LargeBinary, deferred=True, deferred_group="entry")
 
-    new_entry_name: Mapped[Optional[bytes]] = mapped_column(LargeBinary, nullable=True)
-    new_entry_data: Mapped[Optional[bytes]] = mapped_column(LargeBinary, nullable=True)
+    new_entry_name: Mapped[Optional[bytes]] = mapped_column(LargeBinary, nullable=True, deferred=True, deferred_group="new_entry")
+    new_entry_data: Mapped[Optional[bytes]] = mapped_column(LargeBinary, nullable=True, deferred=True, deferred_group="new_entry")
 
     user: Mapped["User"] = relationship("User", back_populates="secure_data")
+    # Blobs are removed by the database's cascade, including for bulk deletes of entries
+    blob: Mapped[Optional["SecureBlob"]] = relationship("SecureBlob", back_populates="secure_data", cascade="all, delete-orphan", passive_deletes=True)
+
+
+class SecureBlob(Base):
+    __tablename__ = "blob"
+
+    data_id: Mapped[int] = mapped_column(ForeignKey("data.id", ondelete="CASCADE"), primary_key=True)
+    entry_data: Mapped[bytes] = mapped_column(LargeBinary)
+
+    secure_data: Mapped["SecureData"] = relationship("SecureData", back_populates="blob")
+
+
+store_uncompressed(SecureData.__table__, "entry_name", "entry_data", "new_entry_name", "new_entry_data")
+store_uncompressed(SecureBlob.__table__, "entry_data")
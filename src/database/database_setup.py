@@ -1,13 +1,44 @@
 import tempfile
 from pathlib import Path
-from typing import Optional, Generator
+from typing import Optional, Generator, Dict, Union, Any
 from contextlib import contextmanager
 
 from logging import getLogger
 logger = getLogger("database")
 
 from sqlalchemy.orm import DeclarativeBase, sessionmaker, Session
-from sqlalchemy import create_engine, inspect
+from sqlalchemy import create_engine, inspect, event, Engine, URL, make_url
+from sqlalchemy.pool import QueuePool
+
+from .query_stats import QueryStats
+
+
+SQLITE_PRAGMAS = {
+    "journal_mode": ("DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"),
+    "synchronous": ("OFF", "NORMAL", "FULL", "EXTRA"),
+    "temp_store": ("DEFAULT", "FILE", "MEMORY"),
+    "mmap_size": int,
+    "cache_size": int,
+    "busy_timeout": int
+}
+
+# Connection pool settings of server databases, with the types of their values
+POOL_SETTINGS = {
+    "pool_size": int,
+    "max_overflow": int,
+    "pool_recycle": int,
+    "pool_timeout": float,
+    "pool_pre_ping": bool
+}
+
+# Pool used for server databases, unless overridden by the pool settings
+DEFAULT_POOL_SETTINGS: Dict[str, Any] = {
+    "pool_size": 10,
+    "max_overflow": 20,
+    "pool_recycle": 1800,
+    "pool_timeout": 30.0,
+    "pool_pre_ping": True
+}
 
 
 class DatabaseSetup:
@@ -19,12 +50,80 @@ class DatabaseSetup:
         DatabaseSetup._session_maker = None
 
     @staticmethod
-    def init_db(directory: Path, base: type[DeclarativeBase]):
-        logger.debug("Initialising database...")
+    def _validate_pragmas(pragmas: Dict[str, str]) -> Dict[str, str]:
+        """
+        Check the requested pragmas are known, and their values are valid
 
-        if DatabaseSetup._session_maker is not None:
-            raise RuntimeError("Database already initialised.")
+        Returns:
+            (dict)  Normalised pragma statements, keyed by pragma name
+        """
+        validated = {}
+        for name, value in pragmas.items():
+            allowed = SQLITE_PRAGMAS.get(name)
+            if allowed is None:
+                raise ValueError(f"Unknown database pragma: {name}")
+
+            if allowed is int:
+                try:
+                    validated[name] = str(int(value))
+                except (TypeError, ValueError) as e:
+                    raise ValueError(f"Invalid value for database pragma {name}: {value}") from e
+            else:
+                if str(value).upper() not in allowed: # type: ignore
+                    raise ValueError(f"Invalid value for database pragma {name}: {value}")
+                validated[name] = str(value).upper()
+
+        return validated
+
+    @staticmethod
+    def _validate_pool(pool: Dict[str, str]) -> Dict[str, Any]:
+        """
+        Check the requested pool settings are known, and their values are valid
+
+        Returns:
+            (dict)  Pool keyword arguments for create_engine, keyed by setting name
+        """
+        validated: Dict[str, Any] = {}
+        for name, value in pool.items():
+            kind = POOL_SETTINGS.get(name)
+            if kind is None:
+                raise ValueError(f"Unknown database pool setting: {name}")
 
+            if kind is bool:
+                if str(value).lower() not in ("1", "true", "yes", "on", "0", "false", "no", "off"):
+                    raise ValueError(f"Invalid value for database pool setting {name}: {value}")
+                validated[name] = str(value).lower() in ("1", "true", "yes", "on")
+                continue
+
+            try:
+                number = kind(value)
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"Invalid value for database pool setting {name}: {value}") from e
+            # A pool_recycle of -1 disables recycling
+            if number < (-1 if name == "pool_recycle" else 0) or (name == "pool_size" and number < 1):
+                raise ValueError(f"Invalid value for database pool setting {name}: {value}")
+            validated[name] = number
+
+        return validated
+
+    @staticmethod
+    def _engine_options(url: URL, pool: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the create_engine keyword arguments for the database
+
+        SQLite keeps the dialect's own pooling. Server databases are given a
+        QueuePool, tuned by the defaults and any pool settings.
+
+        Returns:
+            (dict)  Keyword arguments for create_engine
+        """
+        if url.get_backend_name() == "sqlite":
+            return {}
+        return {"poolclass": QueuePool, **DEFAULT_POOL_SETTINGS, **pool}
+
+    @staticmethod
+    def _check_writable(directory: Path):
+        """Check the directory of the database file can be created and written to"""
         try:
             directory.parent.mkdir(parents=True, exist_ok=True)
             with tempfile.NamedTemporaryFile(dir=directory.parent, delete=True):
@@ -32,20 +131,132 @@ class DatabaseSetup:
         except (PermissionError, OSError) as e:
             raise PermissionError(f"Permission denied: Cannot write to directory {directory.parent}") from e
 
-        engine = create_engine(f"sqlite:///{directory}")
+    @staticmethod
+    def _apply_pragmas(engine: Engine, pragmas: Dict[str, str]):
+        """Register a connect hook, applying the pragmas to every pooled connection"""
+        @event.listens_for(engine, "connect")
+        def set_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            try:
+                for name, value in pragmas.items():
+                    cursor.execute(f"PRAGMA {name}={value}")
+            finally:
+                cursor.close()
+
+    @staticmethod
+    def _enforce_foreign_keys(engine: Engine):
+        """Register a connect hook, enforcing foreign keys and their cascades, which SQLite leaves off by default"""
+        @event.listens_for(engine, "connect")
+        def set_foreign_keys(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            try:
+                cursor.execute("PRAGMA foreign_keys=ON")
+            finally:
+                cursor.close()
+
+    @staticmethod
+    def _migrate(engine: Engine, base: type[DeclarativeBase]):
+        """
+        Upgrade an existing database in place, creating any table or index of the models it is missing
+
+        create_all skips tables that already exist, so indexes added to the
+        models after a vault was created would otherwise never be built.
+        """
+        inspector = inspect(engine)
+        existing_tables = set(inspector.get_table_names())
+        with engine.begin() as connection:
+            for table in base.metadata.sorted_tables:
+                if table.name not in existing_tables:
+                    table.create(connection)
+                    logger.info("Database migrated: created table '%s'.", table.name)
+                    continue
+
+                existing_indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+                for index in table.indexes:
+                    if index.name in existing_indexes:
+                        continue
+                    index.create(connection)
+                    logger.info("Database migrated: created index '%s' on '%s'.", index.name, table.name)
+
+    @staticmethod
+    def init_db(
+        directory: Union[Path, str],
+        base: type[DeclarativeBase],
+        pragmas: Optional[Dict[str, str]] = None,
+        pool: Optional[Dict[str, str]] = None
+    ):
+        """
+        Open the database, creating or migrating its schema
+
+        Args:
+            directory (Path|str):   Path of the SQLite file, or a full database URL
+            base (DeclarativeBase): Base of the models
+            pragmas (dict):         SQLite pragmas, applied to every connection
+            pool (dict):            Connection pool settings, for server databases such as PostgreSQL
+        """
+        logger.debug("Initialising database...")
+
+        if DatabaseSetup._session_maker is not None:
+            raise RuntimeError("Database already initialised.")
+
+        if isinstance(directory, Path):
+            url = URL.create("sqlite", database=str(directory))
+        else:
+            url = make_url(directory)
+        sqlite = url.get_backend_name() == "sqlite"
+
+        validated_pragmas = DatabaseSetup._validate_pragmas(pragmas or {})
+        validated_pool = DatabaseSetup._validate_pool(pool or {})
+        if validated_pragmas and not sqlite:
+            raise ValueError(f"Database pragmas are only supported on SQLite, not {url.get_backend_name()}.")
+        if validated_pool and sqlite:
+            raise ValueError("Database pool settings are not supported on SQLite.")
+
+        if sqlite and url.database and url.database != ":memory:":
+            DatabaseSetup._check_writable(Path(url.database))
+
+        engine = create_engine(url, **DatabaseSetup._engine_options(url, validated_pool))
+        if sqlite:
+            DatabaseSetup._enforce_foreign_keys(engine)
+        if validated_pragmas:
+            DatabaseSetup._apply_pragmas(engine, validated_pragmas)
+            logger.debug("Database pragmas applied: %s.", validated_pragmas)
+        QueryStats.instrument(engine)
 
         inspector = inspect(engine)
         existing_tables = set(inspector.get_table_names())
         expected_tables = set(base.metadata.tables.keys())
 
-        if existing_tables and existing_tables != expected_tables:
+        if existing_tables and not existing_tables <= expected_tables:
             raise RuntimeError(f"Schema mismatch: Existing database has incompatible schema. "
                              f"Expected tables: {sorted(expected_tables)}, "
                              f"Found tables: {sorted(existing_tables)}")
 
+        if existing_tables:
+            DatabaseSetup._migrate(engine, base)
         base.metadata.create_all(engine)
         DatabaseSetup._session_maker = sessionmaker(bind=engine)
-        logger.info("Database initialised to '%s'.", str(directory))
+        logger.info("Database initialised to '%s'.", url.render_as_string(hide_password=True))
+
+    @staticmethod
+    def vacuum():
+        """Rebuild the database file, packing each table's rows and releasing free pages"""
+        if not DatabaseSetup._session_maker:
+            raise RuntimeError("Database not initialised.")
+
+        engine = DatabaseSetup._session_maker.kw["bind"]
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+            connection.exec_driver_sql("VACUUM")
+        logger.info("Database vacuumed.")
+
+    @staticmethod
+    def close_db():
+        """Dispose of the engine and its pooled connections, leaving the database uninitialised"""
+        session_maker = DatabaseSetup._session_maker
+        DatabaseSetup._session_maker = None
+        if session_maker is not None:
+            session_maker.kw["bind"].dispose()
+            logger.info("Database closed.")
 
     @staticmethod
     @contextmanager
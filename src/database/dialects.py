@@ -0,0 +1,42 @@
+from sqlalchemy import String, DDL, Table, event
+from sqlalchemy.sql.expression import FunctionElement
+from sqlalchemy.ext.compiler import compiles
+
+
+class random_public_id(FunctionElement):
+    """
+    Server side default for public ids, rendering a random uuid4 hex string in each dialect
+
+    The ORM and bulk inserts generate public ids in python. This covers rows
+    inserted by plain SQL, such as migrations or maintenance scripts.
+    """
+
+    type = String()
+    inherit_cache = True
+
+
+@compiles(random_public_id, "sqlite")
+def _random_public_id_sqlite(element, compiler, **kw):
+    # Random bits only, unlike uuid4 there are no version or variant bits
+    return "lower(hex(randomblob(16)))"
+
+
+@compiles(random_public_id, "postgresql")
+def _random_public_id_postgresql(element, compiler, **kw):
+    return "replace(gen_random_uuid()::text, '-', '')"
+
+
+def store_uncompressed(
+    table: Table,
+    *columns: str
+):
+    """
+    Store the LargeBinary columns of a table out of line and uncompressed on PostgreSQL
+
+    Ciphertext does not compress, so the default TOAST storage would spend
+    CPU on every write for nothing. Other dialects are unaffected.
+    """
+    statement = "ALTER TABLE %(table)s " + ", ".join(
+        f"ALTER COLUMN {column} SET STORAGE EXTERNAL" for column in columns
+    )
+    event.listen(table, "after_create", DDL(statement).execute_if(dialect="postgresql"))
@@ -0,0 +1,208 @@
+from time import perf_counter
+from functools import wraps
+from inspect import isgeneratorfunction
+from threading import Lock
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional, List, Dict, Callable, Generator, Any
+
+from sqlalchemy import event, Engine
+
+from logging import getLogger
+logger = getLogger("database")
+
+
+class QueryCount():
+    """Statements issued, and time spent in SQL, during one tracked call"""
+
+    __slots__ = ("function", "statements", "seconds")
+
+    def __init__(self, function: str):
+        self.function = function
+        self.statements = 0
+        self.seconds = 0.0
+
+
+_current_call: ContextVar[Optional[QueryCount]] = ContextVar("current_call", default=None)
+
+
+class QueryStats():
+    """
+    Engine level statement counting, attributed to the DBUtils call issuing each statement
+
+    Statements outside a tracked call are counted against 'untracked'.
+    """
+
+    _slow_seconds: float = 0.0
+    _lock = Lock()
+    _totals: Dict[str, List[float]] = {}
+
+
+    @staticmethod
+    def configure(
+        slow_query_ms: float
+    ):
+        """
+        Set the threshold above which statements are logged, with 0 disabling the slow query log
+
+        Args:
+            slow_query_ms (float):  Threshold in milliseconds
+        """
+        if slow_query_ms < 0:
+            raise ValueError(f"Invalid slow query threshold: {slow_query_ms}")
+        QueryStats._slow_seconds = slow_query_ms / 1000
+
+
+    @staticmethod
+    def _reset():
+        QueryStats._slow_seconds = 0.0
+        with QueryStats._lock:
+            QueryStats._totals = {}
+
+
+    @staticmethod
+    def instrument(
+        engine: Engine
+    ):
+        """Register the hooks counting and timing every statement on the engine"""
+
+        @event.listens_for(engine, "before_cursor_execute")
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            conn.info.setdefault("query_start", []).append(perf_counter())
+
+        @event.listens_for(engine, "after_cursor_execute")
+        def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            elapsed = perf_counter() - conn.info["query_start"].pop()
+            QueryStats._record(statement, elapsed)
+
+        # A failed statement skips after_cursor_execute, and would leave its start time behind on the connection
+        @event.listens_for(engine, "handle_error")
+        def handle_error(exception_context):
+            conn = exception_context.connection
+            starts = conn.info.get("query_start") if conn is not None else None
+            if starts:
+                elapsed = perf_counter() - starts.pop()
+                QueryStats._record(exception_context.statement or "", elapsed)
+
+
+    @staticmethod
+    def _record(
+        statement: str,
+        elapsed: float
+    ):
+        call = _current_call.get()
+        function = call.function if call else "untracked"
+        if call:
+            call.statements += 1
+            call.seconds += elapsed
+
+        with QueryStats._lock:
+            totals = QueryStats._totals.get(function)
+            if totals is None:
+                totals = [0, 0.0]
+                QueryStats._totals[function] = totals
+            totals[0] += 1
+            totals[1] += elapsed
+
+        if QueryStats._slow_seconds and elapsed >= QueryStats._slow_seconds:
+            logger.warning("Slow query in %s took %.1f ms: %s", function, elapsed * 1000, " ".join(statement.split()))
+
+
+    @staticmethod
+    @contextmanager
+    def track(
+        function: str
+    ) -> Generator[QueryCount, None, None]:
+        """
+        Attribute statements to the function, unless already inside a tracked call
+
+        Returns:
+            (QueryCount)    Counts for the outermost tracked call
+        """
+        current = _current_call.get()
+        if current is not None:
+            yield current
+            return
+
+        call = QueryCount(function)
+        token = _current_call.set(call)
+        try:
+            yield call
+        finally:
+            _current_call.reset(token)
+            logger.debug("%s issued %s statements in %.1f ms.", function, call.statements, call.seconds * 1000)
+
+
+    @staticmethod
+    def totals() -> Dict[str, Dict[str, float]]:
+        """
+        Get the statement totals of each tracked function
+
+        Returns:
+            (dict)  Statement count and seconds, keyed by function name
+        """
+        with QueryStats._lock:
+            return {
+                function: {"statements": totals[0], "seconds": totals[1]}
+                for function, totals in QueryStats._totals.items()
+            }
+
+
+    @staticmethod
+    def render() -> List[str]:
+        """
+        Render the statement totals in the Prometheus text format
+
+        Returns:
+            ([str]) Lines of the metrics document
+        """
+        totals = QueryStats.totals()
+        lines = [
+            "# HELP passmanager_db_statements_total SQL statements issued, by DBUtils function.",
+            "# TYPE passmanager_db_statements_total counter"
+        ]
+        for function, total in sorted(totals.items()):
+            lines.append(f'passmanager_db_statements_total{{function="{function}"}} {total["statements"]}')
+        lines.append("# HELP passmanager_db_seconds_total Time spent executing SQL, by DBUtils function.")
+        lines.append("# TYPE passmanager_db_seconds_total counter")
+        for function, total in sorted(totals.items()):
+            lines.append(f'passmanager_db_seconds_total{{function="{function}"}} {total["seconds"]}')
+        return lines
+
+
+def track_queries(cls):
+    """
+    Class decorator tracking the statements of every public static method of a DBUtils class
+
+    Generator methods are tracked one resumption at a time, as their
+    consumer may resume them from a different thread.
+    """
+
+    def _tracked(function: Callable[..., Any], name: str):
+        if isgeneratorfunction(function):
+            @wraps(function)
+            def generator_wrapper(*args, **kwargs):
+                generator = function(*args, **kwargs)
+                try:
+                    while True:
+                        with QueryStats.track(name):
+                            try:
+                                item = next(generator)
+                            except StopIteration:
+                                return
+                        yield item
+                finally:
+                    with QueryStats.track(name):
+                        generator.close()
+            return generator_wrapper
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            with QueryStats.track(name):
+                return function(*args, **kwargs)
+        return wrapper
+
+    for name, attribute in list(vars(cls).items()):
+        if isinstance(attribute, staticmethod) and not name.startswith("_"):
+            setattr(cls, name, staticmethod(_tracked(attribute.__func__, f"{cls.__name__}.{name}")))
+    return cls
@@ -1,11 +1,13 @@
 import sys
+import atexit
 from pathlib import Path
 
 from logging import getLogger
 logger = getLogger("database")
 
-from utils import setup_logging, DatabaseConfig
-from database import DatabaseSetup, Base
+from utils import setup_logging, DatabaseConfig, SessionCache, RequestCounter, ExpiryReaper, StageTimer
+from database import DatabaseSetup, Base, SQLITE_PRAGMAS, POOL_SETTINGS, QueryStats, BlobStore
+from cryptography import SRPUtils, EphemeralPool
 
 
 def initialise_config(config_path = None):
@@ -22,13 +24,121 @@ def initialise_logging():
     setup_logging(logging_path, log_config_path)
 
 
-def initialise_database():
-    database_path = DatabaseConfig.get_path("database")
+def initialise_database(verify_blob_storage: bool = True):
+    database_config = DatabaseConfig.get_section("database")
 
-    if not database_path:
-        database_path = Path("./build/data")
+    # A database url, such as for PostgreSQL, takes the place of the SQLite file path
+    database_location = database_config.get("url") or DatabaseConfig.get_path("database")
+    if not database_location:
+        database_location = Path("./build/data")
 
-    DatabaseSetup.init_db(database_path, Base)
+    pragmas = {key: value for key, value in database_config.items() if key in SQLITE_PRAGMAS}
+    pool = {key: value for key, value in database_config.items() if key in POOL_SETTINGS}
+    QueryStats.configure(float(database_config.get("slow_query_ms", 0)))
+
+    BlobStore.configure(database_config.get("blob_storage", "inline"))
+    DatabaseSetup.init_db(database_location, Base, pragmas, pool)
+    if verify_blob_storage:
+        BlobStore.verify()
+
+
+def initialise_session_cache():
+    cache_config = DatabaseConfig.get_section("session_cache")
+    SessionCache.configure(int(cache_config.get("maximum_entries", 0)))
+
+
+def initialise_request_counter():
+    counter_config = DatabaseConfig.get_section("request_counter")
+    RequestCounter.start(
+        interval=float(counter_config.get("flush_interval", 0)),
+        batch_size=int(counter_config.get("batch_size", 0))
+    )
+    atexit.register(RequestCounter.stop)
+
+
+def initialise_expiry_reaper():
+    reaper_config = DatabaseConfig.get_section("expiry_reaper")
+    ExpiryReaper.start(
+        interval=float(reaper_config.get("interval", 0)),
+        chunk_size=int(reaper_config.get("chunk_size", 500))
+    )
+    atexit.register(ExpiryReaper.stop)
+
+
+def initialise_srp_offload():
+    srp_config = DatabaseConfig.get_section("srp")
+    SRPUtils.start_offload(int(srp_config.get("offload_workers", 0)))
+    atexit.register(SRPUtils.stop_offload)
+
+
+def initialise_ephemeral_pool():
+    pool_config = DatabaseConfig.get_section("ephemeral_pool")
+    EphemeralPool.start(
+        size=int(pool_config.get("size", 0)),
+        low_water=int(pool_config.get("low_water", 0)),
+        generate=SRPUtils.generate_private_ephemeral
+    )
+
+
+def initialise_stage_timer():
+    timer_config = DatabaseConfig.get_section("stage_timer")
+    StageTimer.configure(
+        enabled=timer_config.get("enabled", "false").lower() in ("1", "true", "yes", "on"),
+        window=int(timer_config.get("window", 1024))
+    )
+
+
+def initialise_process(workers: int = 1, slot: int = 0):
+    initialise_database()
+    if workers > 1:
+        # The session cache and pending request counts are only seen by their own
+        # process, so a session revoked or used in one worker would go unnoticed by
+        # the others. Every worker reads sessions from the database instead.
+        logger.info("Session cache and request counter disabled for %s prefork workers.", workers)
+    else:
+        initialise_session_cache()
+        initialise_request_counter()
+    initialise_stage_timer()
+    # One reaper is enough, the first worker runs it for every worker
+    if slot == 0:
+        initialise_expiry_reaper()
+    initialise_srp_offload()
+    initialise_ephemeral_pool()
+
+
+def finalise_process():
+    EphemeralPool.stop()
+    ExpiryReaper.stop()
+    RequestCounter.stop()
+    SRPUtils.stop_offload()
+
+
+def prefork_workers() -> int:
+    prefork_config = DatabaseConfig.get_section("prefork")
+    return int(prefork_config.get("workers", 0))
+
+
+def run_server():
+    sys.path.append(str(Path(__file__).parent / "services"))
+    from all_server import serve_configured
+
+    try:
+        serve_configured()
+    finally:
+        finalise_process()
+
+
+def run_prefork_server(workers: int):
+    sys.path.append(str(Path(__file__).parent / "services"))
+    from prefork_server import serve_prefork, PreforkSupervisor
+
+    prefork_config = DatabaseConfig.get_section("prefork")
+    serve_prefork(
+        workers=workers,
+        initialise=lambda: initialise_process(workers, PreforkSupervisor.worker_slot or 0),
+        finalise=finalise_process,
+        grace=float(prefork_config.get("grace", 10))
+    )
 
 
 def main():
@@ -40,11 +150,23 @@ def main():
     try:
         initialise_config(config_path)
         initialise_logging()
-        initialise_database()
+        workers = prefork_workers()
+        if not workers:
+            initialise_process()
+        else:
+            # Create the schema once, so workers do not race to create it
+            initialise_database()
+            DatabaseSetup.close_db()
     except Exception:
         logger.exception("Failed during application initialisation")
         sys.exit(1)
 
+    # Workers open the database themselves, after the fork
+    if workers:
+        run_prefork_server(workers)
+    else:
+        run_server()
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,63 @@
+"""
+Migrate the vault's encrypted entry data to the configured blob storage mode
+
+Run with the server stopped, after setting blob_storage in the [database]
+section of the config:
+
+    python src/migrate_blob_storage.py [config_path] [--chunk-size N] [--no-vacuum]
+"""
+import sys
+import argparse
+from pathlib import Path
+
+from logging import getLogger
+logger = getLogger("database")
+
+from main import initialise_config, initialise_logging, initialise_database
+from database import DatabaseSetup, BlobStore
+
+
+def migrate(
+    chunk_size: int = 1000,
+    vacuum: bool = True
+) -> int:
+    """
+    Migrate the open database to the configured blob storage mode
+
+    Args:
+        chunk_size (int):   Entries moved in each transaction
+        vacuum (bool):      True to rebuild the database file afterwards, packing the data table's rows
+
+    Returns:
+        (int)   The number of entries moved
+    """
+    moved = BlobStore.migrate(BlobStore.mode(), chunk_size)
+    BlobStore.verify()
+    if moved and vacuum:
+        DatabaseSetup.vacuum()
+    return moved
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Migrate the vault to the configured blob storage mode.")
+    parser.add_argument("config_path", nargs="?", type=Path, default=None)
+    parser.add_argument("--chunk-size", type=int, default=1000, help="entries moved in each transaction")
+    parser.add_argument("--no-vacuum", action="store_true", help="skip rebuilding the database file afterwards")
+    args = parser.parse_args()
+
+    try:
+        initialise_config(args.config_path)
+        initialise_logging()
+        initialise_database(verify_blob_storage=False)
+        moved = migrate(args.chunk_size, not args.no_vacuum)
+    except Exception:
+        logger.exception("Failed to migrate blob storage")
+        sys.exit(1)
+    finally:
+        DatabaseSetup.close_db()
+
+    logger.info("Migrated %s entries to %s blob storage.", moved, BlobStore.mode())
+
+
+if __name__ == "__main__":
+    main()
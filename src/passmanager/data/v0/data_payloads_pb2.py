@@ -22,35 +22,60 @@ _runtime_version.ValidateProtobufRuntimeVersion(
 _sym_db = _symbol_database.Default()
 
 
+from passmanager.common.v0 import error_pb2 as passmanager_dot_common_dot_v0_dot_error__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\'passmanager/data/v0/data_payloads.proto\x12\x13passmanager.data.v0\"R\n\x11\x44\x61taCreateRequest\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\x12\x12\n\nentry_name\x18\x02 \x01(\x0c\x12\x12\n\nentry_data\x18\x03 \x01(\x0c\">\n\x12\x44\x61taCreateResponse\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\x12\x11\n\tpublic_id\x18\x02 \x01(\t\"\x8b\x01\n\x0f\x44\x61taEditRequest\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\x12\x11\n\tpublic_id\x18\x02 \x01(\t\x12\x17\n\nentry_name\x18\x03 \x01(\x0cH\x00\x88\x01\x01\x12\x17\n\nentry_data\x18\x04 \x01(\x0cH\x01\x88\x01\x01\x42\r\n\x0b_entry_nameB\r\n\x0b_entry_data\"<\n\x10\x44\x61taEditResponse\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\x12\x11\n\tpublic_id\x18\x02 \x01(\t\"=\n\x11\x44\x61taDeleteRequest\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\x12\x11\n\tpublic_id\x18\x02 \x01(\t\">\n\x12\x44\x61taDeleteResponse\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\x12\x11\n\tpublic_id\x18\x02 \x01(\t\":\n\x0e\x44\x61taGetRequest\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\x12\x11\n\tpublic_id\x18\x02 \x01(\t\"c\n\x0f\x44\x61taGetResponse\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\x12\x11\n\tpublic_id\x18\x02 \x01(\t\x12\x12\n\nentry_name\x18\x03 \x01(\x0c\x12\x12\n\nentry_data\x18\x04 \x01(\x0c\"(\n\x0f\x44\x61taListRequest\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\"\xab\x01\n\x10\x44\x61taListResponse\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\x12I\n\rentry_details\x18\x02 \x03(\x0b\x32\x32.passmanager.data.v0.DataListResponse.EntryDetails\x1a\x35\n\x0c\x45ntryDetails\x12\x11\n\tpublic_id\x18\x01 \x01(\t\x12\x12\n\nentry_name\x18\x02 \x01(\x0c\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\'passmanager/data/v0/data_payloads.proto\x12\x13passmanager.data.v0\x1a!passmanager/common/v0/error.proto\"R\n\x11\x44\x61taCreateRequest\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\x12\x12\n\nentry_name\x18\x02 \x01(\x0c\x12\x12\n\nentry_data\x18\x03 \x01(\x0c\">\n\x12\x44\x61taCreateResponse\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\x12\x11\n\tpublic_id\x18\x02 \x01(\t\"\x8b\x01\n\x0f\x44\x61taEditRequest\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\x12\x11\n\tpublic_id\x18\x02 \x01(\t\x12\x17\n\nentry_name\x18\x03 \x01(\x0cH\x00\x88\x01\x01\x12\x17\n\nentry_data\x18\x04 \x01(\x0cH\x01\x88\x01\x01\x42\r\n\x0b_entry_nameB\r\n\x0b_entry_data\"<\n\x10\x44\x61taEditResponse\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\x12\x11\n\tpublic_id\x18\x02 \x01(\t\"=\n\x11\x44\x61taDeleteRequest\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\x12\x11\n\tpublic_id\x18\x02 \x01(\t\">\n\x12\x44\x61taDeleteResponse\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\x12\x11\n\tpublic_id\x18\x02 \x01(\t\":\n\x0e\x44\x61taGetRequest\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\x12\x11\n\tpublic_id\x18\x02 \x01(\t\"c\n\x0f\x44\x61taGetResponse\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\x12\x11\n\tpublic_id\x18\x02 \x01(\t\x12\x12\n\nentry_name\x18\x03 \x01(\x0c\x12\x12\n\nentry_data\x18\x04 \x01(\x0c\"K\n\x0f\x44\x61taListRequest\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\x12\x11\n\tpage_size\x18\x02 \x01(\r\x12\x0e\n\x06\x63ursor\x18\x03 \x01(\t\"\xc0\x01\n\x10\x44\x61taListResponse\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\x12I\n\rentry_details\x18\x02 \x03(\x0b\x32\x32.passmanager.data.v0.DataListResponse.EntryDetails\x12\x13\n\x0bnext_cursor\x18\x03 \x01(\t\x1a\x35\n\x0c\x45ntryDetails\x12\x11\n\tpublic_id\x18\x01 \x01(\t\x12\x12\n\nentry_name\x18\x02 \x01(\x0c\"?\n\x12\x44\x61taGetManyRequest\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\x12\x12\n\npublic_ids\x18\x02 \x03(\t\"\xe1\x01\n\x13\x44\x61taGetManyResponse\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\x12L\n\rentry_details\x18\x02 \x03(\x0b\x32\x35.passmanager.data.v0.DataGetManyResponse.EntryDetails\x12\x1a\n\x12missing_public_ids\x18\x03 \x03(\t\x1aI\n\x0c\x45ntryDetails\x12\x11\n\tpublic_id\x18\x01 \x01(\t\x12\x12\n\nentry_name\x18\x02 \x01(\x0c\x12\x12\n\nentry_data\x18\x03 \x01(\x0c\"b\n\x0f\x44\x61taBatchResult\x12\x11\n\tpublic_id\x18\x01 \x01(\t\x12\x0f\n\x07success\x18\x02 \x01(\x08\x12+\n\x05\x65rror\x18\x03 \x01(\x0b\x32\x1c.passmanager.common.v0.Error\"\xa2\x01\n\x15\x44\x61taCreateManyRequest\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\x12\x41\n\x07\x65ntries\x18\x02 \x03(\x0b\x32\x30.passmanager.data.v0.DataCreateManyRequest.Entry\x1a/\n\x05\x45ntry\x12\x12\n\nentry_name\x18\x01 \x01(\x0c\x12\x12\n\nentry_data\x18\x02 \x01(\x0c\"f\n\x16\x44\x61taCreateManyResponse\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\x12\x35\n\x07results\x18\x02 \x03(\x0b\x32$.passmanager.data.v0.DataBatchResult\"\xd7\x01\n\x13\x44\x61taEditManyRequest\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\x12>\n\x07\x65ntries\x18\x02 \x03(\x0b\x32-.passmanager.data.v0.DataEditManyRequest.Edit\x1ai\n\x04\x45\x64it\x12\x11\n\tpublic_id\x18\x01 \x01(\t\x12\x17\n\nentry_name\x18\x02 \x01(\x0cH\x00\x88\x01\x01\x12\x17\n\nentry_data\x18\x03 \x01(\x0cH\x01\x88\x01\x01\x42\r\n\x0b_entry_nameB\r\n\x0b_entry_data\"d\n\x14\x44\x61taEditManyResponse\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\x12\x35\n\x07results\x18\x02 \x03(\x0b\x32$.passmanager.data.v0.DataBatchResult\"B\n\x15\x44\x61taDeleteManyRequest\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\x12\x12\n\npublic_ids\x18\x02 \x03(\t\"f\n\x16\x44\x61taDeleteManyResponse\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\x12\x35\n\x07results\x18\x02 \x03(\x0b\x32$.passmanager.data.v0.DataBatchResultb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'passmanager.data.v0.data_payloads_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
-  _globals['_DATACREATEREQUEST']._serialized_start=64
-  _globals['_DATACREATEREQUEST']._serialized_end=146
-  _globals['_DATACREATERESPONSE']._serialized_start=148
-  _globals['_DATACREATERESPONSE']._serialized_end=210
-  _globals['_DATAEDITREQUEST']._serialized_start=213
-  _globals['_DATAEDITREQUEST']._serialized_end=352
-  _globals['_DATAEDITRESPONSE']._serialized_start=354
-  _globals['_DATAEDITRESPONSE']._serialized_end=414
-  _globals['_DATADELETEREQUEST']._serialized_start=416
-  _globals['_DATADELETEREQUEST']._serialized_end=477
-  _globals['_DATADELETERESPONSE']._serialized_start=479
-  _globals['_DATADELETERESPONSE']._serialized_end=541
-  _globals['_DATAGETREQUEST']._serialized_start=543
-  _globals['_DATAGETREQUEST']._serialized_end=601
-  _globals['_DATAGETRESPONSE']._serialized_start=603
-  _globals['_DATAGETRESPONSE']._serialized_end=702
-  _globals['_DATALISTREQUEST']._serialized_start=704
-  _globals['_DATALISTREQUEST']._serialized_end=744
-  _globals['_DATALISTRESPONSE']._serialized_start=747
-  _globals['_DATALISTRESPONSE']._serialized_end=918
-  _globals['_DATALISTRESPONSE_ENTRYDETAILS']._serialized_start=865
-  _globals['_DATALISTRESPONSE_ENTRYDETAILS']._serialized_end=918
+  _globals['_DATACREATEREQUEST']._serialized_start=99
+  _globals['_DATACREATEREQUEST']._serialized_end=181
+  _globals['_DATACREATERESPONSE']._serialized_start=183
+  _globals['_DATACREATERESPONSE']._serialized_end=245
+  _globals['_DATAEDITREQUEST']._serialized_start=248
+  _globals['_DATAEDITREQUEST']._serialized_end=387
+  _globals['_DATAEDITRESPONSE']._serialized_start=389
+  _globals['_DATAEDITRESPONSE']._serialized_end=449
+  _globals['_DATADELETEREQUEST']._serialized_start=451
+  _globals['_DATADELETEREQUEST']._serialized_end=512
+  _globals['_DATADELETERESPONSE']._serialized_start=514
+  _globals['_DATADELETERESPONSE']._serialized_end=576
+  _globals['_DATAGETREQUEST']._serialized_start=578
+  _globals['_DATAGETREQUEST']._serialized_end=636
+  _globals['_DATAGETRESPONSE']._serialized_start=638
+  _globals['_DATAGETRESPONSE']._serialized_end=737
+  _globals['_DATALISTREQUEST']._serialized_start=739
+  _globals['_DATALISTREQUEST']._serialized_end=814
+  _globals['_DATALISTRESPONSE']._serialized_start=817
+  _globals['_DATALISTRESPONSE']._serialized_end=1009
+  _globals['_DATALISTRESPONSE_ENTRYDETAILS']._serialized_start=956
+  _globals['_DATALISTRESPONSE_ENTRYDETAILS']._serialized_end=1009
+  _globals['_DATAGETMANYREQUEST']._serialized_start=1011
+  _globals['_DATAGETMANYREQUEST']._serialized_end=1074
+  _globals['_DATAGETMANYRESPONSE']._serialized_start=1077
+  _globals['_DATAGETMANYRESPONSE']._serialized_end=1302
+  _globals['_DATAGETMANYRESPONSE_ENTRYDETAILS']._serialized_start=1229
+  _globals['_DATAGETMANYRESPONSE_ENTRYDETAILS']._serialized_end=1302
+  _globals['_DATABATCHRESULT']._serialized_start=1304
+  _globals['_DATABATCHRESULT']._serialized_end=1402
+  _globals['_DATACREATEMANYREQUEST']._serialized_start=1405
+  _globals['_DATACREATEMANYREQUEST']._serialized_end=1567
+  _globals['_DATACREATEMANYREQUEST_ENTRY']._serialized_start=1520
+  _globals['_DATACREATEMANYREQUEST_ENTRY']._serialized_end=1567
+  _globals['_DATACREATEMANYRESPONSE']._serialized_start=1569
+  _globals['_DATACREATEMANYRESPONSE']._serialized_end=1671
+  _globals['_DATAEDITMANYREQUEST']._serialized_start=1674
+  _globals['_DATAEDITMANYREQUEST']._serialized_end=1889
+  _globals['_DATAEDITMANYREQUEST_EDIT']._serialized_start=1784
+  _globals['_DATAEDITMANYREQUEST_EDIT']._serialized_end=1889
+  _globals['_DATAEDITMANYRESPONSE']._serialized_start=1891
+  _globals['_DATAEDITMANYRESPONSE']._serialized_end=1991
+  _globals['_DATADELETEMANYREQUEST']._serialized_start=1993
+  _globals['_DATADELETEMANYREQUEST']._serialized_end=2059
+  _globals['_DATADELETEMANYRESPONSE']._serialized_start=2061
+  _globals['_DATADELETEMANYRESPONSE']._serialized_end=2163
 # @@protoc_insertion_point(module_scope)
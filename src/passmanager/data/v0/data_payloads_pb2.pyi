@@ -7,6 +7,7 @@ from collections import abc as _abc
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
 from google.protobuf.internal import containers as _containers
+from passmanager.common.v0 import error_pb2 as _error_pb2
 import builtins as _builtins
 import sys
 import typing as _typing
@@ -200,13 +201,19 @@ class DataListRequest(_message.Message):
     DESCRIPTOR: _descriptor.Descriptor
 
     USERNAME_HASH_FIELD_NUMBER: _builtins.int
+    PAGE_SIZE_FIELD_NUMBER: _builtins.int
+    CURSOR_FIELD_NUMBER: _builtins.int
     username_hash: _builtins.bytes
+    page_size: _builtins.int
+    cursor: _builtins.str
     def __init__(
         self,
         *,
         username_hash: _builtins.bytes = ...,
+        page_size: _builtins.int = ...,
+        cursor: _builtins.str = ...,
     ) -> None: ...
-    _ClearFieldArgType: _TypeAlias = _typing.Literal["username_hash", b"username_hash"]  # noqa: Y015
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["cursor", b"cursor", "page_size", b"page_size", "username_hash", b"username_hash"]  # noqa: Y015
     def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
 
 Global___DataListRequest: _TypeAlias = DataListRequest  # noqa: Y015
@@ -234,7 +241,9 @@ class DataListResponse(_message.Message):
 
     USERNAME_HASH_FIELD_NUMBER: _builtins.int
     ENTRY_DETAILS_FIELD_NUMBER: _builtins.int
+    NEXT_CURSOR_FIELD_NUMBER: _builtins.int
     username_hash: _builtins.bytes
+    next_cursor: _builtins.str
     @_builtins.property
     def entry_details(self) -> _containers.RepeatedCompositeFieldContainer[Global___DataListResponse.EntryDetails]: ...
     def __init__(
@@ -242,8 +251,265 @@ class DataListResponse(_message.Message):
         *,
         username_hash: _builtins.bytes = ...,
         entry_details: _abc.Iterable[Global___DataListResponse.EntryDetails] | None = ...,
+        next_cursor: _builtins.str = ...,
     ) -> None: ...
-    _ClearFieldArgType: _TypeAlias = _typing.Literal["entry_details", b"entry_details", "username_hash", b"username_hash"]  # noqa: Y015
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["entry_details", b"entry_details", "next_cursor", b"next_cursor", "username_hash", b"username_hash"]  # noqa: Y015
     def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
 
 Global___DataListResponse: _TypeAlias = DataListResponse  # noqa: Y015
+
+@_typing.final
+class DataGetManyRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    USERNAME_HASH_FIELD_NUMBER: _builtins.int
+    PUBLIC_IDS_FIELD_NUMBER: _builtins.int
+    username_hash: _builtins.bytes
+    @_builtins.property
+    def public_ids(self) -> _containers.RepeatedScalarFieldContainer[_builtins.str]: ...
+    def __init__(
+        self,
+        *,
+        username_hash: _builtins.bytes = ...,
+        public_ids: _abc.Iterable[_builtins.str] | None = ...,
+    ) -> None: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["public_ids", b"public_ids", "username_hash", b"username_hash"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+
+Global___DataGetManyRequest: _TypeAlias = DataGetManyRequest  # noqa: Y015
+
+@_typing.final
+class DataGetManyResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    @_typing.final
+    class EntryDetails(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        PUBLIC_ID_FIELD_NUMBER: _builtins.int
+        ENTRY_NAME_FIELD_NUMBER: _builtins.int
+        ENTRY_DATA_FIELD_NUMBER: _builtins.int
+        public_id: _builtins.str
+        entry_name: _builtins.bytes
+        entry_data: _builtins.bytes
+        def __init__(
+            self,
+            *,
+            public_id: _builtins.str = ...,
+            entry_name: _builtins.bytes = ...,
+            entry_data: _builtins.bytes = ...,
+        ) -> None: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["entry_data", b"entry_data", "entry_name", b"entry_name", "public_id", b"public_id"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+
+    USERNAME_HASH_FIELD_NUMBER: _builtins.int
+    ENTRY_DETAILS_FIELD_NUMBER: _builtins.int
+    MISSING_PUBLIC_IDS_FIELD_NUMBER: _builtins.int
+    username_hash: _builtins.bytes
+    @_builtins.property
+    def entry_details(self) -> _containers.RepeatedCompositeFieldContainer[Global___DataGetManyResponse.EntryDetails]: ...
+    @_builtins.property
+    def missing_public_ids(self) -> _containers.RepeatedScalarFieldContainer[_builtins.str]: ...
+    def __init__(
+        self,
+        *,
+        username_hash: _builtins.bytes = ...,
+        entry_details: _abc.Iterable[Global___DataGetManyResponse.EntryDetails] | None = ...,
+        missing_public_ids: _abc.Iterable[_builtins.str] | None = ...,
+    ) -> None: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["entry_details", b"entry_details", "missing_public_ids", b"missing_public_ids", "username_hash", b"username_hash"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+
+Global___DataGetManyResponse: _TypeAlias = DataGetManyResponse  # noqa: Y015
+
+@_typing.final
+class DataBatchResult(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PUBLIC_ID_FIELD_NUMBER: _builtins.int
+    SUCCESS_FIELD_NUMBER: _builtins.int
+    ERROR_FIELD_NUMBER: _builtins.int
+    public_id: _builtins.str
+    success: _builtins.bool
+    @_builtins.property
+    def error(self) -> _error_pb2.Error: ...
+    def __init__(
+        self,
+        *,
+        public_id: _builtins.str = ...,
+        success: _builtins.bool = ...,
+        error: _error_pb2.Error | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["error", b"error"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["error", b"error", "public_id", b"public_id", "success", b"success"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+
+Global___DataBatchResult: _TypeAlias = DataBatchResult  # noqa: Y015
+
+@_typing.final
+class DataCreateManyRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    @_typing.final
+    class Entry(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        ENTRY_NAME_FIELD_NUMBER: _builtins.int
+        ENTRY_DATA_FIELD_NUMBER: _builtins.int
+        entry_name: _builtins.bytes
+        entry_data: _builtins.bytes
+        def __init__(
+            self,
+            *,
+            entry_name: _builtins.bytes = ...,
+            entry_data: _builtins.bytes = ...,
+        ) -> None: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["entry_data", b"entry_data", "entry_name", b"entry_name"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+
+    USERNAME_HASH_FIELD_NUMBER: _builtins.int
+    ENTRIES_FIELD_NUMBER: _builtins.int
+    username_hash: _builtins.bytes
+    @_builtins.property
+    def entries(self) -> _containers.RepeatedCompositeFieldContainer[Global___DataCreateManyRequest.Entry]: ...
+    def __init__(
+        self,
+        *,
+        username_hash: _builtins.bytes = ...,
+        entries: _abc.Iterable[Global___DataCreateManyRequest.Entry] | None = ...,
+    ) -> None: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["entries", b"entries", "username_hash", b"username_hash"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+
+Global___DataCreateManyRequest: _TypeAlias = DataCreateManyRequest  # noqa: Y015
+
+@_typing.final
+class DataCreateManyResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    USERNAME_HASH_FIELD_NUMBER: _builtins.int
+    RESULTS_FIELD_NUMBER: _builtins.int
+    username_hash: _builtins.bytes
+    @_builtins.property
+    def results(self) -> _containers.RepeatedCompositeFieldContainer[Global___DataBatchResult]: ...
+    def __init__(
+        self,
+        *,
+        username_hash: _builtins.bytes = ...,
+        results: _abc.Iterable[Global___DataBatchResult] | None = ...,
+    ) -> None: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["results", b"results", "username_hash", b"username_hash"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+
+Global___DataCreateManyResponse: _TypeAlias = DataCreateManyResponse  # noqa: Y015
+
+@_typing.final
+class DataEditManyRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    @_typing.final
+    class Edit(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        PUBLIC_ID_FIELD_NUMBER: _builtins.int
+        ENTRY_NAME_FIELD_NUMBER: _builtins.int
+        ENTRY_DATA_FIELD_NUMBER: _builtins.int
+        public_id: _builtins.str
+        entry_name: _builtins.bytes
+        entry_data: _builtins.bytes
+        def __init__(
+            self,
+            *,
+            public_id: _builtins.str = ...,
+            entry_name: _builtins.bytes | None = ...,
+            entry_data: _builtins.bytes | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _typing.Literal["_entry_data", b"_entry_data", "_entry_name", b"_entry_name", "entry_data", b"entry_data", "entry_name", b"entry_name"]  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["_entry_data", b"_entry_data", "_entry_name", b"_entry_name", "entry_data", b"entry_data", "entry_name", b"entry_name", "public_id", b"public_id"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        _WhichOneofReturnType__entry_data: _TypeAlias = _typing.Literal["entry_data"]  # noqa: Y015
+        _WhichOneofArgType__entry_data: _TypeAlias = _typing.Literal["_entry_data", b"_entry_data"]  # noqa: Y015
+        _WhichOneofReturnType__entry_name: _TypeAlias = _typing.Literal["entry_name"]  # noqa: Y015
+        _WhichOneofArgType__entry_name: _TypeAlias = _typing.Literal["_entry_name", b"_entry_name"]  # noqa: Y015
+        @_typing.overload
+        def WhichOneof(self, oneof_group: _WhichOneofArgType__entry_data) -> _WhichOneofReturnType__entry_data | None: ...
+        @_typing.overload
+        def WhichOneof(self, oneof_group: _WhichOneofArgType__entry_name) -> _WhichOneofReturnType__entry_name | None: ...
+
+    USERNAME_HASH_FIELD_NUMBER: _builtins.int
+    ENTRIES_FIELD_NUMBER: _builtins.int
+    username_hash: _builtins.bytes
+    @_builtins.property
+    def entries(self) -> _containers.RepeatedCompositeFieldContainer[Global___DataEditManyRequest.Edit]: ...
+    def __init__(
+        self,
+        *,
+        username_hash: _builtins.bytes = ...,
+        entries: _abc.Iterable[Global___DataEditManyRequest.Edit] | None = ...,
+    ) -> None: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["entries", b"entries", "username_hash", b"username_hash"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+
+Global___DataEditManyRequest: _TypeAlias = DataEditManyRequest  # noqa: Y015
+
+@_typing.final
+class DataEditManyResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    USERNAME_HASH_FIELD_NUMBER: _builtins.int
+    RESULTS_FIELD_NUMBER: _builtins.int
+    username_hash: _builtins.bytes
+    @_builtins.property
+    def results(self) -> _containers.RepeatedCompositeFieldContainer[Global___DataBatchResult]: ...
+    def __init__(
+        self,
+        *,
+        username_hash: _builtins.bytes = ...,
+        results: _abc.Iterable[Global___DataBatchResult] | None = ...,
+    ) -> None: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["results", b"results", "username_hash", b"username_hash"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+
+Global___DataEditManyResponse: _TypeAlias = DataEditManyResponse  # noqa: Y015
+
+@_typing.final
+class DataDeleteManyRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    USERNAME_HASH_FIELD_NUMBER: _builtins.int
+    PUBLIC_IDS_FIELD_NUMBER: _builtins.int
+    username_hash: _builtins.bytes
+    @_builtins.property
+    def public_ids(self) -> _containers.RepeatedScalarFieldContainer[_builtins.str]: ...
+    def __init__(
+        self,
+        *,
+        username_hash: _builtins.bytes = ...,
+        public_ids: _abc.Iterable[_builtins.str] | None = ...,
+    ) -> None: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["public_ids", b"public_ids", "username_hash", b"username_hash"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+
+Global___DataDeleteManyRequest: _TypeAlias = DataDeleteManyRequest  # noqa: Y015
+
+@_typing.final
+class DataDeleteManyResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    USERNAME_HASH_FIELD_NUMBER: _builtins.int
+    RESULTS_FIELD_NUMBER: _builtins.int
+    username_hash: _builtins.bytes
+    @_builtins.property
+    def results(self) -> _containers.RepeatedCompositeFieldContainer[Global___DataBatchResult]: ...
+    def __init__(
+        self,
+        *,
+        username_hash: _builtins.bytes = ...,
+        results: _abc.Iterable[Global___DataBatchResult] | None = ...,
+    ) -> None: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["results", b"results", "username_hash", b"username_hash"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+
+Global___DataDeleteManyResponse: _TypeAlias = DataDeleteManyResponse  # noqa: Y015
@@ -40,26 +40,51 @@ class DataStub(object):
                 request_serializer=passmanager_dot_common_dot_v0_dot_secure__pb2.SecureRequest.SerializeToString,
                 response_deserializer=passmanager_dot_common_dot_v0_dot_secure__pb2.SecureResponse.FromString,
                 _registered_method=True)
+        self.CreateMany = channel.unary_unary(
+                '/passmanager.data.v0.Data/CreateMany',
+                request_serializer=passmanager_dot_common_dot_v0_dot_secure__pb2.SecureRequest.SerializeToString,
+                response_deserializer=passmanager_dot_common_dot_v0_dot_secure__pb2.SecureResponse.FromString,
+                _registered_method=True)
         self.Edit = channel.unary_unary(
                 '/passmanager.data.v0.Data/Edit',
                 request_serializer=passmanager_dot_common_dot_v0_dot_secure__pb2.SecureRequest.SerializeToString,
                 response_deserializer=passmanager_dot_common_dot_v0_dot_secure__pb2.SecureResponse.FromString,
                 _registered_method=True)
+        self.EditMany = channel.unary_unary(
+                '/passmanager.data.v0.Data/EditMany',
+                request_serializer=passmanager_dot_common_dot_v0_dot_secure__pb2.SecureRequest.SerializeToString,
+                response_deserializer=passmanager_dot_common_dot_v0_dot_secure__pb2.SecureResponse.FromString,
+                _registered_method=True)
         self.Delete = channel.unary_unary(
                 '/passmanager.data.v0.Data/Delete',
                 request_serializer=passmanager_dot_common_dot_v0_dot_secure__pb2.SecureRequest.SerializeToString,
                 response_deserializer=passmanager_dot_common_dot_v0_dot_secure__pb2.SecureResponse.FromString,
                 _registered_method=True)
+        self.DeleteMany = channel.unary_unary(
+                '/passmanager.data.v0.Data/DeleteMany',
+                request_serializer=passmanager_dot_common_dot_v0_dot_secure__pb2.SecureRequest.SerializeToString,
+                response_deserializer=passmanager_dot_common_dot_v0_dot_secure__pb2.SecureResponse.FromString,
+                _registered_method=True)
         self.Get = channel.unary_unary(
                 '/passmanager.data.v0.Data/Get',
                 request_serializer=passmanager_dot_common_dot_v0_dot_secure__pb2.SecureRequest.SerializeToString,
                 response_deserializer=passmanager_dot_common_dot_v0_dot_secure__pb2.SecureResponse.FromString,
                 _registered_method=True)
+        self.GetMany = channel.unary_unary(
+                '/passmanager.data.v0.Data/GetMany',
+                request_serializer=passmanager_dot_common_dot_v0_dot_secure__pb2.SecureRequest.SerializeToString,
+                response_deserializer=passmanager_dot_common_dot_v0_dot_secure__pb2.SecureResponse.FromString,
+                _registered_method=True)
         self.List = channel.unary_unary(
                 '/passmanager.data.v0.Data/List',
                 request_serializer=passmanager_dot_common_dot_v0_dot_secure__pb2.SecureRequest.SerializeToString,
                 response_deserializer=passmanager_dot_common_dot_v0_dot_secure__pb2.SecureResponse.FromString,
                 _registered_method=True)
+        self.ListStream = channel.unary_stream(
+                '/passmanager.data.v0.Data/ListStream',
+                request_serializer=passmanager_dot_common_dot_v0_dot_secure__pb2.SecureRequest.SerializeToString,
+                response_deserializer=passmanager_dot_common_dot_v0_dot_secure__pb2.SecureResponse.FromString,
+                _registered_method=True)
         self.Health = channel.unary_unary(
                 '/passmanager.data.v0.Data/Health',
                 request_serializer=passmanager_dot_common_dot_v0_dot_error__pb2.HealthRequest.SerializeToString,
@@ -76,30 +101,60 @@ class DataServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def CreateMany(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def Edit(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def EditMany(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def Delete(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def DeleteMany(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def Get(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetMany(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def List(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def ListStream(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def Health(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -114,26 +169,51 @@ def add_DataServicer_to_server(servicer, server):
                     request_deserializer=passmanager_dot_common_dot_v0_dot_secure__pb2.SecureRequest.FromString,
                     response_serializer=passmanager_dot_common_dot_v0_dot_secure__pb2.SecureResponse.SerializeToString,
             ),
+            'CreateMany': grpc.unary_unary_rpc_method_handler(
+                    servicer.CreateMany,
+                    request_deserializer=passmanager_dot_common_dot_v0_dot_secure__pb2.SecureRequest.FromString,
+                    response_serializer=passmanager_dot_common_dot_v0_dot_secure__pb2.SecureResponse.SerializeToString,
+            ),
             'Edit': grpc.unary_unary_rpc_method_handler(
                     servicer.Edit,
                     request_deserializer=passmanager_dot_common_dot_v0_dot_secure__pb2.SecureRequest.FromString,
                     response_serializer=passmanager_dot_common_dot_v0_dot_secure__pb2.SecureResponse.SerializeToString,
             ),
+            'EditMany': grpc.unary_unary_rpc_method_handler(
+                    servicer.EditMany,
+                    request_deserializer=passmanager_dot_common_dot_v0_dot_secure__pb2.SecureRequest.FromString,
+                    response_serializer=passmanager_dot_common_dot_v0_dot_secure__pb2.SecureResponse.SerializeToString,
+            ),
             'Delete': grpc.unary_unary_rpc_method_handler(
                     servicer.Delete,
                     request_deserializer=passmanager_dot_common_dot_v0_dot_secure__pb2.SecureRequest.FromString,
                     response_serializer=passmanager_dot_common_dot_v0_dot_secure__pb2.SecureResponse.SerializeToString,
             ),
+            'DeleteMany': grpc.unary_unary_rpc_method_handler(
+                    servicer.DeleteMany,
+                    request_deserializer=passmanager_dot_common_dot_v0_dot_secure__pb2.SecureRequest.FromString,
+                    response_serializer=passmanager_dot_common_dot_v0_dot_secure__pb2.SecureResponse.SerializeToString,
+            ),
             'Get': grpc.unary_unary_rpc_method_handler(
                     servicer.Get,
                     request_deserializer=passmanager_dot_common_dot_v0_dot_secure__pb2.SecureRequest.FromString,
                     response_serializer=passmanager_dot_common_dot_v0_dot_secure__pb2.SecureResponse.SerializeToString,
             ),
+            'GetMany': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetMany,
+                    request_deserializer=passmanager_dot_common_dot_v0_dot_secure__pb2.SecureRequest.FromString,
+                    response_serializer=passmanager_dot_common_dot_v0_dot_secure__pb2.SecureResponse.SerializeToString,
+            ),
             'List': grpc.unary_unary_rpc_method_handler(
                     servicer.List,
                     request_deserializer=passmanager_dot_common_dot_v0_dot_secure__pb2.SecureRequest.FromString,
                     response_serializer=passmanager_dot_common_dot_v0_dot_secure__pb2.SecureResponse.SerializeToString,
             ),
+            'ListStream': grpc.unary_stream_rpc_method_handler(
+                    servicer.ListStream,
+                    request_deserializer=passmanager_dot_common_dot_v0_dot_secure__pb2.SecureRequest.FromString,
+                    response_serializer=passmanager_dot_common_dot_v0_dot_secure__pb2.SecureResponse.SerializeToString,
+            ),
             'Health': grpc.unary_unary_rpc_method_handler(
                     servicer.Health,
                     request_deserializer=passmanager_dot_common_dot_v0_dot_error__pb2.HealthRequest.FromString,
@@ -177,6 +257,33 @@ class Data(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def CreateMany(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/passmanager.data.v0.Data/CreateMany',
+            passmanager_dot_common_dot_v0_dot_secure__pb2.SecureRequest.SerializeToString,
+            passmanager_dot_common_dot_v0_dot_secure__pb2.SecureResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def Edit(request,
             target,
@@ -204,6 +311,33 @@ class Data(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def EditMany(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/passmanager.data.v0.Data/EditMany',
+            passmanager_dot_common_dot_v0_dot_secure__pb2.SecureRequest.SerializeToString,
+            passmanager_dot_common_dot_v0_dot_secure__pb2.SecureResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def Delete(request,
             target,
@@ -231,6 +365,33 @@ class Data(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def DeleteMany(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/passmanager.data.v0.Data/DeleteMany',
+            passmanager_dot_common_dot_v0_dot_secure__pb2.SecureRequest.SerializeToString,
+            passmanager_dot_common_dot_v0_dot_secure__pb2.SecureResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def Get(request,
             target,
@@ -258,6 +419,33 @@ class Data(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def GetMany(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/passmanager.data.v0.Data/GetMany',
+            passmanager_dot_common_dot_v0_dot_secure__pb2.SecureRequest.SerializeToString,
+            passmanager_dot_common_dot_v0_dot_secure__pb2.SecureResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def List(request,
             target,
@@ -285,6 +473,33 @@ class Data(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def ListStream(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/passmanager.data.v0.Data/ListStream',
+            passmanager_dot_common_dot_v0_dot_secure__pb2.SecureRequest.SerializeToString,
+            passmanager_dot_common_dot_v0_dot_secure__pb2.SecureResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def Health(request,
             target,
@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n/passmanager/password/v0/password_payloads.proto\x12\x17passmanager.password.v0\"n\n\x14PasswordStartRequest\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\x12\x10\n\x08srp_salt\x18\x02 \x01(\x0c\x12\x14\n\x0csrp_verifier\x18\x03 \x01(\x0c\x12\x17\n\x0fmaster_key_salt\x18\x04 \x01(\x0c\"\x82\x01\n\x15PasswordStartResponse\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\x12\x11\n\tpublic_id\x18\x02 \x01(\t\x12\x14\n\x0c\x65ph_public_b\x18\x03 \x01(\x0c\x12\x10\n\x08srp_salt\x18\x04 \x01(\x0c\x12\x17\n\x0fmaster_key_salt\x18\x05 \x01(\x0c\"h\n\x13PasswordAuthRequest\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\x12\x11\n\tpublic_id\x18\x02 \x01(\t\x12\x11\n\teph_val_a\x18\x03 \x01(\x0c\x12\x14\n\x0cproof_val_m1\x18\x04 \x01(\x0c\"n\n\x14PasswordAuthResponse\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\x12\x12\n\nsession_id\x18\x02 \x01(\t\x12\x17\n\x0fserver_proof_m2\x18\x03 \x01(\x0c\x12\x12\n\npublic_ids\x18\x04 \x03(\t\".\n\x15PasswordCommitRequest\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\"/\n\x16PasswordCommitResponse\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\"-\n\x14PasswordAbortRequest\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\".\n\x15PasswordAbortResponse\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\">\n\x12PasswordGetRequest\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\x12\x11\n\tpublic_id\x18\x02 \x01(\t\"g\n\x13PasswordGetResponse\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\x12\x11\n\tpublic_id\x18\x02 \x01(\t\x12\x12\n\nentry_name\x18\x03 \x01(\x0c\x12\x12\n\nentry_data\x18\x04 \x01(\x0c\"i\n\x15PasswordUpdateRequest\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\x12\x11\n\tpublic_id\x18\x02 \x01(\t\x12\x12\n\nentry_name\x18\x03 \x01(\x0c\x12\x12\n\nentry_data\x18\x04 \x01(\x0c\"B\n\x16PasswordUpdateResponse\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\x12\x11\n\tpublic_id\x18\x02 \x01(\tb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n/passmanager/password/v0/password_payloads.proto\x12\x17passmanager.password.v0\"n\n\x14PasswordStartRequest\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\x12\x10\n\x08srp_salt\x18\x02 \x01(\x0c\x12\x14\n\x0csrp_verifier\x18\x03 \x01(\x0c\x12\x17\n\x0fmaster_key_salt\x18\x04 \x01(\x0c\"\x82\x01\n\x15PasswordStartResponse\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\x12\x11\n\tpublic_id\x18\x02 \x01(\t\x12\x14\n\x0c\x65ph_public_b\x18\x03 \x01(\x0c\x12\x10\n\x08srp_salt\x18\x04 \x01(\x0c\x12\x17\n\x0fmaster_key_salt\x18\x05 \x01(\x0c\"h\n\x13PasswordAuthRequest\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\x12\x11\n\tpublic_id\x18\x02 \x01(\t\x12\x11\n\teph_val_a\x18\x03 \x01(\x0c\x12\x14\n\x0cproof_val_m1\x18\x04 \x01(\x0c\"n\n\x14PasswordAuthResponse\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\x12\x12\n\nsession_id\x18\x02 \x01(\t\x12\x17\n\x0fserver_proof_m2\x18\x03 \x01(\x0c\x12\x12\n\npublic_ids\x18\x04 \x03(\t\".\n\x15PasswordCommitRequest\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\"/\n\x16PasswordCommitResponse\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\"-\n\x14PasswordAbortRequest\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\".\n\x15PasswordAbortResponse\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\">\n\x12PasswordGetRequest\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\x12\x11\n\tpublic_id\x18\x02 \x01(\t\"g\n\x13PasswordGetResponse\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\x12\x11\n\tpublic_id\x18\x02 \x01(\t\x12\x12\n\nentry_name\x18\x03 \x01(\x0c\x12\x12\n\nentry_data\x18\x04 \x01(\x0c\"i\n\x15PasswordUpdateRequest\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\x12\x11\n\tpublic_id\x18\x02 \x01(\t\x12\x12\n\nentry_name\x18\x03 \x01(\x0c\x12\x12\n\nentry_data\x18\x04 \x01(\x0c\"B\n\x16PasswordUpdateResponse\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\x12\x11\n\tpublic_id\x18\x02 \x01(\t\"E\n\x18PasswordGetStreamRequest\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\x12\x12\n\nchunk_size\x18\x02 \x01(\r\"\xd5\x01\n\x19PasswordGetStreamResponse\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\x12V\n\rentry_details\x18\x02 \x03(\x0b\x32?.passmanager.password.v0.PasswordGetStreamResponse.EntryDetails\x1aI\n\x0c\x45ntryDetails\x12\x11\n\tpublic_id\x18\x01 \x01(\t\x12\x12\n\nentry_name\x18\x02 \x01(\x0c\x12\x12\n\nentry_data\x18\x03 \x01(\x0c\"\xc5\x01\n\x1bPasswordUpdateStreamRequest\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\x12K\n\x07\x65ntries\x18\x02 \x03(\x0b\x32:.passmanager.password.v0.PasswordUpdateStreamRequest.Entry\x1a\x42\n\x05\x45ntry\x12\x11\n\tpublic_id\x18\x01 \x01(\t\x12\x12\n\nentry_name\x18\x02 \x01(\x0c\x12\x12\n\nentry_data\x18\x03 \x01(\x0c\"L\n\x1cPasswordUpdateStreamResponse\x12\x15\n\rusername_hash\x18\x01 \x01(\x0c\x12\x15\n\rupdated_count\x18\x02 \x01(\rb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -55,4 +55,16 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_PASSWORDUPDATEREQUEST']._serialized_end=1005
   _globals['_PASSWORDUPDATERESPONSE']._serialized_start=1007
   _globals['_PASSWORDUPDATERESPONSE']._serialized_end=1073
+  _globals['_PASSWORDGETSTREAMREQUEST']._serialized_start=1075
+  _globals['_PASSWORDGETSTREAMREQUEST']._serialized_end=1144
+  _globals['_PASSWORDGETSTREAMRESPONSE']._serialized_start=1147
+  _globals['_PASSWORDGETSTREAMRESPONSE']._serialized_end=1360
+  _globals['_PASSWORDGETSTREAMRESPONSE_ENTRYDETAILS']._serialized_start=1287
+  _globals['_PASSWORDGETSTREAMRESPONSE_ENTRYDETAILS']._serialized_end=1360
+  _globals['_PASSWORDUPDATESTREAMREQUEST']._serialized_start=1363
+  _globals['_PASSWORDUPDATESTREAMREQUEST']._serialized_end=1560
+  _globals['_PASSWORDUPDATESTREAMREQUEST_ENTRY']._serialized_start=1494
+  _globals['_PASSWORDUPDATESTREAMREQUEST_ENTRY']._serialized_end=1560
+  _globals['_PASSWORDUPDATESTREAMRESPONSE']._serialized_start=1562
+  _globals['_PASSWORDUPDATESTREAMRESPONSE']._serialized_end=1638
 # @@protoc_insertion_point(module_scope)
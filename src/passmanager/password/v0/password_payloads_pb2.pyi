@@ -273,3 +273,121 @@ class PasswordUpdateResponse(_message.Message):
     def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
 
 Global___PasswordUpdateResponse: _TypeAlias = PasswordUpdateResponse  # noqa: Y015
+
+@_typing.final
+class PasswordGetStreamRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    USERNAME_HASH_FIELD_NUMBER: _builtins.int
+    CHUNK_SIZE_FIELD_NUMBER: _builtins.int
+    username_hash: _builtins.bytes
+    chunk_size: _builtins.int
+    def __init__(
+        self,
+        *,
+        username_hash: _builtins.bytes = ...,
+        chunk_size: _builtins.int = ...,
+    ) -> None: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["chunk_size", b"chunk_size", "username_hash", b"username_hash"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+
+Global___PasswordGetStreamRequest: _TypeAlias = PasswordGetStreamRequest  # noqa: Y015
+
+@_typing.final
+class PasswordGetStreamResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    @_typing.final
+    class EntryDetails(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        PUBLIC_ID_FIELD_NUMBER: _builtins.int
+        ENTRY_NAME_FIELD_NUMBER: _builtins.int
+        ENTRY_DATA_FIELD_NUMBER: _builtins.int
+        public_id: _builtins.str
+        entry_name: _builtins.bytes
+        entry_data: _builtins.bytes
+        def __init__(
+            self,
+            *,
+            public_id: _builtins.str = ...,
+            entry_name: _builtins.bytes = ...,
+            entry_data: _builtins.bytes = ...,
+        ) -> None: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["entry_data", b"entry_data", "entry_name", b"entry_name", "public_id", b"public_id"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+
+    USERNAME_HASH_FIELD_NUMBER: _builtins.int
+    ENTRY_DETAILS_FIELD_NUMBER: _builtins.int
+    username_hash: _builtins.bytes
+    @_builtins.property
+    def entry_details(self) -> _containers.RepeatedCompositeFieldContainer[Global___PasswordGetStreamResponse.EntryDetails]: ...
+    def __init__(
+        self,
+        *,
+        username_hash: _builtins.bytes = ...,
+        entry_details: _abc.Iterable[Global___PasswordGetStreamResponse.EntryDetails] | None = ...,
+    ) -> None: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["entry_details", b"entry_details", "username_hash", b"username_hash"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+
+Global___PasswordGetStreamResponse: _TypeAlias = PasswordGetStreamResponse  # noqa: Y015
+
+@_typing.final
+class PasswordUpdateStreamRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    @_typing.final
+    class Entry(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        PUBLIC_ID_FIELD_NUMBER: _builtins.int
+        ENTRY_NAME_FIELD_NUMBER: _builtins.int
+        ENTRY_DATA_FIELD_NUMBER: _builtins.int
+        public_id: _builtins.str
+        entry_name: _builtins.bytes
+        entry_data: _builtins.bytes
+        def __init__(
+            self,
+            *,
+            public_id: _builtins.str = ...,
+            entry_name: _builtins.bytes = ...,
+            entry_data: _builtins.bytes = ...,
+        ) -> None: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["entry_data", b"entry_data", "entry_name", b"entry_name", "public_id", b"public_id"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+
+    USERNAME_HASH_FIELD_NUMBER: _builtins.int
+    ENTRIES_FIELD_NUMBER: _builtins.int
+    username_hash: _builtins.bytes
+    @_builtins.property
+    def entries(self) -> _containers.RepeatedCompositeFieldContainer[Global___PasswordUpdateStreamRequest.Entry]: ...
+    def __init__(
+        self,
+        *,
+        username_hash: _builtins.bytes = ...,
+        entries: _abc.Iterable[Global___PasswordUpdateStreamRequest.Entry] | None = ...,
+    ) -> None: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["entries", b"entries", "username_hash", b"username_hash"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+
+Global___PasswordUpdateStreamRequest: _TypeAlias = PasswordUpdateStreamRequest  # noqa: Y015
+
+@_typing.final
+class PasswordUpdateStreamResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    USERNAME_HASH_FIELD_NUMBER: _builtins.int
+    UPDATED_COUNT_FIELD_NUMBER: _builtins.int
+    username_hash: _builtins.bytes
+    updated_count: _builtins.int
+    def __init__(
+        self,
+        *,
+        username_hash: _builtins.bytes = ...,
+        updated_count: _builtins.int = ...,
+    ) -> None: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["updated_count", b"updated_count", "username_hash", b"username_hash"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+
+Global___PasswordUpdateStreamResponse: _TypeAlias = PasswordUpdateStreamResponse  # noqa: Y015
@@ -1,4 +1,9 @@
+import signal
+import asyncio
+import threading
 from concurrent import futures
+from dataclasses import dataclass, field
+from typing import Optional, List, Tuple, Dict, Any
 
 from logging import getLogger
 logger = getLogger("api")
@@ -14,15 +19,164 @@ from user_service import UserService
 from password_service import PasswordService
 from session_service import SessionService
 from data_service import DataService
+from async_services import (
+    AsyncExecutors,
+    AsyncUserService,
+    AsyncPasswordService,
+    AsyncSessionService,
+    AsyncDataService
+)
 
+from metrics_interceptor import (
+    MetricsInterceptor,
+    AsyncMetricsInterceptor,
+    MetricsEndpoint
+)
 
-def serve():
+from utils import DatabaseConfig, MetricsRegistry, StageTimer, ExpiryReaper
+from database import QueryStats
+from cryptography import EphemeralPool
+
+
+# Config keys of the [server] section passed straight through as gRPC channel arguments
+SERVER_CHANNEL_ARGS = {
+    "max_send_message_length": "grpc.max_send_message_length",
+    "max_receive_message_length": "grpc.max_receive_message_length",
+    "keepalive_time_ms": "grpc.keepalive_time_ms",
+    "keepalive_timeout_ms": "grpc.keepalive_timeout_ms",
+    "keepalive_permit_without_calls": "grpc.keepalive_permit_without_calls",
+    "min_ping_interval_without_data_ms": "grpc.http2.min_ping_interval_without_data_ms",
+    "max_ping_strikes": "grpc.http2.max_ping_strikes"
+}
+
+SERVER_COMPRESSION = {
+    "none": grpc.Compression.NoCompression,
+    "deflate": grpc.Compression.Deflate,
+    "gzip": grpc.Compression.Gzip
+}
+
+# Threaded runs grpc.server on a thread pool, async runs grpc.aio on an event loop
+SERVER_MODES = ("threaded", "async")
+
+
+@dataclass
+class ServerSettings():
+    """Server tuning, as read from the [server] config section"""
+
+    mode: str = "threaded"
+    port: int = 50051
+    max_workers: int = 10
+    maximum_concurrent_rpcs: Optional[int] = None
+    compression: grpc.Compression = grpc.Compression.NoCompression
+    options: List[Tuple[str, Any]] = field(default_factory=list)
+
+
+    @staticmethod
+    def from_config(
+        config: Dict[str, str]
+    ) -> "ServerSettings":
+        """
+        Build the server settings from a config section, with unset keys left at their defaults
+
+        Returns:
+            (ServerSettings)    The validated server settings
+        """
+        settings = ServerSettings()
+
+        for name, value in config.items():
+            try:
+                if name == "mode":
+                    if value.lower() not in SERVER_MODES:
+                        raise ValueError
+                    settings.mode = value.lower()
+                    continue
+
+                if name == "compression":
+                    if value.lower() not in SERVER_COMPRESSION:
+                        raise ValueError
+                    settings.compression = SERVER_COMPRESSION[value.lower()]
+                    continue
+
+                number = int(value)
+                if number < 0:
+                    raise ValueError
+            except ValueError as e:
+                raise ValueError(f"Invalid value for server setting {name}: {value}") from e
+
+            if name == "port":
+                settings.port = number
+            elif name == "max_workers":
+                if number < 1:
+                    raise ValueError(f"Invalid value for server setting {name}: {value}")
+                settings.max_workers = number
+            elif name == "maximum_concurrent_rpcs":
+                settings.maximum_concurrent_rpcs = number or None
+            elif name in SERVER_CHANNEL_ARGS:
+                settings.options.append((SERVER_CHANNEL_ARGS[name], number))
+            else:
+                raise ValueError(f"Unknown server setting: {name}")
+
+        return settings
+
+
+    @staticmethod
+    def load() -> "ServerSettings":
+        """
+        Read the server settings from the loaded config
+
+        Returns:
+            (ServerSettings)    The validated server settings
+        """
+        return ServerSettings.from_config(DatabaseConfig.get_section("server"))
+
+
+def _start_metrics(
+    port_offset: int = 0
+) -> bool:
+    """
+    Start the /metrics endpoint if configured, with a port of 0 leaving it disabled
+
+    Returns:
+        (bool)  True if metrics are being collected, false otherwise
+    """
+    metrics_config = DatabaseConfig.get_section("metrics")
+    port = int(metrics_config.get("port", 0))
+    if not port:
+        return False
+
+    MetricsRegistry.register_gauges("passmanager_ephemeral_pool", EphemeralPool.metrics)
+    MetricsRegistry.register_gauges("passmanager_expiry_reaper", ExpiryReaper.metrics)
+    MetricsRegistry.register_collector("stage_timer", StageTimer.render)
+    MetricsRegistry.register_collector("query_stats", QueryStats.render)
+    MetricsEndpoint.start(metrics_config.get("host", "127.0.0.1"), port + port_offset)
+    return True
+
+
+def serve(
+    options: Optional[List[Tuple[str, Any]]] = None,
+    grace: Optional[float] = None,
+    metrics_port_offset: int = 0
+):
+    """
+    Run the server until terminated, stopping gracefully on SIGTERM
+
+    Args:
+        options (list):             gRPC channel arguments for the server
+        grace (float):              Seconds in-flight RPCs are given to finish on shutdown
+        metrics_port_offset (int):  Offset added to the metrics port, for each pre-fork worker
+    """
+    settings = ServerSettings.load()
+    interceptors = [MetricsInterceptor()] if _start_metrics(metrics_port_offset) else []
 
     # TODO - Use real server credentials
     server_credentials = grpc.local_server_credentials()
 
     server = grpc.server(
-        futures.ThreadPoolExecutor(max_workers=10)
+        futures.ThreadPoolExecutor(max_workers=settings.max_workers),
+        options=settings.options + (options or []),
+        interceptors=interceptors,
+        maximum_concurrent_rpcs=settings.maximum_concurrent_rpcs,
+        compression=settings.compression
     )
 
     user_grpc.add_UserServicer_to_server(
@@ -45,9 +199,117 @@ def serve():
         server
     )
 
-    # TODO - Define specific port
-    server.add_secure_port("[::]:50051", server_credentials)
+    server.add_secure_port(f"[::]:{settings.port}", server_credentials)
     server.start()
 
-    logger.info("Server running on port 50051")
-    server.wait_for_termination()
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM, lambda signum, frame: server.stop(grace))
+
+    logger.info("Server running on port %s", settings.port)
+    try:
+        server.wait_for_termination()
+    finally:
+        MetricsEndpoint.stop()
+
+
+async def _serve_async(
+    settings: ServerSettings,
+    options: Optional[List[Tuple[str, Any]]] = None,
+    grace: Optional[float] = None,
+    metrics_port_offset: int = 0
+):
+    interceptors = [AsyncMetricsInterceptor()] if _start_metrics(metrics_port_offset) else []
+
+    # TODO - Use real server credentials
+    server_credentials = grpc.local_server_credentials()
+
+    server = grpc.aio.server(
+        interceptors=interceptors,
+        options=settings.options + (options or []),
+        maximum_concurrent_rpcs=settings.maximum_concurrent_rpcs,
+        compression=settings.compression
+    )
+
+    user_grpc.add_UserServicer_to_server(
+        AsyncUserService(),
+        server
+    )
+
+    password_grpc.add_PasswordServicer_to_server(
+        AsyncPasswordService(),
+        server
+    )
+
+    session_grpc.add_SessionServicer_to_server(
+        AsyncSessionService(),
+        server
+    )
+
+    data_grpc.add_DataServicer_to_server(
+        AsyncDataService(),
+        server
+    )
+
+    server.add_secure_port(f"[::]:{settings.port}", server_credentials)
+    await server.start()
+
+    if threading.current_thread() is threading.main_thread():
+        asyncio.get_running_loop().add_signal_handler(
+            signal.SIGTERM,
+            lambda: asyncio.ensure_future(server.stop(grace))
+        )
+
+    logger.info("Async server running on port %s", settings.port)
+    try:
+        await server.wait_for_termination()
+    finally:
+        await server.stop(grace=None)
+        MetricsEndpoint.stop()
+
+
+def serve_async(
+    options: Optional[List[Tuple[str, Any]]] = None,
+    grace: Optional[float] = None,
+    metrics_port_offset: int = 0
+):
+    """
+    Run the server on an asyncio event loop, dispatching handlers to bounded executors
+
+    Idle connections cost no threads, so only the executor sizes bound the
+    handler threads, and max_workers of the [server] section is unused.
+
+    Args:
+        options (list):             gRPC channel arguments for the server
+        grace (float):              Seconds in-flight RPCs are given to finish on shutdown
+        metrics_port_offset (int):  Offset added to the metrics port, for each pre-fork worker
+    """
+    settings = ServerSettings.load()
+    server_config = DatabaseConfig.get_section("async_server")
+
+    AsyncExecutors.start(
+        database_workers=int(server_config.get("database_workers", 10)),
+        crypto_workers=int(server_config.get("crypto_workers", 4))
+    )
+    try:
+        asyncio.run(_serve_async(settings, options, grace, metrics_port_offset))
+    finally:
+        AsyncExecutors.stop()
+
+
+def serve_configured(
+    options: Optional[List[Tuple[str, Any]]] = None,
+    grace: Optional[float] = None,
+    metrics_port_offset: int = 0
+):
+    """
+    Run the server in the mode set by the [server] section, threaded unless set to async
+
+    Args:
+        options (list):             gRPC channel arguments for the server
+        grace (float):              Seconds in-flight RPCs are given to finish on shutdown
+        metrics_port_offset (int):  Offset added to the metrics port, for each pre-fork worker
+    """
+    if ServerSettings.load().mode == "async":
+        serve_async(options, grace, metrics_port_offset)
+    else:
+        serve(options, grace, metrics_port_offset)
@@ -0,0 +1,275 @@
+import asyncio
+from functools import partial
+from typing import Optional, Callable, Iterator, AsyncIterator, Tuple, Any
+from concurrent.futures import ThreadPoolExecutor
+
+from logging import getLogger
+logger = getLogger("api")
+
+from passmanager.user.v0.user_pb2_grpc import UserServicer
+from passmanager.password.v0.password_pb2_grpc import PasswordServicer
+from passmanager.session.v0.session_pb2_grpc import SessionServicer
+from passmanager.data.v0.data_pb2_grpc import DataServicer
+from passmanager.common.v0.error_pb2 import (
+    HealthResponse
+)
+
+from cryptography import SRPSteps
+from user_handler import UserHandler
+from password_handler import PasswordHandler, UpdateStreamProgress
+from session_handler import SessionHandler
+from data_handler import DataHandler
+
+
+_STREAM_END = object()
+
+
+def _advance(
+    steps: SRPSteps[Any],
+    value: Any,
+    error: Optional[BaseException]
+) -> Tuple[bool, Any]:
+    """
+    Resume the steps with the result of their last SRP future
+
+    StopIteration cannot pass through an asyncio future, so the end of the steps is returned as a flag.
+
+    Returns:
+        (bool)  True if the steps finished, false otherwise
+        (Any)   The value returned by the steps, or the next SRP future
+    """
+    try:
+        return False, (steps.throw(error) if error is not None else steps.send(value))
+    except StopIteration as stop:
+        return True, stop.value
+
+
+class AsyncExecutors():
+    """Bounded executors used by the async servicers for blocking handler work"""
+
+    _database: Optional[ThreadPoolExecutor] = None
+    _crypto: Optional[ThreadPoolExecutor] = None
+
+
+    @staticmethod
+    def start(
+        database_workers: int,
+        crypto_workers: int
+    ):
+        """
+        Create the executors for database bound and crypto bound handlers
+
+        Args:
+            database_workers (int): Threads for handlers dominated by database work
+            crypto_workers (int):   Threads for handlers dominated by SRP work
+        """
+        if database_workers < 1 or crypto_workers < 1:
+            raise ValueError(f"Invalid executor worker counts: {database_workers}, {crypto_workers}")
+        if AsyncExecutors._database is not None:
+            raise RuntimeError("Async executors already started.")
+
+        AsyncExecutors._database = ThreadPoolExecutor(
+            max_workers=database_workers,
+            thread_name_prefix="database"
+        )
+        AsyncExecutors._crypto = ThreadPoolExecutor(
+            max_workers=crypto_workers,
+            thread_name_prefix="crypto"
+        )
+
+
+    @staticmethod
+    def stop():
+        """Shut down the executors, waiting for running handlers to finish"""
+        for executor in (AsyncExecutors._database, AsyncExecutors._crypto):
+            if executor is not None:
+                executor.shutdown(wait=True)
+        AsyncExecutors._database = None
+        AsyncExecutors._crypto = None
+
+
+    @staticmethod
+    async def run_database(
+        function: Callable[..., Any],
+        *args: Any
+    ) -> Any:
+        """Run a blocking, database bound handler without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(AsyncExecutors._database, partial(function, *args))
+
+
+    @staticmethod
+    async def stream_database(
+        responses: Iterator[Any]
+    ) -> AsyncIterator[Any]:
+        """Consume a blocking, database bound generator one item at a time on the database executor"""
+        try:
+            while True:
+                response = await AsyncExecutors.run_database(next, responses, _STREAM_END)
+                if response is _STREAM_END:
+                    return
+                yield response
+        finally:
+            await AsyncExecutors.run_database(responses.close)
+
+
+    @staticmethod
+    async def run_srp(
+        steps: SRPSteps[Any]
+    ) -> Any:
+        """
+        Run an SRP bound handler's steps, awaiting each SRP future rather than blocking a thread on it
+
+        The steps run on the crypto executor between futures, which releases its
+        thread while the SRP offload pool computes.
+        """
+        loop = asyncio.get_running_loop()
+        value: Any = None
+        error: Optional[BaseException] = None
+        while True:
+            done, result = await loop.run_in_executor(
+                AsyncExecutors._crypto,
+                partial(_advance, steps, value, error)
+            )
+            if done:
+                return result
+
+            try:
+                value, error = await asyncio.wrap_future(result), None
+            except Exception as e:
+                value, error = None, e
+
+
+class AsyncUserService(UserServicer):
+
+    async def Register(self, request, context):
+        logger.info("Register called by: %s", context.peer())
+        return await AsyncExecutors.run_database(UserHandler.register, request)
+
+    async def Username(self, request, context):
+        logger.info("Username called by: %s", context.peer())
+        return await AsyncExecutors.run_database(UserHandler.username, request)
+
+    async def Delete(self, request, context):
+        logger.info("Delete called by: %s", context.peer())
+        return await AsyncExecutors.run_database(UserHandler.delete, request)
+
+    async def Health(self, request, context):
+        logger.info("Health called by: %s", context.peer())
+        return HealthResponse(health=True)
+
+
+class AsyncPasswordService(PasswordServicer):
+
+    async def Start(self, request, context):
+        logger.info("Start called by: %s", context.peer())
+        return await AsyncExecutors.run_srp(PasswordHandler.start_steps(request))
+
+    async def Auth(self, request, context):
+        logger.info("Auth called by: %s", context.peer())
+        return await AsyncExecutors.run_srp(PasswordHandler.auth_steps(request))
+
+    async def Commit(self, request, context):
+        logger.info("Commit called by: %s", context.peer())
+        return await AsyncExecutors.run_database(PasswordHandler.commit, request)
+
+    async def Abort(self, request, context):
+        logger.info("Abort called by: %s", context.peer())
+        return await AsyncExecutors.run_database(PasswordHandler.abort, request)
+
+    async def Get(self, request, context):
+        logger.info("Get called by: %s", context.peer())
+        return await AsyncExecutors.run_database(PasswordHandler.get, request)
+
+    async def GetStream(self, request, context):
+        logger.info("GetStream called by: %s", context.peer())
+        async for response in AsyncExecutors.stream_database(PasswordHandler.get_stream(request)):
+            yield response
+
+    async def Update(self, request, context):
+        logger.info("Update called by: %s", context.peer())
+        return await AsyncExecutors.run_database(PasswordHandler.update, request)
+
+    async def UpdateStream(self, request_iterator, context):
+        logger.info("UpdateStream called by: %s", context.peer())
+        progress = UpdateStreamProgress()
+        async for request in request_iterator:
+            failure = await AsyncExecutors.run_database(PasswordHandler.update_batch, request, progress)
+            if failure is not None:
+                return failure
+        return await AsyncExecutors.run_database(PasswordHandler.update_stream_response, progress)
+
+    async def Health(self, request, context):
+        logger.info("Health called by: %s", context.peer())
+        return HealthResponse(health=True)
+
+
+class AsyncSessionService(SessionServicer):
+
+    async def Start(self, request, context):
+        logger.info("Start called by: %s", context.peer())
+        return await AsyncExecutors.run_srp(SessionHandler.start_steps(request))
+
+    async def Auth(self, request, context):
+        logger.info("Auth called by: %s", context.peer())
+        return await AsyncExecutors.run_srp(SessionHandler.auth_steps(request))
+
+    async def Delete(self, request, context):
+        logger.info("Delete called by: %s", context.peer())
+        return await AsyncExecutors.run_database(SessionHandler.delete, request)
+
+    async def Clean(self, request, context):
+        logger.info("Clean called by: %s", context.peer())
+        return await AsyncExecutors.run_database(SessionHandler.clean, request)
+
+    async def Health(self, request, context):
+        logger.info("Health called by: %s", context.peer())
+        return HealthResponse(health=True)
+
+
+class AsyncDataService(DataServicer):
+
+    async def Create(self, request, context):
+        logger.info("Create called by: %s", context.peer())
+        return await AsyncExecutors.run_database(DataHandler.create, request)
+
+    async def CreateMany(self, request, context):
+        logger.info("CreateMany called by: %s", context.peer())
+        return await AsyncExecutors.run_database(DataHandler.create_many, request)
+
+    async def Edit(self, request, context):
+        logger.info("Edit called by: %s", context.peer())
+        return await AsyncExecutors.run_database(DataHandler.edit, request)
+
+    async def EditMany(self, request, context):
+        logger.info("EditMany called by: %s", context.peer())
+        return await AsyncExecutors.run_database(DataHandler.edit_many, request)
+
+    async def Delete(self, request, context):
+        logger.info("Delete called by: %s", context.peer())
+        return await AsyncExecutors.run_database(DataHandler.delete, request)
+
+    async def DeleteMany(self, request, context):
+        logger.info("DeleteMany called by: %s", context.peer())
+        return await AsyncExecutors.run_database(DataHandler.delete_many, request)
+
+    async def Get(self, request, context):
+        logger.info("Get called by: %s", context.peer())
+        return await AsyncExecutors.run_database(DataHandler.get, request)
+
+    async def GetMany(self, request, context):
+        logger.info("GetMany called by: %s", context.peer())
+        return await AsyncExecutors.run_database(DataHandler.get_many, request)
+
+    async def List(self, request, context):
+        logger.info("List called by: %s", context.peer())
+        return await AsyncExecutors.run_database(DataHandler.list, request)
+
+    async def ListStream(self, request, context):
+        logger.info("ListStream called by: %s", context.peer())
+        async for response in AsyncExecutors.stream_database(DataHandler.list_stream(request)):
+            yield response
+
+    async def Health(self, request, context):
+        logger.info("Health called by: %s", context.peer())
+        return HealthResponse(health=True)
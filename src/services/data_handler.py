@@ -1,17 +1,28 @@
+from typing import Iterator, List, Tuple, Optional
+
 from google.protobuf.message import DecodeError
 from passmanager.common.v0.secure_pb2 import (
     SecureRequest,
     SecureResponse
 )
 from passmanager.data.v0.data_payloads_pb2 import (
+    DataBatchResult,
     DataCreateRequest,
     DataCreateResponse,
+    DataCreateManyRequest,
+    DataCreateManyResponse,
     DataEditRequest,
     DataEditResponse,
+    DataEditManyRequest,
+    DataEditManyResponse,
     DataDeleteRequest,
     DataDeleteResponse,
+    DataDeleteManyRequest,
+    DataDeleteManyResponse,
     DataGetRequest,
     DataGetResponse,
+    DataGetManyRequest,
+    DataGetManyResponse,
     DataListRequest,
     DataListResponse
 )
@@ -19,20 +30,39 @@ from passmanager.common.v0.error_pb2 import (
     Failure
 )
 
-from utils import ServiceUtils, SessionManager, DBUtilsData
+from utils import ServiceUtils, SessionManager, DBUtilsData, StageTimer
 from enums import FailureReason
 
 
 class DataHandler:
 
+    STREAM_CHUNK_SIZE: int = 100
+
+
+    @staticmethod
+    def _batch_results(
+        results: List[Tuple[str, Optional[FailureReason]]]
+    ) -> List[DataBatchResult]:
+        return [
+            DataBatchResult(
+                public_id=public_id,
+                success=failure_reason is None,
+                error=failure_reason.error_proto("public_id") if failure_reason else None
+            )
+            for public_id, failure_reason in results
+        ]
+
+
     @staticmethod
     def create(secure_request: SecureRequest) -> SecureResponse:
         error_list = []
+        timer = StageTimer.start("DataHandler.create")
 
         # Open secure session
         open_session = SessionManager.open_session(
             request=secure_request
         )
+        timer.mark("open")
         status, failure_reason, decrypted_bytes, user_id = open_session
         if not status:
             assert failure_reason
@@ -49,6 +79,7 @@ class DataHandler:
         # Convert to Protobuf Message
         try:
             request = DataCreateRequest.FromString(decrypted_bytes)
+            timer.mark("decode")
         except DecodeError:
             error_list.append(FailureReason.DECRYPTION.error_proto())
 
@@ -70,6 +101,7 @@ class DataHandler:
         status = ServiceUtils.sanitise_entry_data(request.entry_data)
         if status:
             error_list.append(status.error_proto("entry_data"))
+        timer.mark("sanitise")
 
         # Return Errors
         if len(error_list) > 0:
@@ -87,6 +119,7 @@ class DataHandler:
             entry_name=request.entry_name,
             entry_data=request.entry_data
         )
+        timer.mark("database")
 
         # Return error
         if not status:
@@ -106,20 +139,118 @@ class DataHandler:
             username_hash=request.username_hash,
             public_id=public_id
         )
-        return SessionManager.seal_session(
+        secure_response = SessionManager.seal_session(
             session_id=secure_request.session_id,
             response=response.SerializeToString()
         )
+        timer.mark("seal")
+        return secure_response
+
+
+    @staticmethod
+    def create_many(secure_request: SecureRequest) -> SecureResponse:
+        error_list = []
+        timer = StageTimer.start("DataHandler.create_many")
+
+        # Open secure session
+        open_session = SessionManager.open_session(
+            request=secure_request
+        )
+        timer.mark("open")
+        status, failure_reason, decrypted_bytes, user_id = open_session
+        if not status:
+            assert failure_reason
+            error_list.append(failure_reason.error_proto())
+
+            failure = Failure(
+                error_list=error_list
+            )
+            return SecureResponse(
+                success=False,
+                failure_data=failure
+            )
+
+        # Convert to Protobuf Message
+        try:
+            request = DataCreateManyRequest.FromString(decrypted_bytes)
+            timer.mark("decode")
+        except DecodeError:
+            error_list.append(FailureReason.DECRYPTION.error_proto())
+
+            failure = Failure(
+                error_list=error_list
+            )
+            return SecureResponse(
+                success=False,
+                failure_data=failure
+            )
+
+        # Sanitise Inputs
+        status = ServiceUtils.sanitise_username_hash(request.username_hash)
+        if status:
+            error_list.append(status.error_proto("username_hash"))
+        for entry in request.entries:
+            status = ServiceUtils.sanitise_entry_name(entry.entry_name)
+            if not status:
+                status = ServiceUtils.sanitise_entry_data(entry.entry_data)
+            if status:
+                error_list.append(status.error_proto("entries"))
+                break
+        timer.mark("sanitise")
+
+        # Return Errors
+        if len(error_list) > 0:
+            failure = Failure(
+                error_list=error_list
+            )
+            return SecureResponse(
+                success=False,
+                failure_data=failure
+            )
+
+        # Call Util function
+        status, failure_reason, public_ids = DBUtilsData.create_many(
+            user_id=user_id,
+            entries=[(entry.entry_name, entry.entry_data) for entry in request.entries]
+        )
+        timer.mark("database")
+
+        # Return error
+        if not status:
+            assert failure_reason
+            error_list.append(failure_reason.error_proto())
+
+            failure = Failure(
+                error_list=error_list
+            )
+            return SecureResponse(
+                success=False,
+                failure_data=failure
+            )
+
+        # Successful Return
+        response = DataCreateManyResponse(
+            username_hash=request.username_hash,
+            results=DataHandler._batch_results([(public_id, None) for public_id in public_ids])
+        )
+        secure_response = SessionManager.seal_session(
+            session_id=secure_request.session_id,
+            response=response.SerializeToString()
+        )
+        timer.mark("seal")
+        return secure_response
 
 
     @staticmethod
     def edit(secure_request: SecureRequest) -> SecureResponse:
         error_list = []
+        timer = StageTimer.start("DataHandler.edit")
 
         # Open secure session
         open_session = SessionManager.open_session(
             request=secure_request
         )
+        timer.mark("open")
         status, failure_reason, decrypted_bytes, user_id = open_session
         if not status:
             assert failure_reason
@@ -136,6 +267,7 @@ class DataHandler:
         # Convert to Protobuf Message
         try:
             request = DataEditRequest.FromString(decrypted_bytes)
+            timer.mark("decode")
         except DecodeError:
             error_list.append(FailureReason.DECRYPTION.error_proto())
 
@@ -162,6 +294,7 @@ class DataHandler:
             status = ServiceUtils.sanitise_entry_data(request.entry_data)
             if status:
                 error_list.append(status.error_proto("entry_data"))
+        timer.mark("sanitise")
 
         # Return Errors
         if len(error_list) > 0:
@@ -180,6 +313,7 @@ class DataHandler:
             entry_name=request.entry_name if request.HasField("entry_name") else None,
             entry_data=request.entry_data if request.HasField("entry_data") else None
         )
+        timer.mark("database")
 
         # Return error
         if not status:
@@ -199,20 +333,127 @@ class DataHandler:
             username_hash=request.username_hash,
             public_id=request.public_id
         )
-        return SessionManager.seal_session(
+        secure_response = SessionManager.seal_session(
+            session_id=secure_request.session_id,
+            response=response.SerializeToString()
+        )
+        timer.mark("seal")
+        return secure_response
+
+
+    @staticmethod
+    def edit_many(secure_request: SecureRequest) -> SecureResponse:
+        error_list = []
+        timer = StageTimer.start("DataHandler.edit_many")
+
+        # Open secure session
+        open_session = SessionManager.open_session(
+            request=secure_request
+        )
+        timer.mark("open")
+        status, failure_reason, decrypted_bytes, user_id = open_session
+        if not status:
+            assert failure_reason
+            error_list.append(failure_reason.error_proto())
+
+            failure = Failure(
+                error_list=error_list
+            )
+            return SecureResponse(
+                success=False,
+                failure_data=failure
+            )
+
+        # Convert to Protobuf Message
+        try:
+            request = DataEditManyRequest.FromString(decrypted_bytes)
+            timer.mark("decode")
+        except DecodeError:
+            error_list.append(FailureReason.DECRYPTION.error_proto())
+
+            failure = Failure(
+                error_list=error_list
+            )
+            return SecureResponse(
+                success=False,
+                failure_data=failure
+            )
+
+        # Sanitise Inputs
+        status = ServiceUtils.sanitise_username_hash(request.username_hash)
+        if status:
+            error_list.append(status.error_proto("username_hash"))
+        for entry in request.entries:
+            status = ServiceUtils.sanitise_public_id(entry.public_id)
+            if not status and entry.HasField("entry_name"):
+                status = ServiceUtils.sanitise_entry_name(entry.entry_name)
+            if not status and entry.HasField("entry_data"):
+                status = ServiceUtils.sanitise_entry_data(entry.entry_data)
+            if status:
+                error_list.append(status.error_proto("entries"))
+                break
+        timer.mark("sanitise")
+
+        # Return Errors
+        if len(error_list) > 0:
+            failure = Failure(
+                error_list=error_list
+            )
+            return SecureResponse(
+                success=False,
+                failure_data=failure
+            )
+
+        # Call Util function
+        status, failure_reason, results = DBUtilsData.edit_many(
+            user_id=user_id,
+            edits=[
+                (
+                    entry.public_id,
+                    entry.entry_name if entry.HasField("entry_name") else None,
+                    entry.entry_data if entry.HasField("entry_data") else None
+                )
+                for entry in request.entries
+            ]
+        )
+        timer.mark("database")
+
+        # Return error
+        if not status:
+            assert failure_reason
+            error_list.append(failure_reason.error_proto())
+
+            failure = Failure(
+                error_list=error_list
+            )
+            return SecureResponse(
+                success=False,
+                failure_data=failure
+            )
+
+        # Successful Return
+        response = DataEditManyResponse(
+            username_hash=request.username_hash,
+            results=DataHandler._batch_results(results)
+        )
+        secure_response = SessionManager.seal_session(
             session_id=secure_request.session_id,
             response=response.SerializeToString()
         )
+        timer.mark("seal")
+        return secure_response
 
 
     @staticmethod
     def delete(secure_request: SecureRequest) -> SecureResponse:
         error_list = []
+        timer = StageTimer.start("DataHandler.delete")
 
         # Open secure session
         open_session = SessionManager.open_session(
             request=secure_request
         )
+        timer.mark("open")
         status, failure_reason, decrypted_bytes, user_id = open_session
         if not status:
             assert failure_reason
@@ -229,6 +470,7 @@ class DataHandler:
         # Convert to Protobuf Message
         try:
             request = DataDeleteRequest.FromString(decrypted_bytes)
+            timer.mark("decode")
         except DecodeError:
             error_list.append(FailureReason.DECRYPTION.error_proto())
 
@@ -247,6 +489,7 @@ class DataHandler:
         status = ServiceUtils.sanitise_public_id(request.public_id)
         if status:
             error_list.append(status.error_proto("public_id"))
+        timer.mark("sanitise")
 
         # Return Errors
         if len(error_list) > 0:
@@ -263,6 +506,7 @@ class DataHandler:
             user_id=user_id,
             public_id=request.public_id
         )
+        timer.mark("database")
 
         # Return error
         if not status:
@@ -282,20 +526,116 @@ class DataHandler:
             username_hash=request.username_hash,
             public_id=request.public_id
         )
-        return SessionManager.seal_session(
+        secure_response = SessionManager.seal_session(
             session_id=secure_request.session_id,
             response=response.SerializeToString()
         )
+        timer.mark("seal")
+        return secure_response
+
+
+    @staticmethod
+    def delete_many(secure_request: SecureRequest) -> SecureResponse:
+        error_list = []
+        timer = StageTimer.start("DataHandler.delete_many")
+
+        # Open secure session
+        open_session = SessionManager.open_session(
+            request=secure_request
+        )
+        timer.mark("open")
+        status, failure_reason, decrypted_bytes, user_id = open_session
+        if not status:
+            assert failure_reason
+            error_list.append(failure_reason.error_proto())
+
+            failure = Failure(
+                error_list=error_list
+            )
+            return SecureResponse(
+                success=False,
+                failure_data=failure
+            )
+
+        # Convert to Protobuf Message
+        try:
+            request = DataDeleteManyRequest.FromString(decrypted_bytes)
+            timer.mark("decode")
+        except DecodeError:
+            error_list.append(FailureReason.DECRYPTION.error_proto())
+
+            failure = Failure(
+                error_list=error_list
+            )
+            return SecureResponse(
+                success=False,
+                failure_data=failure
+            )
+
+        # Sanitise Inputs
+        status = ServiceUtils.sanitise_username_hash(request.username_hash)
+        if status:
+            error_list.append(status.error_proto("username_hash"))
+        for public_id in request.public_ids:
+            status = ServiceUtils.sanitise_public_id(public_id)
+            if status:
+                error_list.append(status.error_proto("public_ids"))
+                break
+        timer.mark("sanitise")
+
+        # Return Errors
+        if len(error_list) > 0:
+            failure = Failure(
+                error_list=error_list
+            )
+            return SecureResponse(
+                success=False,
+                failure_data=failure
+            )
+
+        # Call Util function
+        status, failure_reason, results = DBUtilsData.delete_many(
+            user_id=user_id,
+            public_ids=list(request.public_ids)
+        )
+        timer.mark("database")
+
+        # Return error
+        if not status:
+            assert failure_reason
+            error_list.append(failure_reason.error_proto())
+
+            failure = Failure(
+                error_list=error_list
+            )
+            return SecureResponse(
+                success=False,
+                failure_data=failure
+            )
+
+        # Successful Return
+        response = DataDeleteManyResponse(
+            username_hash=request.username_hash,
+            results=DataHandler._batch_results(results)
+        )
+        secure_response = SessionManager.seal_session(
+            session_id=secure_request.session_id,
+            response=response.SerializeToString()
+        )
+        timer.mark("seal")
+        return secure_response
 
 
     @staticmethod
     def get(secure_request: SecureRequest) -> SecureResponse:
         error_list = []
+        timer = StageTimer.start("DataHandler.get")
 
         # Open secure session
         open_session = SessionManager.open_session(
             request=secure_request
         )
+        timer.mark("open")
         status, failure_reason, decrypted_bytes, user_id = open_session
         if not status:
             assert failure_reason
@@ -312,6 +652,7 @@ class DataHandler:
         # Convert to Protobuf Message
         try:
             request = DataGetRequest.FromString(decrypted_bytes)
+            timer.mark("decode")
         except DecodeError:
             error_list.append(FailureReason.DECRYPTION.error_proto())
 
@@ -330,6 +671,7 @@ class DataHandler:
         status = ServiceUtils.sanitise_public_id(request.public_id)
         if status:
             error_list.append(status.error_proto("public_id"))
+        timer.mark("sanitise")
 
         # Return Errors
         if len(error_list) > 0:
@@ -346,6 +688,7 @@ class DataHandler:
             user_id=user_id,
             public_id=request.public_id
         )
+        timer.mark("database")
 
         # Return error
         if not status:
@@ -367,20 +710,124 @@ class DataHandler:
             entry_name=entry_name,
             entry_data=entry_data
         )
-        return SessionManager.seal_session(
+        secure_response = SessionManager.seal_session(
             session_id=secure_request.session_id,
             response=response.SerializeToString()
         )
+        timer.mark("seal")
+        return secure_response
+
+
+    @staticmethod
+    def get_many(secure_request: SecureRequest) -> SecureResponse:
+        error_list = []
+        timer = StageTimer.start("DataHandler.get_many")
+
+        # Open secure session
+        open_session = SessionManager.open_session(
+            request=secure_request
+        )
+        timer.mark("open")
+        status, failure_reason, decrypted_bytes, user_id = open_session
+        if not status:
+            assert failure_reason
+            error_list.append(failure_reason.error_proto())
+
+            failure = Failure(
+                error_list=error_list
+            )
+            return SecureResponse(
+                success=False,
+                failure_data=failure
+            )
+
+        # Convert to Protobuf Message
+        try:
+            request = DataGetManyRequest.FromString(decrypted_bytes)
+            timer.mark("decode")
+        except DecodeError:
+            error_list.append(FailureReason.DECRYPTION.error_proto())
+
+            failure = Failure(
+                error_list=error_list
+            )
+            return SecureResponse(
+                success=False,
+                failure_data=failure
+            )
+
+        # Sanitise Inputs
+        status = ServiceUtils.sanitise_username_hash(request.username_hash)
+        if status:
+            error_list.append(status.error_proto("username_hash"))
+        for public_id in request.public_ids:
+            status = ServiceUtils.sanitise_public_id(public_id)
+            if status:
+                error_list.append(status.error_proto("public_ids"))
+                break
+        timer.mark("sanitise")
+
+        # Return Errors
+        if len(error_list) > 0:
+            failure = Failure(
+                error_list=error_list
+            )
+            return SecureResponse(
+                success=False,
+                failure_data=failure
+            )
+
+        # Call Util function
+        status, failure_reason, entries, missing = DBUtilsData.get_entries(
+            user_id=user_id,
+            public_ids=list(request.public_ids)
+        )
+        timer.mark("database")
+
+        # Return error
+        if not status:
+            assert failure_reason
+            error_list.append(failure_reason.error_proto())
+
+            failure = Failure(
+                error_list=error_list
+            )
+            return SecureResponse(
+                success=False,
+                failure_data=failure
+            )
+
+        # Successful Return
+        response = DataGetManyResponse(
+            username_hash=request.username_hash,
+            entry_details=[
+                DataGetManyResponse.EntryDetails(
+                    public_id=public_id,
+                    entry_name=entry_name,
+                    entry_data=entry_data
+                )
+                for public_id, entry_name, entry_data in entries
+            ],
+            missing_public_ids=missing
+        )
+        secure_response = SessionManager.seal_session(
+            session_id=secure_request.session_id,
+            response=response.SerializeToString()
+        )
+        timer.mark("seal")
+        return secure_response
 
 
     @staticmethod
     def list(secure_request: SecureRequest) -> SecureResponse:
         error_list = []
+        timer = StageTimer.start("DataHandler.list")
 
         # Open secure session
         open_session = SessionManager.open_session(
             request=secure_request
         )
+        timer.mark("open")
         status, failure_reason, decrypted_bytes, user_id = open_session
         if not status:
             assert failure_reason
@@ -397,6 +844,7 @@ class DataHandler:
         # Convert to Protobuf Message
         try:
             request = DataListRequest.FromString(decrypted_bytes)
+            timer.mark("decode")
         except DecodeError:
             error_list.append(FailureReason.DECRYPTION.error_proto())
 
@@ -412,6 +860,7 @@ class DataHandler:
         status = ServiceUtils.sanitise_username_hash(request.username_hash)
         if status:
             error_list.append(status.error_proto("username_hash"))
+        timer.mark("sanitise")
 
         # Return Errors
         if len(error_list) > 0:
@@ -424,9 +873,12 @@ class DataHandler:
             )
 
         # Call Util function
-        status, failure_reason, entry_list = DBUtilsData.get_list(
-            user_id=user_id
+        status, failure_reason, entry_list, next_cursor = DBUtilsData.get_page(
+            user_id=user_id,
+            page_size=request.page_size or None,
+            cursor=request.cursor
         )
+        timer.mark("database")
 
         # Return error
         if not status:
@@ -449,10 +901,116 @@ class DataHandler:
                     public_id=public_id,
                     entry_name=entry_name
                 )
-                for public_id, entry_name in entry_list.items()
-            ]
+                for public_id, entry_name in entry_list
+            ],
+            next_cursor=next_cursor
         )
-        return SessionManager.seal_session(
+        secure_response = SessionManager.seal_session(
             session_id=secure_request.session_id,
             response=response.SerializeToString()
         )
+        timer.mark("seal")
+        return secure_response
+
+
+    @staticmethod
+    def list_stream(secure_request: SecureRequest) -> Iterator[SecureResponse]:
+        error_list = []
+        timer = StageTimer.start("DataHandler.list_stream")
+
+        # Open secure session
+        open_session = SessionManager.open_session(
+            request=secure_request
+        )
+        timer.mark("open")
+        status, failure_reason, decrypted_bytes, user_id = open_session
+        if not status:
+            assert failure_reason
+            error_list.append(failure_reason.error_proto())
+
+            failure = Failure(
+                error_list=error_list
+            )
+            yield SecureResponse(
+                success=False,
+                failure_data=failure
+            )
+            return
+
+        # Convert to Protobuf Message
+        try:
+            request = DataListRequest.FromString(decrypted_bytes)
+            timer.mark("decode")
+        except DecodeError:
+            error_list.append(FailureReason.DECRYPTION.error_proto())
+
+            failure = Failure(
+                error_list=error_list
+            )
+            yield SecureResponse(
+                success=False,
+                failure_data=failure
+            )
+            return
+
+        # Sanitise Inputs
+        status = ServiceUtils.sanitise_username_hash(request.username_hash)
+        if status:
+            error_list.append(status.error_proto("username_hash"))
+        timer.mark("sanitise")
+
+        # Return Errors
+        if len(error_list) > 0:
+            failure = Failure(
+                error_list=error_list
+            )
+            yield SecureResponse(
+                success=False,
+                failure_data=failure
+            )
+            return
+
+        # Call Util function, sealing each chunk as it is read
+        chunks = DBUtilsData.stream_list(
+            user_id=user_id,
+            chunk_size=request.page_size or DataHandler.STREAM_CHUNK_SIZE
+        )
+        try:
+            for status, failure_reason, entry_list in chunks:
+                timer.mark("database")
+
+                # Return error
+                if not status:
+                    assert failure_reason
+                    error_list.append(failure_reason.error_proto())
+
+                    failure = Failure(
+                        error_list=error_list
+                    )
+                    yield SecureResponse(
+                        success=False,
+                        failure_data=failure
+                    )
+                    return
+
+                # Successful Chunk
+                response = DataListResponse(
+                    username_hash=request.username_hash,
+                    entry_details=[
+                        DataListResponse.EntryDetails(
+                            public_id=public_id,
+                            entry_name=entry_name
+                        )
+                        for public_id, entry_name in entry_list
+                    ]
+                )
+                secure_response = SessionManager.seal_session(
+                    session_id=secure_request.session_id,
+                    response=response.SerializeToString()
+                )
+                timer.mark("seal")
+                yield secure_response
+                # Time spent waiting on the client, kept out of the next database stage
+                timer.mark("send")
+        finally:
+            chunks.close()
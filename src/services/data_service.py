@@ -15,22 +15,42 @@ class DataService(DataServicer):
         logger.info("Create called by: %s", context.peer())
         return DataHandler.create(request)
 
+    def CreateMany(self, request, context):
+        logger.info("CreateMany called by: %s", context.peer())
+        return DataHandler.create_many(request)
+
     def Edit(self, request, context):
         logger.info("Edit called by: %s", context.peer())
         return DataHandler.edit(request)
 
+    def EditMany(self, request, context):
+        logger.info("EditMany called by: %s", context.peer())
+        return DataHandler.edit_many(request)
+
     def Delete(self, request, context):
         logger.info("Delete called by: %s", context.peer())
         return DataHandler.delete(request)
 
+    def DeleteMany(self, request, context):
+        logger.info("DeleteMany called by: %s", context.peer())
+        return DataHandler.delete_many(request)
+
     def Get(self, request, context):
         logger.info("Get called by: %s", context.peer())
         return DataHandler.get(request)
 
+    def GetMany(self, request, context):
+        logger.info("GetMany called by: %s", context.peer())
+        return DataHandler.get_many(request)
+
     def List(self, request, context):
         logger.info("List called by: %s", context.peer())
         return DataHandler.list(request)
 
+    def ListStream(self, request, context):
+        logger.info("ListStream called by: %s", context.peer())
+        return DataHandler.list_stream(request)
+
     def Health(self, request, context):
         logger.info("Health called by: %s", context.peer())
         return HealthResponse(health=True)
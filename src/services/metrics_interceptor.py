@@ -0,0 +1,264 @@
+import asyncio
+from time import perf_counter
+from typing import Optional, Any
+from threading import Thread
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from logging import getLogger
+logger = getLogger("api")
+
+import grpc
+
+from utils import MetricsRegistry
+from enums import FailureReason
+
+
+_FAILURE_NAMES = {reason.error_code: reason.name for reason in FailureReason}
+
+
+def _rpc_outcome(response: Any) -> str:
+    """Name the outcome of a response, as OK or the FailureReason returned"""
+    if hasattr(response, "success") and hasattr(response, "failure_data") and not response.success:
+        errors = response.failure_data.error_list
+        if not errors:
+            return FailureReason.UNSPECIFIED.name
+        return _FAILURE_NAMES.get(errors[0].code, FailureReason.UNSPECIFIED.name)
+    return "OK"
+
+
+def _wrap_handler(handler, behaviour):
+    return grpc.unary_unary_rpc_method_handler(
+        behaviour,
+        request_deserializer=handler.request_deserializer,
+        response_serializer=handler.response_serializer
+    )
+
+
+def _wrap_stream_handler(handler, behaviour):
+    return grpc.unary_stream_rpc_method_handler(
+        behaviour,
+        request_deserializer=handler.request_deserializer,
+        response_serializer=handler.response_serializer
+    )
+
+
+def _wrap_client_stream_handler(handler, behaviour):
+    return grpc.stream_unary_rpc_method_handler(
+        behaviour,
+        request_deserializer=handler.request_deserializer,
+        response_serializer=handler.response_serializer
+    )
+
+
+class _StreamOutcome():
+    """Outcome of a response stream, as OK or the first FailureReason streamed"""
+
+    __slots__ = ("outcome",)
+
+    def __init__(self):
+        self.outcome = "OK"
+
+    def observe(self, response: Any):
+        if self.outcome == "OK":
+            self.outcome = _rpc_outcome(response)
+
+
+class MetricsInterceptor(grpc.ServerInterceptor):
+    """Records the count, outcome and latency of every unary, server streaming and client streaming RPC"""
+
+    def intercept_service(self, continuation, handler_call_details):
+        handler = continuation(handler_call_details)
+        if handler is None:
+            return handler
+
+        method = handler_call_details.method
+        if handler.unary_stream is not None:
+            return _wrap_stream_handler(handler, self._stream(method, handler.unary_stream))
+        if handler.stream_unary is not None:
+            return _wrap_client_stream_handler(handler, self._client_stream(method, handler.stream_unary))
+        if handler.unary_unary is None:
+            return handler
+
+        behaviour = handler.unary_unary
+
+        def timed(request, context):
+            started = perf_counter()
+            outcome = "EXCEPTION"
+            try:
+                response = behaviour(request, context)
+                outcome = _rpc_outcome(response)
+                return response
+            finally:
+                MetricsRegistry.observe_rpc(method, outcome, perf_counter() - started)
+
+        return _wrap_handler(handler, timed)
+
+    @staticmethod
+    def _stream(method, behaviour):
+        def timed(request, context):
+            started = perf_counter()
+            stream = _StreamOutcome()
+            outcome = "EXCEPTION"
+            try:
+                for response in behaviour(request, context):
+                    stream.observe(response)
+                    yield response
+                outcome = stream.outcome
+            except GeneratorExit:
+                outcome = "CANCELLED"
+                raise
+            finally:
+                MetricsRegistry.observe_rpc(method, outcome, perf_counter() - started)
+        return timed
+
+    @staticmethod
+    def _client_stream(method, behaviour):
+        def timed(request_iterator, context):
+            started = perf_counter()
+            outcome = "EXCEPTION"
+            try:
+                response = behaviour(request_iterator, context)
+                outcome = _rpc_outcome(response)
+                return response
+            finally:
+                MetricsRegistry.observe_rpc(method, outcome, perf_counter() - started)
+        return timed
+
+
+class AsyncMetricsInterceptor(grpc.aio.ServerInterceptor):
+    """Records the count, outcome and latency of every unary, server streaming and client streaming RPC on the asyncio server"""
+
+    async def intercept_service(self, continuation, handler_call_details):
+        handler = await continuation(handler_call_details)
+        if handler is None:
+            return handler
+
+        method = handler_call_details.method
+        if handler.unary_stream is not None:
+            return _wrap_stream_handler(handler, self._stream(method, handler.unary_stream))
+        if handler.stream_unary is not None:
+            return _wrap_client_stream_handler(handler, self._client_stream(method, handler.stream_unary))
+        if handler.unary_unary is None:
+            return handler
+
+        behaviour = handler.unary_unary
+
+        async def timed(request, context):
+            started = perf_counter()
+            outcome = "EXCEPTION"
+            try:
+                response = await behaviour(request, context)
+                outcome = _rpc_outcome(response)
+                return response
+            finally:
+                MetricsRegistry.observe_rpc(method, outcome, perf_counter() - started)
+
+        return _wrap_handler(handler, timed)
+
+    @staticmethod
+    def _stream(method, behaviour):
+        async def timed(request, context):
+            started = perf_counter()
+            stream = _StreamOutcome()
+            outcome = "EXCEPTION"
+            try:
+                async for response in behaviour(request, context):
+                    stream.observe(response)
+                    yield response
+                outcome = stream.outcome
+            except (GeneratorExit, asyncio.CancelledError):
+                outcome = "CANCELLED"
+                raise
+            finally:
+                MetricsRegistry.observe_rpc(method, outcome, perf_counter() - started)
+        return timed
+
+    @staticmethod
+    def _client_stream(method, behaviour):
+        async def timed(request_iterator, context):
+            started = perf_counter()
+            outcome = "EXCEPTION"
+            try:
+                response = await behaviour(request_iterator, context)
+                outcome = _rpc_outcome(response)
+                return response
+            except asyncio.CancelledError:
+                outcome = "CANCELLED"
+                raise
+            finally:
+                MetricsRegistry.observe_rpc(method, outcome, perf_counter() - started)
+        return timed
+
+
+class _MetricsRequestHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        if self.path != "/metrics":
+            self.send_error(404)
+            return
+
+        body = MetricsRegistry.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug("Metrics request from %s: %s", self.address_string(), format % args)
+
+
+class MetricsEndpoint():
+    """Local HTTP endpoint serving the metrics registry on /metrics"""
+
+    _server: Optional[ThreadingHTTPServer] = None
+    _thread: Optional[Thread] = None
+
+
+    @staticmethod
+    def start(
+        host: str,
+        port: int
+    ):
+        """
+        Serve /metrics on a background thread
+
+        Args:
+            host (str):     Address to bind, normally a local address
+            port (int):     Port to bind, or 0 for any free port
+        """
+        if MetricsEndpoint._server is not None:
+            raise RuntimeError("Metrics endpoint already started.")
+
+        server = ThreadingHTTPServer((host, port), _MetricsRequestHandler)
+        server.daemon_threads = True
+        MetricsEndpoint._server = server
+        MetricsEndpoint._thread = Thread(target=server.serve_forever, name="metrics", daemon=True)
+        MetricsEndpoint._thread.start()
+        logger.info("Metrics endpoint running on %s:%s.", host, MetricsEndpoint.port())
+
+
+    @staticmethod
+    def port() -> int:
+        """
+        Get the port the endpoint is bound to
+
+        Returns:
+            (int)   The bound port, or 0 if not started
+        """
+        if MetricsEndpoint._server is None:
+            return 0
+        return MetricsEndpoint._server.server_address[1]
+
+
+    @staticmethod
+    def stop():
+        """Stop serving /metrics"""
+        server = MetricsEndpoint._server
+        MetricsEndpoint._server = None
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+        if MetricsEndpoint._thread is not None:
+            MetricsEndpoint._thread.join()
+            MetricsEndpoint._thread = None
@@ -1,3 +1,6 @@
+from dataclasses import dataclass
+from typing import Iterator, Iterable, Optional
+
 from google.protobuf.message import DecodeError
 from passmanager.common.v0.secure_pb2 import (
     SecureRequest,
@@ -14,27 +17,52 @@ from passmanager.password.v0.password_payloads_pb2 import (
     PasswordAbortResponse,
     PasswordGetRequest,
     PasswordGetResponse,
+    PasswordGetStreamRequest,
+    PasswordGetStreamResponse,
     PasswordUpdateRequest,
-    PasswordUpdateResponse
+    PasswordUpdateResponse,
+    PasswordUpdateStreamRequest,
+    PasswordUpdateStreamResponse
 )
 from passmanager.common.v0.error_pb2 import (
     Failure
 )
 
-from utils import ServiceUtils, SessionManager, DBUtilsPassword, DBUtilsData
+from utils import ServiceUtils, SessionManager, DBUtilsPassword, DBUtilsData, StageTimer
+from cryptography import SRPUtils, SRPSteps
 from enums import FailureReason
 
 
+@dataclass
+class UpdateStreamProgress():
+    """State carried between the batches of a Password.UpdateStream call"""
+
+    session_id: str = ""
+    user_id: Optional[int] = None
+    username_hash: bytes = b''
+    updated_count: int = 0
+
+
 class PasswordHandler():
 
+    STREAM_CHUNK_SIZE: int = 100
+
+
     @staticmethod
     def start(secure_request: SecureRequest) -> SecureResponse:
+        return SRPUtils.run_steps(PasswordHandler.start_steps(secure_request))
+
+
+    @staticmethod
+    def start_steps(secure_request: SecureRequest) -> SRPSteps[SecureResponse]:
         error_list = []
+        timer = StageTimer.start("PasswordHandler.start")
 
         # Open secure session
         open_session = SessionManager.open_session(
             request=secure_request
         )
+        timer.mark("open")
         status, failure_reason, decrypted_bytes, user_id = open_session
         if not status:
             assert failure_reason
@@ -51,6 +79,7 @@ class PasswordHandler():
         # Convert to Protobuf Message
         try:
             request = PasswordStartRequest.FromString(decrypted_bytes)
+            timer.mark("decode")
         except DecodeError:
             error_list.append(FailureReason.DECRYPTION.error_proto())
 
@@ -75,6 +104,7 @@ class PasswordHandler():
         status = ServiceUtils.sanitise_master_key_salt(request.master_key_salt)
         if status:
             error_list.append(status.error_proto("master_key_salt"))
+        timer.mark("sanitise")
 
         # Return errors
         if len(error_list) > 0:
@@ -87,12 +117,13 @@ class PasswordHandler():
             )
 
         # Call Util function
-        result = SessionManager.start_password_session(
+        result = yield from SessionManager.start_password_session_steps(
             user_id=user_id,
             srp_salt=request.srp_salt,
             srp_verifier=request.srp_verifier,
             master_key_salt=request.master_key_salt
         )
+        timer.mark("srp")
         status, failure_reason, public_id, public_ephemeral_b, srp_salt, master_key_salt = result
 
         # Return error
@@ -116,20 +147,29 @@ class PasswordHandler():
             srp_salt=srp_salt,
             master_key_salt=master_key_salt
         )
-        return SessionManager.seal_session(
+        secure_response = SessionManager.seal_session(
             session_id=secure_request.session_id,
             response=response.SerializeToString()
         )
+        timer.mark("seal")
+        return secure_response
 
 
     @staticmethod
     def auth(secure_request: SecureRequest) -> SecureResponse:
+        return SRPUtils.run_steps(PasswordHandler.auth_steps(secure_request))
+
+
+    @staticmethod
+    def auth_steps(secure_request: SecureRequest) -> SRPSteps[SecureResponse]:
         error_list = []
+        timer = StageTimer.start("PasswordHandler.auth")
 
         # Open secure session
         open_session = SessionManager.open_session(
             request=secure_request
         )
+        timer.mark("open")
         status, failure_reason, decrypted_bytes, user_id = open_session
         if not status:
             assert failure_reason
@@ -146,6 +186,7 @@ class PasswordHandler():
         # Convert to Protobuf Message
         try:
             request = PasswordAuthRequest.FromString(decrypted_bytes)
+            timer.mark("decode")
         except DecodeError:
             error_list.append(FailureReason.DECRYPTION.error_proto())
 
@@ -170,6 +211,7 @@ class PasswordHandler():
         status = ServiceUtils.sanitise_proof_val_m1(request.proof_val_m1)
         if status:
             error_list.append(status.error_proto("proof_val_m1"))
+        timer.mark("sanitise")
 
         # Return errors
         if len(error_list) > 0:
@@ -182,12 +224,13 @@ class PasswordHandler():
             )
 
         # Call Util function
-        result = SessionManager.auth_password_session(
+        result = yield from SessionManager.auth_password_session_steps(
             user_id=user_id,
             public_id=request.public_id,
             eph_val_a=request.eph_val_a,
             proof_val_m1=request.proof_val_m1
         )
+        timer.mark("srp")
         status, failure_reason, session_id, server_proof_m2, public_ids = result
 
         # Return error
@@ -210,20 +253,24 @@ class PasswordHandler():
             server_proof_m2=server_proof_m2,
             public_ids=public_ids
         )
-        return SessionManager.seal_session(
+        secure_response = SessionManager.seal_session(
             session_id=secure_request.session_id,
             response=response.SerializeToString()
         )
+        timer.mark("seal")
+        return secure_response
 
 
     @staticmethod
     def commit(secure_request: SecureRequest) -> SecureResponse:
         error_list = []
+        timer = StageTimer.start("PasswordHandler.commit")
 
         # Open secure session
         open_session = SessionManager.open_session(
             request=secure_request
         )
+        timer.mark("open")
         status, failure_reason, decrypted_bytes, user_id = open_session
         if not status:
             assert failure_reason
@@ -240,6 +287,7 @@ class PasswordHandler():
         # Convert to Protobuf Message
         try:
             request = PasswordCommitRequest.FromString(decrypted_bytes)
+            timer.mark("decode")
         except DecodeError:
             error_list.append(FailureReason.DECRYPTION.error_proto())
 
@@ -255,6 +303,7 @@ class PasswordHandler():
         status = ServiceUtils.sanitise_username_hash(request.username_hash)
         if status:
             error_list.append(status.error_proto("username_hash"))
+        timer.mark("sanitise")
 
         # Return errors
         if len(error_list) > 0:
@@ -270,6 +319,7 @@ class PasswordHandler():
         result = DBUtilsPassword.commit(
             user_id=user_id
         )
+        timer.mark("database")
         status, failure_reason = result
 
         # Return error
@@ -289,20 +339,24 @@ class PasswordHandler():
         response = PasswordCommitResponse(
             username_hash=request.username_hash
         )
-        return SessionManager.seal_session(
+        secure_response = SessionManager.seal_session(
             session_id=secure_request.session_id,
             response=response.SerializeToString()
         )
+        timer.mark("seal")
+        return secure_response
 
 
     @staticmethod
     def abort(secure_request: SecureRequest) -> SecureResponse:
         error_list = []
+        timer = StageTimer.start("PasswordHandler.abort")
 
         # Open secure session
         open_session = SessionManager.open_session(
             request=secure_request
         )
+        timer.mark("open")
         status, failure_reason, decrypted_bytes, user_id = open_session
         if not status:
             assert failure_reason
@@ -319,6 +373,7 @@ class PasswordHandler():
         # Convert to Protobuf Message
         try:
             request = PasswordAbortRequest.FromString(decrypted_bytes)
+            timer.mark("decode")
         except DecodeError:
             error_list.append(FailureReason.DECRYPTION.error_proto())
 
@@ -334,6 +389,7 @@ class PasswordHandler():
         status = ServiceUtils.sanitise_username_hash(request.username_hash)
         if status:
             error_list.append(status.error_proto("username_hash"))
+        timer.mark("sanitise")
 
         # Return errors
         if len(error_list) > 0:
@@ -349,6 +405,7 @@ class PasswordHandler():
         result = DBUtilsPassword.abort(
             user_id=user_id
         )
+        timer.mark("database")
         status, failure_reason = result
 
         # Return error
@@ -368,20 +425,24 @@ class PasswordHandler():
         response = PasswordAbortResponse(
             username_hash=request.username_hash
         )
-        return SessionManager.seal_session(
+        secure_response = SessionManager.seal_session(
             session_id=secure_request.session_id,
             response=response.SerializeToString()
         )
+        timer.mark("seal")
+        return secure_response
 
 
     @staticmethod
     def get(secure_request: SecureRequest) -> SecureResponse:
         error_list = []
+        timer = StageTimer.start("PasswordHandler.get")
 
         # Open secure session
         open_session = SessionManager.open_session(
             request=secure_request
         )
+        timer.mark("open")
         status, failure_reason, decrypted_bytes, user_id = open_session
         if not status:
             assert failure_reason
@@ -398,6 +459,7 @@ class PasswordHandler():
         # Convert to Protobuf Message
         try:
             request = PasswordGetRequest.FromString(decrypted_bytes)
+            timer.mark("decode")
         except DecodeError:
             error_list.append(FailureReason.DECRYPTION.error_proto())
 
@@ -416,6 +478,7 @@ class PasswordHandler():
         status = ServiceUtils.sanitise_public_id(request.public_id)
         if status:
             error_list.append(status.error_proto("public_id"))
+        timer.mark("sanitise")
 
         # Return errors
         if len(error_list) > 0:
@@ -433,6 +496,7 @@ class PasswordHandler():
             public_id=request.public_id,
             password_change=True
         )
+        timer.mark("database")
         status, failure_reason, entry_name, entry_data = result
 
         # Return error
@@ -455,20 +519,24 @@ class PasswordHandler():
             entry_name=entry_name,
             entry_data=entry_data
         )
-        return SessionManager.seal_session(
+        secure_response = SessionManager.seal_session(
             session_id=secure_request.session_id,
             response=response.SerializeToString()
         )
+        timer.mark("seal")
+        return secure_response
 
 
     @staticmethod
     def update(secure_request: SecureRequest) -> SecureResponse:
         error_list = []
+        timer = StageTimer.start("PasswordHandler.update")
 
         # Open secure session
         open_session = SessionManager.open_session(
             request=secure_request
         )
+        timer.mark("open")
         status, failure_reason, decrypted_bytes, user_id = open_session
         if not status:
             assert failure_reason
@@ -485,6 +553,7 @@ class PasswordHandler():
         # Convert to Protobuf Message
         try:
             request = PasswordUpdateRequest.FromString(decrypted_bytes)
+            timer.mark("decode")
         except DecodeError:
             error_list.append(FailureReason.DECRYPTION.error_proto())
 
@@ -509,6 +578,7 @@ class PasswordHandler():
         status = ServiceUtils.sanitise_entry_data(request.entry_data)
         if status:
             error_list.append(status.error_proto("entry_data"))
+        timer.mark("sanitise")
 
         # Return errors
         if len(error_list) > 0:
@@ -527,6 +597,7 @@ class PasswordHandler():
             entry_name=request.entry_name,
             entry_data=request.entry_data
         )
+        timer.mark("database")
         status, failure_reason = result
 
         # Return error
@@ -547,7 +618,254 @@ class PasswordHandler():
             username_hash=request.username_hash,
             public_id=request.public_id
         )
-        return SessionManager.seal_session(
+        secure_response = SessionManager.seal_session(
             session_id=secure_request.session_id,
             response=response.SerializeToString()
         )
+        timer.mark("seal")
+        return secure_response
+
+
+    @staticmethod
+    def get_stream(secure_request: SecureRequest) -> Iterator[SecureResponse]:
+        error_list = []
+        timer = StageTimer.start("PasswordHandler.get_stream")
+
+        # Open secure session
+        open_session = SessionManager.open_session(
+            request=secure_request
+        )
+        timer.mark("open")
+        status, failure_reason, decrypted_bytes, user_id = open_session
+        if not status:
+            assert failure_reason
+            error_list.append(failure_reason.error_proto())
+
+            failure = Failure(
+                error_list=error_list
+            )
+            yield SecureResponse(
+                success=False,
+                failure_data=failure
+            )
+            return
+
+        # Convert to Protobuf Message
+        try:
+            request = PasswordGetStreamRequest.FromString(decrypted_bytes)
+            timer.mark("decode")
+        except DecodeError:
+            error_list.append(FailureReason.DECRYPTION.error_proto())
+
+            failure = Failure(
+                error_list=error_list
+            )
+            yield SecureResponse(
+                success=False,
+                failure_data=failure
+            )
+            return
+
+        # Sanitise Inputs
+        status = ServiceUtils.sanitise_username_hash(request.username_hash)
+        if status:
+            error_list.append(status.error_proto("username_hash"))
+        timer.mark("sanitise")
+
+        # Return Errors
+        if len(error_list) > 0:
+            failure = Failure(
+                error_list=error_list
+            )
+            yield SecureResponse(
+                success=False,
+                failure_data=failure
+            )
+            return
+
+        # Call Util function, sealing each chunk as it is read
+        chunks = DBUtilsData.stream_entries(
+            user_id=user_id,
+            chunk_size=request.chunk_size or PasswordHandler.STREAM_CHUNK_SIZE,
+            password_change=True
+        )
+        try:
+            for status, failure_reason, entry_list in chunks:
+                timer.mark("database")
+
+                # Return error
+                if not status:
+                    assert failure_reason
+                    error_list.append(failure_reason.error_proto())
+
+                    failure = Failure(
+                        error_list=error_list
+                    )
+                    yield SecureResponse(
+                        success=False,
+                        failure_data=failure
+                    )
+                    return
+
+                # Successful Chunk
+                response = PasswordGetStreamResponse(
+                    username_hash=request.username_hash,
+                    entry_details=[
+                        PasswordGetStreamResponse.EntryDetails(
+                            public_id=public_id,
+                            entry_name=entry_name,
+                            entry_data=entry_data
+                        )
+                        for public_id, entry_name, entry_data in entry_list
+                    ]
+                )
+                secure_response = SessionManager.seal_session(
+                    session_id=secure_request.session_id,
+                    response=response.SerializeToString()
+                )
+                timer.mark("seal")
+                yield secure_response
+                # Time spent waiting on the client, kept out of the next database stage
+                timer.mark("send")
+        finally:
+            chunks.close()
+
+
+    @staticmethod
+    def update_batch(
+        secure_request: SecureRequest,
+        progress: UpdateStreamProgress
+    ) -> Optional[SecureResponse]:
+        """
+        Apply one batch of a Password.UpdateStream call in its own transaction
+
+        Returns:
+            (SecureResponse)    The failure ending the stream, or None to continue
+        """
+        error_list = []
+        timer = StageTimer.start("PasswordHandler.update_batch")
+
+        # Open secure session
+        open_session = SessionManager.open_session(
+            request=secure_request
+        )
+        timer.mark("open")
+        status, failure_reason, decrypted_bytes, user_id = open_session
+        if not status:
+            assert failure_reason
+            error_list.append(failure_reason.error_proto())
+
+            failure = Failure(
+                error_list=error_list
+            )
+            return SecureResponse(
+                success=False,
+                failure_data=failure
+            )
+
+        # Convert to Protobuf Message
+        try:
+            request = PasswordUpdateStreamRequest.FromString(decrypted_bytes)
+            timer.mark("decode")
+        except DecodeError:
+            error_list.append(FailureReason.DECRYPTION.error_proto())
+
+            failure = Failure(
+                error_list=error_list
+            )
+            return SecureResponse(
+                success=False,
+                failure_data=failure
+            )
+
+        # Sanitise Inputs, with every batch of the stream from the same session and user
+        status = ServiceUtils.sanitise_username_hash(request.username_hash)
+        if status:
+            error_list.append(status.error_proto("username_hash"))
+        if progress.user_id is not None:
+            if secure_request.session_id != progress.session_id or user_id != progress.user_id or \
+                request.username_hash != progress.username_hash:
+                error_list.append(FailureReason.PARAMETERS.error_proto())
+        for entry in request.entries:
+            status = ServiceUtils.sanitise_public_id(entry.public_id)
+            if not status:
+                status = ServiceUtils.sanitise_entry_name(entry.entry_name)
+            if not status:
+                status = ServiceUtils.sanitise_entry_data(entry.entry_data)
+            if status:
+                error_list.append(status.error_proto("entries"))
+                break
+        timer.mark("sanitise")
+
+        # Return errors
+        if len(error_list) > 0:
+            failure = Failure(
+                error_list=error_list
+            )
+            return SecureResponse(
+                success=False,
+                failure_data=failure
+            )
+
+        # Call Util function
+        result = DBUtilsPassword.update_many(
+            user_id=user_id,
+            entries=[
+                (entry.public_id, entry.entry_name, entry.entry_data)
+                for entry in request.entries
+            ]
+        )
+        timer.mark("database")
+        status, failure_reason = result
+
+        # Return error
+        if not status:
+            assert failure_reason
+            error_list.append(failure_reason.error_proto())
+
+            failure = Failure(
+                error_list=error_list
+            )
+            return SecureResponse(
+                success=False,
+                failure_data=failure
+            )
+
+        # Successful Batch
+        progress.session_id = secure_request.session_id
+        progress.user_id = user_id
+        progress.username_hash = request.username_hash
+        progress.updated_count += len(request.entries)
+        return None
+
+
+    @staticmethod
+    def update_stream_response(progress: UpdateStreamProgress) -> SecureResponse:
+        """Seal the response to a Password.UpdateStream call once every batch is applied"""
+        if progress.user_id is None:
+            failure = Failure(
+                error_list=[FailureReason.PARAMETERS.error_proto()]
+            )
+            return SecureResponse(
+                success=False,
+                failure_data=failure
+            )
+
+        response = PasswordUpdateStreamResponse(
+            username_hash=progress.username_hash,
+            updated_count=progress.updated_count
+        )
+        return SessionManager.seal_session(
+            session_id=progress.session_id,
+            response=response.SerializeToString()
+        )
+
+
+    @staticmethod
+    def update_stream(request_iterator: Iterable[SecureRequest]) -> SecureResponse:
+        progress = UpdateStreamProgress()
+        for secure_request in request_iterator:
+            failure = PasswordHandler.update_batch(secure_request, progress)
+            if failure is not None:
+                return failure
+        return PasswordHandler.update_stream_response(progress)
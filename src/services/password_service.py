@@ -31,10 +31,18 @@ class PasswordService(PasswordServicer):
         logger.info("Get called by: %s", context.peer())
         return PasswordHandler.get(request)
 
+    def GetStream(self, request, context):
+        logger.info("GetStream called by: %s", context.peer())
+        return PasswordHandler.get_stream(request)
+
     def Update(self, request, context):
         logger.info("Update called by: %s", context.peer())
         return PasswordHandler.update(request)
 
+    def UpdateStream(self, request_iterator, context):
+        logger.info("UpdateStream called by: %s", context.peer())
+        return PasswordHandler.update_stream(request_iterator)
+
     def Health(self, request, context):
         logger.info("Health called by: %s", context.peer())
         return HealthResponse(health=True)
@@ -0,0 +1,160 @@
+import signal
+from typing import Optional, Callable, Dict
+from threading import Event
+from multiprocessing import get_context
+from multiprocessing.connection import wait
+from multiprocessing.process import BaseProcess
+
+from logging import getLogger
+logger = getLogger("api")
+
+from all_server import serve_configured, ServerSettings
+
+
+class PreforkSupervisor():
+    """
+    Supervisor forking worker processes, and restarting any that exit unexpectedly
+
+    Workers are forked before any per-process state (database engine, caches,
+    background threads) exists, and must create it themselves.
+    """
+
+    _stopping = Event()
+    _workers: Dict[int, BaseProcess] = {}
+
+    # Slot of the current worker process, or None in the supervisor
+    worker_slot: Optional[int] = None
+
+
+    @classmethod
+    def run(
+        cls,
+        workers: int,
+        target: Callable[[], None],
+        grace: float = 10.0,
+        restart_delay: float = 1.0
+    ):
+        """
+        Fork the workers, and supervise them until SIGTERM or SIGINT
+
+        Args:
+            workers (int):          Number of worker processes
+            target (func):          Worker body, run in each forked process
+            grace (float):          Seconds workers are given to stop before being killed
+            restart_delay (float):  Seconds to wait before restarting a crashed worker
+        """
+        if workers < 1:
+            raise ValueError(f"Invalid worker count: {workers}")
+
+        cls._stopping.clear()
+        previous = {
+            signum: signal.signal(signum, lambda signum, frame: cls.stop())
+            for signum in (signal.SIGTERM, signal.SIGINT)
+        }
+
+        try:
+            for slot in range(workers):
+                cls._start_worker(slot, target)
+            logger.info("Supervisor started %s workers.", workers)
+
+            while not cls._stopping.is_set():
+                wait([worker.sentinel for worker in cls._workers.values()], timeout=1.0)
+                for slot, worker in list(cls._workers.items()):
+                    if worker.is_alive() or cls._stopping.is_set():
+                        continue
+                    logger.warning("Worker %s exited with code %s, restarting.", worker.pid, worker.exitcode)
+                    if cls._stopping.wait(restart_delay):
+                        break
+                    cls._start_worker(slot, target)
+        finally:
+            cls._stop_workers(grace)
+            for signum, handler in previous.items():
+                signal.signal(signum, handler)
+
+
+    @classmethod
+    def stop(cls):
+        """Request the supervisor to stop all workers, and return"""
+        cls._stopping.set()
+
+
+    @classmethod
+    def _start_worker(
+        cls,
+        slot: int,
+        target: Callable[[], None]
+    ):
+        worker = get_context("fork").Process(
+            target=cls._worker_main,
+            args=(slot, target),
+            name=f"worker-{slot}",
+            daemon=False
+        )
+        worker.start()
+        cls._workers[slot] = worker
+
+
+    @classmethod
+    def _worker_main(
+        cls,
+        slot: int,
+        target: Callable[[], None]
+    ):
+        # The supervisor forwards interrupts as SIGTERM to each worker
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        cls.worker_slot = slot
+        target()
+
+
+    @classmethod
+    def _stop_workers(
+        cls,
+        grace: float
+    ):
+        for worker in cls._workers.values():
+            if worker.is_alive():
+                worker.terminate()
+
+        for worker in cls._workers.values():
+            worker.join(grace)
+            if worker.is_alive():
+                logger.error("Worker %s did not stop in time, killing.", worker.pid)
+                worker.kill()
+                worker.join()
+
+        cls._workers.clear()
+        logger.info("Supervisor stopped all workers.")
+
+
+def serve_prefork(
+    workers: int,
+    initialise: Callable[[], None],
+    finalise: Callable[[], None],
+    grace: float = 10.0
+):
+    """
+    Run the server in forked worker processes, each binding the port with SO_REUSEPORT
+
+    Each worker runs initialise after the fork, so no database connection or
+    background thread is shared between processes. Any per-process state it
+    creates is invisible to the other workers, so initialise must leave out
+    state that has to agree across workers, such as cached login sessions and
+    pending request counts. Metrics are per worker, with each worker serving
+    them on the metrics port plus its slot.
+    """
+    def _worker():
+        initialise()
+        try:
+            serve_configured(
+                options=[("grpc.so_reuseport", 1)],
+                grace=grace,
+                metrics_port_offset=PreforkSupervisor.worker_slot or 0
+            )
+        finally:
+            finalise()
+
+    # Fail once on an invalid [server] section, rather than in every worker
+    ServerSettings.load()
+
+    PreforkSupervisor.run(workers, _worker, grace)
@@ -19,7 +19,8 @@ from passmanager.common.v0.error_pb2 import (
     Failure
 )
 
-from utils import ServiceUtils, SessionManager, DBUtilsSession
+from utils import ServiceUtils, SessionManager, DBUtilsSession, StageTimer
+from cryptography import SRPUtils, SRPSteps
 from enums import FailureReason
 
 
@@ -27,12 +28,19 @@ class SessionHandler:
 
     @staticmethod
     def start(request: SessionStartRequest) -> SessionStartResponse:
+        return SRPUtils.run_steps(SessionHandler.start_steps(request))
+
+
+    @staticmethod
+    def start_steps(request: SessionStartRequest) -> SRPSteps[SessionStartResponse]:
         error_list = []
+        timer = StageTimer.start("SessionHandler.start")
 
         # Sanitise Inputs
         status = ServiceUtils.sanitise_username_hash(request.username_hash)
         if status:
             error_list.append(status.error_proto("username_hash"))
+        timer.mark("sanitise")
 
         # Return errors
         if len(error_list) > 0:
@@ -45,9 +53,10 @@ class SessionHandler:
             )
 
         # Call Util function
-        result = SessionManager.start_new_session(
+        result = yield from SessionManager.start_new_session_steps(
             username_hash=request.username_hash
         )
+        timer.mark("srp")
         status, failure_reason, public_id, eph_public_b, srp_salt, master_key_salt = result
 
         # Return error
@@ -78,7 +87,13 @@ class SessionHandler:
 
     @staticmethod
     def auth(request: SessionAuthRequest) -> SessionAuthResponse:
+        return SRPUtils.run_steps(SessionHandler.auth_steps(request))
+
+
+    @staticmethod
+    def auth_steps(request: SessionAuthRequest) -> SRPSteps[SessionAuthResponse]:
         error_list = []
+        timer = StageTimer.start("SessionHandler.auth")
 
         # Sanitise Inputs
         status = ServiceUtils.sanitise_username_hash(request.username_hash)
@@ -99,6 +114,7 @@ class SessionHandler:
         status = ServiceUtils.sanitise_expiry_time(request.expiry_time)
         if status:
             error_list.append(status.error_proto("expiry_time"))
+        timer.mark("sanitise")
 
         # Return errors
         if len(error_list) > 0:
@@ -111,7 +127,7 @@ class SessionHandler:
             )
 
         # Call Util function
-        result = SessionManager.auth_new_session(
+        result = yield from SessionManager.auth_new_session_steps(
             username_hash=request.username_hash,
             public_id=request.public_id,
             eph_val_a=request.eph_val_a,
@@ -119,6 +135,7 @@ class SessionHandler:
             maximum_requests=request.maximum_requests,
             expiry_time=request.expiry_time
         )
+        timer.mark("srp")
         status, failure_reason, session_public_id, server_proof_m2 = result
 
         # Return error
@@ -148,11 +165,13 @@ class SessionHandler:
     @staticmethod
     def delete(secure_request: SecureRequest) -> SecureResponse:
         error_list = []
+        timer = StageTimer.start("SessionHandler.delete")
 
         # Open secure session
         open_session = SessionManager.open_session(
             request=secure_request
         )
+        timer.mark("open")
         status, failure_reason, decrypted_bytes, user_id = open_session
         if not status:
             assert failure_reason
@@ -169,6 +188,7 @@ class SessionHandler:
         # Convert to Protobuf Message
         try:
             request = SessionDeleteRequest.FromString(decrypted_bytes)
+            timer.mark("decode")
         except DecodeError:
             error_list.append(FailureReason.DECRYPTION.error_proto())
 
@@ -187,6 +207,7 @@ class SessionHandler:
         status = ServiceUtils.sanitise_public_id(request.session_id)
         if status:
             error_list.append(status.error_proto("session_id"))
+        timer.mark("sanitise")
 
         # Return errors
         if len(error_list) > 0:
@@ -203,6 +224,7 @@ class SessionHandler:
             user_id=user_id,
             public_id=request.session_id
         )
+        timer.mark("database")
 
         # Return error
         if not status:
@@ -221,20 +243,24 @@ class SessionHandler:
         response = SessionDeleteResponse(
             username_hash=request.username_hash
         )
-        return SessionManager.seal_session(
+        secure_response = SessionManager.seal_session(
             session_id=secure_request.session_id,
             response=response.SerializeToString()
         )
+        timer.mark("seal")
+        return secure_response
 
 
     @staticmethod
     def clean(secure_request: SecureRequest) -> SecureResponse:
         error_list = []
+        timer = StageTimer.start("SessionHandler.clean")
 
         # Open secure session
         open_session = SessionManager.open_session(
             request=secure_request
         )
+        timer.mark("open")
         status, failure_reason, decrypted_bytes, user_id = open_session
         if not status:
             assert failure_reason
@@ -251,6 +277,7 @@ class SessionHandler:
         # Convert to Protobuf Message
         try:
             request = SessionCleanRequest.FromString(decrypted_bytes)
+            timer.mark("decode")
         except DecodeError:
             error_list.append(FailureReason.DECRYPTION.error_proto())
 
@@ -266,6 +293,7 @@ class SessionHandler:
         status = ServiceUtils.sanitise_username_hash(request.username_hash)
         if status:
             error_list.append(status.error_proto("username_hash"))
+        timer.mark("sanitise")
 
         # Return errors
         if len(error_list) > 0:
@@ -281,6 +309,7 @@ class SessionHandler:
         status, failure_reason = DBUtilsSession.clean_user(
             user_id=user_id
         )
+        timer.mark("database")
 
         # Return error
         if not status:
@@ -299,7 +328,9 @@ class SessionHandler:
         response = SessionCleanResponse(
             username_hash=request.username_hash
         )
-        return SessionManager.seal_session(
+        secure_response = SessionManager.seal_session(
             session_id=secure_request.session_id,
             response=response.SerializeToString()
         )
+        timer.mark("seal")
+        return secure_response
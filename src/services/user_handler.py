@@ -17,7 +17,7 @@ from passmanager.common.v0.error_pb2 import (
     Failure
 )
 
-from utils import ServiceUtils, SessionManager, DBUtilsUser
+from utils import ServiceUtils, SessionManager, DBUtilsUser, StageTimer
 from enums import FailureReason
 
 
@@ -26,6 +26,7 @@ class UserHandler():
     @staticmethod
     def register(request: UserRegisterRequest) -> UserRegisterResponse:
         error_list = []
+        timer = StageTimer.start("UserHandler.register")
 
         # Sanitise Inputs
         status = ServiceUtils.sanitise_username_hash(request.new_username)
@@ -40,6 +41,7 @@ class UserHandler():
         status = ServiceUtils.sanitise_master_key_salt(request.master_key_salt)
         if status:
             error_list.append(status.error_proto("master_key_salt"))
+        timer.mark("sanitise")
 
         # Return errors
         if len(error_list) > 0:
@@ -58,6 +60,7 @@ class UserHandler():
             srp_verifier=request.srp_verifier,
             master_key_salt=request.master_key_salt
         )
+        timer.mark("database")
 
         # Return error
         if not status:
@@ -85,12 +88,14 @@ class UserHandler():
     @staticmethod
     def username(secure_request: SecureRequest) -> SecureResponse:
         error_list = []
+        timer = StageTimer.start("UserHandler.username")
 
         # Open secure session
         open_session = SessionManager.open_session(
             request=secure_request,
             first_request=True
         )
+        timer.mark("open")
         status, failure_reason, decrypted_bytes, user_id = open_session
         if not status:
             assert failure_reason
@@ -107,6 +112,7 @@ class UserHandler():
         # Convert to Protobuf Message
         try:
             request = UserUsernameRequest.FromString(decrypted_bytes)
+            timer.mark("decode")
         except DecodeError:
             error_list.append(FailureReason.DECRYPTION.error_proto())
 
@@ -125,6 +131,7 @@ class UserHandler():
         status = ServiceUtils.sanitise_username_hash(request.new_username)
         if status:
             error_list.append(status.error_proto("new_username"))
+        timer.mark("sanitise")
 
         # Return Errors
         if len(error_list) > 0:
@@ -141,6 +148,7 @@ class UserHandler():
             user_id=user_id,
             new_username_hash=request.new_username
         )
+        timer.mark("database")
 
         # Return error
         if not status:
@@ -159,21 +167,25 @@ class UserHandler():
         response = UserUsernameResponse(
             new_username=request.new_username
         )
-        return SessionManager.seal_session(
+        secure_response = SessionManager.seal_session(
             session_id=secure_request.session_id,
             response=response.SerializeToString()
         )
+        timer.mark("seal")
+        return secure_response
 
 
     @staticmethod
     def delete(secure_request: SecureRequest) -> SecureResponse:
         error_list = []
+        timer = StageTimer.start("UserHandler.delete")
 
         # Open secure session
         open_session = SessionManager.open_session(
             request=secure_request,
             first_request=True
         )
+        timer.mark("open")
         status, failure_reason, decrypted_bytes, user_id = open_session
         if not status:
             assert failure_reason
@@ -190,6 +202,7 @@ class UserHandler():
         # Convert to Protobuf Message
         try:
             request = UserDeleteRequest.FromString(decrypted_bytes)
+            timer.mark("decode")
         except DecodeError:
             error_list.append(FailureReason.DECRYPTION.error_proto())
 
@@ -205,6 +218,7 @@ class UserHandler():
         status = ServiceUtils.sanitise_username_hash(request.username_hash)
         if status:
             error_list.append(status.error_proto("username_hash"))
+        timer.mark("sanitise")
 
         # Return Errors
         if len(error_list) > 0:
@@ -220,6 +234,7 @@ class UserHandler():
         status, failure_reason = DBUtilsUser.delete(
             user_id=user_id
         )
+        timer.mark("database")
 
         # Return error
         if not status:
@@ -238,7 +253,9 @@ class UserHandler():
         response = UserDeleteResponse(
             username_hash=request.username_hash
         )
-        return SessionManager.seal_session(
+        secure_response = SessionManager.seal_session(
             session_id=secure_request.session_id,
             response=response.SerializeToString()
         )
+        timer.mark("seal")
+        return secure_response
@@ -6,4 +6,9 @@ from .db_utils_password import DBUtilsPassword
 from .db_utils_session import DBUtilsSession
 from .db_utils_user import DBUtilsUser
 from .service_utils import ServiceUtils
+from .session_cache import SessionCache
+from .request_counter import RequestCounter
+from .expiry_reaper import ExpiryReaper
+from .metrics import MetricsRegistry
+from .stage_timer import StageTimer
 from .session_manager import SessionManager
\ No newline at end of file
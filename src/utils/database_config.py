@@ -1,5 +1,5 @@
 from configparser import ConfigParser
-from typing import Optional
+from typing import Optional, Dict
 from pathlib import Path
 
 
@@ -43,3 +43,27 @@ class DatabaseConfig:
             return cls.PROJECT_ROOT / Path(value)
         except Exception:
             return None
+
+
+    @classmethod
+    def get_section(cls, section: str) -> Dict[str, str]:
+        """
+        Get the settings of a section of the config
+
+        Args:
+            section (str):  Name of the section
+
+        Returns:
+            (dict)  The section's keys and values, leaving out empty values, or empty if there is no such section
+        """
+        if cls._config is None:
+            cls.load()
+
+        if not cls._config.has_section(section): # type: ignore
+            return {}
+
+        return {
+            key: value
+            for key, value in cls._config.items(section) # type: ignore
+            if value
+        }
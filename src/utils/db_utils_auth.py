@@ -4,13 +4,15 @@ from typing import Tuple, Optional
 from logging import getLogger
 logger = getLogger("database")
 
+from sqlalchemy import select, delete
 from sqlalchemy.orm import Session
 
-from database import DatabaseSetup, User, AuthEphemeral, LoginSession
+from database import DatabaseSetup, User, AuthEphemeral, LoginSession, track_queries
 from enums import FailureReason
 from .db_utils_password import DBUtilsPassword
 
 
+@track_queries
 class DBUtilsAuth():
     """Utility functions for managing auth based database functions"""
 
@@ -246,3 +248,68 @@ class DBUtilsAuth():
         except Exception:
             logger.exception("Unknown database session exception.")
             return False, FailureReason.UNKNOWN_EXCEPTION
+
+
+    @staticmethod
+    def reap_expired(
+        chunk_size: int
+    ) -> Tuple[bool, Optional[FailureReason], int, int]:
+        """
+        Delete expired Auth Ephemerals with set-based statements, each chunk in its own transaction
+
+        Expired password change ephemerals cancel the password change of their
+        user, as they would when found expired on the request path.
+
+        Args:
+            chunk_size (int):   Maximum rows, or users, handled in each transaction
+
+        Returns:
+            (int)   Number of expired Auth Ephemerals deleted
+            (int)   Number of password changes cancelled
+        """
+        chunk_size = max(1, chunk_size)
+        now = datetime.now()
+        reaped = 0
+        cleaned = 0
+
+        try:
+            while True:
+                with DatabaseSetup.get_db_session() as session:
+                    expired = (
+                        select(AuthEphemeral.id)
+                        .where(AuthEphemeral.expiry_time < now, AuthEphemeral.password_change == False)
+                        .limit(chunk_size)
+                    )
+                    deleted = session.execute(
+                        delete(AuthEphemeral)
+                        .where(AuthEphemeral.id.in_(expired))
+                        .execution_options(synchronize_session=False)
+                    ).rowcount
+                reaped += deleted
+                if deleted < chunk_size:
+                    break
+
+            while True:
+                with DatabaseSetup.get_db_session() as session:
+                    users = (
+                        session.query(User)
+                        .join(AuthEphemeral, AuthEphemeral.user_id == User.id)
+                        .filter(AuthEphemeral.expiry_time < now, AuthEphemeral.password_change == True)
+                        .distinct()
+                        .limit(chunk_size)
+                        .all()
+                    )
+                    for user in users:
+                        DBUtilsPassword.clean_password_change(session, user)
+                cleaned += len(users)
+                if len(users) < chunk_size:
+                    break
+
+            logger.debug("Reaped %s expired Auth Ephemerals, and %s password changes.", reaped, cleaned)
+            return True, None, reaped, cleaned
+        except RuntimeError:
+            logger.warning("Database uninitialised.")
+            return False, FailureReason.DATABASE_UNINITIALISED, reaped, cleaned
+        except Exception:
+            logger.exception("Unknown database session exception.")
+            return False, FailureReason.UNKNOWN_EXCEPTION, reaped, cleaned
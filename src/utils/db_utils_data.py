@@ -1,15 +1,89 @@
-from typing import Tuple, Optional
+import uuid
+from typing import Tuple, List, Dict, Iterator, Optional, Any
+from base64 import urlsafe_b64encode, urlsafe_b64decode
+
+from sqlalchemy import and_, insert, update, delete
+from sqlalchemy.orm import Session, contains_eager, undefer_group
 
 from logging import getLogger
 logger = getLogger("database")
 
 from enums import FailureReason
-from database import DatabaseSetup, SecureData, User
+from database import DatabaseSetup, SecureData, SecureBlob, User, BlobStore, track_queries
 
 
+@track_queries
 class DBUtilsData():
     """Utility functions for managing data based database functions"""
 
+    MAX_PAGE_SIZE: int = 500
+    MAX_BATCH_SIZE: int = 1000
+
+
+    @staticmethod
+    def _owned_entry(
+        session: Session,
+        user_id: int,
+        public_id: str,
+        group: Optional[str] = None
+    ) -> Optional[SecureData]:
+        """
+        Fetch a data entry and its user in a single query, if owned by the user
+
+        Args:
+            group (str):    Deferred column group to load with the entry, if any
+
+        Returns:
+            (SecureData)    The data entry with its user loaded, or None if not found
+        """
+        query = (
+            session.query(SecureData)
+            .join(SecureData.user)
+            .options(contains_eager(SecureData.user))
+            .filter(SecureData.public_id == public_id)
+            .filter(SecureData.user_id == user_id)
+        )
+        if group:
+            query = query.options(undefer_group(group))
+        return query.first()
+
+
+    @staticmethod
+    def _owned_ids(
+        session: Session,
+        user_id: int,
+        public_ids: List[str]
+    ) -> Optional[Tuple[bool, Dict[str, int]]]:
+        """
+        Fetch the user's password change state, and the ids of those entries it owns, in a single query
+
+        Returns:
+            (bool)  True if the user is undergoing a password change
+            (dict)  Primary key of each owned entry, keyed by public id
+            Or None if the user is not found
+        """
+        rows = (
+            session.query(User.password_change, SecureData.public_id, SecureData.id)
+            .select_from(User)
+            .outerjoin(SecureData, and_(
+                SecureData.user_id == User.id,
+                SecureData.public_id.in_(public_ids)
+            ))
+            .filter(User.id == user_id)
+            .all()
+        )
+        if not rows:
+            return None
+        owned = {public_id: id for _, public_id, id in rows if public_id is not None}
+        return rows[0][0], owned
+
+
+    @staticmethod
+    def _entry_data_column() -> Any:
+        """Column holding the encrypted entry data, in the blob table or inline as the storage mode sets"""
+        return SecureBlob.entry_data if BlobStore.separate() else SecureData.entry_data
+
+
     @staticmethod
     def create(
         user_id: int,
@@ -36,10 +110,12 @@ class DBUtilsData():
                 secure_data = SecureData(
                     user=user,
                     entry_name=entry_name,
-                    entry_data=entry_data
+                    entry_data=b'' if BlobStore.separate() else entry_data
                 )
                 session.add(secure_data)
                 session.flush()
+                if BlobStore.separate():
+                    session.add(SecureBlob(data_id=secure_data.id, entry_data=entry_data))
 
                 logger.info("Secure Data: %s created.", secure_data.public_id[-4:])
                 return True, None, secure_data.public_id
@@ -51,6 +127,68 @@ class DBUtilsData():
             return False, FailureReason.UNKNOWN_EXCEPTION, ""
 
 
+    @staticmethod
+    def create_many(
+        user_id: int,
+        entries: List[Tuple[bytes, bytes]]
+    ) -> Tuple[bool, Optional[FailureReason], List[str]]:
+        """
+        Make many data entries in a single transaction, with one bulk insert
+
+        Args:
+            entries ([(bytes, bytes)]): Encrypted entry name and entry data of each entry, at most MAX_BATCH_SIZE
+
+        Returns:
+            ([str]) The public IDs of the created data entries, in the order given
+        """
+        if len(entries) > DBUtilsData.MAX_BATCH_SIZE:
+            logger.debug("Too many Secure Data created for User id: %s.", user_id)
+            return False, FailureReason.TOO_MANY, []
+
+        try:
+            with DatabaseSetup.get_db_session() as session:
+                user = session.query(User).filter(User.id == user_id).first()
+
+                if not user:
+                    logger.debug("User id: %s not found.", user_id)
+                    return False, FailureReason.NOT_FOUND, []
+                if user.password_change:
+                    logger.debug("User: %s undergoing password change.", user.username_hash[-4:])
+                    return False, FailureReason.PASSWORD_CHANGE, []
+
+                public_ids = [uuid.uuid4().hex for _ in entries]
+                separate = BlobStore.separate()
+                rows = [
+                    {
+                        "public_id": public_id,
+                        "user_id": user_id,
+                        "entry_name": entry_name,
+                        "entry_data": b'' if separate else entry_data
+                    }
+                    for public_id, (entry_name, entry_data) in zip(public_ids, entries)
+                ]
+                if rows and not separate:
+                    session.execute(insert(SecureData), rows)
+                elif rows:
+                    ids = session.scalars(
+                        insert(SecureData).returning(SecureData.id, sort_by_parameter_order=True),
+                        rows
+                    ).all()
+                    session.execute(insert(SecureBlob), [
+                        {"data_id": id, "entry_data": entry_data}
+                        for id, (_, entry_data) in zip(ids, entries)
+                    ])
+
+                logger.info("%s Secure Data created for User: %s.", len(public_ids), user.username_hash[-4:])
+                return True, None, public_ids
+        except RuntimeError:
+            logger.warning("Database uninitialised.")
+            return False, FailureReason.DATABASE_UNINITIALISED, []
+        except:
+            logger.exception("Unknown database session exception.")
+            return False, FailureReason.UNKNOWN_EXCEPTION, []
+
+
     @staticmethod
     def edit(
         user_id: int,
@@ -66,13 +204,10 @@ class DBUtilsData():
         """
         try:
             with DatabaseSetup.get_db_session() as session:
-                secure_data = session.query(SecureData).filter(SecureData.public_id == public_id).first()
+                secure_data = DBUtilsData._owned_entry(session, user_id, public_id)
 
                 if not secure_data:
-                    logger.debug("Secure Data: %s not found.", public_id[-4:])
-                    return False, FailureReason.NOT_FOUND
-                if secure_data.user.id != user_id:
-                    logger.debug("Secure Data: %s does not belong to user.", public_id[-4:])
+                    logger.debug("Secure Data: %s not found for user.", public_id[-4:])
                     return False, FailureReason.NOT_FOUND
                 if secure_data.user.password_change:
                     logger.debug("Secure Data: %s undergoing password change.", secure_data.public_id[-4:])
@@ -80,7 +215,13 @@ class DBUtilsData():
 
                 if entry_name:
                     secure_data.entry_name = entry_name
-                if entry_data:
+                if entry_data and BlobStore.separate():
+                    session.execute(
+                        update(SecureBlob)
+                        .where(SecureBlob.data_id == secure_data.id)
+                        .values(entry_data=entry_data)
+                    )
+                elif entry_data:
                     secure_data.entry_data = entry_data
 
                 logger.info("Secure Data: %s edited.", public_id[-4:])
@@ -93,6 +234,79 @@ class DBUtilsData():
             return False, FailureReason.UNKNOWN_EXCEPTION
 
 
+    @staticmethod
+    def edit_many(
+        user_id: int,
+        edits: List[Tuple[str, Optional[bytes], Optional[bytes]]]
+    ) -> Tuple[bool, Optional[FailureReason], List[Tuple[str, Optional[FailureReason]]]]:
+        """
+        Adjust many data entries in a single transaction, only updating non-null values
+
+        Entries not owned by the user are reported as not found, without
+        failing the rest of the batch.
+
+        Args:
+            edits ([(str, bytes, bytes)]):  Public id, entry name and entry data of each edit, at most MAX_BATCH_SIZE
+
+        Returns:
+            [(str, FailureReason)]
+                (str)           The public id of the entry
+                (FailureReason) The reason the edit failed, or None if edited
+        """
+        if len(edits) > DBUtilsData.MAX_BATCH_SIZE:
+            logger.debug("Too many Secure Data edited for User id: %s.", user_id)
+            return False, FailureReason.TOO_MANY, []
+
+        try:
+            with DatabaseSetup.get_db_session() as session:
+                owned_ids = DBUtilsData._owned_ids(session, user_id, [edit[0] for edit in edits])
+
+                if owned_ids is None:
+                    logger.debug("User id: %s not found.", user_id)
+                    return False, FailureReason.NOT_FOUND, []
+                password_change, owned = owned_ids
+                if password_change:
+                    logger.debug("User id: %s undergoing password change.", user_id)
+                    return False, FailureReason.PASSWORD_CHANGE, []
+
+                separate = BlobStore.separate()
+                results: List[Tuple[str, Optional[FailureReason]]] = []
+                updates = []
+                blob_updates = []
+                edited = 0
+                for public_id, entry_name, entry_data in edits:
+                    if public_id not in owned:
+                        results.append((public_id, FailureReason.NOT_FOUND))
+                        continue
+
+                    values: Dict[str, Any] = {"id": owned[public_id]}
+                    if entry_name:
+                        values["entry_name"] = entry_name
+                    if entry_data and separate:
+                        blob_updates.append({"data_id": owned[public_id], "entry_data": entry_data})
+                    elif entry_data:
+                        values["entry_data"] = entry_data
+                    if len(values) > 1:
+                        updates.append(values)
+                    if entry_name or entry_data:
+                        edited += 1
+                    results.append((public_id, None))
+
+                if updates:
+                    session.execute(update(SecureData), updates)
+                if blob_updates:
+                    session.execute(update(SecureBlob), blob_updates)
+
+                logger.info("%s Secure Data edited for User id: %s.", edited, user_id)
+                return True, None, results
+        except RuntimeError:
+            logger.warning("Database uninitialised.")
+            return False, FailureReason.DATABASE_UNINITIALISED, []
+        except:
+            logger.exception("Unknown database session exception.")
+            return False, FailureReason.UNKNOWN_EXCEPTION, []
+
+
     @staticmethod
     def delete(
         user_id: int,
@@ -101,13 +315,10 @@ class DBUtilsData():
         """Delete the given data entry"""
         try:
             with DatabaseSetup.get_db_session() as session:
-                secure_data = session.query(SecureData).filter(SecureData.public_id == public_id).first()
+                secure_data = DBUtilsData._owned_entry(session, user_id, public_id)
 
                 if not secure_data:
-                    logger.debug("Secure Data: %s not found.", public_id[-4:])
-                    return False, FailureReason.NOT_FOUND
-                if secure_data.user.id != user_id:
-                    logger.debug("Secure Data: %s does not belong to user.", public_id[-4:])
+                    logger.debug("Secure Data: %s not found for user.", public_id[-4:])
                     return False, FailureReason.NOT_FOUND
                 if secure_data.user.password_change:
                     logger.debug("Secure Data: %s undergoing password change.", secure_data.public_id[-4:])
@@ -125,6 +336,58 @@ class DBUtilsData():
             return False, FailureReason.UNKNOWN_EXCEPTION
 
 
+    @staticmethod
+    def delete_many(
+        user_id: int,
+        public_ids: List[str]
+    ) -> Tuple[bool, Optional[FailureReason], List[Tuple[str, Optional[FailureReason]]]]:
+        """
+        Delete many data entries in a single transaction
+
+        Entries not owned by the user are reported as not found, without
+        failing the rest of the batch.
+
+        Args:
+            public_ids ([str]): Public ids of the entries, at most MAX_BATCH_SIZE
+
+        Returns:
+            [(str, FailureReason)]
+                (str)           The public id of the entry
+                (FailureReason) The reason the delete failed, or None if deleted
+        """
+        if len(public_ids) > DBUtilsData.MAX_BATCH_SIZE:
+            logger.debug("Too many Secure Data deleted for User id: %s.", user_id)
+            return False, FailureReason.TOO_MANY, []
+
+        try:
+            with DatabaseSetup.get_db_session() as session:
+                owned_ids = DBUtilsData._owned_ids(session, user_id, public_ids)
+
+                if owned_ids is None:
+                    logger.debug("User id: %s not found.", user_id)
+                    return False, FailureReason.NOT_FOUND, []
+                password_change, owned = owned_ids
+                if password_change:
+                    logger.debug("User id: %s undergoing password change.", user_id)
+                    return False, FailureReason.PASSWORD_CHANGE, []
+
+                results = [
+                    (public_id, None if public_id in owned else FailureReason.NOT_FOUND)
+                    for public_id in public_ids
+                ]
+                if owned:
+                    session.execute(delete(SecureData).where(SecureData.id.in_(owned.values())))
+
+                logger.info("%s Secure Data deleted for User id: %s.", len(owned), user_id)
+                return True, None, results
+        except RuntimeError:
+            logger.warning("Database uninitialised.")
+            return False, FailureReason.DATABASE_UNINITIALISED, []
+        except:
+            logger.exception("Unknown database session exception.")
+            return False, FailureReason.UNKNOWN_EXCEPTION, []
+
+
     @staticmethod
     def get_entry(
         user_id: int,
@@ -140,20 +403,21 @@ class DBUtilsData():
         """
         try:
             with DatabaseSetup.get_db_session() as session:
-                secure_data = session.query(SecureData).filter(SecureData.public_id == public_id).first()
+                secure_data = DBUtilsData._owned_entry(session, user_id, public_id, group="entry")
 
                 if not secure_data:
-                    logger.debug("Secure Data: %s not found.", public_id[-4:])
-                    return False, FailureReason.NOT_FOUND, b'', b''
-                if secure_data.user.id != user_id:
-                    logger.debug("Secure Data: %s does not belong to user.", public_id[-4:])
+                    logger.debug("Secure Data: %s not found for user.", public_id[-4:])
                     return False, FailureReason.NOT_FOUND, b'', b''
                 if secure_data.user.password_change and not password_change:
                     logger.debug("Secure Data: %s undergoing password change.", secure_data.public_id[-4:])
                     return False, FailureReason.PASSWORD_CHANGE, b'', b''
 
+                entry_data = secure_data.entry_data
+                if BlobStore.separate():
+                    entry_data = session.query(SecureBlob.entry_data).filter(SecureBlob.data_id == secure_data.id).scalar()
+
                 logger.info("Secure Data: %s requested.", public_id[-4:])
-                return True, None, secure_data.entry_name, secure_data.entry_data
+                return True, None, secure_data.entry_name, entry_data
         except RuntimeError:
             logger.warning("Database uninitialised.")
             return False, FailureReason.DATABASE_UNINITIALISED, b'', b''
@@ -163,35 +427,291 @@ class DBUtilsData():
 
 
     @staticmethod
-    def get_list(
-        user_id: int
-    ) -> Tuple[bool, Optional[FailureReason], dict[str, bytes]]:
+    def get_entries(
+        user_id: int,
+        public_ids: List[str],
+        password_change: bool = False
+    ) -> Tuple[bool, Optional[FailureReason], List[Tuple[str, bytes, bytes]], List[str]]:
         """
-        Make a data entry with the given data values
+        Get many of the user's data entries in a single query
+
+        Entries not found, or not owned by the user, are returned as missing
+        rather than failing the whole batch.
+
+        Args:
+            public_ids ([str]):     Public ids of the entries, at most MAX_PAGE_SIZE
+            password_change (bool): True if called as part of a password change
 
         Returns:
-            dict[str, bytes]
+            [(str, bytes, bytes)]
+                (str)   The encrypted entry public id
+                (bytes) The encrypted entry name
+                (bytes) The encrypted entry data
+            ([str]) Public ids requested but not found for the user
+        """
+        wanted = list(dict.fromkeys(public_ids))
+        if len(wanted) > DBUtilsData.MAX_PAGE_SIZE:
+            logger.debug("Too many Secure Data requested for User id: %s.", user_id)
+            return False, FailureReason.TOO_MANY, [], []
+
+        try:
+            with DatabaseSetup.get_db_session() as session:
+                query = (
+                    session.query(
+                        User.password_change,
+                        SecureData.public_id,
+                        SecureData.entry_name,
+                        DBUtilsData._entry_data_column()
+                    )
+                    .select_from(User)
+                    .outerjoin(SecureData, and_(
+                        SecureData.user_id == User.id,
+                        SecureData.public_id.in_(wanted)
+                    ))
+                )
+                if BlobStore.separate():
+                    query = query.outerjoin(SecureBlob, SecureBlob.data_id == SecureData.id)
+                rows = query.filter(User.id == user_id).all()
+
+                if not rows:
+                    logger.debug("User id: %s not found.", user_id)
+                    return False, FailureReason.NOT_FOUND, [], []
+                if rows[0][0] and not password_change:
+                    logger.debug("User id: %s undergoing password change.", user_id)
+                    return False, FailureReason.PASSWORD_CHANGE, [], []
+
+                found = {
+                    public_id: (public_id, entry_name, entry_data)
+                    for _, public_id, entry_name, entry_data in rows
+                    if public_id is not None
+                }
+                entries = [found[public_id] for public_id in wanted if public_id in found]
+                missing = [public_id for public_id in wanted if public_id not in found]
+
+                logger.info("%s Secure Data requested for User id: %s.", len(entries), user_id)
+                return True, None, entries, missing
+        except RuntimeError:
+            logger.warning("Database uninitialised.")
+            return False, FailureReason.DATABASE_UNINITIALISED, [], []
+        except:
+            logger.exception("Unknown database session exception.")
+            return False, FailureReason.UNKNOWN_EXCEPTION, [], []
+
+
+    @staticmethod
+    def _encode_cursor(
+        public_id: str
+    ) -> str:
+        return urlsafe_b64encode(public_id.encode("utf-8")).rstrip(b"=").decode("ascii")
+
+
+    @staticmethod
+    def _decode_cursor(
+        cursor: str
+    ) -> Optional[str]:
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            return urlsafe_b64decode(padded.encode("ascii")).decode("utf-8")
+        except (ValueError, UnicodeError):
+            return None
+
+
+    @staticmethod
+    def get_page(
+        user_id: int,
+        page_size: Optional[int],
+        cursor: str = ""
+    ) -> Tuple[bool, Optional[FailureReason], List[Tuple[str, bytes]], str]:
+        """
+        Get a page of the user's data entries, ordered by public id, without loading the entry data
+
+        Args:
+            page_size (int):    Maximum entries returned, capped at MAX_PAGE_SIZE, or None for all entries
+            cursor (str):       Cursor returned with the previous page, or empty for the first page
+
+        Returns:
+            [(str, bytes)]
                 (str)   The encrypted entry public id
                 (bytes) The encrypted entry name
+            (str)   Cursor for the next page, or empty if this is the last page
         """
+        after = None
+        if cursor:
+            after = DBUtilsData._decode_cursor(cursor)
+            if not after:
+                logger.debug("Invalid list cursor for User id: %s.", user_id)
+                return False, FailureReason.INVALID, [], ""
+
         try:
             with DatabaseSetup.get_db_session() as session:
                 user = session.query(User).filter(User.id == user_id).first()
 
                 if not user:
                     logger.debug("User id: %s not found.", user_id)
-                    return False, FailureReason.NOT_FOUND, {}
+                    return False, FailureReason.NOT_FOUND, [], ""
                 if user.password_change:
                     logger.debug("User: %s undergoing password change.", user.username_hash[-4:])
-                    return False, FailureReason.PASSWORD_CHANGE, {}
+                    return False, FailureReason.PASSWORD_CHANGE, [], ""
+
+                query = (
+                    session.query(SecureData.public_id, SecureData.entry_name)
+                    .filter(SecureData.user_id == user_id)
+                )
+                if after:
+                    query = query.filter(SecureData.public_id > after)
+                query = query.order_by(SecureData.public_id)
 
-                all_entries = {data.public_id: data.entry_name for data in user.secure_data}
+                if page_size is None:
+                    entries = [(public_id, entry_name) for public_id, entry_name in query.all()]
+                    next_cursor = ""
+                else:
+                    page_size = min(page_size, DBUtilsData.MAX_PAGE_SIZE)
+                    rows = query.limit(page_size + 1).all()
+                    entries = [(public_id, entry_name) for public_id, entry_name in rows[:page_size]]
+                    next_cursor = ""
+                    if len(rows) > page_size and entries:
+                        next_cursor = DBUtilsData._encode_cursor(entries[-1][0])
 
-                logger.info("Secure Data List requested for User: %s.", user.username_hash[-4:])
-                return True, None, all_entries
+                logger.info("Secure Data List page requested for User: %s.", user.username_hash[-4:])
+                return True, None, entries, next_cursor
         except RuntimeError:
             logger.warning("Database uninitialised.")
-            return False, FailureReason.DATABASE_UNINITIALISED, {}
+            return False, FailureReason.DATABASE_UNINITIALISED, [], ""
         except:
             logger.exception("Unknown database session exception.")
-            return False, FailureReason.UNKNOWN_EXCEPTION, {}
+            return False, FailureReason.UNKNOWN_EXCEPTION, [], ""
+
+
+    @staticmethod
+    def _stream_rows(
+        user_id: int,
+        chunk_size: int,
+        columns: Tuple[Any, ...],
+        password_change: bool,
+        join_blobs: bool = False
+    ) -> Iterator[Tuple[bool, Optional[FailureReason], List[Tuple[Any, ...]]]]:
+        chunk_size = max(1, min(chunk_size, DBUtilsData.MAX_PAGE_SIZE))
+        after = None
+        sent = False
+
+        while True:
+            # Each chunk is read in its own short transaction, and yielded after it
+            # ends, so a slow client holds no transaction or pooled connection
+            try:
+                with DatabaseSetup.get_db_session() as session:
+                    user = session.query(User).filter(User.id == user_id).first()
+
+                    if not user:
+                        logger.debug("User id: %s not found.", user_id)
+                        failure = FailureReason.NOT_FOUND
+                    elif user.password_change and not password_change:
+                        logger.debug("User: %s undergoing password change.", user.username_hash[-4:])
+                        failure = FailureReason.PASSWORD_CHANGE
+                    else:
+                        failure = None
+                        if after is None:
+                            logger.info("Secure Data streamed for User: %s.", user.username_hash[-4:])
+
+                        query = session.query(*columns).select_from(SecureData)
+                        if join_blobs:
+                            query = query.outerjoin(SecureBlob, SecureBlob.data_id == SecureData.id)
+                        query = query.filter(SecureData.user_id == user_id)
+                        if after is not None:
+                            query = query.filter(SecureData.public_id > after)
+                        chunk = [tuple(row) for row in query.order_by(SecureData.public_id).limit(chunk_size).all()]
+            except RuntimeError:
+                logger.warning("Database uninitialised.")
+                failure = FailureReason.DATABASE_UNINITIALISED
+            except:
+                logger.exception("Unknown database session exception.")
+                failure = FailureReason.UNKNOWN_EXCEPTION
+
+            if failure is not None:
+                yield False, failure, []
+                return
+
+            if chunk or not sent:
+                yield True, None, chunk
+                sent = True
+            if len(chunk) < chunk_size:
+                return
+            after = chunk[-1][0]
+
+
+    @staticmethod
+    def stream_list(
+        user_id: int,
+        chunk_size: int
+    ) -> Iterator[Tuple[bool, Optional[FailureReason], List[Tuple[str, bytes]]]]:
+        """
+        Stream the user's data entries in chunks, as they are read from the database
+
+        Each chunk is read by public id after the previous one, in its own
+        transaction, so no session is held open while a chunk is consumed. A
+        failure is yielded once and ends the stream, after any chunks already
+        read. At least one chunk is yielded on success, even if the user has
+        no entries.
+
+        Args:
+            chunk_size (int):   Entries in each chunk, capped at MAX_PAGE_SIZE
+
+        Returns:
+            (bool)  True if the chunk was read, false otherwise
+            (FailureReason) The reason for failure, if any
+            [(str, bytes)]
+                (str)   The encrypted entry public id
+                (bytes) The encrypted entry name
+        """
+        yield from DBUtilsData._stream_rows(
+            user_id,
+            chunk_size,
+            (SecureData.public_id, SecureData.entry_name),
+            password_change=False
+        )
+
+
+    @staticmethod
+    def stream_entries(
+        user_id: int,
+        chunk_size: int,
+        password_change: bool = False
+    ) -> Iterator[Tuple[bool, Optional[FailureReason], List[Tuple[str, bytes, bytes]]]]:
+        """
+        Stream the user's data entries in chunks, with their encrypted data
+
+        Behaves as stream_list, with each entry's data included.
+
+        Returns:
+            (bool)  True if the chunk was read, false otherwise
+            (FailureReason) The reason for failure, if any
+            [(str, bytes, bytes)]
+                (str)   The encrypted entry public id
+                (bytes) The encrypted entry name
+                (bytes) The encrypted entry data
+        """
+        yield from DBUtilsData._stream_rows(
+            user_id,
+            chunk_size,
+            (SecureData.public_id, SecureData.entry_name, DBUtilsData._entry_data_column()),
+            password_change,
+            join_blobs=BlobStore.separate()
+        )
+
+
+    @staticmethod
+    def get_list(
+        user_id: int
+    ) -> Tuple[bool, Optional[FailureReason], dict[str, bytes]]:
+        """
+        Get every data entry of the user in one list, for clients not paging through get_page
+
+        Returns:
+            dict[str, bytes]
+                (str)   The encrypted entry public id
+                (bytes) The encrypted entry name
+        """
+        status, failure_reason, entries, _ = DBUtilsData.get_page(
+            user_id=user_id,
+            page_size=None
+        )
+        return status, failure_reason, dict(entries)
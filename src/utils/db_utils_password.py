@@ -4,12 +4,17 @@ from typing import Tuple, Optional, List
 from logging import getLogger
 logger = getLogger("database")
 
+from sqlalchemy import func, or_, select, update, delete
 from sqlalchemy.orm import Session
 
 from enums import FailureReason
-from database import DatabaseSetup, User, AuthEphemeral, SecureData, LoginSession
+from database import DatabaseSetup, User, AuthEphemeral, SecureData, SecureBlob, LoginSession, BlobStore, track_queries
+from .session_cache import SessionCache
+from .request_counter import RequestCounter
+from .db_utils_data import DBUtilsData
 
 
+@track_queries
 class DBUtilsPassword():
     """Utility functions for managing password change based database functions"""
 
@@ -18,7 +23,13 @@ class DBUtilsPassword():
         db_session: Session,
         user: User
     ):
-        """Remove all partial password change entries, ephemerals and login sessions"""
+        """
+        Remove all partial password change entries, ephemerals and login sessions
+
+        Done in three bulk statements, so no entry is loaded. Objects already
+        in the session are updated or removed to match, and the user's
+        collections are expired to be reloaded on next access.
+        """
         logger.info("Cleaned password change for User: %s.", user.username_hash[-4:])
 
         user.password_change = False
@@ -26,17 +37,31 @@ class DBUtilsPassword():
         user.new_srp_verifier = None
         user.new_master_key_salt = None
 
-        for ephemeral in user.auth_ephemerals:
-            if ephemeral.password_change:
-                db_session.delete(ephemeral)
-
-        for login_session in user.login_sessions:
-            if login_session.password_change:
-                db_session.delete(login_session)
-
-        for secure_data in user.secure_data:
-            secure_data.new_entry_name = None
-            secure_data.new_entry_data = None
+        db_session.execute(
+            delete(AuthEphemeral)
+            .where(AuthEphemeral.user_id == user.id, AuthEphemeral.password_change == True)
+            .execution_options(synchronize_session="evaluate")
+        )
+        session_ids = db_session.execute(
+            delete(LoginSession)
+            .where(LoginSession.user_id == user.id, LoginSession.password_change == True)
+            .returning(LoginSession.id)
+            .execution_options(synchronize_session="evaluate")
+        ).scalars().all()
+        db_session.execute(
+            update(SecureData)
+            .where(
+                SecureData.user_id == user.id,
+                or_(SecureData.new_entry_name.isnot(None), SecureData.new_entry_data.isnot(None))
+            )
+            .values(new_entry_name=None, new_entry_data=None)
+            .execution_options(synchronize_session="evaluate")
+        )
+        db_session.expire(user, ["auth_ephemerals", "login_sessions", "secure_data"])
+
+        SessionCache.invalidate_user(user.id, db_session)
+        for session_id in session_ids:
+            RequestCounter.discard(session_id, db_session)
 
 
     @staticmethod
@@ -162,8 +187,9 @@ class DBUtilsPassword():
         """
         Complete password change process
 
-        Returns:
-            ([str]) [public_id]
+        Completeness is checked with one count before anything changes. The
+        entries are then swapped with one set-based update, so no entry blob
+        is read into memory whatever the size of the vault.
         """
         try:
             with DatabaseSetup.get_db_session() as session:
@@ -177,6 +203,22 @@ class DBUtilsPassword():
                     DBUtilsPassword.clean_password_change(session, user)
                     return False, FailureReason.INCOMPLETE
 
+                incomplete = (
+                    session.query(func.count(SecureData.id))
+                    .filter(SecureData.user_id == user.id)
+                    .filter(or_(
+                        SecureData.new_entry_name.is_(None),
+                        SecureData.new_entry_data.is_(None),
+                        SecureData.new_entry_name == b'',
+                        SecureData.new_entry_data == b''
+                    ))
+                    .scalar()
+                )
+                if incomplete:
+                    logger.debug("User: %s password change failed: Secure Data not all updated.", user.username_hash)
+                    DBUtilsPassword.clean_password_change(session, user)
+                    return False, FailureReason.INCOMPLETE
+
                 user.password_change = False
                 user.srp_salt = user.new_srp_salt
                 user.srp_verifier = user.new_srp_verifier
@@ -185,19 +227,37 @@ class DBUtilsPassword():
                 user.new_srp_verifier = None
                 user.new_master_key_salt = None
 
-                for login_session in user.login_sessions:
-                    session.delete(login_session)
-
-                for secure_data in user.secure_data:
-                    if not secure_data.new_entry_name or not secure_data.new_entry_data:
-                        logger.debug("User: %s password change failed: Secure Data not all updated.", user.username_hash)
-                        DBUtilsPassword.clean_password_change(session, user)
-                        return False, FailureReason.INCOMPLETE
-
-                    secure_data.entry_name = secure_data.new_entry_name
-                    secure_data.entry_data = secure_data.new_entry_data
-                    secure_data.new_entry_name = None
-                    secure_data.new_entry_data = None
+                if BlobStore.separate():
+                    session.execute(
+                        update(SecureBlob)
+                        .where(SecureBlob.data_id.in_(select(SecureData.id).where(SecureData.user_id == user.id)))
+                        .values(entry_data=(
+                            select(SecureData.new_entry_data)
+                            .where(SecureData.id == SecureBlob.data_id)
+                            .scalar_subquery()
+                        ))
+                        .execution_options(synchronize_session=False)
+                    )
+                session.execute(
+                    update(SecureData)
+                    .where(SecureData.user_id == user.id)
+                    .values(
+                        entry_name=SecureData.new_entry_name,
+                        entry_data=b'' if BlobStore.separate() else SecureData.new_entry_data,
+                        new_entry_name=None,
+                        new_entry_data=None
+                    )
+                    .execution_options(synchronize_session=False)
+                )
+                session_ids = session.execute(
+                    delete(LoginSession)
+                    .where(LoginSession.user_id == user.id)
+                    .returning(LoginSession.id)
+                    .execution_options(synchronize_session=False)
+                ).scalars().all()
+                SessionCache.invalidate_user(user.id, session)
+                for session_id in session_ids:
+                    RequestCounter.discard(session_id, session)
 
                 logger.info("Password change for User: %s completed.", user.username_hash[-4:])
                 return True, None
@@ -244,13 +304,10 @@ class DBUtilsPassword():
         """Add new encrypted entries for a secure entry"""
         try:
             with DatabaseSetup.get_db_session() as session:
-                secure_data = session.query(SecureData).filter(SecureData.public_id == public_id).first()
+                secure_data = DBUtilsData._owned_entry(session, user_id, public_id, group="new_entry")
 
                 if secure_data is None:
-                    logger.debug("Secure Data: %s not found.", public_id[-4:])
-                    return False, FailureReason.NOT_FOUND
-                if secure_data.user.id != user_id:
-                    logger.debug("Secure Data: %s does not belong to user.", public_id[-4:])
+                    logger.debug("Secure Data: %s not found for user.", public_id[-4:])
                     return False, FailureReason.NOT_FOUND
                 if secure_data.new_entry_name or secure_data.new_entry_data:
                     logger.debug("Secure Data: %s has already been updated.", public_id[-4:])
@@ -268,3 +325,68 @@ class DBUtilsPassword():
         except:
             logger.exception("Unknown database session exception.")
             return False, FailureReason.UNKNOWN_EXCEPTION
+
+
+    @staticmethod
+    def update_many(
+        user_id: int,
+        entries: List[Tuple[str, bytes, bytes]]
+    ) -> Tuple[bool, Optional[FailureReason]]:
+        """
+        Add new encrypted entries for many secure entries in one transaction
+
+        Either every entry is updated or none are. As with update, an entry
+        already updated, or repeated in the batch, cancels the password change.
+
+        Args:
+            entries ([(str, bytes, bytes)]):    Public id, new entry name and new entry data of each entry
+        """
+        if len(entries) > DBUtilsData.MAX_BATCH_SIZE:
+            logger.debug("Too many entries in update batch: %s.", len(entries))
+            return False, FailureReason.TOO_MANY
+
+        public_ids = {public_id for public_id, _, _ in entries}
+
+        try:
+            with DatabaseSetup.get_db_session() as session:
+                rows = (
+                    session.query(
+                        SecureData.id,
+                        SecureData.public_id,
+                        or_(SecureData.new_entry_name.isnot(None), SecureData.new_entry_data.isnot(None))
+                    )
+                    .filter(SecureData.user_id == user_id)
+                    .filter(SecureData.public_id.in_(public_ids))
+                    .all()
+                )
+
+                ids = {public_id: id for id, public_id, _ in rows}
+                missing = public_ids - ids.keys()
+
+                if missing:
+                    logger.debug("%s Secure Data not found for user.", len(missing))
+                    return False, FailureReason.NOT_FOUND
+                if len(public_ids) < len(entries) or any(updated for _, _, updated in rows):
+                    logger.debug("Secure Data in batch has already been updated.")
+                    user = session.query(User).filter(User.id == user_id).first()
+                    if user is not None:
+                        DBUtilsPassword.clean_password_change(session, user)
+                    return False, FailureReason.ENTRY_UPDATED
+
+                if entries:
+                    session.execute(
+                        update(SecureData),
+                        [
+                            {"id": ids[public_id], "new_entry_name": entry_name, "new_entry_data": entry_data}
+                            for public_id, entry_name, entry_data in entries
+                        ]
+                    )
+
+                logger.info("%s Secure Data updated for Password change.", len(entries))
+                return True, None
+        except RuntimeError:
+            logger.warning("Database uninitialised.")
+            return False, FailureReason.DATABASE_UNINITIALISED
+        except:
+            logger.exception("Unknown database session exception.")
+            return False, FailureReason.UNKNOWN_EXCEPTION
@@ -4,24 +4,32 @@ from typing import Tuple, Optional
 from logging import getLogger
 logger = getLogger("database")
 
+from sqlalchemy import select, delete
 from sqlalchemy.orm import Session
 
 from enums import FailureReason
-from database import DatabaseSetup, LoginSession, User
+from database import DatabaseSetup, LoginSession, User, track_queries
 from .db_utils_password import DBUtilsPassword
+from .session_cache import SessionCache, CachedSession
+from .request_counter import RequestCounter
 
 
+@track_queries
 class DBUtilsSession():
     """Utility functions for managing session based database functions"""
 
     @staticmethod
     def _check_expiry(
         db_session: Session,
-        login_session: LoginSession
+        login_session: LoginSession,
+        request_count: int
     ) -> bool:
         """
         Checks if a login session is expired, and cleans up appropriately
 
+        Args:
+            request_count (int):    The session's request count, including increments not yet flushed
+
         Returns:
             (bool)  True if expired & being deleted, false otherwise
         """
@@ -35,7 +43,7 @@ class DBUtilsSession():
 
         if (
             login_session.maximum_requests is not None and
-            login_session.maximum_requests <= login_session.request_count
+            login_session.maximum_requests <= request_count
         ):
             is_expired = True
 
@@ -49,6 +57,8 @@ class DBUtilsSession():
                 )
             else:
                 db_session.delete(login_session)
+                SessionCache.invalidate(login_session.public_id, db_session)
+                RequestCounter.discard(login_session.id, db_session)
 
         return is_expired
 
@@ -68,17 +78,48 @@ class DBUtilsSession():
             (int)   request_count
             (bool)  password_change
         """
+        cached = SessionCache.get(public_id)
+        if cached is not None and not cached.is_expired():
+            logger.debug("Login Session: %s requested from cache.", public_id[-4:])
+            return (
+                True, None,
+                cached.user_id,
+                cached.username_hash,
+                cached.session_id,
+                cached.session_key,
+                cached.request_count,
+                cached.password_change
+            )
+
         try:
+            generation = SessionCache.generation()
+            sequence = RequestCounter.sequence()
             with DatabaseSetup.get_db_session() as session:
                 login_session = session.query(LoginSession).filter(LoginSession.public_id == public_id).first()
 
                 if login_session is None:
                     logger.debug("Login Session: %s not found.", public_id[-4:])
                     return False, FailureReason.NOT_FOUND, 0, b'', 0, b'', 0, False
-                if DBUtilsSession._check_expiry(session, login_session):
+                request_count = RequestCounter.request_count(session, login_session, sequence)
+                if DBUtilsSession._check_expiry(session, login_session, request_count):
                     logger.debug("Login Session: %s expired.", public_id[-4:])
                     return False, FailureReason.NOT_FOUND, 0, b'', 0, b'', 0, False
 
+                SessionCache.put(
+                    CachedSession(
+                        public_id=login_session.public_id,
+                        session_id=login_session.id,
+                        user_id=login_session.user.id,
+                        username_hash=login_session.user.username_hash,
+                        session_key=login_session.session_key,
+                        request_count=request_count,
+                        maximum_requests=login_session.maximum_requests,
+                        expiry_time=login_session.expiry_time,
+                        password_change=login_session.password_change
+                    ),
+                    generation
+                )
+
                 logger.debug("Login Session: %s requested.", public_id[-4:])
                 return (
                     True, None,
@@ -86,7 +127,7 @@ class DBUtilsSession():
                     login_session.user.username_hash,
                     login_session.id,
                     login_session.session_key,
-                    login_session.request_count,
+                    request_count,
                     login_session.password_change
                 )
         except RuntimeError:
@@ -107,18 +148,56 @@ class DBUtilsSession():
         Returns:
             (bytes) session_key
         """
+        cached = SessionCache.consume(session_id)
+        if cached is not None and RequestCounter.enabled():
+            RequestCounter.add(session_id)
+            logger.debug("Login Session: %s request count deferred.", cached.public_id[-4:])
+            return True, None, cached.session_key
+        if cached is not None:
+            try:
+                with DatabaseSetup.get_db_session() as session:
+                    updated = session.query(LoginSession).filter(LoginSession.id == session_id).update(
+                        {LoginSession.request_count: LoginSession.request_count + 1},
+                        synchronize_session=False
+                    )
+
+                    if not updated:
+                        logger.debug("Login Session id: %s not found.", session_id)
+                        SessionCache.invalidate(cached.public_id)
+                        return False, FailureReason.NOT_FOUND, b''
+
+                    logger.debug("Login Session: %s request count incremented.", cached.public_id[-4:])
+                    return True, None, cached.session_key
+            except RuntimeError:
+                logger.warning("Database uninitialised.")
+                SessionCache.invalidate(cached.public_id)
+                return False, FailureReason.DATABASE_UNINITIALISED, b''
+            except:
+                logger.exception("Unknown database session exception.")
+                SessionCache.invalidate(cached.public_id)
+                return False, FailureReason.UNKNOWN_EXCEPTION, b''
+
         try:
+            sequence = RequestCounter.sequence()
             with DatabaseSetup.get_db_session() as session:
                 login_session = session.query(LoginSession).filter(LoginSession.id == session_id).first()
 
                 if login_session is None:
                     logger.debug("Login Session id: %s not found.", session_id)
                     return False, FailureReason.NOT_FOUND, b''
-                if DBUtilsSession._check_expiry(session, login_session):
+                request_count = RequestCounter.request_count(session, login_session, sequence)
+                if DBUtilsSession._check_expiry(session, login_session, request_count):
                     logger.debug("Login Session: %s expired.", login_session.public_id[-4:])
                     return False, FailureReason.NOT_FOUND, b''
 
-                login_session.request_count += 1
+                if RequestCounter.enabled():
+                    # Checked again with the increment, as concurrent requests may have used the last of the budget
+                    if not RequestCounter.try_add(session, login_session, sequence):
+                        logger.debug("Login Session: %s has no requests left.", login_session.public_id[-4:])
+                        return False, FailureReason.NOT_FOUND, b''
+                else:
+                    login_session.request_count += 1
+                SessionCache.invalidate(login_session.public_id, session)
 
                 logger.debug("Login Session: %s request count incremented.", login_session.public_id[-4:])
                 return True, None, login_session.session_key
@@ -137,13 +216,15 @@ class DBUtilsSession():
     ) -> Tuple[bool, Optional[FailureReason]]:
         """Delete given login session"""
         try:
+            sequence = RequestCounter.sequence()
             with DatabaseSetup.get_db_session() as session:
                 login_session = session.query(LoginSession).filter(LoginSession.public_id == public_id).first()
 
                 if not login_session:
                     logger.debug("Login Session: %s not found.", public_id[-4:])
                     return False, FailureReason.NOT_FOUND
-                if DBUtilsSession._check_expiry(session, login_session):
+                request_count = RequestCounter.request_count(session, login_session, sequence)
+                if DBUtilsSession._check_expiry(session, login_session, request_count):
                     logger.debug("Login Session: %s expired.", public_id[-4:])
                     return False, FailureReason.NOT_FOUND
                 if login_session.user.id != user_id:
@@ -154,6 +235,8 @@ class DBUtilsSession():
                     return False, FailureReason.PASSWORD_CHANGE
 
                 session.delete(login_session)
+                SessionCache.invalidate(public_id, session)
+                RequestCounter.discard(login_session.id, session)
 
                 logger.debug("Login Session: %s deleted.", public_id[-4:])
                 return True, None
@@ -187,6 +270,8 @@ class DBUtilsSession():
                         DBUtilsPassword.clean_password_change(session, login_session.user)
                     else:
                         session.delete(login_session)
+                        RequestCounter.discard(login_session.id, session)
+                SessionCache.invalidate_user(user_id, session)
 
                 logger.debug("Login Sessions cleaned for User: %s.", user.username_hash[-4:])
                 return True, None
@@ -203,10 +288,12 @@ class DBUtilsSession():
     ) -> Tuple[bool, Optional[FailureReason]]:
         """Remove all expired Login Sessions from the database"""
         try:
+            sequence = RequestCounter.sequence()
             with DatabaseSetup.get_db_session() as session:
                 login_sessions = session.query(LoginSession)
                 for login_session in login_sessions:
-                    _ = DBUtilsSession._check_expiry(session, login_session)
+                    request_count = RequestCounter.request_count(session, login_session, sequence)
+                    _ = DBUtilsSession._check_expiry(session, login_session, request_count)
 
                 logger.debug("Login Sessions cleaned.")
                 return True, None
@@ -216,3 +303,72 @@ class DBUtilsSession():
         except Exception:
             logger.exception("Unknown database session exception.")
             return False, FailureReason.UNKNOWN_EXCEPTION
+
+
+    @staticmethod
+    def reap_expired(
+        chunk_size: int
+    ) -> Tuple[bool, Optional[FailureReason], int, int]:
+        """
+        Delete expired Login Sessions with set-based statements, each chunk in its own transaction
+
+        Expired password change sessions cancel the password change of their
+        user, as they would when found expired on the request path.
+
+        Args:
+            chunk_size (int):   Maximum rows, or users, handled in each transaction
+
+        Returns:
+            (int)   Number of expired Login Sessions deleted
+            (int)   Number of password changes cancelled
+        """
+        chunk_size = max(1, chunk_size)
+        now = datetime.now()
+        reaped = 0
+        cleaned = 0
+
+        try:
+            while True:
+                with DatabaseSetup.get_db_session() as session:
+                    expired = (
+                        select(LoginSession.id)
+                        .where(LoginSession.expiry_time < now, LoginSession.password_change == False)
+                        .limit(chunk_size)
+                    )
+                    deleted = session.execute(
+                        delete(LoginSession)
+                        .where(LoginSession.id.in_(expired))
+                        .returning(LoginSession.id, LoginSession.public_id)
+                        .execution_options(synchronize_session=False)
+                    ).all()
+                    for session_id, public_id in deleted:
+                        SessionCache.invalidate(public_id, session)
+                        RequestCounter.discard(session_id, session)
+                reaped += len(deleted)
+                if len(deleted) < chunk_size:
+                    break
+
+            while True:
+                with DatabaseSetup.get_db_session() as session:
+                    users = (
+                        session.query(User)
+                        .join(LoginSession, LoginSession.user_id == User.id)
+                        .filter(LoginSession.expiry_time < now, LoginSession.password_change == True)
+                        .distinct()
+                        .limit(chunk_size)
+                        .all()
+                    )
+                    for user in users:
+                        DBUtilsPassword.clean_password_change(session, user)
+                cleaned += len(users)
+                if len(users) < chunk_size:
+                    break
+
+            logger.debug("Reaped %s expired Login Sessions, and %s password changes.", reaped, cleaned)
+            return True, None, reaped, cleaned
+        except RuntimeError:
+            logger.warning("Database uninitialised.")
+            return False, FailureReason.DATABASE_UNINITIALISED, reaped, cleaned
+        except Exception:
+            logger.exception("Unknown database session exception.")
+            return False, FailureReason.UNKNOWN_EXCEPTION, reaped, cleaned
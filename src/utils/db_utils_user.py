@@ -6,9 +6,12 @@ logger = getLogger("database")
 from sqlalchemy.exc import IntegrityError
 
 from enums import FailureReason
-from database import DatabaseSetup, User
+from database import DatabaseSetup, User, track_queries
+from .session_cache import SessionCache
+from .request_counter import RequestCounter
 
 
+@track_queries
 class DBUtilsUser():
     """Utility functions for managing user based database functions"""
 
@@ -61,6 +64,7 @@ class DBUtilsUser():
                     return False, FailureReason.PASSWORD_CHANGE
 
                 user.username_hash = new_username_hash
+                SessionCache.invalidate_user(user_id, session)
 
                 return True, None
         except IntegrityError:
@@ -90,6 +94,9 @@ class DBUtilsUser():
                     return False, FailureReason.PASSWORD_CHANGE
 
                 session.delete(user)
+                SessionCache.invalidate_user(user_id, session)
+                for login_session in user.login_sessions:
+                    RequestCounter.discard(login_session.id, session)
 
                 return True, None
         except RuntimeError:
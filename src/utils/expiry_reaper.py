@@ -0,0 +1,147 @@
+from typing import Optional, Dict
+from threading import Lock, Event, Thread
+
+from logging import getLogger
+logger = getLogger("database")
+
+from .db_utils_auth import DBUtilsAuth
+from .db_utils_session import DBUtilsSession
+
+
+class ExpiryReaper():
+    """
+    Background deletion of expired auth ephemerals and login sessions
+
+    Expired rows are deleted in bounded chunks of set-based statements, so
+    the tables stay small and the expiry checks made on the request path
+    rarely find anything to remove. Expired password change rows cancel the
+    password change, as they would on the request path.
+    """
+
+    _interval: float = 0
+    _chunk_size: int = 500
+    _lock = Lock()
+    _runs: int = 0
+    _totals: Dict[str, int] = {}
+    _wake = Event()
+    _stopping = Event()
+    _thread: Optional[Thread] = None
+
+
+    @classmethod
+    def start(
+        cls,
+        interval: float,
+        chunk_size: int = 500
+    ):
+        """
+        Begin reaping expired rows in the background, with an interval of 0 leaving it disabled
+
+        Args:
+            interval (float):   Seconds between reaps
+            chunk_size (int):   Maximum rows deleted in each transaction
+        """
+        if interval < 0 or chunk_size < 1:
+            raise ValueError(f"Invalid expiry reaper settings: {interval}, {chunk_size}")
+        if cls._thread is not None:
+            raise RuntimeError("Expiry reaper already started.")
+
+        cls._interval = interval
+        cls._chunk_size = chunk_size
+        if interval == 0:
+            return
+
+        cls._stopping.clear()
+        cls._wake.clear()
+        cls._thread = Thread(target=cls._run, name="expiry-reaper", daemon=True)
+        cls._thread.start()
+        logger.info("Expiry reaper running every %s seconds.", interval)
+
+
+    @classmethod
+    def stop(cls):
+        """Stop the background reaper, waiting for any reap in progress"""
+        thread = cls._thread
+        if thread is not None:
+            cls._stopping.set()
+            cls._wake.set()
+            thread.join()
+            cls._thread = None
+
+        cls._interval = 0
+
+
+    @classmethod
+    def _reset(cls):
+        cls.stop()
+        cls._chunk_size = 500
+        with cls._lock:
+            cls._runs = 0
+            cls._totals = {}
+
+
+    @classmethod
+    def _run(cls):
+        while not cls._stopping.is_set():
+            cls._wake.wait(cls._interval)
+            cls._wake.clear()
+            if cls._stopping.is_set():
+                break
+            cls.reap()
+
+
+    @classmethod
+    def enabled(cls) -> bool:
+        return cls._thread is not None
+
+
+    @classmethod
+    def reap(cls) -> Dict[str, int]:
+        """
+        Delete every expired auth ephemeral and login session
+
+        Returns:
+            (dict)  Rows reaped this run, keyed by 'auth_ephemerals', 'login_sessions' and 'password_changes'
+        """
+        counts = {"auth_ephemerals": 0, "login_sessions": 0, "password_changes": 0}
+
+        status, failure_reason, reaped, cleaned = DBUtilsAuth.reap_expired(cls._chunk_size)
+        counts["auth_ephemerals"] += reaped
+        counts["password_changes"] += cleaned
+        if not status:
+            assert failure_reason
+            logger.warning("Failed to reap expired Auth Ephemerals: %s.", failure_reason.name)
+
+        status, failure_reason, reaped, cleaned = DBUtilsSession.reap_expired(cls._chunk_size)
+        counts["login_sessions"] += reaped
+        counts["password_changes"] += cleaned
+        if not status:
+            assert failure_reason
+            logger.warning("Failed to reap expired Login Sessions: %s.", failure_reason.name)
+
+        with cls._lock:
+            cls._runs += 1
+            for name, count in counts.items():
+                cls._totals[name] = cls._totals.get(name, 0) + count
+
+        if any(counts.values()):
+            logger.info(
+                "Reaped %s Auth Ephemerals and %s Login Sessions, cancelling %s password changes.",
+                counts["auth_ephemerals"], counts["login_sessions"], counts["password_changes"]
+            )
+        return counts
+
+
+    @classmethod
+    def metrics(cls) -> Dict[str, float]:
+        """
+        Get the totals reaped since the process started
+
+        Returns:
+            (dict)  Reaper metrics, keyed by metric name
+        """
+        with cls._lock:
+            metrics: Dict[str, float] = {"runs": cls._runs}
+            for name in ("auth_ephemerals", "login_sessions", "password_changes"):
+                metrics[f"{name}_reaped"] = cls._totals.get(name, 0)
+            return metrics
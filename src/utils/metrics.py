@@ -0,0 +1,145 @@
+from bisect import bisect_left
+from threading import Lock
+from typing import Tuple, List, Dict, Callable
+
+
+# Latency histogram upper bounds, in seconds
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+
+class MetricsRegistry():
+    """
+    In-process registry of server metrics, rendered in the Prometheus text format
+
+    Only holds the current process' metrics. Each pre-fork worker keeps its own.
+    """
+
+    _lock = Lock()
+    _requests: Dict[Tuple[str, str], int] = {}
+    _latency_buckets: Dict[str, List[int]] = {}
+    _latency_sum: Dict[str, float] = {}
+    _latency_count: Dict[str, int] = {}
+    _gauges: Dict[str, Callable[[], Dict[str, float]]] = {}
+    _collectors: Dict[str, Callable[[], List[str]]] = {}
+
+
+    @classmethod
+    def _reset(cls):
+        with cls._lock:
+            cls._requests = {}
+            cls._latency_buckets = {}
+            cls._latency_sum = {}
+            cls._latency_count = {}
+            cls._gauges = {}
+            cls._collectors = {}
+
+
+    @classmethod
+    def observe_rpc(
+        cls,
+        method: str,
+        outcome: str,
+        seconds: float
+    ):
+        """
+        Record a completed RPC
+
+        Args:
+            method (str):       Full gRPC method name
+            outcome (str):      OK, or the name of the FailureReason returned
+            seconds (float):    Time taken to handle the RPC
+        """
+        bucket = bisect_left(LATENCY_BUCKETS, seconds)
+
+        with cls._lock:
+            key = (method, outcome)
+            cls._requests[key] = cls._requests.get(key, 0) + 1
+
+            buckets = cls._latency_buckets.get(method)
+            if buckets is None:
+                buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+                cls._latency_buckets[method] = buckets
+            buckets[bucket] += 1
+            cls._latency_sum[method] = cls._latency_sum.get(method, 0.0) + seconds
+            cls._latency_count[method] = cls._latency_count.get(method, 0) + 1
+
+
+    @classmethod
+    def register_gauges(
+        cls,
+        prefix: str,
+        collect: Callable[[], Dict[str, float]]
+    ):
+        """
+        Register a function whose values are exported as gauges on every render
+
+        Args:
+            prefix (str):       Prefix of each gauge name
+            collect (func):     Function returning gauge values, keyed by name
+        """
+        with cls._lock:
+            cls._gauges[prefix] = collect
+
+
+    @classmethod
+    def register_collector(
+        cls,
+        name: str,
+        collect: Callable[[], List[str]]
+    ):
+        """
+        Register a function rendering its own metric lines on every render
+
+        Args:
+            name (str):         Name the collector is registered under
+            collect (func):     Function returning lines in the Prometheus text format
+        """
+        with cls._lock:
+            cls._collectors[name] = collect
+
+
+    @classmethod
+    def render(cls) -> str:
+        """
+        Render all metrics in the Prometheus text exposition format
+
+        Returns:
+            (str)   The metrics document
+        """
+        with cls._lock:
+            requests = dict(cls._requests)
+            latency_buckets = {method: list(buckets) for method, buckets in cls._latency_buckets.items()}
+            latency_sum = dict(cls._latency_sum)
+            latency_count = dict(cls._latency_count)
+            gauges = dict(cls._gauges)
+            collectors = dict(cls._collectors)
+
+        lines = [
+            "# HELP passmanager_rpc_requests_total Completed RPCs, by method and outcome.",
+            "# TYPE passmanager_rpc_requests_total counter"
+        ]
+        for (method, outcome), count in sorted(requests.items()):
+            lines.append(f'passmanager_rpc_requests_total{{method="{method}",outcome="{outcome}"}} {count}')
+
+        lines.append("# HELP passmanager_rpc_latency_seconds Time taken to handle RPCs, by method.")
+        lines.append("# TYPE passmanager_rpc_latency_seconds histogram")
+        for method in sorted(latency_buckets):
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS + (float("inf"),), latency_buckets[method]):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'passmanager_rpc_latency_seconds_bucket{{method="{method}",le="{le}"}} {cumulative}')
+            lines.append(f'passmanager_rpc_latency_seconds_sum{{method="{method}"}} {latency_sum[method]}')
+            lines.append(f'passmanager_rpc_latency_seconds_count{{method="{method}"}} {latency_count[method]}')
+
+        for prefix, collect in sorted(gauges.items()):
+            for name, value in sorted(collect().items()):
+                lines.append(f"# TYPE {prefix}_{name} gauge")
+                lines.append(f"{prefix}_{name} {value}")
+
+        for name, collect in sorted(collectors.items()):
+            lines.extend(collect())
+
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,316 @@
+from typing import Optional, Dict
+from threading import Lock, Event, Thread, Condition
+
+from logging import getLogger
+logger = getLogger("database")
+
+from sqlalchemy import update, bindparam, event
+from sqlalchemy.orm import Session
+
+from database import DatabaseSetup, LoginSession, QueryStats
+
+
+class RequestCounter():
+    """
+    Write-behind accumulator for login session request counts
+
+    Increments are held in memory, and applied periodically in a single
+    batched 'request_count = request_count + n' statement. Until flushed,
+    they are reported through 'pending', so expiry checks stay exact.
+
+    A stored count read from the database is only combined with the
+    increments not yet flushed if no flush committed while it was read.
+    Callers take the flush 'sequence' before reading the login session, and
+    the rare read overlapping a commit is repeated, so a batch is never
+    counted twice or missed, and reads never wait behind the flush.
+    """
+
+    _interval: float = 0
+    _batch_size: int = 0
+    _pending: Dict[int, int] = {}
+    _pending_total: int = 0
+    _in_flight: Dict[int, int] = {}
+    # Odd while a flush is committing, and advanced again once its batch stops being in flight
+    _sequence: int = 0
+    _lock = Lock()
+    _committed = Condition(_lock)
+    _flush_lock = Lock()
+    _wake = Event()
+    _stopping = Event()
+    _thread: Optional[Thread] = None
+
+    _statement = (
+        update(LoginSession.__table__)
+        .where(LoginSession.__table__.c.id == bindparam("session_id"))
+        .values(request_count=LoginSession.__table__.c.request_count + bindparam("increment"))
+    )
+
+
+    @classmethod
+    def start(
+        cls,
+        interval: float,
+        batch_size: int = 0
+    ):
+        """
+        Begin flushing increments in the background, with an interval of 0 leaving it disabled
+
+        Args:
+            interval (float):   Seconds between flushes
+            batch_size (int):   Number of pending increments that triggers an early flush
+        """
+        if interval < 0 or batch_size < 0:
+            raise ValueError(f"Invalid request counter settings: {interval}, {batch_size}")
+        if cls._thread is not None:
+            raise RuntimeError("Request counter already started.")
+
+        cls._interval = interval
+        cls._batch_size = batch_size
+        if interval == 0:
+            return
+
+        cls._stopping.clear()
+        cls._wake.clear()
+        cls._thread = Thread(target=cls._run, name="request-counter", daemon=True)
+        cls._thread.start()
+        logger.info("Request counter flushing every %s seconds.", interval)
+
+
+    @classmethod
+    def stop(cls):
+        """Stop the background flush, and apply any remaining increments"""
+        thread = cls._thread
+        if thread is not None:
+            cls._stopping.set()
+            cls._wake.set()
+            thread.join()
+            cls._thread = None
+
+        cls._interval = 0
+        cls.flush()
+
+
+    @classmethod
+    def _reset(cls):
+        with cls._lock:
+            cls._pending = {}
+            cls._pending_total = 0
+            cls._in_flight = {}
+        cls.stop()
+
+
+    @classmethod
+    def _run(cls):
+        while not cls._stopping.is_set():
+            cls._wake.wait(cls._interval)
+            cls._wake.clear()
+            cls.flush()
+
+
+    @classmethod
+    def enabled(cls) -> bool:
+        return cls._thread is not None
+
+
+    @classmethod
+    def add(
+        cls,
+        session_id: int
+    ):
+        """Record a single use of the given login session"""
+        with cls._lock:
+            cls._pending[session_id] = cls._pending.get(session_id, 0) + 1
+            cls._pending_total += 1
+            pending_total = cls._pending_total
+
+        if cls._batch_size and pending_total >= cls._batch_size:
+            cls._wake.set()
+
+
+    @classmethod
+    def discard(
+        cls,
+        session_id: int,
+        db_session: Optional[Session] = None
+    ):
+        """
+        Drop the unflushed increments of a deleted login session, and again once the database session commits
+
+        Deleted ids may be given to new login sessions, which would otherwise inherit the increments.
+        """
+        with cls._lock:
+            cls._pending_total -= cls._pending.pop(session_id, 0)
+            cls._in_flight.pop(session_id, None)
+
+        if isinstance(db_session, Session):
+            event.listen(db_session, "after_commit", lambda _: cls.discard(session_id), once=True)
+
+
+    @classmethod
+    def pending(
+        cls,
+        session_id: Optional[int]
+    ) -> int:
+        """
+        Get the increments not yet visible in the database for a login session
+
+        Returns:
+            (int)   Number of unapplied increments
+        """
+        if session_id is None:
+            return 0
+
+        with cls._lock:
+            return cls._pending.get(session_id, 0) + cls._in_flight.get(session_id, 0)
+
+
+    @classmethod
+    def sequence(cls) -> int:
+        """
+        Get the flush sequence, to be taken before reading login sessions from the database
+
+        Returns:
+            (int)   The flush sequence
+        """
+        with cls._lock:
+            return cls._sequence
+
+
+    @classmethod
+    def _unflushed(
+        cls,
+        session_id: int,
+        sequence: int
+    ) -> Optional[int]:
+        # Called holding the lock. None if a flush committed since the stored count was read
+        if sequence != cls._sequence or sequence % 2:
+            return None
+        return cls._pending.get(session_id, 0) + cls._in_flight.get(session_id, 0)
+
+
+    @classmethod
+    def _reread(
+        cls,
+        db_session: Session,
+        login_session: LoginSession
+    ) -> int:
+        with cls._committed:
+            cls._committed.wait_for(lambda: not cls._sequence % 2)
+            sequence = cls._sequence
+        db_session.refresh(login_session, ["request_count"])
+        return sequence
+
+
+    @classmethod
+    def request_count(
+        cls,
+        db_session: Session,
+        login_session: LoginSession,
+        sequence: int
+    ) -> int:
+        """
+        Get the request count of a login session, including increments not yet flushed
+
+        The stored count is only read again if a flush committed since it
+        was loaded.
+
+        Args:
+            sequence (int):     The flush sequence, taken before the login session was loaded
+
+        Returns:
+            (int)   Number of requests made in the login session
+        """
+        while True:
+            with cls._lock:
+                unflushed = cls._unflushed(login_session.id, sequence)
+            if unflushed is not None:
+                return login_session.request_count + unflushed
+            sequence = cls._reread(db_session, login_session)
+
+
+    @classmethod
+    def try_add(
+        cls,
+        db_session: Session,
+        login_session: LoginSession,
+        sequence: int
+    ) -> bool:
+        """
+        Record a single use of the given login session, unless it has used its maximum requests
+
+        The count is checked and incremented under the lock, so concurrent
+        uses of a session can never take it past its maximum.
+
+        Args:
+            sequence (int):     The flush sequence, taken before the login session was loaded
+
+        Returns:
+            (bool)  True if recorded, false if the session has no requests left
+        """
+        session_id = login_session.id
+        maximum = login_session.maximum_requests
+        while True:
+            with cls._lock:
+                unflushed = cls._unflushed(session_id, sequence)
+                if unflushed is not None:
+                    if maximum is not None and login_session.request_count + unflushed >= maximum:
+                        return False
+                    cls._pending[session_id] = cls._pending.get(session_id, 0) + 1
+                    cls._pending_total += 1
+                    pending_total = cls._pending_total
+                    break
+            sequence = cls._reread(db_session, login_session)
+
+        if cls._batch_size and pending_total >= cls._batch_size:
+            cls._wake.set()
+        return True
+
+
+    @classmethod
+    def flush(cls) -> int:
+        """
+        Apply all pending increments in a single transaction
+
+        Returns:
+            (int)   Number of login sessions updated
+        """
+        with cls._flush_lock:
+            with cls._lock:
+                batch = cls._pending
+                cls._pending = {}
+                cls._pending_total = 0
+                cls._in_flight = batch
+
+            if not batch:
+                return 0
+
+            try:
+                with QueryStats.track("RequestCounter.flush"), DatabaseSetup.get_db_session() as session:
+                    session.execute(
+                        cls._statement,
+                        [
+                            {"session_id": session_id, "increment": increment}
+                            for session_id, increment in batch.items()
+                        ]
+                    )
+                    with cls._lock:
+                        cls._sequence += 1
+                    session.commit()
+                    with cls._committed:
+                        cls._in_flight = {}
+                        cls._sequence += 1
+                        cls._committed.notify_all()
+
+                logger.debug("Request counts flushed for %s Login Sessions.", len(batch))
+                return len(batch)
+            except Exception:
+                logger.exception("Failed to flush request counts.")
+                with cls._committed:
+                    for session_id, increment in batch.items():
+                        cls._pending[session_id] = cls._pending.get(session_id, 0) + increment
+                        cls._pending_total += increment
+                    cls._in_flight = {}
+                    if cls._sequence % 2:
+                        cls._sequence += 1
+                        cls._committed.notify_all()
+                return 0
@@ -0,0 +1,241 @@
+from threading import Lock
+from datetime import datetime
+from dataclasses import dataclass, replace
+from collections import OrderedDict
+from typing import Any, Optional, Dict, Set
+
+from logging import getLogger
+logger = getLogger("database")
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+
+@dataclass
+class CachedSession():
+    """Snapshot of the login session details required to serve a secured request"""
+
+    public_id: str
+    session_id: int
+    user_id: int
+    username_hash: bytes
+    session_key: bytes
+    request_count: int
+    maximum_requests: Optional[int]
+    expiry_time: Optional[datetime]
+    password_change: bool
+
+    def is_expired(self) -> bool:
+        """
+        Checks if the cached session has run out of time or requests
+
+        Returns:
+            (bool)  True if expired, false otherwise
+        """
+        if self.expiry_time and self.expiry_time < datetime.now():
+            return True
+        if self.maximum_requests is not None and self.maximum_requests <= self.request_count:
+            return True
+        return False
+
+
+class SessionCache():
+    """Bounded, thread safe LRU cache of login sessions, keyed by session public id"""
+
+    _maximum_entries: int = 0
+    _entries: "OrderedDict[str, CachedSession]" = OrderedDict()
+    _session_ids: Dict[int, str] = {}
+    _user_sessions: Dict[int, Set[str]] = {}
+    _generation: int = 0
+    # Generation of the latest invalidation of each session and user, kept for as many as the cache holds
+    _invalidated: "OrderedDict[str, int]" = OrderedDict()
+    _user_invalidated: "OrderedDict[int, int]" = OrderedDict()
+    # Sessions read before this generation are never cached, as their invalidations have been forgotten
+    _forgotten: int = 0
+    _lock = Lock()
+
+
+    @classmethod
+    def configure(
+        cls,
+        maximum_entries: int
+    ):
+        """Set the maximum number of cached sessions, with 0 disabling the cache"""
+        if maximum_entries < 0:
+            raise ValueError(f"Invalid session cache size: {maximum_entries}")
+
+        with cls._lock:
+            cls._maximum_entries = maximum_entries
+            cls._clear()
+
+        logger.info("Session cache configured for %s entries.", maximum_entries)
+
+
+    @classmethod
+    def _reset(cls):
+        with cls._lock:
+            cls._maximum_entries = 0
+            cls._clear()
+
+
+    @classmethod
+    def _clear(cls):
+        cls._entries = OrderedDict()
+        cls._session_ids = {}
+        cls._user_sessions = {}
+        cls._generation += 1
+        cls._invalidated = OrderedDict()
+        cls._user_invalidated = OrderedDict()
+        cls._forgotten = cls._generation
+
+
+    @classmethod
+    def _record_invalidation(
+        cls,
+        invalidated: "OrderedDict[Any, int]",
+        key: Any
+    ):
+        cls._generation += 1
+        invalidated.pop(key, None)
+        invalidated[key] = cls._generation
+
+        while len(invalidated) > cls._maximum_entries:
+            _, generation = invalidated.popitem(last=False)
+            cls._forgotten = max(cls._forgotten, generation)
+
+
+    @classmethod
+    def _remove(
+        cls,
+        public_id: str
+    ):
+        entry = cls._entries.pop(public_id, None)
+        if entry is None:
+            return
+
+        cls._session_ids.pop(entry.session_id, None)
+        user_sessions = cls._user_sessions.get(entry.user_id)
+        if user_sessions is not None:
+            user_sessions.discard(public_id)
+            if not user_sessions:
+                del cls._user_sessions[entry.user_id]
+
+
+    @classmethod
+    def enabled(cls) -> bool:
+        return cls._maximum_entries > 0
+
+
+    @classmethod
+    def generation(cls) -> int:
+        """
+        Get the current invalidation generation, to be taken before reading from the database
+
+        Returns:
+            (int)   The invalidation generation
+        """
+        with cls._lock:
+            return cls._generation
+
+
+    @classmethod
+    def get(
+        cls,
+        public_id: str
+    ) -> Optional[CachedSession]:
+        """
+        Get a copy of the cached session for the given public id
+
+        Returns:
+            (CachedSession) The cached session, or None if not cached
+        """
+        with cls._lock:
+            entry = cls._entries.get(public_id)
+            if entry is None:
+                return None
+
+            cls._entries.move_to_end(public_id)
+            return replace(entry)
+
+
+    @classmethod
+    def put(
+        cls,
+        entry: CachedSession,
+        generation: int
+    ):
+        """Cache a session, unless it or its user has been invalidated since the given generation"""
+        with cls._lock:
+            if (
+                cls._maximum_entries <= 0 or
+                generation < cls._forgotten or
+                generation < cls._invalidated.get(entry.public_id, 0) or
+                generation < cls._user_invalidated.get(entry.user_id, 0)
+            ):
+                return
+
+            cls._remove(entry.public_id)
+            cls._entries[entry.public_id] = replace(entry)
+            cls._session_ids[entry.session_id] = entry.public_id
+            cls._user_sessions.setdefault(entry.user_id, set()).add(entry.public_id)
+
+            while len(cls._entries) > cls._maximum_entries:
+                oldest = next(iter(cls._entries))
+                cls._remove(oldest)
+
+
+    @classmethod
+    def consume(
+        cls,
+        session_id: int
+    ) -> Optional[CachedSession]:
+        """
+        Use one request from the budget of a cached session
+
+        Returns:
+            (CachedSession) The updated session, or None if not cached or expired
+        """
+        with cls._lock:
+            public_id = cls._session_ids.get(session_id)
+            if public_id is None:
+                return None
+
+            entry = cls._entries[public_id]
+            if entry.is_expired():
+                cls._remove(public_id)
+                return None
+
+            entry.request_count += 1
+            cls._entries.move_to_end(public_id)
+            return replace(entry)
+
+
+    @classmethod
+    def invalidate(
+        cls,
+        public_id: str,
+        db_session: Optional[Session] = None
+    ):
+        """Remove a session from the cache, and again once the database session commits"""
+        with cls._lock:
+            cls._remove(public_id)
+            cls._record_invalidation(cls._invalidated, public_id)
+
+        if isinstance(db_session, Session):
+            event.listen(db_session, "after_commit", lambda _: cls.invalidate(public_id), once=True)
+
+
+    @classmethod
+    def invalidate_user(
+        cls,
+        user_id: int,
+        db_session: Optional[Session] = None
+    ):
+        """Remove all sessions for a user from the cache, and again once the database session commits"""
+        with cls._lock:
+            for public_id in list(cls._user_sessions.get(user_id, ())):
+                cls._remove(public_id)
+            cls._record_invalidation(cls._user_invalidated, user_id)
+
+        if isinstance(db_session, Session):
+            event.listen(db_session, "after_commit", lambda _: cls.invalidate_user(user_id), once=True)
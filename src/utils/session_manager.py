@@ -9,7 +9,7 @@ from passmanager.common.v0.secure_pb2 import (
 from enums import FailureReason
 from .db_utils_auth import DBUtilsAuth
 from .db_utils_password import DBUtilsPassword
-from cryptography import SRPUtils
+from cryptography import SRPUtils, SRPSteps
 
 EPHEMERAL_DELAY = 180
 DEFAULT_AUTH_SESSION_LIFETIME = 3600
@@ -25,7 +25,22 @@ class SessionManager():
         username_hash: bytes
     ) -> Tuple[bool, Optional[FailureReason], str, bytes, bytes, bytes]:
         """
-        Start the process to create a new auth session
+        Start the process to create a new auth session, blocking on the SRP math
+
+        Returns:
+            (str)   Public ID
+            (bytes) Public Ephemeral (b)
+            (bytes) SRP Salt
+            (bytes) Master Key Salt
+        """
+        return SRPUtils.run_steps(SessionManager.start_new_session_steps(username_hash))
+
+    @staticmethod
+    def start_new_session_steps(
+        username_hash: bytes
+    ) -> SRPSteps[Tuple[bool, Optional[FailureReason], str, bytes, bytes, bytes]]:
+        """
+        Start the process to create a new auth session, yielding the SRP future to wait on
 
         Returns:
             (str)   Public ID
@@ -40,7 +55,7 @@ class SessionManager():
             return False, failure_reason, "", b'', b'', b''
 
         # Generate ephemeral
-        public_ephemeral, private_ephemeral = SRPUtils.generate_ephemeral(srp_verifier)
+        public_ephemeral, private_ephemeral = yield SRPUtils.submit_generate_ephemeral(srp_verifier)
 
         # Add details to database
         result = DBUtilsAuth.start(
@@ -65,7 +80,32 @@ class SessionManager():
         expiry_time: int
     ) -> Tuple[bool, Optional[FailureReason], str, bytes]:
         """
-        Authenticate and create a session
+        Authenticate and create a session, blocking on the SRP math
+
+        Returns:
+            (str)   Session Public ID
+            (bytes) Server Proof (M2)
+        """
+        return SRPUtils.run_steps(SessionManager.auth_new_session_steps(
+            username_hash=username_hash,
+            public_id=public_id,
+            eph_val_a=eph_val_a,
+            proof_val_m1=proof_val_m1,
+            maximum_requests=maximum_requests,
+            expiry_time=expiry_time
+        ))
+
+    @staticmethod
+    def auth_new_session_steps(
+        username_hash: bytes,
+        public_id: str,
+        eph_val_a: bytes,
+        proof_val_m1: bytes,
+        maximum_requests: int,
+        expiry_time: int
+    ) -> SRPSteps[Tuple[bool, Optional[FailureReason], str, bytes]]:
+        """
+        Authenticate and create a session, yielding the SRP future to wait on
 
         Returns:
             (str)   Session Public ID
@@ -81,11 +121,11 @@ class SessionManager():
             return False, failure_reason, "", b''
 
         # Calculate session key
-        session_key = SRPUtils.compute_session_key(
-            eph_val_a=eph_val_a,
-            eph_public_b=public_ephemeral,
-            eph_private_b=private_ephemeral,
-            srp_verifier_v=srp_verifier
+        session_key = yield SRPUtils.submit_compute_session_key(
+            eph_val_a,
+            public_ephemeral,
+            private_ephemeral,
+            srp_verifier
         )
 
         # Verify client proof
@@ -134,7 +174,30 @@ class SessionManager():
         master_key_salt: bytes
     ) -> Tuple[bool, Optional[FailureReason], str, bytes, bytes, bytes]:
         """
-        Start the process to create a new password session
+        Start the process to create a new password session, blocking on the SRP math
+
+        Returns:
+            (str)   Public ID
+            (bytes) Public Ephemeral (b)
+            (bytes) SRP Salt
+            (bytes) Master Key Salt
+        """
+        return SRPUtils.run_steps(SessionManager.start_password_session_steps(
+            user_id=user_id,
+            srp_salt=srp_salt,
+            srp_verifier=srp_verifier,
+            master_key_salt=master_key_salt
+        ))
+
+    @staticmethod
+    def start_password_session_steps(
+        user_id: int,
+        srp_salt: bytes,
+        srp_verifier: bytes,
+        master_key_salt: bytes
+    ) -> SRPSteps[Tuple[bool, Optional[FailureReason], str, bytes, bytes, bytes]]:
+        """
+        Start the process to create a new password session, yielding the SRP future to wait on
 
         Returns:
             (str)   Public ID
@@ -149,7 +212,7 @@ class SessionManager():
             return False, failure_reason, "", b'', b'', b''
 
         # Generate ephemeral
-        public_ephemeral, private_ephemeral = SRPUtils.generate_ephemeral(existing_srp_verifier)
+        public_ephemeral, private_ephemeral = yield SRPUtils.submit_generate_ephemeral(existing_srp_verifier)
 
         # Add details to database
         result = DBUtilsPassword.start(
@@ -175,7 +238,29 @@ class SessionManager():
         proof_val_m1: bytes
     ) -> Tuple[bool, Optional[FailureReason], str, bytes, List[str]]:
         """
-        Authenticate and create a password session
+        Authenticate and create a password session, blocking on the SRP math
+
+        Returns:
+            (str)   Session Public ID
+            (bytes) Server Proof (M2)
+            ([str]) Entry Public IDs
+        """
+        return SRPUtils.run_steps(SessionManager.auth_password_session_steps(
+            user_id=user_id,
+            public_id=public_id,
+            eph_val_a=eph_val_a,
+            proof_val_m1=proof_val_m1
+        ))
+
+    @staticmethod
+    def auth_password_session_steps(
+        user_id: int,
+        public_id: str,
+        eph_val_a: bytes,
+        proof_val_m1: bytes
+    ) -> SRPSteps[Tuple[bool, Optional[FailureReason], str, bytes, List[str]]]:
+        """
+        Authenticate and create a password session, yielding the SRP future to wait on
 
         Returns:
             (str)   Session Public ID
@@ -192,11 +277,11 @@ class SessionManager():
             return False, failure_reason, "", b'', []
 
         # Calculate session key
-        session_key = SRPUtils.compute_session_key(
-            eph_val_a=eph_val_a,
-            eph_public_b=public_ephemeral,
-            eph_private_b=private_ephemeral,
-            srp_verifier_v=srp_verifier
+        session_key = yield SRPUtils.submit_compute_session_key(
+            eph_val_a,
+            public_ephemeral,
+            private_ephemeral,
+            srp_verifier
         )
 
         # Verify client proof
@@ -0,0 +1,163 @@
+from time import perf_counter_ns
+from collections import deque
+from threading import Lock
+from typing import Tuple, List, Dict, Deque
+
+from logging import getLogger
+logger = getLogger("api")
+
+
+STAGE_QUANTILES: Tuple[float, ...] = (0.5, 0.9, 0.99)
+
+
+class RPCTimer():
+    """Times the stages of a single RPC, each stage ending where the next begins"""
+
+    __slots__ = ("rpc", "last")
+
+    def __init__(self, rpc: str):
+        self.rpc = rpc
+        self.last = perf_counter_ns()
+
+    def mark(self, stage: str):
+        """Record the time since the previous mark against the stage"""
+        now = perf_counter_ns()
+        StageTimer._record(self.rpc, stage, now - self.last)
+        self.last = now
+
+
+class _DisabledTimer():
+
+    __slots__ = ()
+
+    def mark(self, stage: str):
+        pass
+
+
+_DISABLED_TIMER = _DisabledTimer()
+
+
+class StageTimer():
+    """
+    Per-stage handler timings, keeping a window of recent samples for each RPC and stage
+
+    Disabled by default, in which case handlers are given a timer that records nothing.
+    """
+
+    _enabled: bool = False
+    _window: int = 1024
+    _lock = Lock()
+    _samples: Dict[Tuple[str, str], Deque[int]] = {}
+    _totals: Dict[Tuple[str, str], List[int]] = {}
+
+
+    @classmethod
+    def configure(
+        cls,
+        enabled: bool,
+        window: int = 1024
+    ):
+        """
+        Enable or disable stage timings
+
+        Args:
+            enabled (bool):     True to record stage timings, false otherwise
+            window (int):       Number of recent samples kept for each RPC and stage
+        """
+        if window < 1:
+            raise ValueError(f"Invalid stage timer window: {window}")
+
+        with cls._lock:
+            cls._enabled = enabled
+            cls._window = window
+            cls._samples = {}
+            cls._totals = {}
+
+        if enabled:
+            logger.info("Stage timer enabled with a window of %s samples.", window)
+
+
+    @classmethod
+    def _reset(cls):
+        cls.configure(False)
+
+
+    @classmethod
+    def start(
+        cls,
+        rpc: str
+    ):
+        """
+        Begin timing the stages of an RPC
+
+        Returns:
+            (RPCTimer)  Timer to mark the end of each stage on
+        """
+        if not cls._enabled:
+            return _DISABLED_TIMER
+        return RPCTimer(rpc)
+
+
+    @classmethod
+    def _record(
+        cls,
+        rpc: str,
+        stage: str,
+        nanoseconds: int
+    ):
+        key = (rpc, stage)
+        with cls._lock:
+            samples = cls._samples.get(key)
+            if samples is None:
+                samples = deque(maxlen=cls._window)
+                cls._samples[key] = samples
+                cls._totals[key] = [0, 0]
+            samples.append(nanoseconds)
+            totals = cls._totals[key]
+            totals[0] += 1
+            totals[1] += nanoseconds
+
+
+    @classmethod
+    def percentiles(cls) -> Dict[Tuple[str, str], Dict[str, int]]:
+        """
+        Get percentiles of the recent samples for each RPC and stage
+
+        Returns:
+            (dict)  Nanosecond percentiles of the window, and totals, keyed by (rpc, stage)
+        """
+        with cls._lock:
+            snapshot = {key: sorted(samples) for key, samples in cls._samples.items()}
+            totals = {key: list(total) for key, total in cls._totals.items()}
+
+        result = {}
+        for key, samples in snapshot.items():
+            summary = {"count": totals[key][0], "sum": totals[key][1]}
+            for quantile in STAGE_QUANTILES:
+                index = min(len(samples) - 1, int(quantile * len(samples)))
+                summary[f"p{round(quantile * 100)}"] = samples[index]
+            summary["max"] = samples[-1]
+            result[key] = summary
+        return result
+
+
+    @classmethod
+    def render(cls) -> List[str]:
+        """
+        Render the stage percentiles as a Prometheus summary
+
+        Returns:
+            ([str]) Lines of the metrics document
+        """
+        lines = [
+            "# HELP passmanager_handler_stage_seconds Time spent in each handler stage, with quantiles of recent RPCs.",
+            "# TYPE passmanager_handler_stage_seconds summary"
+        ]
+        for (rpc, stage), summary in sorted(cls.percentiles().items()):
+            labels = f'rpc="{rpc}",stage="{stage}"'
+            for quantile in STAGE_QUANTILES:
+                value = summary[f"p{round(quantile * 100)}"] / 1e9
+                lines.append(f'passmanager_handler_stage_seconds{{{labels},quantile="{quantile}"}} {value}')
+            lines.append(f'passmanager_handler_stage_seconds_sum{{{labels}}} {summary["sum"] / 1e9}')
+            lines.append(f'passmanager_handler_stage_seconds_count{{{labels}}} {summary["count"]}')
+        return lines
@@ -0,0 +1,54 @@
+import os
+import sys
+import pytest
+import shutil
+import tempfile
+from pathlib import Path
+
+from sqlalchemy import create_engine
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from database.database_setup import DatabaseSetup
+from database.database_models import Base
+
+
+# Also run the database backed tests against this URL, such as a local PostgreSQL
+TEST_DATABASE_URL = os.environ.get("PASSMANAGER_TEST_DATABASE_URL")
+
+
+def _init_database_url(url: str):
+    """Drop every table of the database at the URL, then initialise it"""
+    engine = create_engine(url)
+    try:
+        Base.metadata.drop_all(engine)
+    finally:
+        engine.dispose()
+    DatabaseSetup.init_db(url, Base)
+
+
+@pytest.fixture(params=["sqlite", "postgresql"])
+def real_database(request):
+    """
+    Initialise an empty test database on each backend, closing it afterwards
+
+    The PostgreSQL run is skipped unless a test database URL is set.
+
+    Returns:
+        (Path|str)  The SQLite file, or the database URL, to reopen the database with
+    """
+    if request.param == "postgresql" and not TEST_DATABASE_URL:
+        pytest.skip("PASSMANAGER_TEST_DATABASE_URL is not set")
+
+    test_dir = tempfile.mkdtemp()
+    if request.param == "postgresql":
+        database = TEST_DATABASE_URL
+        _init_database_url(database) # type: ignore
+    else:
+        database = Path(test_dir) / "test_vault.db"
+        DatabaseSetup.init_db(database, Base)
+
+    yield database
+
+    DatabaseSetup.close_db()
+    shutil.rmtree(test_dir, ignore_errors=True)
@@ -5,18 +5,69 @@ class _MockQuery:
     def __init__(self, results):
         self._results = results
         self._filters = []
+        self._updates = []
+        self._order_by = []
+        self._limit = None
+        self._yield_per = None
 
     def filter(self, condition):
         self._filters.append(condition)
         return self
 
+    def join(self, *targets):
+        return self
+
+    def outerjoin(self, *targets):
+        return self
+
+    def select_from(self, *froms):
+        return self
+
+    def options(self, *options):
+        return self
+
+    def order_by(self, *clauses):
+        self._order_by.extend(clauses)
+        return self
+
+    def yield_per(self, count):
+        self._yield_per = count
+        return self
+
+    def limit(self, limit):
+        self._limit = limit
+        return self
+
+    def all(self):
+        if self._limit is not None:
+            return list(self._results[:self._limit])
+        return list(self._results)
+
     def first(self):
         return self._results[0] if self._results else None
 
+    def scalar(self):
+        return self._results[0] if self._results else None
+
+    def update(self, values, synchronize_session=None):
+        self._updates.append(values)
+        return len(self._results)
+
     def __iter__(self):
         return iter(self._results)
 
 
+class _MockResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return list(self._rows)
+
+
 class _MockSession:
     def __init__(self, on_commit: Optional[Callable[[], None]] = None):
         self._added = []
@@ -26,6 +77,9 @@ class _MockSession:
         self.closed = False
         self._on_commit = on_commit
         self._deletes= []
+        self._executed = []
+        self._expired = []
+        self._refreshed = []
 
     def __enter__(self):
         return self
@@ -57,8 +111,26 @@ class _MockSession:
     def query(self):
         pass
 
+    def execute(self, statement, params=None):
+        self._executed.append((statement, params))
+        return _MockResult([])
+
     def delete(self, obj):
         self._deletes.append(obj)
 
+    def expire(self, obj, attribute_names=None):
+        self._expired.append((obj, attribute_names))
+
+    def refresh(self, obj, attribute_names=None):
+        self._refreshed.append((obj, attribute_names))
+
     def flush(self):
         self.flushes+= 1
+
+
+def _fake_steps(function: Callable) -> Callable:
+    """Wrap a fake function as SRP steps, finishing without waiting on any future"""
+    def steps(*args, **kwargs):
+        yield from ()
+        return function(*args, **kwargs)
+    return steps
@@ -0,0 +1,12 @@
+from contextlib import contextmanager
+from typing import Generator
+
+from database.query_stats import QueryStats, QueryCount
+
+
+@contextmanager
+def assert_max_queries(maximum: int) -> Generator[QueryCount, None, None]:
+    """Fail if the statements issued inside the block exceed the maximum"""
+    with QueryStats.track("test") as call:
+        yield call
+    assert call.statements <= maximum, f"Expected at most {maximum} statements, {call.statements} issued."
@@ -0,0 +1,170 @@
+import os
+import sys
+import pytest
+from itertools import count
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from cryptography.ephemeral_pool import EphemeralPool
+from cryptography.srp_utils import SRPUtils, SRP_PRIME_N, SRP_GENERATOR_G, SRP_MULTIPLIER_K
+
+
+def _wait_for_available(expected: int, refills: int = 1):
+    for _ in range(500):
+        metrics = EphemeralPool.metrics()
+        if metrics["available"] >= expected and metrics["refills"] >= refills:
+            return
+        EphemeralPool._stopping.wait(0.01)
+
+
+class TestEphemeralPool():
+    """Test cases for the precomputed ephemeral pool"""
+
+    @pytest.fixture(autouse=True)
+    def setup_teardown(self):
+        counter = count(1)
+        self.generate = lambda: (next(counter), 0)
+        yield
+        EphemeralPool._reset()
+
+    def test_disabled_by_default(self):
+        """Should not hand out ephemerals if not started"""
+        assert EphemeralPool.take() is None
+        assert EphemeralPool.metrics()["misses"] == 0
+
+    def test_disabled_with_zero_size(self):
+        """Should not start a refill thread with a size of 0"""
+        EphemeralPool.start(0, 0, self.generate)
+
+        assert EphemeralPool._thread is None
+        assert EphemeralPool.take() is None
+
+    @pytest.mark.parametrize(
+        "size, low_water",
+        [
+            (-1, 0),
+            (4, -1),
+            (4, 5)
+        ]
+    )
+    def test_start_rejects_invalid(self, size, low_water):
+        """Should raise exception if given invalid settings"""
+        with pytest.raises(ValueError):
+            EphemeralPool.start(size, low_water, self.generate)
+
+    def test_fills_to_size(self):
+        """Should fill the pool to its size in the background"""
+        EphemeralPool.start(8, 2, self.generate)
+        _wait_for_available(8)
+
+        metrics = EphemeralPool.metrics()
+        assert metrics["available"] == 8
+        assert metrics["refills"] == 1
+
+    def test_take_hands_out_once(self):
+        """Should hand out each pair only once"""
+        EphemeralPool.start(4, 0, self.generate)
+        _wait_for_available(4)
+
+        taken = [EphemeralPool.take() for _ in range(4)]
+
+        assert len(set(taken)) == 4
+        assert EphemeralPool.metrics()["hits"] == 4
+
+    def test_take_empty_is_miss(self):
+        """Should count a miss if the pool is empty"""
+        EphemeralPool.start(1, 0, self.generate)
+        _wait_for_available(1)
+
+        with EphemeralPool._lock:
+            EphemeralPool._pairs.clear()
+
+        assert EphemeralPool.take() is None
+        assert EphemeralPool.metrics()["misses"] == 1
+
+    def test_refills_below_low_water(self):
+        """Should refill once the pool drops to the low water mark"""
+        EphemeralPool.start(4, 2, self.generate)
+        _wait_for_available(4)
+
+        EphemeralPool.take()
+        EphemeralPool.take()
+        _wait_for_available(4, refills=2)
+
+        metrics = EphemeralPool.metrics()
+        assert metrics["available"] == 4
+        assert metrics["refills"] == 2
+        assert metrics["refill_seconds_total"] >= metrics["refill_seconds_last"]
+
+    def test_refill_failure(self, caplog):
+        """Should log and count a failed refill, and refill again on the next low water take"""
+        calls = count(1)
+        def flaky_generate():
+            call = next(calls)
+            if call == 3:
+                raise ValueError("fake generate failure")
+            return (call, 0)
+
+        EphemeralPool.start(4, 2, flaky_generate)
+        for _ in range(500):
+            if EphemeralPool.metrics()["refill_failures"]:
+                break
+            EphemeralPool._stopping.wait(0.01)
+
+        metrics = EphemeralPool.metrics()
+        assert metrics["available"] == 2
+        assert metrics["refill_failures"] == 1
+        assert "Ephemeral pool refill failed after 2 entries." in caplog.messages
+        assert EphemeralPool._thread.is_alive() # type: ignore
+
+        EphemeralPool.take()
+        _wait_for_available(4, refills=2)
+
+        metrics = EphemeralPool.metrics()
+        assert metrics["available"] == 4
+        assert metrics["refill_failures"] == 1
+
+    def test_stop_discards(self):
+        """Should discard pooled ephemerals when stopped"""
+        EphemeralPool.start(4, 0, self.generate)
+        _wait_for_available(4)
+
+        EphemeralPool.stop()
+
+        assert EphemeralPool.metrics()["available"] == 0
+        assert EphemeralPool.take() is None
+
+
+class TestGenerateEphemeralFromPool():
+    """Test cases for generating ephemerals using the pool"""
+
+    @pytest.fixture(autouse=True)
+    def setup_teardown(self):
+        yield
+        EphemeralPool._reset()
+
+    def test_uses_pooled_pair(self):
+        """Should combine a pooled pair with the verifier"""
+        EphemeralPool.start(1, 0, SRPUtils.generate_private_ephemeral)
+        _wait_for_available(1)
+        with EphemeralPool._lock:
+            private_b, generator_b = EphemeralPool._pairs[0]
+
+        eph_public_b, eph_private_b = SRPUtils.generate_ephemeral(b'\x07')
+
+        assert int.from_bytes(eph_private_b, "big") == private_b
+        assert generator_b == pow(SRP_GENERATOR_G, private_b, SRP_PRIME_N)
+        assert int.from_bytes(eph_public_b, "big") == (SRP_MULTIPLIER_K * 7 + generator_b) % SRP_PRIME_N
+        assert EphemeralPool.metrics()["hits"] == 1
+
+    def test_falls_back_inline(self):
+        """Should generate inline if the pool is disabled"""
+        eph_public_b, eph_private_b = SRPUtils.generate_ephemeral(b'\x07')
+
+        private_b = int.from_bytes(eph_private_b, "big")
+        expected = (SRP_MULTIPLIER_K * 7 + pow(SRP_GENERATOR_G, private_b, SRP_PRIME_N)) % SRP_PRIME_N
+        assert int.from_bytes(eph_public_b, "big") == expected
+
+
+if __name__ == '__main__':
+    pytest.main(['-v', __file__])
@@ -0,0 +1,366 @@
+import os
+import sys
+import pytest
+import secrets
+from hashlib import sha256
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from cryptography import srp_utils
+from cryptography.srp_utils import (
+    SRPUtils,
+    SRP_PRIME_N,
+    SRP_GENERATOR_G,
+    SRP_PRIME_BYTES,
+    SRP_MULTIPLIER_K
+)
+
+
+def _pad(value: int) -> bytes:
+    return value.to_bytes(SRP_PRIME_BYTES, "big")
+
+
+def _hash(*values: bytes) -> bytes:
+    return sha256(b''.join(values)).digest()
+
+
+class _SRPClient():
+    """Client side SRP-6a steps, as described in the cryptographic implementation"""
+
+    def __init__(self, username: bytes = b'user', password: bytes = b'password'):
+        self.salt = secrets.token_bytes(32)
+        self.x = int.from_bytes(_hash(self.salt, _hash(username + b':' + password)), "big")
+        self.verifier = _pad(pow(SRP_GENERATOR_G, self.x, SRP_PRIME_N))
+        self.a = secrets.randbits(320)
+        self.val_a = _pad(pow(SRP_GENERATOR_G, self.a, SRP_PRIME_N))
+
+    def session_key(self, eph_public_b: bytes) -> bytes:
+        public_b = int.from_bytes(eph_public_b, "big")
+        u = int.from_bytes(_hash(self.val_a, eph_public_b), "big")
+        base = (public_b - SRP_MULTIPLIER_K * pow(SRP_GENERATOR_G, self.x, SRP_PRIME_N)) % SRP_PRIME_N
+        return _hash(_pad(pow(base, self.a + u * self.x, SRP_PRIME_N)))
+
+    def proof(self, eph_public_b: bytes, session_key: bytes) -> bytes:
+        return _hash(self.val_a, eph_public_b, session_key)
+
+
+class TestMultiplier():
+    """Test cases for the SRP-6a multiplier"""
+
+    def test_multiplier(self):
+        """Should be the hash of N and the padded generator"""
+        expected = int.from_bytes(_hash(_pad(SRP_PRIME_N), _pad(SRP_GENERATOR_G)), "big")
+        assert SRP_MULTIPLIER_K == expected
+
+
+class TestGeneratorPow():
+    """Test cases for the fixed-base generator exponentiation"""
+
+    @pytest.mark.parametrize(
+        "exponent",
+        [
+            0,
+            1,
+            63,
+            64,
+            (1 << 320) - 1,
+            1 << 319,
+            (1 << 400) + 12345
+        ]
+    )
+    def test_matches_pow(self, exponent):
+        """Should match the builtin modular exponentiation"""
+        assert SRPUtils._generator_pow(exponent) == pow(SRP_GENERATOR_G, exponent, SRP_PRIME_N)
+
+    def test_matches_pow_random(self):
+        """Should match the builtin modular exponentiation for random exponents"""
+        for _ in range(20):
+            exponent = secrets.randbits(320)
+            assert SRPUtils._generator_pow(exponent) == pow(SRP_GENERATOR_G, exponent, SRP_PRIME_N)
+
+    @pytest.mark.parametrize(
+        "exponent",
+        [
+            1,
+            1 << 6,
+            (1 << 320) - 1
+        ]
+    )
+    def test_uses_every_window(self, exponent, monkeypatch):
+        """Should multiply in every window row, whatever the exponent"""
+        lookups = []
+
+        class _RecordingRow(list):
+            def __getitem__(self, digit):
+                lookups.append(digit)
+                return list.__getitem__(self, digit)
+
+        table = [_RecordingRow(row) for row in srp_utils._GENERATOR_TABLE]
+        monkeypatch.setattr(srp_utils, "_GENERATOR_TABLE", table)
+
+        assert SRPUtils._generator_pow(exponent) == pow(SRP_GENERATOR_G, exponent, SRP_PRIME_N)
+        assert len(lookups) == len(table)
+
+
+class TestGenerateEphemeral():
+    """Test cases for the generate ephemeral function"""
+
+    def test_returns_correct_values(self):
+        """Should return B = k*v + g^b mod N, with a 320 bit private value"""
+        client = _SRPClient()
+
+        eph_public_b, eph_private_b = SRPUtils.generate_ephemeral(client.verifier)
+
+        assert isinstance(eph_public_b, bytes)
+        assert isinstance(eph_private_b, bytes)
+        assert len(eph_public_b) == SRP_PRIME_BYTES
+        assert len(eph_private_b) == 40
+
+        private_b = int.from_bytes(eph_private_b, "big")
+        verifier = int.from_bytes(client.verifier, "big")
+        expected = (SRP_MULTIPLIER_K * verifier + pow(SRP_GENERATOR_G, private_b, SRP_PRIME_N)) % SRP_PRIME_N
+        assert int.from_bytes(eph_public_b, "big") == expected
+
+    def test_values_are_random(self):
+        """Should generate different values each call"""
+        client = _SRPClient()
+
+        first = SRPUtils.generate_ephemeral(client.verifier)
+        second = SRPUtils.generate_ephemeral(client.verifier)
+
+        assert first[0] != second[0]
+        assert first[1] != second[1]
+
+
+class TestComputeSessionKey():
+    """Test cases for the compute session key function"""
+
+    def test_matches_client(self):
+        """Should compute the same session key as the client"""
+        client = _SRPClient()
+        eph_public_b, eph_private_b = SRPUtils.generate_ephemeral(client.verifier)
+
+        session_key = SRPUtils.compute_session_key(
+            eph_val_a=client.val_a,
+            eph_public_b=eph_public_b,
+            eph_private_b=eph_private_b,
+            srp_verifier_v=client.verifier
+        )
+
+        assert len(session_key) == 32
+        assert session_key == client.session_key(eph_public_b)
+
+    def test_wrong_password(self):
+        """Should not match a client using the wrong password"""
+        client = _SRPClient()
+        eph_public_b, eph_private_b = SRPUtils.generate_ephemeral(client.verifier)
+
+        other_client = _SRPClient(password=b'wrong_password')
+        other_client.val_a = client.val_a
+        other_client.a = client.a
+
+        session_key = SRPUtils.compute_session_key(
+            eph_val_a=client.val_a,
+            eph_public_b=eph_public_b,
+            eph_private_b=eph_private_b,
+            srp_verifier_v=client.verifier
+        )
+
+        assert session_key != other_client.session_key(eph_public_b)
+
+    @pytest.mark.parametrize(
+        "eph_val_a",
+        [
+            b'',
+            _pad(0),
+            _pad(SRP_PRIME_N),
+            (SRP_PRIME_N * 2).to_bytes(SRP_PRIME_BYTES + 1, "big")
+        ]
+    )
+    def test_rejects_unsafe_client_value(self, eph_val_a):
+        """Should refuse to compute a key if A mod N is zero"""
+        client = _SRPClient()
+        eph_public_b, eph_private_b = SRPUtils.generate_ephemeral(client.verifier)
+
+        session_key = SRPUtils.compute_session_key(
+            eph_val_a=eph_val_a,
+            eph_public_b=eph_public_b,
+            eph_private_b=eph_private_b,
+            srp_verifier_v=client.verifier
+        )
+
+        assert session_key == b''
+
+
+class TestVerifyProof():
+    """Test cases for the verify proof function"""
+
+    def _session(self):
+        client = _SRPClient()
+        eph_public_b, eph_private_b = SRPUtils.generate_ephemeral(client.verifier)
+        session_key = SRPUtils.compute_session_key(
+            eph_val_a=client.val_a,
+            eph_public_b=eph_public_b,
+            eph_private_b=eph_private_b,
+            srp_verifier_v=client.verifier
+        )
+        return client, eph_public_b, session_key
+
+    def test_verifies_client_proof(self):
+        """Should verify a correct client proof, and return the server proof"""
+        client, eph_public_b, session_key = self._session()
+        proof_val_m1 = client.proof(eph_public_b, client.session_key(eph_public_b))
+
+        success, proof_val_m2 = SRPUtils.verify_proof(
+            eph_val_a=client.val_a,
+            eph_public_b=eph_public_b,
+            session_key_k=session_key,
+            proof_val_m1=proof_val_m1
+        )
+
+        assert success == True
+        assert proof_val_m2 == _hash(client.val_a, proof_val_m1, session_key)
+
+    def test_rejects_wrong_proof(self):
+        """Should fail if the client proof does not match"""
+        client, eph_public_b, session_key = self._session()
+
+        success, proof_val_m2 = SRPUtils.verify_proof(
+            eph_val_a=client.val_a,
+            eph_public_b=eph_public_b,
+            session_key_k=session_key,
+            proof_val_m1=b'\x00' * 32
+        )
+
+        assert success == False
+        assert proof_val_m2 == b''
+
+    def test_rejects_empty_session_key(self):
+        """Should fail if no session key could be computed"""
+        client, eph_public_b, _ = self._session()
+        proof_val_m1 = _hash(client.val_a, eph_public_b, b'')
+
+        success, proof_val_m2 = SRPUtils.verify_proof(
+            eph_val_a=client.val_a,
+            eph_public_b=eph_public_b,
+            session_key_k=b'',
+            proof_val_m1=proof_val_m1
+        )
+
+        assert success == False
+        assert proof_val_m2 == b''
+
+
+class TestOffload():
+    """Test cases for running SRP math in the process pool"""
+
+    @pytest.fixture(autouse=True)
+    def setup_teardown(self):
+        yield
+        SRPUtils.stop_offload()
+
+    def test_inline_by_default(self):
+        """Should return completed futures if offload not started"""
+        future = SRPUtils.submit_generate_private_ephemeral()
+
+        assert future.done()
+        private_b, generator_b = future.result()
+        assert generator_b == pow(SRP_GENERATOR_G, private_b, SRP_PRIME_N)
+
+    def test_inline_exception(self):
+        """Should pass exceptions through the future if run inline"""
+        future = SRPUtils._submit(int, "not_a_number")
+
+        assert future.done()
+        with pytest.raises(ValueError):
+            future.result()
+
+    def test_start_rejects_invalid(self):
+        """Should raise exception if given a negative worker count"""
+        with pytest.raises(ValueError):
+            SRPUtils.start_offload(-1)
+
+    def test_start_zero_workers(self):
+        """Should stay inline if given 0 workers"""
+        SRPUtils.start_offload(0)
+        assert SRPUtils._executor is None
+
+    def test_start_twice(self):
+        """Should raise exception if offload already started"""
+        SRPUtils.start_offload(1)
+        with pytest.raises(RuntimeError):
+            SRPUtils.start_offload(1)
+
+    def test_offloaded_matches_client(self):
+        """Should compute the same values in the process pool"""
+        SRPUtils.start_offload(1)
+        client = _SRPClient()
+
+        eph_public_b, eph_private_b = SRPUtils.generate_ephemeral(client.verifier)
+        future = SRPUtils.submit_compute_session_key(
+            client.val_a,
+            eph_public_b,
+            eph_private_b,
+            client.verifier
+        )
+
+        assert future.result(timeout=30) == client.session_key(eph_public_b)
+        assert SRPUtils.compute_session_key(
+            eph_val_a=client.val_a,
+            eph_public_b=eph_public_b,
+            eph_private_b=eph_private_b,
+            srp_verifier_v=client.verifier
+        ) == client.session_key(eph_public_b)
+
+    def test_offloaded_generate_ephemeral(self):
+        """Should combine an offloaded private ephemeral with the verifier, without waiting"""
+        SRPUtils.start_offload(1)
+
+        eph_public_b, eph_private_b = SRPUtils.submit_generate_ephemeral(b'\x07').result(timeout=30)
+
+        private_b = int.from_bytes(eph_private_b, "big")
+        expected = (SRP_MULTIPLIER_K * 7 + pow(SRP_GENERATOR_G, private_b, SRP_PRIME_N)) % SRP_PRIME_N
+        assert int.from_bytes(eph_public_b, "big") == expected
+
+    def test_stop_returns_inline(self):
+        """Should compute inline again once stopped"""
+        SRPUtils.start_offload(1)
+        SRPUtils.stop_offload()
+
+        assert SRPUtils._executor is None
+        assert SRPUtils.submit_generate_private_ephemeral().done()
+
+
+class TestRunSteps():
+    """Test cases for running SRP steps on the calling thread"""
+
+    def test_sends_results(self):
+        """Should send each future's result back into the steps, and return their value"""
+        def steps():
+            first = yield SRPUtils._submit(int, "2")
+            second = yield SRPUtils._submit(int, "3")
+            return first * second
+
+        assert SRPUtils.run_steps(steps()) == 6
+
+    def test_throws_exceptions(self):
+        """Should raise a failed future's exception inside the steps"""
+        def steps():
+            try:
+                yield SRPUtils._submit(int, "not_a_number")
+            except ValueError:
+                return "handled"
+
+        assert SRPUtils.run_steps(steps()) == "handled"
+
+    def test_no_futures(self):
+        """Should return the value of steps that wait on nothing"""
+        def steps():
+            yield from ()
+            return "done"
+
+        assert SRPUtils.run_steps(steps()) == "done"
+
+
+if __name__ == '__main__':
+    pytest.main(['-v', __file__])
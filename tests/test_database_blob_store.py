@@ -0,0 +1,237 @@
+import os
+import sys
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from database.database_setup import DatabaseSetup
+from database.database_models import User, SecureData, SecureBlob
+from database.blob_store import BlobStore
+from utils.db_utils_data import DBUtilsData
+from utils.db_utils_user import DBUtilsUser
+from utils.db_utils_password import DBUtilsPassword
+
+
+class TestBlobStore():
+    """Test cases for the blob storage mode and its migration"""
+
+    @pytest.fixture(autouse=True)
+    def setup_teardown(self, real_database):
+        with DatabaseSetup.get_db_session() as session:
+            user = User(
+                username_hash=b'fake_hash',
+                srp_salt=b'fake_srp_salt',
+                srp_verifier=b'fake_srp_verifier',
+                master_key_salt=b'fake_master_key_salt',
+                password_change=False
+            )
+            session.add(user)
+            session.flush()
+            self.user_id = user.id
+
+        yield
+
+        BlobStore._reset()
+
+    def _stored(self):
+        """Helper function to read the entry data held in the data and blob tables"""
+        with DatabaseSetup.get_db_session() as session:
+            inline = dict(session.query(SecureData.public_id, SecureData.entry_data).all())
+            blobs = dict(
+                session.query(SecureData.public_id, SecureBlob.entry_data)
+                .join(SecureBlob, SecureBlob.data_id == SecureData.id)
+                .all()
+            )
+            orphans = session.query(SecureBlob).filter(~SecureBlob.data_id.in_(session.query(SecureData.id))).count()
+        return inline, blobs, orphans
+
+    def test_defaults_to_inline(self):
+        """Should store entry data inline unless configured otherwise"""
+        assert BlobStore.separate() is False
+        assert BlobStore.mode() == "inline"
+
+    @pytest.mark.parametrize("mode", ["inline", "table"])
+    def test_configure(self, mode):
+        """Should set the storage mode"""
+        BlobStore.configure(mode)
+
+        assert BlobStore.mode() == mode
+        assert BlobStore.separate() is (mode == "table")
+
+    def test_configure_rejects_unknown_mode(self):
+        """Should raise exception for an unknown mode, leaving the mode unchanged"""
+        with pytest.raises(ValueError):
+            BlobStore.configure("disk")
+
+        assert BlobStore.mode() == "inline"
+
+    @pytest.mark.parametrize("mode", ["inline", "table"])
+    def test_verify_empty_vault(self, mode):
+        """Should accept a vault without entries in either mode"""
+        BlobStore.configure(mode)
+
+        BlobStore.verify()
+
+    def test_verify_rejects_mismatched_vault(self):
+        """Should raise exception if the vault stores entry data in the other mode"""
+        DBUtilsData.create(self.user_id, b'entry_name', b'entry_data')
+
+        BlobStore.configure("table")
+        with pytest.raises(RuntimeError) as exc_info:
+            BlobStore.verify()
+        assert "blob storage mismatch" in str(exc_info.value).lower()
+
+        BlobStore.migrate("table")
+        BlobStore.verify()
+
+        BlobStore.configure("inline")
+        with pytest.raises(RuntimeError):
+            BlobStore.verify()
+
+    def test_migrate_to_table(self):
+        """Should move every entry's data into the blob table, leaving the data table's empty"""
+        _, _, public_ids = DBUtilsData.create_many(self.user_id, [(b'entry_name', b'entry_data_%d' % i) for i in range(25)])
+
+        moved = BlobStore.migrate("table", chunk_size=10)
+
+        inline, blobs, orphans = self._stored()
+        assert moved == 25
+        assert set(inline.values()) == {b''}
+        assert blobs == {public_id: b'entry_data_%d' % i for i, public_id in enumerate(public_ids)}
+        assert orphans == 0
+
+    def test_migrate_round_trip(self):
+        """Should restore the original entry data when migrated back inline"""
+        _, _, public_ids = DBUtilsData.create_many(self.user_id, [(b'entry_name', b'entry_data_%d' % i) for i in range(25)])
+
+        BlobStore.migrate("table", chunk_size=7)
+        moved = BlobStore.migrate("inline", chunk_size=7)
+
+        inline, blobs, _ = self._stored()
+        assert moved == 25
+        assert inline == {public_id: b'entry_data_%d' % i for i, public_id in enumerate(public_ids)}
+        assert blobs == {}
+
+    def test_migrate_resumes(self):
+        """Should move only the entries not yet moved when run again"""
+        DBUtilsData.create_many(self.user_id, [(b'entry_name', b'entry_data')] * 5)
+        BlobStore.migrate("table")
+        DBUtilsData.create_many(self.user_id, [(b'entry_name', b'entry_data')] * 3)
+
+        assert BlobStore.migrate("table") == 3
+        assert BlobStore.migrate("table") == 0
+
+    @pytest.mark.parametrize("mode, chunk_size", [("disk", 10), ("table", 0)])
+    def test_migrate_rejects_invalid_arguments(self, mode, chunk_size):
+        """Should raise exception for an unknown mode or a chunk size below 1"""
+        with pytest.raises(ValueError):
+            BlobStore.migrate(mode, chunk_size)
+
+
+class TestBlobStoreTableMode():
+    """Test cases for the DBUtils data paths with entry data stored in the blob table"""
+
+    @pytest.fixture(autouse=True)
+    def setup_teardown(self, real_database):
+        BlobStore.configure("table")
+
+        DBUtilsUser.create(b'fake_hash', b'fake_srp_salt', b'fake_srp_verifier', b'fake_master_key_salt')
+        with DatabaseSetup.get_db_session() as session:
+            self.user_id = session.query(User.id).filter(User.username_hash == b'fake_hash').scalar()
+
+        yield
+
+        BlobStore._reset()
+
+    def _blob_count(self):
+        """Helper function to count the rows of the blob table"""
+        with DatabaseSetup.get_db_session() as session:
+            return session.query(SecureBlob).count()
+
+    def test_create_and_get(self):
+        """Should store entry data in the blob table, and read it back"""
+        _, _, public_id = DBUtilsData.create(self.user_id, b'entry_name', b'entry_data')
+        _, _, public_ids = DBUtilsData.create_many(self.user_id, [(b'name_1', b'data_1'), (b'name_2', b'data_2')])
+
+        assert DBUtilsData.get_entry(self.user_id, public_id) == (True, None, b'entry_name', b'entry_data')
+        assert DBUtilsData.get_entries(self.user_id, public_ids)[2] == [
+            (public_ids[0], b'name_1', b'data_1'),
+            (public_ids[1], b'name_2', b'data_2')
+        ]
+        streamed = [entry for chunk in DBUtilsData.stream_entries(self.user_id, 2) for entry in chunk[2]]
+        assert sorted(streamed) == sorted([
+            (public_id, b'entry_name', b'entry_data'),
+            (public_ids[0], b'name_1', b'data_1'),
+            (public_ids[1], b'name_2', b'data_2')
+        ])
+
+        assert self._blob_count() == 3
+        with DatabaseSetup.get_db_session() as session:
+            assert {row.entry_data for row in session.query(SecureData.entry_data)} == {b''}
+
+    def test_edit(self):
+        """Should update entry data in the blob table, and names inline"""
+        _, _, public_id = DBUtilsData.create(self.user_id, b'entry_name', b'entry_data')
+        _, _, public_ids = DBUtilsData.create_many(self.user_id, [(b'name_1', b'data_1'), (b'name_2', b'data_2')])
+
+        assert DBUtilsData.edit(self.user_id, public_id, None, b'new_entry_data') == (True, None)
+        status, _, results = DBUtilsData.edit_many(self.user_id, [
+            (public_ids[0], b'new_name_1', None),
+            (public_ids[1], None, b'new_data_2')
+        ])
+
+        assert status is True
+        assert results == [(public_ids[0], None), (public_ids[1], None)]
+        assert DBUtilsData.get_entry(self.user_id, public_id)[2:] == (b'entry_name', b'new_entry_data')
+        assert DBUtilsData.get_entries(self.user_id, public_ids)[2] == [
+            (public_ids[0], b'new_name_1', b'data_1'),
+            (public_ids[1], b'name_2', b'new_data_2')
+        ]
+
+    def test_delete(self):
+        """Should delete the blobs of deleted entries"""
+        _, _, public_id = DBUtilsData.create(self.user_id, b'entry_name', b'entry_data')
+        _, _, public_ids = DBUtilsData.create_many(self.user_id, [(b'name_1', b'data_1'), (b'name_2', b'data_2')])
+
+        assert DBUtilsData.delete(self.user_id, public_id) == (True, None)
+        assert DBUtilsData.delete_many(self.user_id, public_ids[:1])[0] is True
+
+        assert self._blob_count() == 1
+        assert DBUtilsData.get_entry(self.user_id, public_ids[1])[2:] == (b'name_2', b'data_2')
+
+    def test_delete_user(self):
+        """Should delete the blobs of a deleted user's entries"""
+        DBUtilsData.create_many(self.user_id, [(b'name_1', b'data_1'), (b'name_2', b'data_2')])
+
+        assert DBUtilsUser.delete(self.user_id) == (True, None)
+
+        assert self._blob_count() == 0
+
+    def test_password_change_commit(self):
+        """Should move the new entry data of a committed password change into the blob table"""
+        _, _, public_ids = DBUtilsData.create_many(self.user_id, [(b'name_1', b'data_1'), (b'name_2', b'data_2')])
+        with DatabaseSetup.get_db_session() as session:
+            user = session.query(User).filter(User.id == self.user_id).one()
+            user.password_change = True
+            user.new_srp_salt = b'new_srp_salt'
+            user.new_srp_verifier = b'new_srp_verifier'
+            user.new_master_key_salt = b'new_master_key_salt'
+        DBUtilsPassword.update_many(self.user_id, [
+            (public_ids[0], b'new_name_1', b'new_data_1'),
+            (public_ids[1], b'new_name_2', b'new_data_2')
+        ])
+
+        assert DBUtilsPassword.commit(self.user_id) == (True, None)
+
+        assert DBUtilsData.get_entries(self.user_id, public_ids)[2] == [
+            (public_ids[0], b'new_name_1', b'new_data_1'),
+            (public_ids[1], b'new_name_2', b'new_data_2')
+        ]
+        with DatabaseSetup.get_db_session() as session:
+            assert session.query(SecureData).filter(SecureData.new_entry_data.isnot(None)).count() == 0
+            assert {row.entry_data for row in session.query(SecureData.entry_data)} == {b''}
+        BlobStore.verify()
+
+
+if __name__ == '__main__':
+    pytest.main(['-v', __file__])
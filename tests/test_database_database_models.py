@@ -3,13 +3,13 @@ import sys
 import pytest
 from datetime import datetime, timedelta
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, create_mock_engine, inspect, text, delete
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.exc import IntegrityError
 
 sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
 
-from database.database_models import Base, User, AuthEphemeral, LoginSession, SecureData
+from database.database_models import Base, User, AuthEphemeral, LoginSession, SecureData, SecureBlob
 
 
 class TestDatabaseUserModel():
@@ -1404,6 +1404,55 @@ class TestDatabaseRelationships():
         assert data not in user.secure_data
         assert login.user == user
 
+    def test_user_deletion_removes_blobs(self):
+        """Should delete the SecureBlobs of a User's SecureData when User is deleted"""
+        user = User(
+            username_hash=b'fake_hash',
+            srp_salt=b'fake_srp_salt',
+            srp_verifier=b'fake_srp_verifier',
+            master_key_salt=b'fake_master_key_salt',
+            password_change=False
+        )
+        data = SecureData(
+            user=user,
+            entry_name=b'fake_secure_data_name',
+            entry_data=b''
+        )
+        data.blob = SecureBlob(entry_data=b'fake_secure_data_entry')
+        self.session.add(user)
+        self.session.commit()
+
+        assert self.session.query(SecureBlob).one().secure_data == data
+
+        # Expire the blob, so only the database's cascade can remove it
+        self.session.expire_all()
+        self.session.delete(self.session.query(User).one())
+        self.session.commit()
+
+        assert self.session.query(SecureData).count() == 0
+        assert self.session.query(SecureBlob).count() == 0
+
+    def test_bulk_secure_data_deletion_removes_blobs(self):
+        """Should delete the SecureBlob of SecureData removed by a bulk delete"""
+        user = User(
+            username_hash=b'fake_hash',
+            srp_salt=b'fake_srp_salt',
+            srp_verifier=b'fake_srp_verifier',
+            master_key_salt=b'fake_master_key_salt',
+            password_change=False
+        )
+        deleted = SecureData(user=user, entry_name=b'deleted_name', entry_data=b'')
+        deleted.blob = SecureBlob(entry_data=b'deleted_data')
+        kept = SecureData(user=user, entry_name=b'kept_name', entry_data=b'')
+        kept.blob = SecureBlob(entry_data=b'kept_data')
+        self.session.add(user)
+        self.session.commit()
+
+        self.session.execute(delete(SecureData).where(SecureData.id == deleted.id))
+        self.session.commit()
+
+        assert self.session.query(SecureBlob.entry_data).all() == [(b'kept_data',)]
+
 
 class TestDatabaseModelsUnitTests():
     """Further unit tests for database models"""
@@ -1940,5 +1989,103 @@ class TestDatabaseModelsUnitTests():
         assert db_login.last_used == datetime.max
 
 
+class TestDatabaseModelIndexes():
+    """Test cases for the indexes of the database models"""
+
+    @pytest.fixture(autouse=True)
+    def setup_teardown(self):
+        self.engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(self.engine)
+
+        yield
+
+        Base.metadata.drop_all(self.engine)
+
+    def _query_plan(self, statement):
+        """Helper function to get the sqlite query plan of a statement"""
+        with self.engine.connect() as connection:
+            rows = connection.execute(text(f"EXPLAIN QUERY PLAN {statement}")).all()
+        return " ".join(row[-1] for row in rows)
+
+    @pytest.mark.parametrize(
+        "table, columns",
+        [
+            ("auth", ["expiry_time"]),
+            ("auth", ["user_id"]),
+            ("login", ["expiry_time"]),
+            ("login", ["user_id"]),
+            ("data", ["user_id", "public_id"])
+        ]
+    )
+    def test_index_exists(self, table, columns):
+        """Should index expiry times and the user_id foreign keys"""
+        indexes = inspect(self.engine).get_indexes(table)
+        assert columns in [index["column_names"] for index in indexes]
+
+    @pytest.mark.parametrize(
+        "statement",
+        [
+            "SELECT id FROM auth WHERE expiry_time < '2000-01-01'",
+            "SELECT id FROM login WHERE expiry_time < '2000-01-01'",
+            "SELECT id FROM auth WHERE user_id = 1",
+            "SELECT id FROM login WHERE user_id = 1",
+            "SELECT id FROM data WHERE user_id = 1",
+            "SELECT id FROM data WHERE user_id = 1 AND public_id IN ('a', 'b')"
+        ]
+    )
+    def test_lookups_use_index(self, statement):
+        """Should search an index rather than scan the table"""
+        plan = self._query_plan(statement)
+        assert "USING" in plan and "INDEX" in plan
+        assert "SCAN" not in plan
+
+
+class TestDatabaseModelDialects():
+    """Test cases for the dialect specific DDL of the database models"""
+
+    def _postgresql_ddl(self):
+        """Helper function to render the PostgreSQL DDL of the models, without a server"""
+        statements = []
+        engine = create_mock_engine(
+            "postgresql+psycopg2://",
+            lambda sql, *args, **kwargs: statements.append(str(sql.compile(dialect=engine.dialect)))
+        )
+        Base.metadata.create_all(engine, checkfirst=False)
+        return statements
+
+    def test_postgresql_public_id_default(self):
+        """Should default public ids to a random uuid on the server"""
+        ddl = self._postgresql_ddl()
+
+        for table in ("auth", "login", "data"):
+            create = next(statement for statement in ddl if f"CREATE TABLE {table} " in statement)
+            assert "public_id VARCHAR DEFAULT replace(gen_random_uuid()::text, '-', '')" in create
+
+    def test_postgresql_blobs_stored_uncompressed(self):
+        """Should store the encrypted columns out of line without compression"""
+        ddl = self._postgresql_ddl()
+
+        assert "ALTER TABLE data ALTER COLUMN entry_name SET STORAGE EXTERNAL, ALTER COLUMN entry_data SET STORAGE EXTERNAL, " \
+               "ALTER COLUMN new_entry_name SET STORAGE EXTERNAL, ALTER COLUMN new_entry_data SET STORAGE EXTERNAL" in ddl
+        assert "ALTER TABLE blob ALTER COLUMN entry_data SET STORAGE EXTERNAL" in ddl
+
+    def test_sqlite_public_id_default(self):
+        """Should give rows inserted by plain SQL a random public id"""
+        engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(engine)
+
+        with engine.begin() as connection:
+            connection.execute(text(
+                "INSERT INTO user (username_hash, srp_salt, srp_verifier, master_key_salt, password_change) "
+                "VALUES (x'01', x'02', x'03', x'04', 0)"
+            ))
+            for _ in range(2):
+                connection.execute(text("INSERT INTO data (user_id, entry_name, entry_data) VALUES (1, x'05', x'06')"))
+            public_ids = connection.execute(text("SELECT public_id FROM data")).scalars().all()
+
+        assert len(set(public_ids)) == 2
+        assert all(len(public_id) == 32 and int(public_id, 16) >= 0 for public_id in public_ids)
+
+
 if __name__ == '__main__':
     pytest.main(['-v', __file__])
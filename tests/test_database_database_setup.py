@@ -7,11 +7,12 @@ import platform
 from pathlib import Path
 
 from sqlalchemy.orm import declarative_base, Session, Mapped, mapped_column
-from sqlalchemy import Integer, inspect
+from sqlalchemy import Integer, inspect, text, make_url
+from sqlalchemy.pool import QueuePool
 
 sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
 
-from database.database_setup import DatabaseSetup
+from database.database_setup import DatabaseSetup, DEFAULT_POOL_SETTINGS
 
 
 class TestDatabaseSetup:
@@ -151,6 +152,24 @@ class TestDatabaseSetup:
             same_record = session2.query(self.TestTableOne).filter_by(id=record_id).one()
             assert same_record.id == record_id
 
+    def test_close_db(self):
+        """Should leave the database uninitialised, and allow init_db again"""
+        self._create_minimal_database()
+
+        DatabaseSetup.close_db()
+        with pytest.raises(RuntimeError):
+            with DatabaseSetup.get_db_session():
+                pass
+
+        file_path = Path(self.test_dir) / "test_vault.db"
+        DatabaseSetup.init_db(file_path, self.TestBase)
+        with DatabaseSetup.get_db_session() as session:
+            assert session.query(self.TestTableOne).all() == []
+
+    def test_close_db_before_init(self):
+        """Should do nothing if the database was never initialised"""
+        DatabaseSetup.close_db()
+
 
 class TestDatabaseSetupUnitTests:
     """Further unit tests for database setup"""
@@ -258,5 +277,311 @@ class TestDatabaseSetupUnitTests:
         assert "schema mismatch" in error_message
 
 
+class TestDatabaseSetupPragmas:
+    """Test cases for the database performance pragmas"""
+
+    @pytest.fixture(autouse=True)
+    def setup_teardown(self):
+        self.test_dir = tempfile.mkdtemp()
+
+        yield
+
+        DatabaseSetup._reset_database()
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _create_database(self, pragmas):
+        """Helper function to create and initialise a database with pragmas"""
+        TestBase = declarative_base()
+
+        class TestTable(TestBase):
+            __tablename__ = "test_table"
+            id: Mapped[int] = mapped_column(Integer, primary_key=True)
+
+        file_path = Path(self.test_dir) / "test_vault.db"
+        DatabaseSetup.init_db(file_path, TestBase, pragmas)
+
+    def _read_pragma(self, name):
+        """Helper function to read a pragma value from a pooled connection"""
+        with DatabaseSetup.get_db_session() as session:
+            return session.execute(text(f"PRAGMA {name}")).scalar()
+
+    def test_applies_pragmas(self):
+        """Should apply all requested pragmas to the connection"""
+        self._create_database({
+            "journal_mode": "wal",
+            "synchronous": "NORMAL",
+            "mmap_size": "1048576",
+            "cache_size": "-2000",
+            "temp_store": "MEMORY",
+            "busy_timeout": "2500"
+        })
+
+        assert self._read_pragma("journal_mode") == "wal"
+        assert self._read_pragma("synchronous") == 1
+        assert self._read_pragma("mmap_size") == 1048576
+        assert self._read_pragma("cache_size") == -2000
+        assert self._read_pragma("temp_store") == 2
+        assert self._read_pragma("busy_timeout") == 2500
+
+    def test_applies_pragmas_to_every_connection(self):
+        """Should apply pragmas to new pooled connections, not just the first"""
+        self._create_database({"busy_timeout": "1234"})
+
+        with DatabaseSetup.get_db_session() as session1:
+            with DatabaseSetup.get_db_session() as session2:
+                first = session1.execute(text("PRAGMA busy_timeout")).scalar()
+                second = session2.execute(text("PRAGMA busy_timeout")).scalar()
+
+        assert first == 1234
+        assert second == 1234
+
+    def test_no_pragmas_leaves_defaults(self):
+        """Should leave the sqlite defaults in place if no pragmas given"""
+        self._create_database(None)
+
+        assert self._read_pragma("journal_mode") == "delete"
+
+    @pytest.mark.parametrize("pragmas", [None, {"journal_mode": "wal"}])
+    def test_enforces_foreign_keys(self, pragmas):
+        """Should enforce foreign keys on every connection, with or without pragmas"""
+        self._create_database(pragmas)
+
+        assert self._read_pragma("foreign_keys") == 1
+
+    @pytest.mark.parametrize(
+        "pragmas",
+        [
+            {"not_a_pragma": "1"},
+            {"journal_mode": "fast"},
+            {"synchronous": "NORMAL; DROP TABLE test_table"},
+            {"cache_size": "large"}
+        ]
+    )
+    def test_invalid_pragmas_raise(self, pragmas):
+        """Should raise exception if a pragma or its value is not recognised"""
+        with pytest.raises(ValueError):
+            self._create_database(pragmas)
+
+        assert DatabaseSetup._session_maker is None
+
+
+class TestDatabaseSetupMigration:
+    """Test cases for upgrading an existing database in place"""
+
+    @pytest.fixture(autouse=True)
+    def setup_teardown(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.file_path = Path(self.test_dir) / "test_vault.db"
+
+        yield
+
+        DatabaseSetup._reset_database()
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _create_base(self, indexed):
+        """Helper function to create a base whose value column is optionally indexed"""
+        TestBase = declarative_base()
+
+        class TestTable(TestBase):
+            __tablename__ = "test_table"
+            id: Mapped[int] = mapped_column(Integer, primary_key=True)
+            value: Mapped[int] = mapped_column(Integer, index=indexed)
+
+        return TestBase, TestTable
+
+    def _index_names(self, table):
+        """Helper function to read the index names of a table"""
+        with DatabaseSetup.get_db_session() as session:
+            return {index["name"] for index in inspect(session.get_bind()).get_indexes(table)}
+
+    def test_creates_missing_indexes(self):
+        """Should create indexes added to the models since the database was created"""
+        OldBase, OldTable = self._create_base(indexed=False)
+        DatabaseSetup.init_db(self.file_path, OldBase)
+        assert self._index_names("test_table") == set()
+        DatabaseSetup.close_db()
+
+        NewBase, NewTable = self._create_base(indexed=True)
+        DatabaseSetup.init_db(self.file_path, NewBase)
+
+        assert self._index_names("test_table") == {"ix_test_table_value"}
+
+    def test_keeps_existing_data(self):
+        """Should leave the rows of an upgraded database untouched"""
+        OldBase, OldTable = self._create_base(indexed=False)
+        DatabaseSetup.init_db(self.file_path, OldBase)
+        with DatabaseSetup.get_db_session() as session:
+            session.add(OldTable(value=7))
+        DatabaseSetup.close_db()
+
+        NewBase, NewTable = self._create_base(indexed=True)
+        DatabaseSetup.init_db(self.file_path, NewBase)
+
+        with DatabaseSetup.get_db_session() as session:
+            assert [row.value for row in session.query(NewTable).all()] == [7]
+
+    def test_migration_is_repeatable(self):
+        """Should do nothing to a database that already has every index"""
+        NewBase, NewTable = self._create_base(indexed=True)
+        DatabaseSetup.init_db(self.file_path, NewBase)
+        DatabaseSetup.close_db()
+
+        DatabaseSetup.init_db(self.file_path, NewBase)
+
+        assert self._index_names("test_table") == {"ix_test_table_value"}
+
+    def test_creates_missing_tables(self):
+        """Should create tables added to the models since the database was created"""
+        OldBase, OldTable = self._create_base(indexed=True)
+        DatabaseSetup.init_db(self.file_path, OldBase)
+        DatabaseSetup.close_db()
+
+        NewBase, NewTable = self._create_base(indexed=True)
+
+        class AddedTable(NewBase):
+            __tablename__ = "added_table"
+            id: Mapped[int] = mapped_column(Integer, primary_key=True)
+            value: Mapped[int] = mapped_column(Integer, index=True)
+
+        DatabaseSetup.init_db(self.file_path, NewBase)
+
+        with DatabaseSetup.get_db_session() as session:
+            assert set(inspect(session.get_bind()).get_table_names()) == {"test_table", "added_table"}
+        assert self._index_names("added_table") == {"ix_added_table_value"}
+
+    def test_vacuum(self):
+        """Should rebuild the database file, keeping its rows"""
+        NewBase, NewTable = self._create_base(indexed=True)
+        DatabaseSetup.init_db(self.file_path, NewBase)
+        with DatabaseSetup.get_db_session() as session:
+            session.add(NewTable(value=7))
+
+        DatabaseSetup.vacuum()
+
+        with DatabaseSetup.get_db_session() as session:
+            assert [row.value for row in session.query(NewTable).all()] == [7]
+            assert session.execute(text("PRAGMA freelist_count")).scalar() == 0
+
+    def test_vacuum_before_init(self):
+        """Should raise exception if the database is not initialised"""
+        with pytest.raises(RuntimeError):
+            DatabaseSetup.vacuum()
+
+    def test_upgrades_vault_without_new_indexes(self):
+        """Should add the expiry and user_id indexes to a vault created before them"""
+        from database.database_models import Base
+
+        DatabaseSetup.init_db(self.file_path, Base)
+        expected = {table: self._index_names(table) for table in Base.metadata.tables}
+        with DatabaseSetup.get_db_session() as session:
+            for name in (
+                "ix_auth_expiry_time", "ix_auth_user_id",
+                "ix_login_expiry_time", "ix_login_user_id",
+                "ix_data_user_id_public_id"
+            ):
+                session.execute(text(f"DROP INDEX {name}"))
+        DatabaseSetup.close_db()
+
+        DatabaseSetup.init_db(self.file_path, Base)
+
+        assert {table: self._index_names(table) for table in Base.metadata.tables} == expected
+
+
+class TestDatabaseSetupUrls:
+    """Test cases for opening a database by URL, and the connection pool of server databases"""
+
+    @pytest.fixture(autouse=True)
+    def setup_teardown(self):
+        self.test_dir = tempfile.mkdtemp()
+
+        yield
+
+        DatabaseSetup.close_db()
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _create_base(self):
+        """Helper function to create a minimal base"""
+        TestBase = declarative_base()
+
+        class TestTable(TestBase):
+            __tablename__ = "test_table"
+            id: Mapped[int] = mapped_column(Integer, primary_key=True)
+
+        return TestBase
+
+    def test_init_db_from_sqlite_url(self):
+        """Should open a SQLite database given as a URL, as with a path"""
+        file_path = Path(self.test_dir) / "test_vault.db"
+
+        DatabaseSetup.init_db(f"sqlite:///{file_path}", self._create_base(), {"busy_timeout": "1234"})
+
+        assert file_path.exists()
+        with DatabaseSetup.get_db_session() as session:
+            assert session.execute(text("PRAGMA busy_timeout")).scalar() == 1234
+
+    def test_pool_settings_rejected_on_sqlite(self):
+        """Should raise exception if pool settings are given for a SQLite database"""
+        with pytest.raises(ValueError):
+            DatabaseSetup.init_db(Path(self.test_dir) / "test_vault.db", self._create_base(), pool={"pool_size": "5"})
+
+        assert DatabaseSetup._session_maker is None
+
+    def test_pragmas_rejected_on_server_database(self):
+        """Should raise exception if SQLite pragmas are given for a server database"""
+        with pytest.raises(ValueError):
+            DatabaseSetup.init_db("postgresql+psycopg2://user@localhost/vault", self._create_base(), {"busy_timeout": "1234"})
+
+        assert DatabaseSetup._session_maker is None
+
+    def test_sqlite_keeps_dialect_pool(self):
+        """Should leave SQLite with the pool its dialect chooses"""
+        assert DatabaseSetup._engine_options(make_url("sqlite:///vault.db"), {}) == {}
+
+    def test_server_database_pool(self):
+        """Should give server databases a queue pool, with the defaults overridden by the pool settings"""
+        pool = DatabaseSetup._validate_pool({"pool_size": "4", "pool_pre_ping": "false"})
+
+        options = DatabaseSetup._engine_options(make_url("postgresql+psycopg2://user@localhost/vault"), pool)
+
+        assert options == {
+            **DEFAULT_POOL_SETTINGS,
+            "poolclass": QueuePool,
+            "pool_size": 4,
+            "pool_pre_ping": False
+        }
+
+    def test_validate_pool(self):
+        """Should convert each pool setting to its type"""
+        assert DatabaseSetup._validate_pool({
+            "pool_size": "5",
+            "max_overflow": "0",
+            "pool_recycle": "-1",
+            "pool_timeout": "2.5",
+            "pool_pre_ping": "yes"
+        }) == {
+            "pool_size": 5,
+            "max_overflow": 0,
+            "pool_recycle": -1,
+            "pool_timeout": 2.5,
+            "pool_pre_ping": True
+        }
+
+    @pytest.mark.parametrize(
+        "pool",
+        [
+            {"not_a_setting": "1"},
+            {"pool_size": "0"},
+            {"max_overflow": "-1"},
+            {"pool_recycle": "-2"},
+            {"pool_timeout": "soon"},
+            {"pool_pre_ping": "maybe"}
+        ]
+    )
+    def test_invalid_pool_settings_raise(self, pool):
+        """Should raise exception if a pool setting or its value is not recognised"""
+        with pytest.raises(ValueError):
+            DatabaseSetup._validate_pool(pool)
+
+
 if __name__ == '__main__':
     pytest.main(['-v', __file__])
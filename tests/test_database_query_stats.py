@@ -0,0 +1,534 @@
+import os
+import sys
+import pytest
+import logging
+from datetime import datetime, timedelta
+from sqlalchemy import text, event
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from database.query_stats import QueryStats, track_queries
+from database.database_setup import DatabaseSetup
+from database.database_models import User, AuthEphemeral, LoginSession, SecureData
+from utils.db_utils_data import DBUtilsData
+from utils.db_utils_password import DBUtilsPassword
+from enums import FailureReason
+
+from query_helpers import assert_max_queries
+
+
+class TestQueryStats():
+    """Test cases for the engine level query counter"""
+
+    @pytest.fixture(autouse=True)
+    def setup_teardown(self, real_database):
+        with DatabaseSetup.get_db_session() as session:
+            user = User(
+                username_hash=b'fake_hash',
+                srp_salt=b'fake_srp_salt',
+                srp_verifier=b'fake_srp_verifier',
+                master_key_salt=b'fake_master_key_salt',
+                password_change=False
+            )
+            secure_data = SecureData(
+                user=user,
+                entry_name=b'fake_entry_name',
+                entry_data=b'fake_entry_data'
+            )
+            session.add(secure_data)
+            session.flush()
+            self.user_id = user.id
+            self.public_id = secure_data.public_id
+        QueryStats._reset()
+
+        yield
+
+        QueryStats._reset()
+
+    def test_counts_statements_of_call(self):
+        """Should count the statements issued inside a tracked call"""
+        with QueryStats.track("test") as call:
+            with DatabaseSetup.get_db_session() as session:
+                session.execute(text("SELECT 1"))
+                session.execute(text("SELECT 2"))
+
+        assert call.statements == 2
+        assert call.seconds > 0
+
+    def test_attributes_to_dbutils_function(self):
+        """Should attribute statements to the DBUtils function issuing them"""
+        DBUtilsData.get_entry(self.user_id, self.public_id)
+
+        totals = QueryStats.totals()
+        assert totals["DBUtilsData.get_entry"]["statements"] >= 1
+
+    def test_nested_calls_count_once(self):
+        """Should attribute nested tracked calls to the outermost call"""
+        with QueryStats.track("outer") as outer:
+            with QueryStats.track("inner") as inner:
+                with DatabaseSetup.get_db_session() as session:
+                    session.execute(text("SELECT 1"))
+
+        assert inner is outer
+        assert outer.statements == 1
+        assert "inner" not in QueryStats.totals()
+
+    def test_untracked_statements(self):
+        """Should count statements outside any tracked call as untracked"""
+        with DatabaseSetup.get_db_session() as session:
+            session.execute(text("SELECT 1"))
+
+        assert QueryStats.totals()["untracked"]["statements"] == 1
+
+    def test_failed_statement(self):
+        """Should count a failed statement, and leave no start time behind on the connection"""
+        with QueryStats.track("test") as call:
+            with pytest.raises(Exception):
+                with DatabaseSetup.get_db_session() as session:
+                    session.execute(text("SELECT * FROM missing_table"))
+
+        with DatabaseSetup.get_db_session() as session:
+            assert session.connection().info["query_start"] == []
+
+        assert call.statements == 1
+        assert call.seconds > 0
+
+    def test_slow_query_log(self, caplog):
+        """Should log statements slower than the threshold, with their DBUtils function"""
+        QueryStats.configure(slow_query_ms=0.000001)
+
+        with caplog.at_level(logging.WARNING, logger="database"):
+            DBUtilsData.get_entry(self.user_id, self.public_id)
+
+        assert any("Slow query in DBUtilsData.get_entry" in record.message for record in caplog.records)
+
+    def test_slow_query_log_disabled(self, caplog):
+        """Should not log any statements if the threshold is 0"""
+        with caplog.at_level(logging.WARNING, logger="database"):
+            DBUtilsData.get_entry(self.user_id, self.public_id)
+
+        assert not any("Slow query" in record.message for record in caplog.records)
+
+    def test_configure_rejects_negative(self):
+        """Should raise exception if given a negative threshold"""
+        with pytest.raises(ValueError):
+            QueryStats.configure(-1)
+
+    def test_render(self):
+        """Should render the totals in the Prometheus text format"""
+        DBUtilsData.get_entry(self.user_id, self.public_id)
+
+        lines = QueryStats.render()
+
+        assert any(line.startswith('passmanager_db_statements_total{function="DBUtilsData.get_entry"}') for line in lines)
+        assert any(line.startswith('passmanager_db_seconds_total{function="DBUtilsData.get_entry"}') for line in lines)
+
+    def test_track_queries_decorator(self):
+        """Should only wrap public static methods"""
+        @track_queries
+        class Example():
+            @staticmethod
+            def public():
+                with DatabaseSetup.get_db_session() as session:
+                    session.execute(text("SELECT 1"))
+
+            @staticmethod
+            def _private():
+                with DatabaseSetup.get_db_session() as session:
+                    session.execute(text("SELECT 1"))
+
+        Example.public()
+        Example._private()
+
+        totals = QueryStats.totals()
+        assert totals["Example.public"]["statements"] == 1
+        assert "Example._private" not in totals
+
+    def test_track_queries_generator(self):
+        """Should attribute the statements of a generator method to it while it is being resumed"""
+        @track_queries
+        class Example():
+            @staticmethod
+            def stream():
+                for value in (1, 2):
+                    with DatabaseSetup.get_db_session() as session:
+                        session.execute(text(f"SELECT {value}"))
+                    yield value
+
+        values = []
+        for value in Example.stream():
+            values.append(value)
+            with DatabaseSetup.get_db_session() as session:
+                session.execute(text("SELECT 3"))
+
+        totals = QueryStats.totals()
+        assert values == [1, 2]
+        assert totals["Example.stream"]["statements"] == 2
+        assert totals["untracked"]["statements"] == 2
+
+    def test_stream_list_statements(self):
+        """Should read the user and a page of entries for each chunk, stopping at a short page"""
+        chunks = list(DBUtilsData.stream_list(self.user_id, 2))
+
+        assert chunks == [(True, None, [(self.public_id, b'fake_entry_name')])]
+        assert QueryStats.totals()["DBUtilsData.stream_list"]["statements"] == 2
+
+        QueryStats._reset()
+        chunks = list(DBUtilsData.stream_list(self.user_id, 1))
+
+        assert chunks == [(True, None, [(self.public_id, b'fake_entry_name')])]
+        assert QueryStats.totals()["DBUtilsData.stream_list"]["statements"] == 4
+
+    def test_assert_max_queries(self):
+        """Should fail if a call issues more statements than allowed"""
+        with assert_max_queries(2):
+            DBUtilsData.get_entry(self.user_id, self.public_id)
+
+        with pytest.raises(AssertionError):
+            with assert_max_queries(0):
+                DBUtilsData.get_entry(self.user_id, self.public_id)
+
+
+class TestOwnershipQueries():
+    """Regression tests for the statements issued by ownership checked DBUtils calls"""
+
+    @pytest.fixture(autouse=True)
+    def setup_teardown(self, real_database):
+        with DatabaseSetup.get_db_session() as session:
+            user = User(
+                username_hash=b'fake_hash',
+                srp_salt=b'fake_srp_salt',
+                srp_verifier=b'fake_srp_verifier',
+                master_key_salt=b'fake_master_key_salt',
+                password_change=False
+            )
+            secure_data = SecureData(
+                user=user,
+                entry_name=b'fake_entry_name',
+                entry_data=b'fake_entry_data'
+            )
+            session.add(secure_data)
+            session.flush()
+            self.user_id = user.id
+            self.public_id = secure_data.public_id
+        QueryStats._reset()
+
+        yield
+
+        QueryStats._reset()
+
+    def test_get_entry_single_query(self):
+        """Should fetch the entry and its owner's password change state in one statement"""
+        with assert_max_queries(1) as call:
+            response = DBUtilsData.get_entry(self.user_id, self.public_id)
+
+        assert response == (True, None, b'fake_entry_name', b'fake_entry_data')
+        assert call.statements == 1
+
+    def test_get_entry_other_user_single_query(self):
+        """Should reject another user's entry without loading the owner"""
+        with assert_max_queries(1):
+            response = DBUtilsData.get_entry(self.user_id + 1, self.public_id)
+
+        assert response[0] is False
+
+    def test_get_entries_single_query(self):
+        """Should fetch many entries, and their owner's password change state, in one statement"""
+        with DatabaseSetup.get_db_session() as session:
+            other_user = User(
+                username_hash=b'other_hash',
+                srp_salt=b'fake_srp_salt',
+                srp_verifier=b'fake_srp_verifier',
+                master_key_salt=b'fake_master_key_salt',
+                password_change=False
+            )
+            other_data = SecureData(
+                user=other_user,
+                entry_name=b'other_entry_name',
+                entry_data=b'other_entry_data'
+            )
+            session.add(other_data)
+            session.flush()
+            other_public_id = other_data.public_id
+
+        with assert_max_queries(1) as call:
+            response = DBUtilsData.get_entries(self.user_id, [self.public_id, other_public_id])
+
+        assert response == (
+            True,
+            None,
+            [(self.public_id, b'fake_entry_name', b'fake_entry_data')],
+            [other_public_id]
+        )
+        assert call.statements == 1
+
+    def test_batch_queries(self):
+        """Should create, edit and delete a whole batch in a fixed number of statements"""
+        entries = [(b'entry_name_%d' % i, b'entry_data_%d' % i) for i in range(100)]
+
+        with assert_max_queries(2):
+            status, _, public_ids = DBUtilsData.create_many(self.user_id, entries)
+        assert status is True
+
+        with assert_max_queries(2):
+            status, _, results = DBUtilsData.edit_many(self.user_id, [(public_id, b'new_entry_name', None) for public_id in public_ids])
+        assert status is True
+        assert all(failure_reason is None for _, failure_reason in results)
+
+        with assert_max_queries(2):
+            status, _, results = DBUtilsData.delete_many(self.user_id, public_ids)
+        assert status is True
+        assert all(failure_reason is None for _, failure_reason in results)
+
+        assert len(DBUtilsData.get_list(self.user_id)[2]) == 1
+
+    def test_edit_queries(self):
+        """Should check ownership in one statement before the update"""
+        with assert_max_queries(2):
+            response = DBUtilsData.edit(self.user_id, self.public_id, b'new_entry_name', None)
+
+        assert response[0] is True
+
+    def test_delete_queries(self):
+        """Should check ownership in one statement before the delete"""
+        with assert_max_queries(2):
+            response = DBUtilsData.delete(self.user_id, self.public_id)
+
+        assert response[0] is True
+
+    def test_update_queries(self):
+        """Should check ownership and password change in one statement before the update"""
+        with assert_max_queries(2):
+            response = DBUtilsPassword.update(self.user_id, self.public_id, b'new_entry_name', b'new_entry_data')
+
+        assert response[0] is True
+
+    @pytest.mark.parametrize("entries", [1, 200])
+    def test_commit_queries(self, entries):
+        """Should commit a password change in the same number of statements whatever the vault size"""
+        DBUtilsData.create_many(self.user_id, [(b'entry_name', b'entry_data')] * (entries - 1))
+        with DatabaseSetup.get_db_session() as session:
+            user = session.query(User).filter(User.id == self.user_id).one()
+            user.password_change = True
+            user.new_srp_salt = b'new_srp_salt'
+            user.new_srp_verifier = b'new_srp_verifier'
+            user.new_master_key_salt = b'new_master_key_salt'
+            public_ids = [secure_data.public_id for secure_data in user.secure_data]
+        DBUtilsPassword.update_many(self.user_id, [(public_id, b'new_entry_name', b'new_entry_data') for public_id in public_ids])
+
+        with assert_max_queries(5):
+            response = DBUtilsPassword.commit(self.user_id)
+
+        assert response == (True, None)
+        with DatabaseSetup.get_db_session() as session:
+            rows = session.query(SecureData.entry_name, SecureData.entry_data, SecureData.new_entry_name).all()
+            user = session.query(User).filter(User.id == self.user_id).one()
+            assert user.srp_salt == b'new_srp_salt'
+            assert user.password_change is False
+        assert rows == [(b'new_entry_name', b'new_entry_data', None)] * entries
+
+    def test_commit_incomplete_changes_nothing(self):
+        """Should leave the user's password unchanged if any entry is not yet updated"""
+        with DatabaseSetup.get_db_session() as session:
+            user = session.query(User).filter(User.id == self.user_id).one()
+            user.password_change = True
+            user.new_srp_salt = b'new_srp_salt'
+            user.new_srp_verifier = b'new_srp_verifier'
+            user.new_master_key_salt = b'new_master_key_salt'
+
+        response = DBUtilsPassword.commit(self.user_id)
+
+        assert response == (False, FailureReason.INCOMPLETE)
+        with DatabaseSetup.get_db_session() as session:
+            user = session.query(User).filter(User.id == self.user_id).one()
+            assert user.srp_salt == b'fake_srp_salt'
+            assert user.password_change is False
+
+    def test_update_many_queries(self):
+        """Should update a whole password change batch in a fixed number of statements"""
+        status, _, public_ids = DBUtilsData.create_many(self.user_id, [(b'entry_name_%d' % i, b'entry_data_%d' % i) for i in range(100)])
+        assert status is True
+
+        with assert_max_queries(2):
+            response = DBUtilsPassword.update_many(self.user_id, [(public_id, b'new_entry_name', b'new_entry_data') for public_id in public_ids])
+
+        assert response == (True, None)
+
+        with DatabaseSetup.get_db_session() as session:
+            updated = session.query(SecureData).filter(SecureData.new_entry_data == b'new_entry_data').count()
+        assert updated == 100
+
+        chunks = list(DBUtilsData.stream_entries(self.user_id, 40, password_change=True))
+        assert [len(chunk[2]) for chunk in chunks] == [40, 40, 21]
+
+    def _selects(self, call):
+        """Helper function to capture the SELECT statements issued by a call"""
+        statements = []
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT"):
+                statements.append(statement)
+
+        with DatabaseSetup.get_db_session() as session:
+            engine = session.get_bind()
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            response = call()
+        finally:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+        return response, " ".join(statements)
+
+    @pytest.mark.parametrize(
+        "call",
+        [
+            lambda self: DBUtilsData.edit(self.user_id, self.public_id, b'new_entry_name', None),
+            lambda self: DBUtilsData.delete(self.user_id, self.public_id),
+            lambda self: DBUtilsPassword.update(self.user_id, self.public_id, b'new_entry_name', b'new_entry_data')
+        ]
+    )
+    def test_ownership_checks_skip_entry_blobs(self, call):
+        """Should check ownership without reading the encrypted entry"""
+        response, selects = self._selects(lambda: call(self))
+
+        assert response[0] is True
+        assert "data.entry_name" not in selects
+        assert "data.entry_data" not in selects
+
+    def test_get_entry_loads_entry_blobs(self):
+        """Should load the deferred entry columns with the ownership check"""
+        response, selects = self._selects(lambda: DBUtilsData.get_entry(self.user_id, self.public_id))
+
+        assert response == (True, None, b'fake_entry_name', b'fake_entry_data')
+        assert "data.entry_data" in selects
+        assert "data.new_entry_data" not in selects
+
+    def test_complete_skips_entry_blobs(self):
+        """Should list the entries of a password change without reading any encrypted entry"""
+        with DatabaseSetup.get_db_session() as session:
+            user = session.query(User).filter(User.id == self.user_id).one()
+            user.password_change = True
+            auth_ephemeral = AuthEphemeral(
+                user=user,
+                eph_private_b=b'fake_eph_private_b',
+                eph_public_b=b'fake_eph_public_b',
+                expiry_time=datetime.now() + timedelta(minutes=5),
+                password_change=True
+            )
+            session.add(auth_ephemeral)
+            session.flush()
+            auth_public_id = auth_ephemeral.public_id
+
+        response, selects = self._selects(
+            lambda: DBUtilsPassword.complete(auth_public_id, b'fake_session_key', datetime.now() + timedelta(minutes=5))
+        )
+
+        assert response[0] is True
+        assert response[3] == [self.public_id]
+        assert "entry_name" not in selects
+        assert "entry_data" not in selects
+
+
+class TestCleanPasswordChangeQueries():
+    """Regression tests for the bulk statements of clean_password_change"""
+
+    @pytest.fixture(autouse=True)
+    def setup_teardown(self, real_database):
+        with DatabaseSetup.get_db_session() as session:
+            user = User(
+                username_hash=b'fake_hash',
+                srp_salt=b'fake_srp_salt',
+                srp_verifier=b'fake_srp_verifier',
+                master_key_salt=b'fake_master_key_salt',
+                password_change=True,
+                new_srp_salt=b'new_srp_salt',
+                new_srp_verifier=b'new_srp_verifier',
+                new_master_key_salt=b'new_master_key_salt'
+            )
+            for password_change in (True, False):
+                session.add(AuthEphemeral(
+                    user=user,
+                    eph_private_b=b'fake_eph_private_b',
+                    eph_public_b=b'fake_eph_public_b',
+                    expiry_time=datetime.now() + timedelta(hours=1),
+                    password_change=password_change
+                ))
+                session.add(LoginSession(
+                    user=user,
+                    session_key=b'fake_session_key_%d' % password_change,
+                    request_count=0,
+                    last_used=datetime.now(),
+                    expiry_time=datetime.now() + timedelta(hours=1),
+                    password_change=password_change
+                ))
+            for i in range(50):
+                session.add(SecureData(
+                    user=user,
+                    entry_name=b'entry_name',
+                    entry_data=b'entry_data',
+                    new_entry_name=b'new_entry_name' if i % 2 else None,
+                    new_entry_data=b'new_entry_data' if i % 2 else None
+                ))
+            session.flush()
+            self.user_id = user.id
+        QueryStats._reset()
+
+        yield
+
+        QueryStats._reset()
+
+    def test_bulk_statements(self):
+        """Should clean in a fixed number of statements, without reading any entry"""
+        statements = []
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        with DatabaseSetup.get_db_session() as session:
+            user = session.query(User).filter(User.id == self.user_id).one()
+            engine = session.get_bind()
+            event.listen(engine, "before_cursor_execute", before_cursor_execute)
+            try:
+                with assert_max_queries(4):
+                    DBUtilsPassword.clean_password_change(session, user)
+                    session.flush()
+            finally:
+                event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+        assert not any(statement.lstrip().upper().startswith("SELECT") for statement in statements)
+
+        with DatabaseSetup.get_db_session() as session:
+            assert session.query(AuthEphemeral).filter(AuthEphemeral.password_change == True).count() == 0
+            assert session.query(AuthEphemeral).count() == 1
+            assert session.query(LoginSession).filter(LoginSession.password_change == True).count() == 0
+            assert session.query(LoginSession).count() == 1
+            assert session.query(SecureData).filter(SecureData.new_entry_name.isnot(None)).count() == 0
+            assert session.query(SecureData).count() == 50
+            user = session.query(User).filter(User.id == self.user_id).one()
+            assert user.password_change is False
+            assert user.new_srp_salt is None
+
+    def test_held_objects_kept_consistent(self):
+        """Should update and remove the objects a caller already holds"""
+        with DatabaseSetup.get_db_session() as session:
+            login_session = session.query(LoginSession).filter(LoginSession.password_change == True).one()
+            other_session = session.query(LoginSession).filter(LoginSession.password_change == False).one()
+            secure_data = session.query(SecureData).filter(SecureData.new_entry_name.isnot(None)).first()
+            user = login_session.user
+            assert len(user.login_sessions) == 2
+
+            DBUtilsPassword.clean_password_change(session, user)
+
+            assert login_session not in session
+            assert other_session in session
+            assert secure_data.new_entry_name is None
+            assert secure_data.new_entry_data is None
+            assert user.login_sessions == [other_session]
+            assert len(user.auth_ephemerals) == 1
+
+            # A caller may still delete the rows left behind
+            session.delete(other_session)
+
+        with DatabaseSetup.get_db_session() as session:
+            assert session.query(LoginSession).count() == 0
+
+
+if __name__ == '__main__':
+    pytest.main(['-v', __file__])
@@ -0,0 +1,161 @@
+import os
+import sys
+import pytest
+import shutil
+import logging
+import tempfile
+from pathlib import Path
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import migrate_blob_storage
+from migrate_blob_storage import migrate
+from database.database_setup import DatabaseSetup
+from database.database_models import Base, User, SecureData, SecureBlob
+from database.blob_store import BlobStore
+from utils.database_config import DatabaseConfig
+from utils.db_utils_data import DBUtilsData
+
+
+class TestMigrateBlobStorage():
+    """Test cases for migrating a vault between blob storage modes, and rolling it back"""
+
+    @pytest.fixture(autouse=True)
+    def setup_teardown(self, monkeypatch, real_database):
+        self.test_dir = tempfile.mkdtemp()
+        self.database = real_database
+        DatabaseConfig._config = None
+
+        # Keep the test run's logging as it is, rather than the file handlers of the config
+        monkeypatch.setattr(migrate_blob_storage, "initialise_logging", lambda: None)
+
+        self.vacuums = 0
+        original_vacuum = DatabaseSetup.vacuum
+        def counting_vacuum():
+            self.vacuums += 1
+            original_vacuum()
+        monkeypatch.setattr(DatabaseSetup, "vacuum", staticmethod(counting_vacuum))
+
+        with DatabaseSetup.get_db_session() as session:
+            user = User(
+                username_hash=b'fake_hash',
+                srp_salt=b'fake_srp_salt',
+                srp_verifier=b'fake_srp_verifier',
+                master_key_salt=b'fake_master_key_salt',
+                password_change=False
+            )
+            session.add(user)
+            session.flush()
+            self.user_id = user.id
+
+        self.entries = [(b'entry_name_%d' % i, b'entry_data_%d' % i) for i in range(7)]
+        _, _, self.public_ids = DBUtilsData.create_many(self.user_id, self.entries)
+
+        yield
+
+        BlobStore._reset()
+        DatabaseConfig._config = None
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _stored(self):
+        """Helper function to read the entry data held in the data and blob tables"""
+        with DatabaseSetup.get_db_session() as session:
+            inline = dict(session.query(SecureData.public_id, SecureData.entry_data).all())
+            blobs = dict(
+                session.query(SecureData.public_id, SecureBlob.entry_data)
+                .join(SecureBlob, SecureBlob.data_id == SecureData.id)
+                .all()
+            )
+        return inline, blobs
+
+    def _expected(self):
+        """Helper function to map each public id to its entry data"""
+        return {public_id: entry_data for public_id, (_, entry_data) in zip(self.public_ids, self.entries)}
+
+    def _write_config(self, blob_storage):
+        """Helper function to write a config file for the test database, in the given blob storage mode"""
+        config_path = Path(self.test_dir) / "config.ini"
+        if isinstance(self.database, Path):
+            paths, database = f"database = {self.database}\n", ""
+        else:
+            paths, database = "", f"url = {self.database}\n"
+        config_path.write_text(
+            f"[paths]\n{paths}\n"
+            f"[database]\n{database}blob_storage = {blob_storage}\n"
+        )
+        DatabaseConfig._config = None
+        return config_path
+
+    def _run_main(self, monkeypatch, *args):
+        """Helper function to run the migration command with the given arguments, on the closed test database"""
+        DatabaseSetup.close_db()
+        monkeypatch.setattr(sys, "argv", ["migrate_blob_storage.py", *[str(arg) for arg in args]])
+        try:
+            migrate_blob_storage.main()
+        finally:
+            BlobStore._reset()
+            DatabaseSetup.init_db(self.database, Base)
+
+    def test_migrate_verify_rollback(self):
+        """Should move every entry to the blob table and back inline, verifying each mode in turn"""
+        BlobStore.configure("table")
+
+        assert migrate(chunk_size=3) == len(self.entries)
+        BlobStore.verify()
+        inline, blobs = self._stored()
+        assert set(inline.values()) == {b''}
+        assert blobs == self._expected()
+        assert DBUtilsData.get_entries(self.user_id, self.public_ids)[2] == [
+            (public_id, entry_name, entry_data)
+            for public_id, (entry_name, entry_data) in zip(self.public_ids, self.entries)
+        ]
+
+        BlobStore.configure("inline")
+
+        assert migrate(chunk_size=3) == len(self.entries)
+        BlobStore.verify()
+        inline, blobs = self._stored()
+        assert inline == self._expected()
+        assert blobs == {}
+        assert self.vacuums == 2
+
+    def test_migrate_nothing_to_move(self):
+        """Should verify an already migrated vault without vacuuming it"""
+        assert migrate() == 0
+        assert self.vacuums == 0
+
+    def test_migrate_without_vacuum(self):
+        """Should not vacuum the database if told not to"""
+        BlobStore.configure("table")
+
+        assert migrate(vacuum=False) == len(self.entries)
+        assert self.vacuums == 0
+
+    def test_main_migrate_and_rollback(self, monkeypatch, caplog):
+        """Should migrate to the mode set in the given config, and log the entries moved"""
+        caplog.set_level(logging.INFO, logger="database")
+
+        self._run_main(monkeypatch, self._write_config("table"), "--chunk-size", 2, "--no-vacuum")
+
+        assert f"Migrated {len(self.entries)} entries to table blob storage." in caplog.messages
+        assert self._stored()[1] == self._expected()
+        assert self.vacuums == 0
+
+        self._run_main(monkeypatch, self._write_config("inline"))
+
+        assert f"Migrated {len(self.entries)} entries to inline blob storage." in caplog.messages
+        assert self._stored() == (self._expected(), {})
+        assert self.vacuums == 1
+
+    def test_main_failure(self, monkeypatch, caplog):
+        """Should log the failure and exit with an error, leaving the vault as it was"""
+        with pytest.raises(SystemExit) as exit_info:
+            self._run_main(monkeypatch, self._write_config("disk"))
+
+        assert exit_info.value.code == 1
+        assert "Failed to migrate blob storage" in caplog.messages
+        assert self._stored() == (self._expected(), {})
+
+
+if __name__ == '__main__':
+    pytest.main(['-v', __file__])
@@ -0,0 +1,82 @@
+import os
+import sys
+import grpc
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src", "services"))
+
+from services.all_server import ServerSettings
+
+
+class TestServerSettings():
+    """Test cases for reading the server settings"""
+
+    def test_defaults(self):
+        """Should match the previous hard coded server if nothing is set"""
+        settings = ServerSettings.from_config({})
+
+        assert settings.mode == "threaded"
+        assert settings.port == 50051
+        assert settings.max_workers == 10
+        assert settings.maximum_concurrent_rpcs is None
+        assert settings.compression == grpc.Compression.NoCompression
+        assert settings.options == []
+
+    def test_reads_settings(self):
+        """Should read every supported setting"""
+        settings = ServerSettings.from_config({
+            "mode": "Async",
+            "port": "50052",
+            "max_workers": "32",
+            "maximum_concurrent_rpcs": "1000",
+            "max_send_message_length": "1024",
+            "max_receive_message_length": "2048",
+            "keepalive_time_ms": "60000",
+            "keepalive_timeout_ms": "20000",
+            "keepalive_permit_without_calls": "1",
+            "min_ping_interval_without_data_ms": "30000",
+            "max_ping_strikes": "2",
+            "compression": "GZIP"
+        })
+
+        assert settings.mode == "async"
+        assert settings.port == 50052
+        assert settings.max_workers == 32
+        assert settings.maximum_concurrent_rpcs == 1000
+        assert settings.compression == grpc.Compression.Gzip
+        assert dict(settings.options) == {
+            "grpc.max_send_message_length": 1024,
+            "grpc.max_receive_message_length": 2048,
+            "grpc.keepalive_time_ms": 60000,
+            "grpc.keepalive_timeout_ms": 20000,
+            "grpc.keepalive_permit_without_calls": 1,
+            "grpc.http2.min_ping_interval_without_data_ms": 30000,
+            "grpc.http2.max_ping_strikes": 2
+        }
+
+    def test_zero_concurrent_rpcs_is_unlimited(self):
+        """Should not limit concurrent RPCs if set to 0"""
+        settings = ServerSettings.from_config({"maximum_concurrent_rpcs": "0"})
+        assert settings.maximum_concurrent_rpcs is None
+
+    @pytest.mark.parametrize(
+        "config",
+        [
+            {"unknown": "1"},
+            {"port": "not_a_number"},
+            {"port": "-1"},
+            {"max_workers": "0"},
+            {"keepalive_time_ms": "1.5"},
+            {"compression": "brotli"},
+            {"mode": "forked"}
+        ]
+    )
+    def test_invalid_settings_raise(self, config):
+        """Should raise exception for unknown settings or invalid values"""
+        with pytest.raises(ValueError):
+            ServerSettings.from_config(config)
+
+
+if __name__ == '__main__':
+    pytest.main(['-v', __file__])
@@ -0,0 +1,425 @@
+import os
+import sys
+import grpc
+import time
+import pytest
+import asyncio
+import threading
+from concurrent.futures import Future
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src", "services"))
+
+from passmanager.common.v0.secure_pb2 import SecureResponse
+from passmanager.common.v0.error_pb2 import Failure, HealthResponse
+
+import services.async_services as async_services
+from services.async_services import (
+    AsyncExecutors,
+    AsyncUserService,
+    AsyncPasswordService,
+    AsyncSessionService,
+    AsyncDataService
+)
+from services.metrics_interceptor import AsyncMetricsInterceptor
+from utils import MetricsRegistry
+from enums import FailureReason
+
+
+class _Context():
+    def peer(self):
+        return "ipv4:127.0.0.1:50000"
+
+
+class _HandlerCallDetails():
+    method = "/passmanager.data.v0.Data/Get"
+
+
+def _completed(value) -> Future:
+    future: Future = Future()
+    future.set_result(value)
+    return future
+
+
+async def _collect(responses):
+    return [response async for response in responses]
+
+
+async def _requests(*requests):
+    for request in requests:
+        yield request
+
+
+def _intercept(handler):
+    async def continuation(details):
+        return handler
+    return asyncio.run(AsyncMetricsInterceptor().intercept_service(continuation, _HandlerCallDetails()))
+
+
+class TestAsyncExecutors():
+    """Test cases for the bounded executors of the async servicers"""
+
+    @pytest.fixture(autouse=True)
+    def setup_teardown(self):
+        AsyncExecutors.start(database_workers=2, crypto_workers=1)
+        yield
+        AsyncExecutors.stop()
+
+    @pytest.mark.parametrize("database_workers, crypto_workers", [(0, 1), (1, 0)])
+    def test_start_rejects_invalid(self, database_workers, crypto_workers):
+        """Should raise exception if either executor is given no workers"""
+        AsyncExecutors.stop()
+
+        with pytest.raises(ValueError):
+            AsyncExecutors.start(database_workers, crypto_workers)
+
+    def test_start_twice(self):
+        """Should raise exception if already started"""
+        with pytest.raises(RuntimeError):
+            AsyncExecutors.start(database_workers=2, crypto_workers=1)
+
+    def test_runs_on_named_executors(self):
+        """Should run database work and SRP steps on their own executor threads"""
+        def thread_name():
+            return threading.current_thread().name
+
+        def steps():
+            yield from ()
+            return thread_name()
+
+        async def run():
+            return (
+                await AsyncExecutors.run_database(thread_name),
+                await AsyncExecutors.run_srp(steps())
+            )
+
+        database, crypto = asyncio.run(run())
+
+        assert database.startswith("database")
+        assert crypto.startswith("crypto")
+
+    def test_run_srp_sends_results(self):
+        """Should send each SRP future's result back into the steps"""
+        def steps():
+            first = yield _completed(2)
+            second = yield _completed(3)
+            return first * second
+
+        assert asyncio.run(AsyncExecutors.run_srp(steps())) == 6
+
+    def test_run_srp_throws_exceptions(self):
+        """Should raise a failed SRP future's exception inside the steps"""
+        failed: Future = Future()
+        failed.set_exception(ValueError("Failed"))
+
+        def steps():
+            try:
+                yield failed
+            except ValueError:
+                return "handled"
+
+        assert asyncio.run(AsyncExecutors.run_srp(steps())) == "handled"
+
+    def test_run_srp_releases_crypto_thread(self):
+        """Should not hold the crypto thread while waiting on an SRP future"""
+        pending = []
+
+        def steps():
+            future: Future = Future()
+            pending.append(future)
+            return (yield future)
+
+        async def run():
+            calls = [asyncio.ensure_future(AsyncExecutors.run_srp(steps())) for _ in range(3)]
+            try:
+                while len(pending) < 3:
+                    await asyncio.sleep(0.01)
+            finally:
+                for i, future in enumerate(pending):
+                    future.set_result(i)
+            return await asyncio.gather(*calls)
+
+        # A single crypto thread starts all three handlers before any SRP future completes
+        assert asyncio.run(asyncio.wait_for(run(), timeout=5)) == [0, 1, 2]
+
+    def test_stop_waits_for_running_work(self):
+        """Should finish running handlers before shutting down, then leave the executors unset"""
+        finished = []
+
+        def slow():
+            time.sleep(0.05)
+            finished.append(True)
+
+        AsyncExecutors._database.submit(slow) # type: ignore
+        AsyncExecutors.stop()
+
+        assert finished == [True]
+        assert AsyncExecutors._database is None
+        assert AsyncExecutors._crypto is None
+
+    def test_stop_twice(self):
+        """Should do nothing if already stopped"""
+        AsyncExecutors.stop()
+        AsyncExecutors.stop()
+
+    def test_stream_database(self):
+        """Should yield every item of a blocking generator, read on the database executor"""
+        threads = []
+
+        def responses():
+            for i in range(3):
+                threads.append(threading.current_thread().name)
+                yield i
+
+        assert asyncio.run(_collect(AsyncExecutors.stream_database(responses()))) == [0, 1, 2]
+        assert all(name.startswith("database") for name in threads)
+
+    def test_stream_database_closes_generator(self):
+        """Should close the blocking generator if the stream stops early"""
+        closed = []
+
+        def responses():
+            try:
+                yield 1
+                yield 2
+            finally:
+                closed.append(True)
+
+        async def first():
+            stream = AsyncExecutors.stream_database(responses())
+            response = await stream.__anext__()
+            await stream.aclose()
+            return response
+
+        assert asyncio.run(first()) == 1
+        assert closed == [True]
+
+
+class TestAsyncServices():
+    """Test cases for the async servicers dispatching to the handlers"""
+
+    @pytest.fixture(autouse=True)
+    def setup_teardown(self):
+        AsyncExecutors.start(database_workers=2, crypto_workers=1)
+        yield
+        AsyncExecutors.stop()
+
+    @pytest.mark.parametrize(
+        "service, method, handler, function, executor",
+        [
+            (AsyncUserService, "Register", "UserHandler", "register", "database"),
+            (AsyncUserService, "Username", "UserHandler", "username", "database"),
+            (AsyncUserService, "Delete", "UserHandler", "delete", "database"),
+            (AsyncPasswordService, "Commit", "PasswordHandler", "commit", "database"),
+            (AsyncPasswordService, "Abort", "PasswordHandler", "abort", "database"),
+            (AsyncPasswordService, "Get", "PasswordHandler", "get", "database"),
+            (AsyncPasswordService, "Update", "PasswordHandler", "update", "database"),
+            (AsyncSessionService, "Delete", "SessionHandler", "delete", "database"),
+            (AsyncSessionService, "Clean", "SessionHandler", "clean", "database"),
+            (AsyncDataService, "Create", "DataHandler", "create", "database"),
+            (AsyncDataService, "CreateMany", "DataHandler", "create_many", "database"),
+            (AsyncDataService, "Edit", "DataHandler", "edit", "database"),
+            (AsyncDataService, "EditMany", "DataHandler", "edit_many", "database"),
+            (AsyncDataService, "Delete", "DataHandler", "delete", "database"),
+            (AsyncDataService, "DeleteMany", "DataHandler", "delete_many", "database"),
+            (AsyncDataService, "Get", "DataHandler", "get", "database"),
+            (AsyncDataService, "GetMany", "DataHandler", "get_many", "database"),
+            (AsyncDataService, "List", "DataHandler", "list", "database")
+        ]
+    )
+    def test_unary_dispatch(self, monkeypatch, service, method, handler, function, executor):
+        """Should pass the request to its handler on the matching executor, and return the response"""
+        request = object()
+        response = SecureResponse(success=True)
+        calls = []
+
+        def fake_handler(secure_request):
+            calls.append((secure_request, threading.current_thread().name))
+            return response
+        monkeypatch.setattr(getattr(async_services, handler), function, staticmethod(fake_handler))
+
+        result = asyncio.run(getattr(service(), method)(request, _Context()))
+
+        assert result is response
+        assert calls[0][0] is request
+        assert calls[0][1].startswith(executor)
+
+    @pytest.mark.parametrize(
+        "service, method, handler, function",
+        [
+            (AsyncPasswordService, "Start", "PasswordHandler", "start_steps"),
+            (AsyncPasswordService, "Auth", "PasswordHandler", "auth_steps"),
+            (AsyncSessionService, "Start", "SessionHandler", "start_steps"),
+            (AsyncSessionService, "Auth", "SessionHandler", "auth_steps")
+        ]
+    )
+    def test_srp_dispatch(self, monkeypatch, service, method, handler, function):
+        """Should run the handler's SRP steps on the crypto executor, awaiting their SRP futures"""
+        request = object()
+        calls = []
+
+        def fake_steps(secure_request):
+            calls.append((secure_request, threading.current_thread().name))
+            success = yield _completed(True)
+            return SecureResponse(success=success)
+        monkeypatch.setattr(getattr(async_services, handler), function, staticmethod(fake_steps))
+
+        result = asyncio.run(getattr(service(), method)(request, _Context()))
+
+        assert result == SecureResponse(success=True)
+        assert calls[0][0] is request
+        assert calls[0][1].startswith("crypto")
+
+    @pytest.mark.parametrize(
+        "service, method, handler, function",
+        [
+            (AsyncPasswordService, "GetStream", "PasswordHandler", "get_stream"),
+            (AsyncDataService, "ListStream", "DataHandler", "list_stream")
+        ]
+    )
+    def test_stream_dispatch(self, monkeypatch, service, method, handler, function):
+        """Should stream every response of the handler"""
+        responses = [SecureResponse(success=True), SecureResponse(success=False)]
+
+        def fake_handler(secure_request):
+            yield from responses
+        monkeypatch.setattr(getattr(async_services, handler), function, staticmethod(fake_handler))
+
+        result = asyncio.run(_collect(getattr(service(), method)(object(), _Context())))
+
+        assert result == responses
+
+    def test_update_stream(self, monkeypatch):
+        """Should apply each batch in turn, then return the stream response"""
+        batches = []
+        response = SecureResponse(success=True)
+
+        def update_batch(secure_request, progress):
+            batches.append(secure_request)
+            progress.updated_count += 1
+            return None
+        monkeypatch.setattr(async_services.PasswordHandler, "update_batch", staticmethod(update_batch))
+        monkeypatch.setattr(
+            async_services.PasswordHandler,
+            "update_stream_response",
+            staticmethod(lambda progress: response if progress.updated_count == 2 else None)
+        )
+
+        result = asyncio.run(AsyncPasswordService().UpdateStream(_requests("first", "second"), _Context()))
+
+        assert result is response
+        assert batches == ["first", "second"]
+
+    def test_update_stream_stops_on_failure(self, monkeypatch):
+        """Should return the first failing batch, without applying the rest"""
+        batches = []
+        failure = SecureResponse(success=False)
+
+        def update_batch(secure_request, progress):
+            batches.append(secure_request)
+            return failure
+        monkeypatch.setattr(async_services.PasswordHandler, "update_batch", staticmethod(update_batch))
+
+        result = asyncio.run(AsyncPasswordService().UpdateStream(_requests("first", "second"), _Context()))
+
+        assert result is failure
+        assert batches == ["first"]
+
+    @pytest.mark.parametrize("service", [AsyncUserService, AsyncPasswordService, AsyncSessionService, AsyncDataService])
+    def test_health(self, service):
+        """Should report healthy without using an executor"""
+        AsyncExecutors.stop()
+
+        assert asyncio.run(service().Health(object(), _Context())) == HealthResponse(health=True)
+
+
+class TestAsyncMetricsInterceptor():
+    """Test cases for the metrics interceptor of the async server"""
+
+    @pytest.fixture(autouse=True)
+    def setup_teardown(self):
+        MetricsRegistry._reset()
+        yield
+        MetricsRegistry._reset()
+
+    def test_records_success(self):
+        """Should record a successful response as OK"""
+        async def behaviour(request, context):
+            return SecureResponse(success=True)
+        handler = _intercept(grpc.unary_unary_rpc_method_handler(behaviour))
+
+        response = asyncio.run(handler.unary_unary(None, None))
+
+        assert response.success
+        assert 'method="/passmanager.data.v0.Data/Get",outcome="OK"} 1' in MetricsRegistry.render()
+
+    def test_records_failure_reason(self):
+        """Should record a failed response by its FailureReason"""
+        failure = Failure(error_list=[FailureReason.NOT_FOUND.error_proto("public_id")])
+        async def behaviour(request, context):
+            return SecureResponse(success=False, failure_data=failure)
+        handler = _intercept(grpc.unary_unary_rpc_method_handler(behaviour))
+
+        asyncio.run(handler.unary_unary(None, None))
+
+        assert 'outcome="NOT_FOUND"} 1' in MetricsRegistry.render()
+
+    def test_records_exception(self):
+        """Should record an exception, and raise it"""
+        async def behaviour(request, context):
+            raise ValueError("Failed")
+        handler = _intercept(grpc.unary_unary_rpc_method_handler(behaviour))
+
+        with pytest.raises(ValueError):
+            asyncio.run(handler.unary_unary(None, None))
+
+        assert 'outcome="EXCEPTION"} 1' in MetricsRegistry.render()
+
+    def test_passes_unknown_method(self):
+        """Should return None if there is no handler for the method"""
+        assert _intercept(None) is None
+
+    def test_records_stream(self):
+        """Should record a stream by the first FailureReason it sends"""
+        failure = Failure(error_list=[FailureReason.PASSWORD_CHANGE.error_proto()])
+        async def behaviour(request, context):
+            yield SecureResponse(success=True)
+            yield SecureResponse(success=False, failure_data=failure)
+        handler = _intercept(grpc.unary_stream_rpc_method_handler(behaviour))
+
+        responses = asyncio.run(_collect(handler.unary_stream(None, None)))
+
+        assert len(responses) == 2
+        assert 'outcome="PASSWORD_CHANGE"} 1' in MetricsRegistry.render()
+
+    def test_records_stream_cancelled(self):
+        """Should record a stream closed before it finished as cancelled"""
+        async def behaviour(request, context):
+            yield SecureResponse(success=True)
+            yield SecureResponse(success=True)
+        handler = _intercept(grpc.unary_stream_rpc_method_handler(behaviour))
+
+        async def first():
+            responses = handler.unary_stream(None, None)
+            await responses.__anext__()
+            await responses.aclose()
+        asyncio.run(first())
+
+        assert 'outcome="CANCELLED"} 1' in MetricsRegistry.render()
+
+    def test_records_client_stream(self):
+        """Should record a client stream by the single response it returns"""
+        failure = Failure(error_list=[FailureReason.ENTRY_UPDATED.error_proto()])
+        async def behaviour(request_iterator, context):
+            assert len([request async for request in request_iterator]) == 2
+            return SecureResponse(success=False, failure_data=failure)
+        handler = _intercept(grpc.stream_unary_rpc_method_handler(behaviour))
+
+        response = asyncio.run(handler.stream_unary(_requests(None, None), None))
+
+        assert not response.success
+        assert 'method="/passmanager.data.v0.Data/Get",outcome="ENTRY_UPDATED"} 1' in MetricsRegistry.render()
+
+
+if __name__ == '__main__':
+    pytest.main(['-v', __file__])
@@ -8,12 +8,20 @@ from google.protobuf.message import DecodeError
 from passmanager.data.v0.data_payloads_pb2 import (
     DataCreateRequest,
     DataCreateResponse,
+    DataCreateManyRequest,
+    DataCreateManyResponse,
     DataEditRequest,
     DataEditResponse,
+    DataEditManyRequest,
+    DataEditManyResponse,
     DataDeleteRequest,
     DataDeleteResponse,
+    DataDeleteManyRequest,
+    DataDeleteManyResponse,
     DataGetRequest,
     DataGetResponse,
+    DataGetManyRequest,
+    DataGetManyResponse,
     DataListRequest,
     DataListResponse
 )
@@ -30,6 +38,7 @@ from services.data_handler import DataHandler
 from utils.service_utils import ServiceUtils
 from utils.db_utils_data import DBUtilsData
 from utils.session_manager import SessionManager
+from utils.stage_timer import StageTimer
 from enums.failure_reason import FailureReason
 
 
@@ -449,6 +458,206 @@ class TestCreate:
         assert response == secure_response
 
 
+    def test_records_stage_timings(self):
+        """Should record the time taken by each stage, if the stage timer is enabled"""
+
+        StageTimer.configure(True)
+        request = SecureRequest(
+            session_id="fake_session_id",
+            request_number=0,
+            encrypted_data=b'fake_encryption_data'
+        )
+
+        try:
+            DataHandler.create(request)
+            stages = StageTimer.percentiles()
+        finally:
+            StageTimer._reset()
+
+        assert set(stages) == {
+            ("DataHandler.create", "open"),
+            ("DataHandler.create", "decode"),
+            ("DataHandler.create", "sanitise"),
+            ("DataHandler.create", "database"),
+            ("DataHandler.create", "seal")
+        }
+        assert all(summary["count"] == 1 for summary in stages.values())
+
+
+class TestCreateMany:
+    """Test cases for data create many function"""
+
+    @pytest.fixture(autouse=True)
+    def setup_teardown(self, monkeypatch):
+
+        self.open_session_called = []
+        self.open_session_response = True, None, b'fake_decrypted_bytes', 0
+        def fake_open_session(request, password_session = False, first_request = False):
+            self.open_session_called.append((request, password_session, first_request))
+            return self.open_session_response
+        monkeypatch.setattr(SessionManager, "open_session", fake_open_session)
+
+        self.from_string_response = DataCreateManyRequest(
+            username_hash=b'fake_username_hash',
+            entries=[
+                DataCreateManyRequest.Entry(entry_name=b'fake_name_a', entry_data=b'fake_data_a'),
+                DataCreateManyRequest.Entry(entry_name=b'fake_name_b', entry_data=b'fake_data_b')
+            ]
+        )
+        self.from_string_exception = False
+        def fake_from_string(data):
+            if self.from_string_exception:
+                raise DecodeError("invalid bytes")
+            else:
+                return self.from_string_response
+        monkeypatch.setattr(DataCreateManyRequest, "FromString", fake_from_string)
+
+        self.sanitise_username_hash_response = None
+        def fake_sanitise_username_hash(input):
+            return self.sanitise_username_hash_response
+        monkeypatch.setattr(ServiceUtils, "sanitise_username_hash", fake_sanitise_username_hash)
+
+        self.sanitise_entry_name_called = []
+        self.sanitise_entry_name_response = None
+        def fake_sanitise_entry_name(input):
+            self.sanitise_entry_name_called.append(input)
+            return self.sanitise_entry_name_response
+        monkeypatch.setattr(ServiceUtils, "sanitise_entry_name", fake_sanitise_entry_name)
+
+        self.sanitise_entry_data_called = []
+        self.sanitise_entry_data_response = None
+        def fake_sanitise_entry_data(input):
+            self.sanitise_entry_data_called.append(input)
+            return self.sanitise_entry_data_response
+        monkeypatch.setattr(ServiceUtils, "sanitise_entry_data", fake_sanitise_entry_data)
+
+        self.create_many_called = []
+        self.create_many_response = True, None, []
+        def fake_create_many(user_id, entries):
+            self.create_many_called.append((user_id, entries))
+            return self.create_many_response
+        monkeypatch.setattr(DBUtilsData, "create_many", fake_create_many)
+
+        self.seal_session_called = []
+        def fake_seal_session(session_id, response):
+            self.seal_session_called.append((session_id, response))
+            return SecureResponse(
+                success=True,
+                success_data=SecureResponse.Success(
+                    session_id=session_id,
+                    encrypted_data=response
+                )
+            )
+        monkeypatch.setattr(SessionManager, "seal_session", fake_seal_session)
+
+        self.request = SecureRequest(
+            session_id="fake_session_id",
+            request_number=0,
+            encrypted_data=b'fake_encryption_data'
+        )
+
+        yield
+
+    def test_opens_session_once(self):
+        """Should open the session once for the whole batch"""
+
+        DataHandler.create_many(self.request)
+
+        assert self.open_session_called == [(self.request, False, False)]
+
+    def test_open_session_fails(self):
+        """Should return error if open session fails"""
+
+        self.open_session_response = False, FailureReason.DECRYPTION, b'', 0
+
+        response = DataHandler.create_many(self.request)
+
+        assert not response.success
+        assert response.failure_data.error_list[0].code == ErrorCode.RQS01
+        assert len(self.create_many_called) == 0
+
+    def test_convert_to_proto_fails(self):
+        """Should fail if conversion to proto raises exception"""
+
+        self.from_string_exception = True
+
+        response = DataHandler.create_many(self.request)
+
+        assert not response.success
+        assert response.failure_data.error_list[0].code == ErrorCode.RQS01
+        assert len(self.create_many_called) == 0
+
+    def test_sanitises_each_entry(self):
+        """Should sanitise every entry in the batch"""
+
+        DataHandler.create_many(self.request)
+
+        assert self.sanitise_entry_name_called == [b'fake_name_a', b'fake_name_b']
+        assert self.sanitise_entry_data_called == [b'fake_data_a', b'fake_data_b']
+
+    @pytest.mark.parametrize(
+        "failing_sanitiser",
+        ["sanitise_entry_name", "sanitise_entry_data"]
+    )
+    def test_sanitising_fails(self, failing_sanitiser):
+        """Should return a single invalid error if any entry fails sanitising"""
+
+        setattr(self, f"{failing_sanitiser}_response", FailureReason.INVALID)
+
+        response = DataHandler.create_many(self.request)
+
+        assert not response.success
+        assert len(response.failure_data.error_list) == 1
+        error = response.failure_data.error_list[0]
+        assert error.field == "entries"
+        assert error.code == ErrorCode.GNR00
+        assert len(self.create_many_called) == 0
+
+    def test_calls_util(self):
+        """Should pass the whole batch to one util call"""
+
+        self.open_session_response = True, None, b'fake_decrypted_bytes', 15
+
+        DataHandler.create_many(self.request)
+
+        assert self.create_many_called == [(15, [(b'fake_name_a', b'fake_data_a'), (b'fake_name_b', b'fake_data_b')])]
+
+    @pytest.mark.parametrize(
+        "failure_reason, field",
+        [
+            (FailureReason.TOO_MANY,            "request"),
+            (FailureReason.PASSWORD_CHANGE,     "request"),
+            (FailureReason.UNKNOWN_EXCEPTION,   "server"),
+            (FailureReason.NOT_FOUND,           "unknown")
+        ]
+    )
+    def test_returns_error_util_call_fails(self, failure_reason, field):
+        """Should return correct error if util function fails"""
+
+        self.create_many_response = False, failure_reason, []
+
+        response = DataHandler.create_many(self.request)
+
+        assert not response.success
+        error = response.failure_data.error_list[0]
+        assert error.field == field
+        assert error.code == failure_reason.error_code
+
+    def test_seals_results(self):
+        """Should seal the status of each entry in one response"""
+
+        self.create_many_response = True, None, ["fake_public_id_a", "fake_public_id_b"]
+
+        response = DataHandler.create_many(self.request)
+
+        assert response.success
+        assert len(self.seal_session_called) == 1
+
+        sealed = DataCreateManyResponse.FromString(response.success_data.encrypted_data)
+        assert sealed.username_hash == b'fake_username_hash'
+        assert [(result.public_id, result.success, result.error.code) for result in sealed.results] == [("fake_public_id_a", True, 0), ("fake_public_id_b", True, 0)]
+
+
 class TestEdit:
     """Test cases for data edit function"""
 
@@ -978,6 +1187,188 @@ class TestEdit:
         assert edit[3] == None
 
 
+class TestEditMany:
+    """Test cases for data edit many function"""
+
+    @pytest.fixture(autouse=True)
+    def setup_teardown(self, monkeypatch):
+
+        self.open_session_called = []
+        self.open_session_response = True, None, b'fake_decrypted_bytes', 0
+        def fake_open_session(request, password_session = False, first_request = False):
+            self.open_session_called.append((request, password_session, first_request))
+            return self.open_session_response
+        monkeypatch.setattr(SessionManager, "open_session", fake_open_session)
+
+        self.from_string_response = DataEditManyRequest(
+            username_hash=b'fake_username_hash',
+            entries=[
+                DataEditManyRequest.Edit(public_id="fake_public_id_a", entry_name=b'fake_name_a'),
+                DataEditManyRequest.Edit(public_id="fake_public_id_b", entry_data=b'fake_data_b')
+            ]
+        )
+        self.from_string_exception = False
+        def fake_from_string(data):
+            if self.from_string_exception:
+                raise DecodeError("invalid bytes")
+            else:
+                return self.from_string_response
+        monkeypatch.setattr(DataEditManyRequest, "FromString", fake_from_string)
+
+        self.sanitise_username_hash_response = None
+        def fake_sanitise_username_hash(input):
+            return self.sanitise_username_hash_response
+        monkeypatch.setattr(ServiceUtils, "sanitise_username_hash", fake_sanitise_username_hash)
+
+        self.sanitise_public_id_called = []
+        self.sanitise_public_id_response = None
+        def fake_sanitise_public_id(input):
+            self.sanitise_public_id_called.append(input)
+            return self.sanitise_public_id_response
+        monkeypatch.setattr(ServiceUtils, "sanitise_public_id", fake_sanitise_public_id)
+
+        self.sanitise_entry_name_called = []
+        self.sanitise_entry_name_response = None
+        def fake_sanitise_entry_name(input):
+            self.sanitise_entry_name_called.append(input)
+            return self.sanitise_entry_name_response
+        monkeypatch.setattr(ServiceUtils, "sanitise_entry_name", fake_sanitise_entry_name)
+
+        self.sanitise_entry_data_called = []
+        self.sanitise_entry_data_response = None
+        def fake_sanitise_entry_data(input):
+            self.sanitise_entry_data_called.append(input)
+            return self.sanitise_entry_data_response
+        monkeypatch.setattr(ServiceUtils, "sanitise_entry_data", fake_sanitise_entry_data)
+
+        self.edit_many_called = []
+        self.edit_many_response = True, None, []
+        def fake_edit_many(user_id, edits):
+            self.edit_many_called.append((user_id, edits))
+            return self.edit_many_response
+        monkeypatch.setattr(DBUtilsData, "edit_many", fake_edit_many)
+
+        self.seal_session_called = []
+        def fake_seal_session(session_id, response):
+            self.seal_session_called.append((session_id, response))
+            return SecureResponse(
+                success=True,
+                success_data=SecureResponse.Success(
+                    session_id=session_id,
+                    encrypted_data=response
+                )
+            )
+        monkeypatch.setattr(SessionManager, "seal_session", fake_seal_session)
+
+        self.request = SecureRequest(
+            session_id="fake_session_id",
+            request_number=0,
+            encrypted_data=b'fake_encryption_data'
+        )
+
+        yield
+
+    def test_opens_session_once(self):
+        """Should open the session once for the whole batch"""
+
+        DataHandler.edit_many(self.request)
+
+        assert self.open_session_called == [(self.request, False, False)]
+
+    def test_open_session_fails(self):
+        """Should return error if open session fails"""
+
+        self.open_session_response = False, FailureReason.DECRYPTION, b'', 0
+
+        response = DataHandler.edit_many(self.request)
+
+        assert not response.success
+        assert response.failure_data.error_list[0].code == ErrorCode.RQS01
+        assert len(self.edit_many_called) == 0
+
+    def test_convert_to_proto_fails(self):
+        """Should fail if conversion to proto raises exception"""
+
+        self.from_string_exception = True
+
+        response = DataHandler.edit_many(self.request)
+
+        assert not response.success
+        assert response.failure_data.error_list[0].code == ErrorCode.RQS01
+        assert len(self.edit_many_called) == 0
+
+    def test_sanitises_each_entry(self):
+        """Should sanitise every entry in the batch"""
+
+        DataHandler.edit_many(self.request)
+
+        assert self.sanitise_public_id_called == ["fake_public_id_a", "fake_public_id_b"]
+        assert self.sanitise_entry_name_called == [b'fake_name_a']
+        assert self.sanitise_entry_data_called == [b'fake_data_b']
+
+    @pytest.mark.parametrize(
+        "failing_sanitiser",
+        ["sanitise_public_id", "sanitise_entry_name", "sanitise_entry_data"]
+    )
+    def test_sanitising_fails(self, failing_sanitiser):
+        """Should return a single invalid error if any entry fails sanitising"""
+
+        setattr(self, f"{failing_sanitiser}_response", FailureReason.INVALID)
+
+        response = DataHandler.edit_many(self.request)
+
+        assert not response.success
+        assert len(response.failure_data.error_list) == 1
+        error = response.failure_data.error_list[0]
+        assert error.field == "entries"
+        assert error.code == ErrorCode.GNR00
+        assert len(self.edit_many_called) == 0
+
+    def test_calls_util(self):
+        """Should pass the whole batch to one util call"""
+
+        self.open_session_response = True, None, b'fake_decrypted_bytes', 15
+
+        DataHandler.edit_many(self.request)
+
+        assert self.edit_many_called == [(15, [("fake_public_id_a", b'fake_name_a', None), ("fake_public_id_b", None, b'fake_data_b')])]
+
+    @pytest.mark.parametrize(
+        "failure_reason, field",
+        [
+            (FailureReason.TOO_MANY,            "request"),
+            (FailureReason.PASSWORD_CHANGE,     "request"),
+            (FailureReason.UNKNOWN_EXCEPTION,   "server"),
+            (FailureReason.NOT_FOUND,           "unknown")
+        ]
+    )
+    def test_returns_error_util_call_fails(self, failure_reason, field):
+        """Should return correct error if util function fails"""
+
+        self.edit_many_response = False, failure_reason, []
+
+        response = DataHandler.edit_many(self.request)
+
+        assert not response.success
+        error = response.failure_data.error_list[0]
+        assert error.field == field
+        assert error.code == failure_reason.error_code
+
+    def test_seals_results(self):
+        """Should seal the status of each entry in one response"""
+
+        self.edit_many_response = True, None, [("fake_public_id_a", None), ("fake_public_id_b", FailureReason.NOT_FOUND)]
+
+        response = DataHandler.edit_many(self.request)
+
+        assert response.success
+        assert len(self.seal_session_called) == 1
+
+        sealed = DataEditManyResponse.FromString(response.success_data.encrypted_data)
+        assert sealed.username_hash == b'fake_username_hash'
+        assert [(result.public_id, result.success, result.error.code) for result in sealed.results] == [("fake_public_id_a", True, 0), ("fake_public_id_b", False, ErrorCode.GNR01)]
+
+
 class TestDelete:
     """Test cases for data delete function"""
 
@@ -1365,8 +1756,8 @@ class TestDelete:
         assert response == secure_response
 
 
-class TestGet:
-    """Test cases for data get function"""
+class TestDeleteMany:
+    """Test cases for data delete many function"""
 
     @pytest.fixture(autouse=True)
     def setup_teardown(self, monkeypatch):
@@ -1378,10 +1769,173 @@ class TestGet:
             return self.open_session_response
         monkeypatch.setattr(SessionManager, "open_session", fake_open_session)
 
-        self.from_string_called = []
-        self.from_string_response = DataGetRequest(
+        self.from_string_response = DataDeleteManyRequest(
             username_hash=b'fake_username_hash',
-            public_id="fake_public_id"
+            public_ids=["fake_public_id_a", "fake_public_id_b"]
+        )
+        self.from_string_exception = False
+        def fake_from_string(data):
+            if self.from_string_exception:
+                raise DecodeError("invalid bytes")
+            else:
+                return self.from_string_response
+        monkeypatch.setattr(DataDeleteManyRequest, "FromString", fake_from_string)
+
+        self.sanitise_username_hash_response = None
+        def fake_sanitise_username_hash(input):
+            return self.sanitise_username_hash_response
+        monkeypatch.setattr(ServiceUtils, "sanitise_username_hash", fake_sanitise_username_hash)
+
+        self.sanitise_public_id_called = []
+        self.sanitise_public_id_response = None
+        def fake_sanitise_public_id(input):
+            self.sanitise_public_id_called.append(input)
+            return self.sanitise_public_id_response
+        monkeypatch.setattr(ServiceUtils, "sanitise_public_id", fake_sanitise_public_id)
+
+        self.delete_many_called = []
+        self.delete_many_response = True, None, []
+        def fake_delete_many(user_id, public_ids):
+            self.delete_many_called.append((user_id, public_ids))
+            return self.delete_many_response
+        monkeypatch.setattr(DBUtilsData, "delete_many", fake_delete_many)
+
+        self.seal_session_called = []
+        def fake_seal_session(session_id, response):
+            self.seal_session_called.append((session_id, response))
+            return SecureResponse(
+                success=True,
+                success_data=SecureResponse.Success(
+                    session_id=session_id,
+                    encrypted_data=response
+                )
+            )
+        monkeypatch.setattr(SessionManager, "seal_session", fake_seal_session)
+
+        self.request = SecureRequest(
+            session_id="fake_session_id",
+            request_number=0,
+            encrypted_data=b'fake_encryption_data'
+        )
+
+        yield
+
+    def test_opens_session_once(self):
+        """Should open the session once for the whole batch"""
+
+        DataHandler.delete_many(self.request)
+
+        assert self.open_session_called == [(self.request, False, False)]
+
+    def test_open_session_fails(self):
+        """Should return error if open session fails"""
+
+        self.open_session_response = False, FailureReason.DECRYPTION, b'', 0
+
+        response = DataHandler.delete_many(self.request)
+
+        assert not response.success
+        assert response.failure_data.error_list[0].code == ErrorCode.RQS01
+        assert len(self.delete_many_called) == 0
+
+    def test_convert_to_proto_fails(self):
+        """Should fail if conversion to proto raises exception"""
+
+        self.from_string_exception = True
+
+        response = DataHandler.delete_many(self.request)
+
+        assert not response.success
+        assert response.failure_data.error_list[0].code == ErrorCode.RQS01
+        assert len(self.delete_many_called) == 0
+
+    def test_sanitises_each_entry(self):
+        """Should sanitise every entry in the batch"""
+
+        DataHandler.delete_many(self.request)
+
+        assert self.sanitise_public_id_called == ["fake_public_id_a", "fake_public_id_b"]
+
+    @pytest.mark.parametrize(
+        "failing_sanitiser",
+        ["sanitise_public_id"]
+    )
+    def test_sanitising_fails(self, failing_sanitiser):
+        """Should return a single invalid error if any entry fails sanitising"""
+
+        setattr(self, f"{failing_sanitiser}_response", FailureReason.INVALID)
+
+        response = DataHandler.delete_many(self.request)
+
+        assert not response.success
+        assert len(response.failure_data.error_list) == 1
+        error = response.failure_data.error_list[0]
+        assert error.field == "public_ids"
+        assert error.code == ErrorCode.GNR00
+        assert len(self.delete_many_called) == 0
+
+    def test_calls_util(self):
+        """Should pass the whole batch to one util call"""
+
+        self.open_session_response = True, None, b'fake_decrypted_bytes', 15
+
+        DataHandler.delete_many(self.request)
+
+        assert self.delete_many_called == [(15, ["fake_public_id_a", "fake_public_id_b"])]
+
+    @pytest.mark.parametrize(
+        "failure_reason, field",
+        [
+            (FailureReason.TOO_MANY,            "request"),
+            (FailureReason.PASSWORD_CHANGE,     "request"),
+            (FailureReason.UNKNOWN_EXCEPTION,   "server"),
+            (FailureReason.NOT_FOUND,           "unknown")
+        ]
+    )
+    def test_returns_error_util_call_fails(self, failure_reason, field):
+        """Should return correct error if util function fails"""
+
+        self.delete_many_response = False, failure_reason, []
+
+        response = DataHandler.delete_many(self.request)
+
+        assert not response.success
+        error = response.failure_data.error_list[0]
+        assert error.field == field
+        assert error.code == failure_reason.error_code
+
+    def test_seals_results(self):
+        """Should seal the status of each entry in one response"""
+
+        self.delete_many_response = True, None, [("fake_public_id_a", FailureReason.NOT_FOUND), ("fake_public_id_b", None)]
+
+        response = DataHandler.delete_many(self.request)
+
+        assert response.success
+        assert len(self.seal_session_called) == 1
+
+        sealed = DataDeleteManyResponse.FromString(response.success_data.encrypted_data)
+        assert sealed.username_hash == b'fake_username_hash'
+        assert [(result.public_id, result.success, result.error.code) for result in sealed.results] == [("fake_public_id_a", False, ErrorCode.GNR01), ("fake_public_id_b", True, 0)]
+
+
+class TestGet:
+    """Test cases for data get function"""
+
+    @pytest.fixture(autouse=True)
+    def setup_teardown(self, monkeypatch):
+
+        self.open_session_called = []
+        self.open_session_response = True, None, b'fake_decrypted_bytes', 0
+        def fake_open_session(request, password_session = False, first_request = False):
+            self.open_session_called.append((request, password_session, first_request))
+            return self.open_session_response
+        monkeypatch.setattr(SessionManager, "open_session", fake_open_session)
+
+        self.from_string_called = []
+        self.from_string_response = DataGetRequest(
+            username_hash=b'fake_username_hash',
+            public_id="fake_public_id"
         )
         self.from_string_exception = False
         def fake_from_string(data):
@@ -1757,6 +2311,169 @@ class TestGet:
         assert response == secure_response
 
 
+class TestGetMany:
+    """Test cases for data get many function"""
+
+    @pytest.fixture(autouse=True)
+    def setup_teardown(self, monkeypatch):
+
+        self.open_session_called = []
+        self.open_session_response = True, None, b'fake_decrypted_bytes', 0
+        def fake_open_session(request, password_session = False, first_request = False):
+            self.open_session_called.append((request, password_session, first_request))
+            return self.open_session_response
+        monkeypatch.setattr(SessionManager, "open_session", fake_open_session)
+
+        self.from_string_response = DataGetManyRequest(
+            username_hash=b'fake_username_hash',
+            public_ids=["fake_public_id_a", "fake_public_id_b"]
+        )
+        self.from_string_exception = False
+        def fake_from_string(data):
+            if self.from_string_exception:
+                raise DecodeError("invalid bytes")
+            else:
+                return self.from_string_response
+        monkeypatch.setattr(DataGetManyRequest, "FromString", fake_from_string)
+
+        self.sanitise_username_hash_response = None
+        def fake_sanitise_username_hash(input):
+            return self.sanitise_username_hash_response
+        monkeypatch.setattr(ServiceUtils, "sanitise_username_hash", fake_sanitise_username_hash)
+
+        self.sanitise_public_id_called = []
+        self.sanitise_public_id_response = None
+        def fake_sanitise_public_id(input):
+            self.sanitise_public_id_called.append(input)
+            return self.sanitise_public_id_response
+        monkeypatch.setattr(ServiceUtils, "sanitise_public_id", fake_sanitise_public_id)
+
+        self.get_entries_called = []
+        self.get_entries_response = True, None, [], []
+        def fake_get_entries(user_id, public_ids):
+            self.get_entries_called.append((user_id, public_ids))
+            return self.get_entries_response
+        monkeypatch.setattr(DBUtilsData, "get_entries", fake_get_entries)
+
+        self.seal_session_called = []
+        def fake_seal_session(session_id, response):
+            self.seal_session_called.append((session_id, response))
+            return SecureResponse(
+                success=True,
+                success_data=SecureResponse.Success(
+                    session_id=session_id,
+                    encrypted_data=response
+                )
+            )
+        monkeypatch.setattr(SessionManager, "seal_session", fake_seal_session)
+
+        self.request = SecureRequest(
+            session_id="fake_session_id",
+            request_number=0,
+            encrypted_data=b'fake_encryption_data'
+        )
+
+        yield
+
+    def test_opens_session_once(self):
+        """Should open the session once for the whole batch"""
+
+        DataHandler.get_many(self.request)
+
+        assert self.open_session_called == [(self.request, False, False)]
+
+    def test_open_session_fails(self):
+        """Should return error if open session fails"""
+
+        self.open_session_response = False, FailureReason.DECRYPTION, b'', 0
+
+        response = DataHandler.get_many(self.request)
+
+        assert not response.success
+        assert response.failure_data.error_list[0].code == ErrorCode.RQS01
+        assert len(self.get_entries_called) == 0
+
+    def test_convert_to_proto_fails(self):
+        """Should fail if conversion to proto raises exception"""
+
+        self.from_string_exception = True
+
+        response = DataHandler.get_many(self.request)
+
+        assert not response.success
+        assert response.failure_data.error_list[0].code == ErrorCode.RQS01
+        assert len(self.get_entries_called) == 0
+
+    def test_sanitises_each_public_id(self):
+        """Should sanitise every public id requested"""
+
+        DataHandler.get_many(self.request)
+
+        assert self.sanitise_public_id_called == ["fake_public_id_a", "fake_public_id_b"]
+
+    def test_sanitising_fails(self):
+        """Should return a single invalid error if any public id fails sanitising"""
+
+        self.sanitise_public_id_response = FailureReason.INVALID
+
+        response = DataHandler.get_many(self.request)
+
+        assert not response.success
+        assert len(response.failure_data.error_list) == 1
+        error = response.failure_data.error_list[0]
+        assert error.field == "public_ids"
+        assert error.code == ErrorCode.GNR00
+        assert len(self.get_entries_called) == 0
+
+    def test_calls_util(self):
+        """Should fetch every public id in one util call"""
+
+        self.open_session_response = True, None, b'fake_decrypted_bytes', 15
+
+        DataHandler.get_many(self.request)
+
+        assert self.get_entries_called == [(15, ["fake_public_id_a", "fake_public_id_b"])]
+
+    @pytest.mark.parametrize(
+        "failure_reason, field",
+        [
+            (FailureReason.TOO_MANY,            "request"),
+            (FailureReason.PASSWORD_CHANGE,     "request"),
+            (FailureReason.UNKNOWN_EXCEPTION,   "server"),
+            (FailureReason.NOT_FOUND,           "unknown")
+        ]
+    )
+    def test_returns_error_util_call_fails(self, failure_reason, field):
+        """Should return correct error if util function fails"""
+
+        self.get_entries_response = False, failure_reason, [], []
+
+        response = DataHandler.get_many(self.request)
+
+        assert not response.success
+        error = response.failure_data.error_list[0]
+        assert error.field == field
+        assert error.code == failure_reason.error_code
+
+    def test_seals_response(self):
+        """Should seal the found entries, and the missing public ids, in one response"""
+
+        self.get_entries_response = True, None, [("fake_public_id_a", b'fake_name', b'fake_data')], ["fake_public_id_b"]
+
+        response = DataHandler.get_many(self.request)
+
+        assert response.success
+        assert len(self.seal_session_called) == 1
+        assert self.seal_session_called[0][0] == "fake_session_id"
+
+        sealed = DataGetManyResponse.FromString(response.success_data.encrypted_data)
+        assert sealed.username_hash == b'fake_username_hash'
+        assert [(e.public_id, e.entry_name, e.entry_data) for e in sealed.entry_details] == [
+            ("fake_public_id_a", b'fake_name', b'fake_data')
+        ]
+        assert list(sealed.missing_public_ids) == ["fake_public_id_b"]
+
+
 class TestList:
     """Test cases for data list function"""
 
@@ -1790,12 +2507,12 @@ class TestList:
             return self.sanitise_username_hash_response
         monkeypatch.setattr(ServiceUtils, "sanitise_username_hash", fake_sanitise_username_hash)
 
-        self.get_list_called = []
-        self.get_list_response = True, None, {}
-        def fake_get_list(user_id):
-            self.get_list_called.append(user_id)
-            return self.get_list_response
-        monkeypatch.setattr(DBUtilsData, "get_list", fake_get_list)
+        self.get_page_called = []
+        self.get_page_response = True, None, [], ""
+        def fake_get_page(user_id, page_size, cursor):
+            self.get_page_called.append((user_id, page_size, cursor))
+            return self.get_page_response
+        monkeypatch.setattr(DBUtilsData, "get_page", fake_get_page)
 
         self.serialize_to_string_called = []
         self.serialize_to_string_response = b'fake_serialized_bytes'
@@ -1979,10 +2696,36 @@ class TestList:
 
         response = DataHandler.list(request)
 
-        assert len(self.get_list_called) == 1
+        assert len(self.get_page_called) == 1
+
+        get_page = self.get_page_called[0]
+        assert get_page == (user_id, None, "")
+
+    @pytest.mark.parametrize(
+        "page_size, cursor, expected_page_size",
+        [
+            (0,     "",             None),
+            (50,    "",             50),
+            (50,    "fake_cursor",  50),
+            (1,     "abc",          1)
+        ]
+    )
+    def test_calls_util_with_page(self, page_size, cursor, expected_page_size):
+        """Should pass the page size and cursor, with a page size of 0 listing every entry"""
+
+        self.from_string_response.page_size = page_size
+        self.from_string_response.cursor = cursor
 
-        create = self.get_list_called[0]
-        assert create == user_id
+        request = SecureRequest(
+            session_id="fake_session_id",
+            request_number=0,
+            encrypted_data=b'fake_encryption_data'
+        )
+
+        response = DataHandler.list(request)
+
+        assert len(self.get_page_called) == 1
+        assert self.get_page_called[0] == (0, expected_page_size, cursor)
 
     @pytest.mark.parametrize(
         "failure_reason, field",
@@ -1996,7 +2739,7 @@ class TestList:
     def test_returns_error_util_call_fails(self, failure_reason, field):
         """Should return correct error if util function fails"""
 
-        self.get_list_response = False, failure_reason, []
+        self.get_page_response = False, failure_reason, [], ""
 
         request = SecureRequest(
             session_id="fake_session_id",
@@ -2020,8 +2763,8 @@ class TestList:
 
         self.from_string_response.username_hash = b'fake_username_hash'
 
-        result_list = {"a": b'1', "b": b'2', "c": b'3'}
-        self.get_list_response = True, None, result_list
+        result_list = [("a", b'1'), ("b", b'2'), ("c", b'3')]
+        self.get_page_response = True, None, result_list, "fake_next_cursor"
 
         request = SecureRequest(
             session_id="fake_session_id",
@@ -2039,7 +2782,8 @@ class TestList:
 
         entry_details = serialize_to_string.entry_details
         assert len(entry_details) == len(result_list)
-        assert {e.public_id: e.entry_name for e in entry_details} == result_list
+        assert [(e.public_id, e.entry_name) for e in entry_details] == result_list
+        assert serialize_to_string.next_cursor == "fake_next_cursor"
 
     def test_calls_seal_session(self):
         """Should call to seal session"""
@@ -2120,5 +2864,193 @@ class TestList:
         assert response == secure_response
 
 
+class TestListStream:
+    """Test cases for data list stream function"""
+
+    @pytest.fixture(autouse=True)
+    def setup_teardown(self, monkeypatch):
+
+        self.open_session_called = []
+        self.open_session_response = True, None, b'fake_decrypted_bytes', 0
+        def fake_open_session(request, password_session = False, first_request = False):
+            self.open_session_called.append((request, password_session, first_request))
+            return self.open_session_response
+        monkeypatch.setattr(SessionManager, "open_session", fake_open_session)
+
+        self.from_string_response = DataListRequest(
+            username_hash=b'fake_username_hash'
+        )
+        self.from_string_exception = False
+        def fake_from_string(data):
+            if self.from_string_exception:
+                raise DecodeError("invalid bytes")
+            else:
+                return self.from_string_response
+        monkeypatch.setattr(DataListRequest, "FromString", fake_from_string)
+
+        self.sanitise_username_hash_response = None
+        def fake_sanitise_username_hash(input):
+            return self.sanitise_username_hash_response
+        monkeypatch.setattr(ServiceUtils, "sanitise_username_hash", fake_sanitise_username_hash)
+
+        self.stream_list_called = []
+        self.stream_list_closed = []
+        self.stream_list_response = [
+            (True, None, [("a", b'1'), ("b", b'2')]),
+            (True, None, [("c", b'3')])
+        ]
+        def fake_stream_list(user_id, chunk_size):
+            self.stream_list_called.append((user_id, chunk_size))
+            try:
+                yield from self.stream_list_response
+            finally:
+                self.stream_list_closed.append(True)
+        monkeypatch.setattr(DBUtilsData, "stream_list", fake_stream_list)
+
+        self.seal_session_called = []
+        def fake_seal_session(session_id, response):
+            self.seal_session_called.append((session_id, response))
+            return SecureResponse(
+                success=True,
+                success_data=SecureResponse.Success(
+                    session_id=session_id,
+                    encrypted_data=response
+                )
+            )
+        monkeypatch.setattr(SessionManager, "seal_session", fake_seal_session)
+
+        self.request = SecureRequest(
+            session_id="fake_session_id",
+            request_number=0,
+            encrypted_data=b'fake_encryption_data'
+        )
+
+        yield
+
+    def test_open_session_fails(self):
+        """Should stream only the error if open session fails"""
+
+        self.open_session_response = False, FailureReason.DECRYPTION, b'', 0
+
+        responses = list(DataHandler.list_stream(self.request))
+
+        assert len(responses) == 1
+        assert not responses[0].success
+        assert responses[0].failure_data.error_list[0].code == ErrorCode.RQS01
+        assert len(self.stream_list_called) == 0
+
+    def test_convert_to_proto_fails(self):
+        """Should stream only the error if conversion to proto raises exception"""
+
+        self.from_string_exception = True
+
+        responses = list(DataHandler.list_stream(self.request))
+
+        assert len(responses) == 1
+        assert not responses[0].success
+        assert responses[0].failure_data.error_list[0].code == ErrorCode.RQS01
+        assert len(self.stream_list_called) == 0
+
+    def test_sanitising_fails(self):
+        """Should stream only the error if sanitising fails"""
+
+        self.sanitise_username_hash_response = FailureReason.INVALID
+
+        responses = list(DataHandler.list_stream(self.request))
+
+        assert len(responses) == 1
+        error = responses[0].failure_data.error_list[0]
+        assert error.field == "username_hash"
+        assert error.code == ErrorCode.GNR00
+        assert len(self.stream_list_called) == 0
+
+    @pytest.mark.parametrize(
+        "page_size, chunk_size",
+        [
+            (0,     DataHandler.STREAM_CHUNK_SIZE),
+            (1,     1),
+            (250,   250)
+        ]
+    )
+    def test_calls_util(self, page_size, chunk_size):
+        """Should stream in chunks of the page size, or the default chunk size if not given"""
+
+        self.open_session_response = True, None, b'fake_decrypted_bytes', 15
+        self.from_string_response.page_size = page_size
+
+        list(DataHandler.list_stream(self.request))
+
+        assert self.stream_list_called == [(15, chunk_size)]
+
+    def test_seals_each_chunk(self):
+        """Should seal and stream each chunk as it is read"""
+
+        responses = list(DataHandler.list_stream(self.request))
+
+        assert len(responses) == 2
+        assert len(self.seal_session_called) == 2
+        assert all(sealed[0] == "fake_session_id" for sealed in self.seal_session_called)
+
+        chunks = [DataListResponse.FromString(response.success_data.encrypted_data) for response in responses]
+        assert all(chunk.username_hash == b'fake_username_hash' for chunk in chunks)
+        assert [(e.public_id, e.entry_name) for e in chunks[0].entry_details] == [("a", b'1'), ("b", b'2')]
+        assert [(e.public_id, e.entry_name) for e in chunks[1].entry_details] == [("c", b'3')]
+        assert self.stream_list_closed == [True]
+
+    @pytest.mark.parametrize(
+        "failure_reason, field",
+        [
+            (FailureReason.UNKNOWN_EXCEPTION,   "server"),
+            (FailureReason.PASSWORD_CHANGE,     "request"),
+            (FailureReason.NOT_FOUND,           "unknown")
+        ]
+    )
+    def test_util_call_fails(self, failure_reason, field):
+        """Should end the stream with the error if the util function fails"""
+
+        self.stream_list_response = [
+            (True, None, [("a", b'1')]),
+            (False, failure_reason, [])
+        ]
+
+        responses = list(DataHandler.list_stream(self.request))
+
+        assert len(responses) == 2
+        assert responses[0].success
+        assert not responses[1].success
+
+        error = responses[1].failure_data.error_list[0]
+        assert error.field == field
+        assert error.code == failure_reason.error_code
+
+    def test_closed_early(self):
+        """Should close the util stream if the response stream is closed early"""
+
+        responses = DataHandler.list_stream(self.request)
+        next(responses)
+        responses.close()
+
+        assert self.stream_list_closed == [True]
+        assert len(self.seal_session_called) == 1
+
+    def test_send_time_kept_out_of_database_stage(self, monkeypatch):
+        """Should time waiting on the client as its own stage, not as database time"""
+        ticks = iter(range(0, 10**12, 10**9))
+        monkeypatch.setattr("utils.stage_timer.perf_counter_ns", lambda: next(ticks))
+        StageTimer.configure(True)
+
+        try:
+            responses = DataHandler.list_stream(self.request)
+            for _ in responses:
+                next(ticks)
+            stages = StageTimer.percentiles()
+        finally:
+            StageTimer._reset()
+
+        assert stages[("DataHandler.list_stream", "database")]["count"] == 2
+        assert stages[("DataHandler.list_stream", "send")]["count"] == 2
+        assert stages[("DataHandler.list_stream", "database")]["p99"] < stages[("DataHandler.list_stream", "send")]["p99"]
+
+
 if __name__ == '__main__':
     pytest.main(['-v', __file__])
@@ -0,0 +1,203 @@
+import os
+import sys
+import grpc
+import pytest
+import urllib.request
+from urllib.error import HTTPError
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src", "services"))
+
+from passmanager.common.v0.secure_pb2 import SecureResponse
+from passmanager.session.v0.session_pb2 import SessionStartResponse, SessionAuthResponse
+from passmanager.user.v0.user_pb2 import UserRegisterResponse
+from passmanager.common.v0.error_pb2 import Failure
+
+from services.metrics_interceptor import MetricsInterceptor, MetricsEndpoint
+from utils import MetricsRegistry
+from enums import FailureReason
+
+
+class _HandlerCallDetails():
+    method = "/passmanager.data.v0.Data/Get"
+
+
+def _intercept(behaviour):
+    handler = grpc.unary_unary_rpc_method_handler(behaviour)
+    return MetricsInterceptor().intercept_service(lambda details: handler, _HandlerCallDetails())
+
+
+def _intercept_stream(behaviour):
+    handler = grpc.unary_stream_rpc_method_handler(behaviour)
+    return MetricsInterceptor().intercept_service(lambda details: handler, _HandlerCallDetails())
+
+
+def _intercept_client_stream(behaviour):
+    handler = grpc.stream_unary_rpc_method_handler(behaviour)
+    return MetricsInterceptor().intercept_service(lambda details: handler, _HandlerCallDetails())
+
+
+class TestMetricsInterceptor():
+    """Test cases for the metrics interceptor"""
+
+    @pytest.fixture(autouse=True)
+    def setup_teardown(self):
+        MetricsRegistry._reset()
+        yield
+        MetricsRegistry._reset()
+
+    def test_records_success(self):
+        """Should record a successful response as OK"""
+        handler = _intercept(lambda request, context: SecureResponse(success=True))
+
+        response = handler.unary_unary(None, None)
+
+        assert response.success
+        assert 'method="/passmanager.data.v0.Data/Get",outcome="OK"} 1' in MetricsRegistry.render()
+
+    def test_records_failure_reason(self):
+        """Should record a failed response by its FailureReason"""
+        failure = Failure(error_list=[FailureReason.NOT_FOUND.error_proto("public_id")])
+        handler = _intercept(lambda request, context: SecureResponse(success=False, failure_data=failure))
+
+        handler.unary_unary(None, None)
+
+        assert 'outcome="NOT_FOUND"} 1' in MetricsRegistry.render()
+
+    @pytest.mark.parametrize(
+        "method, response_type, reason",
+        [
+            ("/passmanager.session.v0.Session/Start", SessionStartResponse, FailureReason.NOT_FOUND),
+            ("/passmanager.session.v0.Session/Auth", SessionAuthResponse, FailureReason.INVALID),
+            ("/passmanager.user.v0.User/Register", UserRegisterResponse, FailureReason.USER_EXISTS),
+            ("/passmanager.password.v0.Password/Start", SecureResponse, FailureReason.PASSWORD_CHANGE),
+            ("/passmanager.password.v0.Password/Auth", SecureResponse, FailureReason.INVALID)
+        ]
+    )
+    def test_records_failure_reason_by_type(self, monkeypatch, method, response_type, reason):
+        """Should record a failed response of any type with a success field by its FailureReason"""
+        monkeypatch.setattr(_HandlerCallDetails, "method", method)
+        failure = Failure(error_list=[reason.error_proto("field")])
+        handler = _intercept(lambda request, context: response_type(success=False, failure_data=failure))
+
+        handler.unary_unary(None, None)
+
+        assert f'method="{method}",outcome="{reason.name}"}} 1' in MetricsRegistry.render()
+
+    def test_records_exception(self):
+        """Should record an exception, and raise it"""
+        def behaviour(request, context):
+            raise ValueError("Failed")
+        handler = _intercept(behaviour)
+
+        with pytest.raises(ValueError):
+            handler.unary_unary(None, None)
+
+        assert 'outcome="EXCEPTION"} 1' in MetricsRegistry.render()
+
+    def test_passes_unknown_method(self):
+        """Should return None if there is no handler for the method"""
+        assert MetricsInterceptor().intercept_service(lambda details: None, _HandlerCallDetails()) is None
+
+    def test_records_stream_success(self):
+        """Should record a stream as OK once every response has been sent"""
+        def behaviour(request, context):
+            yield SecureResponse(success=True)
+            yield SecureResponse(success=True)
+        handler = _intercept_stream(behaviour)
+
+        responses = handler.unary_stream(None, None)
+        assert 'outcome="OK"' not in MetricsRegistry.render()
+
+        assert len(list(responses)) == 2
+        assert 'method="/passmanager.data.v0.Data/Get",outcome="OK"} 1' in MetricsRegistry.render()
+
+    def test_records_stream_failure_reason(self):
+        """Should record a stream by the first FailureReason it sends"""
+        failure = Failure(error_list=[FailureReason.PASSWORD_CHANGE.error_proto()])
+        def behaviour(request, context):
+            yield SecureResponse(success=True)
+            yield SecureResponse(success=False, failure_data=failure)
+        handler = _intercept_stream(behaviour)
+
+        list(handler.unary_stream(None, None))
+
+        assert 'outcome="PASSWORD_CHANGE"} 1' in MetricsRegistry.render()
+
+    def test_records_stream_cancelled(self):
+        """Should record a stream closed before it finished as cancelled"""
+        def behaviour(request, context):
+            yield SecureResponse(success=True)
+            yield SecureResponse(success=True)
+        handler = _intercept_stream(behaviour)
+
+        responses = handler.unary_stream(None, None)
+        next(responses)
+        responses.close()
+
+        assert 'outcome="CANCELLED"} 1' in MetricsRegistry.render()
+
+    def test_records_stream_exception(self):
+        """Should record an exception raised part way through a stream"""
+        def behaviour(request, context):
+            yield SecureResponse(success=True)
+            raise ValueError("Failed")
+        handler = _intercept_stream(behaviour)
+
+        with pytest.raises(ValueError):
+            list(handler.unary_stream(None, None))
+
+        assert 'outcome="EXCEPTION"} 1' in MetricsRegistry.render()
+
+    def test_records_client_stream(self):
+        """Should record a client stream by the single response it returns"""
+        failure = Failure(error_list=[FailureReason.ENTRY_UPDATED.error_proto()])
+        def behaviour(request_iterator, context):
+            assert len(list(request_iterator)) == 2
+            return SecureResponse(success=False, failure_data=failure)
+        handler = _intercept_client_stream(behaviour)
+
+        response = handler.stream_unary(iter([None, None]), None)
+
+        assert not response.success
+        assert 'method="/passmanager.data.v0.Data/Get",outcome="ENTRY_UPDATED"} 1' in MetricsRegistry.render()
+
+
+class TestMetricsEndpoint():
+    """Test cases for the metrics endpoint"""
+
+    @pytest.fixture(autouse=True)
+    def setup_teardown(self):
+        MetricsRegistry._reset()
+        MetricsEndpoint.start("127.0.0.1", 0)
+        yield
+        MetricsEndpoint.stop()
+        MetricsRegistry._reset()
+
+    def test_serves_metrics(self):
+        """Should serve the rendered registry on /metrics"""
+        MetricsRegistry.observe_rpc("/data/Get", "OK", 0.001)
+
+        url = f"http://127.0.0.1:{MetricsEndpoint.port()}/metrics"
+        with urllib.request.urlopen(url, timeout=5) as response:
+            assert response.status == 200
+            assert response.headers["Content-Type"].startswith("text/plain")
+            body = response.read().decode("utf-8")
+
+        assert 'passmanager_rpc_requests_total{method="/data/Get",outcome="OK"} 1' in body
+
+    def test_unknown_path(self):
+        """Should return not found for any other path"""
+        url = f"http://127.0.0.1:{MetricsEndpoint.port()}/other"
+        with pytest.raises(HTTPError) as exc_info:
+            urllib.request.urlopen(url, timeout=5)
+        assert exc_info.value.code == 404
+
+    def test_start_twice(self):
+        """Should raise exception if already started"""
+        with pytest.raises(RuntimeError):
+            MetricsEndpoint.start("127.0.0.1", 0)
+
+
+if __name__ == '__main__':
+    pytest.main(['-v', __file__])
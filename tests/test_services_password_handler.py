@@ -16,8 +16,12 @@ from passmanager.password.v0.password_payloads_pb2 import (
     PasswordAbortResponse,
     PasswordGetRequest,
     PasswordGetResponse,
+    PasswordGetStreamRequest,
+    PasswordGetStreamResponse,
     PasswordUpdateRequest,
-    PasswordUpdateResponse
+    PasswordUpdateResponse,
+    PasswordUpdateStreamRequest,
+    PasswordUpdateStreamResponse
 )
 from passmanager.common.v0.secure_pb2 import (
     SecureRequest,
@@ -28,11 +32,13 @@ from passmanager.common.v0.error_pb2 import (
     ErrorCode
 )
 
-from services.password_handler import PasswordHandler
+from services.password_handler import PasswordHandler, UpdateStreamProgress
 from utils.service_utils import ServiceUtils
 from utils.db_utils_password import DBUtilsPassword
 from utils.db_utils_data import DBUtilsData
 from utils.session_manager import SessionManager
+from mock_classes import _fake_steps
+from utils.stage_timer import StageTimer
 from enums.failure_reason import FailureReason
 
 
@@ -98,7 +104,7 @@ class TestStart():
         def fake_start_password_session(user_id, srp_salt, srp_verifier, master_key_salt):
             self.start_password_session_called.append((user_id, srp_salt, srp_verifier, master_key_salt))
             return self.start_password_session_response
-        monkeypatch.setattr(SessionManager, "start_password_session", fake_start_password_session)
+        monkeypatch.setattr(SessionManager, "start_password_session_steps", _fake_steps(fake_start_password_session))
 
         self.serialize_to_string_called = []
         self.serialize_to_string_response = b'fake_serialized_bytes'
@@ -545,7 +551,7 @@ class TestAuth():
         def fake_auth_password_session(user_id, public_id, eph_val_a, proof_val_m1):
             self.auth_password_session_called.append((user_id, public_id, eph_val_a, proof_val_m1))
             return self.auth_password_session_response
-        monkeypatch.setattr(SessionManager, "auth_password_session", fake_auth_password_session)
+        monkeypatch.setattr(SessionManager, "auth_password_session_steps", _fake_steps(fake_auth_password_session))
 
         self.serialize_to_string_called = []
         self.serialize_to_string_response = b'fake_serialized_bytes'
@@ -2477,5 +2483,361 @@ class TestUpdate():
         assert response == secure_response
 
 
+class TestGetStream:
+    """Test cases for password get stream function"""
+
+    @pytest.fixture(autouse=True)
+    def setup_teardown(self, monkeypatch):
+
+        self.open_session_response = True, None, b'fake_decrypted_bytes', 0
+        def fake_open_session(request, password_session = False, first_request = False):
+            return self.open_session_response
+        monkeypatch.setattr(SessionManager, "open_session", fake_open_session)
+
+        self.from_string_response = PasswordGetStreamRequest(
+            username_hash=b'fake_username_hash'
+        )
+        self.from_string_exception = False
+        def fake_from_string(data):
+            if self.from_string_exception:
+                raise DecodeError("invalid bytes")
+            else:
+                return self.from_string_response
+        monkeypatch.setattr(PasswordGetStreamRequest, "FromString", fake_from_string)
+
+        self.sanitise_username_hash_response = None
+        def fake_sanitise_username_hash(input):
+            return self.sanitise_username_hash_response
+        monkeypatch.setattr(ServiceUtils, "sanitise_username_hash", fake_sanitise_username_hash)
+
+        self.stream_entries_called = []
+        self.stream_entries_closed = []
+        self.stream_entries_response = [
+            (True, None, [("a", b'1', b'x'), ("b", b'2', b'y')]),
+            (True, None, [("c", b'3', b'z')])
+        ]
+        def fake_stream_entries(user_id, chunk_size, password_change = False):
+            self.stream_entries_called.append((user_id, chunk_size, password_change))
+            try:
+                yield from self.stream_entries_response
+            finally:
+                self.stream_entries_closed.append(True)
+        monkeypatch.setattr(DBUtilsData, "stream_entries", fake_stream_entries)
+
+        self.seal_session_called = []
+        def fake_seal_session(session_id, response):
+            self.seal_session_called.append((session_id, response))
+            return SecureResponse(
+                success=True,
+                success_data=SecureResponse.Success(
+                    session_id=session_id,
+                    encrypted_data=response
+                )
+            )
+        monkeypatch.setattr(SessionManager, "seal_session", fake_seal_session)
+
+        self.request = SecureRequest(
+            session_id="fake_session_id",
+            request_number=0,
+            encrypted_data=b'fake_encryption_data'
+        )
+
+        yield
+
+    def test_open_session_fails(self):
+        """Should stream only the error if open session fails"""
+
+        self.open_session_response = False, FailureReason.DECRYPTION, b'', 0
+
+        responses = list(PasswordHandler.get_stream(self.request))
+
+        assert len(responses) == 1
+        assert not responses[0].success
+        assert responses[0].failure_data.error_list[0].code == ErrorCode.RQS01
+        assert len(self.stream_entries_called) == 0
+
+    def test_convert_to_proto_fails(self):
+        """Should stream only the error if conversion to proto raises exception"""
+
+        self.from_string_exception = True
+
+        responses = list(PasswordHandler.get_stream(self.request))
+
+        assert len(responses) == 1
+        assert responses[0].failure_data.error_list[0].code == ErrorCode.RQS01
+        assert len(self.stream_entries_called) == 0
+
+    def test_sanitising_fails(self):
+        """Should stream only the error if sanitising fails"""
+
+        self.sanitise_username_hash_response = FailureReason.INVALID
+
+        responses = list(PasswordHandler.get_stream(self.request))
+
+        assert len(responses) == 1
+        error = responses[0].failure_data.error_list[0]
+        assert error.field == "username_hash"
+        assert error.code == ErrorCode.GNR00
+        assert len(self.stream_entries_called) == 0
+
+    @pytest.mark.parametrize(
+        "chunk_size, expected",
+        [
+            (0,     PasswordHandler.STREAM_CHUNK_SIZE),
+            (1,     1),
+            (250,   250)
+        ]
+    )
+    def test_calls_util(self, chunk_size, expected):
+        """Should stream the password change entries, in the default chunk size if not given"""
+
+        self.open_session_response = True, None, b'fake_decrypted_bytes', 15
+        self.from_string_response.chunk_size = chunk_size
+
+        list(PasswordHandler.get_stream(self.request))
+
+        assert self.stream_entries_called == [(15, expected, True)]
+
+    def test_seals_each_chunk(self):
+        """Should seal and stream each chunk, with the entry data, as it is read"""
+
+        responses = list(PasswordHandler.get_stream(self.request))
+
+        assert len(responses) == 2
+        assert all(sealed[0] == "fake_session_id" for sealed in self.seal_session_called)
+
+        chunks = [PasswordGetStreamResponse.FromString(response.success_data.encrypted_data) for response in responses]
+        assert all(chunk.username_hash == b'fake_username_hash' for chunk in chunks)
+        assert [(e.public_id, e.entry_name, e.entry_data) for e in chunks[0].entry_details] == [("a", b'1', b'x'), ("b", b'2', b'y')]
+        assert [(e.public_id, e.entry_name, e.entry_data) for e in chunks[1].entry_details] == [("c", b'3', b'z')]
+        assert self.stream_entries_closed == [True]
+
+    def test_util_call_fails(self):
+        """Should end the stream with the error if the util function fails"""
+
+        self.stream_entries_response = [
+            (True, None, [("a", b'1', b'x')]),
+            (False, FailureReason.UNKNOWN_EXCEPTION, [])
+        ]
+
+        responses = list(PasswordHandler.get_stream(self.request))
+
+        assert len(responses) == 2
+        assert responses[0].success
+        error = responses[1].failure_data.error_list[0]
+        assert error.field == "server"
+        assert error.code == FailureReason.UNKNOWN_EXCEPTION.error_code
+
+    def test_closed_early(self):
+        """Should close the util stream if the response stream is closed early"""
+
+        responses = PasswordHandler.get_stream(self.request)
+        next(responses)
+        responses.close()
+
+        assert self.stream_entries_closed == [True]
+        assert len(self.seal_session_called) == 1
+
+    def test_send_time_kept_out_of_database_stage(self, monkeypatch):
+        """Should time waiting on the client as its own stage, not as database time"""
+        ticks = iter(range(0, 10**12, 10**9))
+        monkeypatch.setattr("utils.stage_timer.perf_counter_ns", lambda: next(ticks))
+        StageTimer.configure(True)
+
+        try:
+            responses = PasswordHandler.get_stream(self.request)
+            for _ in responses:
+                next(ticks)
+            stages = StageTimer.percentiles()
+        finally:
+            StageTimer._reset()
+
+        assert stages[("PasswordHandler.get_stream", "database")]["count"] == 2
+        assert stages[("PasswordHandler.get_stream", "send")]["count"] == 2
+        assert stages[("PasswordHandler.get_stream", "database")]["p99"] < stages[("PasswordHandler.get_stream", "send")]["p99"]
+
+
+class TestUpdateStream:
+    """Test cases for password update stream function"""
+
+    @pytest.fixture(autouse=True)
+    def setup_teardown(self, monkeypatch):
+
+        self.open_session_called = []
+        self.open_session_response = True, None, b'', 15
+        def fake_open_session(request, password_session = False, first_request = False):
+            self.open_session_called.append(request)
+            status, failure_reason, _, user_id = self.open_session_response
+            return status, failure_reason, request.encrypted_data, user_id
+        monkeypatch.setattr(SessionManager, "open_session", fake_open_session)
+
+        self.from_string_responses = {
+            b'batch_a': PasswordUpdateStreamRequest(
+                username_hash=b'fake_username_hash',
+                entries=[
+                    PasswordUpdateStreamRequest.Entry(public_id="a", entry_name=b'1', entry_data=b'x'),
+                    PasswordUpdateStreamRequest.Entry(public_id="b", entry_name=b'2', entry_data=b'y')
+                ]
+            ),
+            b'batch_b': PasswordUpdateStreamRequest(
+                username_hash=b'fake_username_hash',
+                entries=[
+                    PasswordUpdateStreamRequest.Entry(public_id="c", entry_name=b'3', entry_data=b'z')
+                ]
+            )
+        }
+        def fake_from_string(data):
+            if data not in self.from_string_responses:
+                raise DecodeError("invalid bytes")
+            return self.from_string_responses[data]
+        monkeypatch.setattr(PasswordUpdateStreamRequest, "FromString", fake_from_string)
+
+        self.sanitise_entry_name_response = None
+        def fake_sanitise_entry_name(input):
+            return self.sanitise_entry_name_response
+        monkeypatch.setattr(ServiceUtils, "sanitise_entry_name", fake_sanitise_entry_name)
+
+        self.update_many_called = []
+        self.update_many_response = True, None
+        def fake_update_many(user_id, entries):
+            self.update_many_called.append((user_id, entries))
+            return self.update_many_response
+        monkeypatch.setattr(DBUtilsPassword, "update_many", fake_update_many)
+
+        self.seal_session_called = []
+        def fake_seal_session(session_id, response):
+            self.seal_session_called.append((session_id, response))
+            return SecureResponse(
+                success=True,
+                success_data=SecureResponse.Success(
+                    session_id=session_id,
+                    encrypted_data=response
+                )
+            )
+        monkeypatch.setattr(SessionManager, "seal_session", fake_seal_session)
+
+        self.requests = [
+            SecureRequest(session_id="fake_session_id", request_number=0, encrypted_data=b'batch_a'),
+            SecureRequest(session_id="fake_session_id", request_number=1, encrypted_data=b'batch_b')
+        ]
+
+        yield
+
+    def test_nominal_case(self):
+        """Should apply each batch in its own util call, and seal the total once the stream ends"""
+
+        response = PasswordHandler.update_stream(iter(self.requests))
+
+        assert response.success
+        assert self.update_many_called == [
+            (15, [("a", b'1', b'x'), ("b", b'2', b'y')]),
+            (15, [("c", b'3', b'z')])
+        ]
+        assert len(self.seal_session_called) == 1
+        assert self.seal_session_called[0][0] == "fake_session_id"
+
+        result = PasswordUpdateStreamResponse.FromString(response.success_data.encrypted_data)
+        assert result.username_hash == b'fake_username_hash'
+        assert result.updated_count == 3
+
+    def test_empty_stream(self):
+        """Should fail without sealing if no batch was sent"""
+
+        response = PasswordHandler.update_stream(iter([]))
+
+        assert not response.success
+        assert response.failure_data.error_list[0].code == ErrorCode.RQS00
+        assert len(self.seal_session_called) == 0
+
+    def test_open_session_fails(self):
+        """Should end the stream with the error if open session fails"""
+
+        self.open_session_response = False, FailureReason.DECRYPTION, b'', 0
+
+        response = PasswordHandler.update_stream(iter(self.requests))
+
+        assert not response.success
+        assert response.failure_data.error_list[0].code == ErrorCode.RQS01
+        assert len(self.open_session_called) == 1
+        assert len(self.update_many_called) == 0
+
+    def test_convert_to_proto_fails(self):
+        """Should stop at the batch that cannot be decoded"""
+
+        self.requests[1].encrypted_data = b'invalid'
+
+        response = PasswordHandler.update_stream(iter(self.requests))
+
+        assert not response.success
+        assert response.failure_data.error_list[0].code == ErrorCode.RQS01
+        assert len(self.update_many_called) == 1
+
+    def test_sanitising_fails(self):
+        """Should report an invalid entry against the entries field"""
+
+        self.sanitise_entry_name_response = FailureReason.INVALID
+
+        response = PasswordHandler.update_stream(iter(self.requests))
+
+        error = response.failure_data.error_list[0]
+        assert error.field == "entries"
+        assert error.code == ErrorCode.GNR00
+        assert len(self.update_many_called) == 0
+
+    @pytest.mark.parametrize(
+        "session_id, username_hash",
+        [
+            ("other_session_id",    b'fake_username_hash'),
+            ("fake_session_id",     b'other_username_hash')
+        ]
+    )
+    def test_batches_must_match(self, session_id, username_hash):
+        """Should reject a batch from a different session or user than the first"""
+
+        self.requests[1].session_id = session_id
+        self.from_string_responses[b'batch_b'].username_hash = username_hash
+
+        response = PasswordHandler.update_stream(iter(self.requests))
+
+        assert not response.success
+        assert response.failure_data.error_list[0].code == ErrorCode.RQS00
+        assert len(self.update_many_called) == 1
+
+    @pytest.mark.parametrize(
+        "failure_reason, field",
+        [
+            (FailureReason.UNKNOWN_EXCEPTION,   "server"),
+            (FailureReason.ENTRY_UPDATED,       "server"),
+            (FailureReason.NOT_FOUND,           "unknown")
+        ]
+    )
+    def test_util_call_fails(self, failure_reason, field):
+        """Should stop reading the stream at the first failed batch"""
+
+        self.update_many_response = False, failure_reason
+        requests = iter(self.requests)
+
+        response = PasswordHandler.update_stream(requests)
+
+        assert not response.success
+        error = response.failure_data.error_list[0]
+        assert error.field == field
+        assert error.code == failure_reason.error_code
+        assert len(self.update_many_called) == 1
+        assert next(requests) == self.requests[1]
+
+    def test_update_batch_tracks_progress(self):
+        """Should only count a batch once it has been applied"""
+
+        progress = UpdateStreamProgress()
+
+        assert PasswordHandler.update_batch(self.requests[0], progress) is None
+        assert progress == UpdateStreamProgress("fake_session_id", 15, b'fake_username_hash', 2)
+
+        self.update_many_response = False, FailureReason.NOT_FOUND
+        assert PasswordHandler.update_batch(self.requests[1], progress) is not None
+        assert progress.updated_count == 2
+
+
 if __name__ == '__main__':
     pytest.main(['-v', __file__])
@@ -0,0 +1,88 @@
+import os
+import sys
+import time
+import signal
+import pytest
+import threading
+from pathlib import Path
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src", "services"))
+
+from services.prefork_server import PreforkSupervisor
+
+
+def _starts(log_path: Path) -> int:
+    if not log_path.exists():
+        return 0
+    return len(log_path.read_text().split())
+
+
+def _stop_when(condition, timeout: float = 20.0):
+    def _wait():
+        deadline = time.monotonic() + timeout
+        while not condition() and time.monotonic() < deadline:
+            time.sleep(0.05)
+        PreforkSupervisor.stop()
+    thread = threading.Thread(target=_wait, daemon=True)
+    thread.start()
+    return thread
+
+
+class TestPreforkSupervisor():
+    """Test cases for the pre-fork supervisor"""
+
+    def test_rejects_invalid_workers(self):
+        """Should raise exception if given no workers"""
+        with pytest.raises(ValueError):
+            PreforkSupervisor.run(0, lambda: None)
+
+    def test_starts_workers(self, tmp_path):
+        """Should start each worker in its own process, and stop them all"""
+        log_path = tmp_path / "starts"
+
+        def target():
+            with log_path.open("a") as f_out:
+                f_out.write(f"{os.getpid()}\n")
+            time.sleep(60)
+
+        watcher = _stop_when(lambda: _starts(log_path) >= 3)
+        PreforkSupervisor.run(3, target, grace=5.0)
+        watcher.join()
+
+        pids = log_path.read_text().split()
+        assert len(pids) == 3
+        assert len(set(pids)) == 3
+        assert str(os.getpid()) not in pids
+        assert PreforkSupervisor._workers == {}
+
+    def test_restarts_crashed_worker(self, tmp_path):
+        """Should restart a worker that exits unexpectedly"""
+        log_path = tmp_path / "starts"
+
+        def target():
+            with log_path.open("a") as f_out:
+                f_out.write(f"{os.getpid()}\n")
+            if _starts(log_path) == 1:
+                raise SystemExit(1)
+            time.sleep(60)
+
+        watcher = _stop_when(lambda: _starts(log_path) >= 2)
+        PreforkSupervisor.run(1, target, grace=5.0, restart_delay=0.05)
+        watcher.join()
+
+        assert _starts(log_path) == 2
+
+    def test_restores_signal_handlers(self):
+        """Should restore the previous signal handlers once stopped"""
+        previous = signal.getsignal(signal.SIGTERM)
+
+        watcher = _stop_when(lambda: bool(PreforkSupervisor._workers))
+        PreforkSupervisor.run(1, lambda: time.sleep(60), grace=5.0)
+        watcher.join()
+
+        assert signal.getsignal(signal.SIGTERM) == previous
+
+
+if __name__ == '__main__':
+    pytest.main(['-v', __file__])
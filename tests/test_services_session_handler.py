@@ -30,6 +30,7 @@ from services.session_handler import SessionHandler
 from utils.service_utils import ServiceUtils
 from utils.db_utils_session import DBUtilsSession
 from utils.session_manager import SessionManager
+from mock_classes import _fake_steps
 from enums.failure_reason import FailureReason
 
 
@@ -58,7 +59,7 @@ class TestStart():
         def fake_start_new_session(username_hash):
             self.start_new_session_called.append(username_hash)
             return self.start_new_session_response
-        monkeypatch.setattr(SessionManager, "start_new_session", fake_start_new_session)
+        monkeypatch.setattr(SessionManager, "start_new_session_steps", _fake_steps(fake_start_new_session))
 
         yield
 
@@ -256,7 +257,7 @@ class TestAuth():
                 expiry_time
             ))
             return self.auth_new_session_response
-        monkeypatch.setattr(SessionManager, "auth_new_session", fake_auth_new_session)
+        monkeypatch.setattr(SessionManager, "auth_new_session_steps", _fake_steps(fake_auth_new_session))
 
         yield
 
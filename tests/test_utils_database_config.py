@@ -1,7 +1,6 @@
 import os
 import sys
 import pytest
-from typing import Dict, Any
 from pathlib import Path
 from configparser import ConfigParser
 
@@ -193,5 +192,69 @@ class TestGetPath():
         assert result == None
 
 
+class TestGetSection():
+    """Test the get_section function"""
+
+    def test_returns_section_values(self, monkeypatch):
+        """Should return all values declared in the section"""
+
+        parser = ConfigParser()
+        parser.add_section("database")
+        parser.set("database", "journal_mode", "WAL")
+        parser.set("database", "cache_size", "-2000")
+
+        monkeypatch.setattr(DatabaseConfig, "_config", parser)
+
+        result = DatabaseConfig.get_section("database")
+
+        assert result == {"journal_mode": "WAL", "cache_size": "-2000"}
+
+    def test_no_section(self, monkeypatch):
+        """Should return empty dict if section not in config"""
+
+        parser = ConfigParser()
+        parser.add_section("paths")
+
+        monkeypatch.setattr(DatabaseConfig, "_config", parser)
+
+        result = DatabaseConfig.get_section("database")
+
+        assert result == {}
+
+    def test_skips_empty_values(self, monkeypatch):
+        """Should not return values that are not declared"""
+
+        parser = ConfigParser()
+        parser.add_section("database")
+        parser.set("database", "journal_mode", "")
+        parser.set("database", "synchronous", "NORMAL")
+
+        monkeypatch.setattr(DatabaseConfig, "_config", parser)
+
+        result = DatabaseConfig.get_section("database")
+
+        assert result == {"synchronous": "NORMAL"}
+
+    def test_get_section_without_config(self, monkeypatch):
+        """Should call 'load' if config is None"""
+
+        called = {"count": 0}
+
+        def fake_load():
+            called["count"] += 1
+            parser = ConfigParser()
+            parser.add_section("database")
+            parser.set("database", "synchronous", "NORMAL")
+            DatabaseConfig._config = parser
+
+        monkeypatch.setattr(DatabaseConfig, "_config", None)
+        monkeypatch.setattr(DatabaseConfig, "load", fake_load)
+
+        result = DatabaseConfig.get_section("database")
+
+        assert called["count"] == 1
+        assert result == {"synchronous": "NORMAL"}
+
+
 if __name__ == '__main__':
     pytest.main(['-v', __file__])
@@ -1691,5 +1691,87 @@ class TestCleanAll():
         assert mock_session.closed is True
 
 
+class TestDBUtilsAuthDatabase():
+    """Test cases for the database utils auth functions against each real database backend"""
+
+    @pytest.fixture(autouse=True)
+    def setup_teardown(self, real_database):
+        with DatabaseSetup.get_db_session() as session:
+            user = User(
+                username_hash=b'fake_hash',
+                srp_salt=b'fake_srp_salt',
+                srp_verifier=b'fake_srp_verifier',
+                master_key_salt=b'fake_master_key_salt',
+                password_change=False
+            )
+            session.add(user)
+            session.flush()
+            self.user_id = user.id
+
+        yield
+
+    def test_login_flow(self):
+        """Should fetch the user, start an auth ephemeral and complete it into a login session"""
+        assert DBUtilsAuth.fetch(username_hash=b'fake_hash') == (
+            True, None, self.user_id, b'fake_srp_salt', b'fake_srp_verifier'
+        )
+
+        ok, reason, public_id, master_key_salt = DBUtilsAuth.start(
+            self.user_id, b'eph_private_b', b'eph_public_b', datetime.now() + timedelta(minutes=5)
+        )
+        assert (ok, reason, master_key_salt) == (True, None, b'fake_master_key_salt')
+        assert public_id
+
+        assert DBUtilsAuth.get_details(public_id, username_hash=b'fake_hash') == (
+            True, None, b'eph_private_b', b'eph_public_b', b'fake_srp_verifier'
+        )
+        assert DBUtilsAuth.get_details(public_id, username_hash=b'other_hash')[:2] == (False, FailureReason.NOT_FOUND)
+
+        ok, reason, session_public_id = DBUtilsAuth.complete(public_id, b'session_key', 5, None)
+        assert (ok, reason) == (True, None)
+
+        with DatabaseSetup.get_db_session() as session:
+            assert session.query(AuthEphemeral).count() == 0
+            login_session = session.query(LoginSession).filter(LoginSession.public_id == session_public_id).one()
+            assert login_session.user_id == self.user_id
+            assert login_session.session_key == b'session_key'
+            assert login_session.request_count == 0
+            assert login_session.maximum_requests == 5
+
+    def test_start_unique_public_ids(self):
+        """Should give each auth ephemeral its own public id"""
+        expiry_time = datetime.now() + timedelta(minutes=5)
+        public_ids = {
+            DBUtilsAuth.start(self.user_id, b'eph_private_b', b'eph_public_b', expiry_time)[2]
+            for _ in range(5)
+        }
+
+        assert len(public_ids) == 5
+
+    def test_complete_expired(self):
+        """Should delete an expired auth ephemeral rather than complete it"""
+        _, _, public_id, _ = DBUtilsAuth.start(
+            self.user_id, b'eph_private_b', b'eph_public_b', datetime.now() - timedelta(minutes=5)
+        )
+
+        assert DBUtilsAuth.complete(public_id, b'session_key', 5, None) == (False, FailureReason.NOT_FOUND, "")
+
+        with DatabaseSetup.get_db_session() as session:
+            assert session.query(AuthEphemeral).count() == 0
+            assert session.query(LoginSession).count() == 0
+
+    def test_clean_all(self):
+        """Should remove only the expired auth ephemerals"""
+        _, _, live_id, _ = DBUtilsAuth.start(
+            self.user_id, b'eph_private_b', b'eph_public_b', datetime.now() + timedelta(minutes=5)
+        )
+        DBUtilsAuth.start(self.user_id, b'eph_private_b', b'eph_public_b', datetime.now() - timedelta(minutes=5))
+
+        DBUtilsAuth.clean_all()
+
+        with DatabaseSetup.get_db_session() as session:
+            assert [public_id for public_id, in session.query(AuthEphemeral.public_id).all()] == [live_id]
+
+
 if __name__ == '__main__':
     pytest.main(['-v', __file__])
@@ -224,6 +224,146 @@ class TestCreate():
         assert response[1] == FailureReason.PASSWORD_CHANGE
 
 
+class TestCreateMany():
+    """Test cases for database utils data create many function"""
+
+    @pytest.fixture(autouse=True)
+    def setup_teardown(self, monkeypatch):
+        self.mock_session = _MockSession()
+
+        @contextmanager
+        def mock_get_db_session():
+            try:
+                yield self.mock_session
+                self.mock_session.commit()
+            except Exception:
+                self.mock_session.rollback()
+                raise
+            finally:
+                self.mock_session.close()
+        monkeypatch.setattr(DatabaseSetup, "get_db_session", mock_get_db_session)
+
+        self.fake_user = User(
+            id=123456,
+            username_hash=b'fake_hash',
+            srp_salt=b'fake_srp_salt',
+            srp_verifier=b'fake_srp_verifier',
+            master_key_salt=b'fake_master_key_salt',
+            password_change=False
+        )
+
+        self.mock_query = _MockQuery([self.fake_user])
+        def fake_query(session, *entities):
+            return self.mock_query
+        monkeypatch.setattr(_MockSession, "query", fake_query)
+
+        yield
+
+    def test_nominal_case(self):
+        """Should insert every entry in one statement, and return their public ids in order"""
+        response = DBUtilsData.create_many(
+            user_id=123456,
+            entries=[(b'fake_name_a', b'fake_data_a'), (b'fake_name_b', b'fake_data_b')]
+        )
+
+        assert response[0] == True
+        assert response[1] == None
+        assert len(response[2]) == 2
+        assert len(set(response[2])) == 2
+
+        assert len(self.mock_session._executed) == 1
+        statement, rows = self.mock_session._executed[0]
+        assert statement.is_insert
+        assert rows == [
+            {"public_id": response[2][0], "user_id": 123456, "entry_name": b'fake_name_a', "entry_data": b'fake_data_a'},
+            {"public_id": response[2][1], "user_id": 123456, "entry_name": b'fake_name_b', "entry_data": b'fake_data_b'}
+        ]
+
+        assert self.mock_session.commits == 1
+        assert self.mock_session.closed is True
+
+        assert len(self.mock_query._filters) == 1
+        condition = self.mock_query._filters[0]
+        assert isinstance(condition, BinaryExpression)
+        assert str(condition.left.name) == "id"
+        assert condition.right.value == 123456
+
+    def test_no_entries(self):
+        """Should not issue an insert for an empty batch"""
+        response = DBUtilsData.create_many(
+            user_id=123456,
+            entries=[]
+        )
+
+        assert response == (True, None, [])
+        assert len(self.mock_session._executed) == 0
+
+    def test_too_many(self):
+        """Should reject more entries than the maximum batch size, without opening a session"""
+        response = DBUtilsData.create_many(
+            user_id=123456,
+            entries=[(b'fake_name', b'fake_data')] * (DBUtilsData.MAX_BATCH_SIZE + 1)
+        )
+
+        assert response == (False, FailureReason.TOO_MANY, [])
+        assert self.mock_session.commits == 0
+
+    def test_handles_user_not_found(self):
+        """Should return correct failure reason if user is not found"""
+        self.mock_query._results = []
+
+        response = DBUtilsData.create_many(
+            user_id=123456,
+            entries=[(b'fake_name', b'fake_data')]
+        )
+
+        assert response == (False, FailureReason.NOT_FOUND, [])
+        assert len(self.mock_session._executed) == 0
+
+    def test_handles_password_change(self):
+        """Should check the password change once, for the whole batch"""
+        self.fake_user.password_change = True
+
+        response = DBUtilsData.create_many(
+            user_id=123456,
+            entries=[(b'fake_name', b'fake_data')] * 3
+        )
+
+        assert response == (False, FailureReason.PASSWORD_CHANGE, [])
+        assert len(self.mock_session._executed) == 0
+
+    def test_handles_database_unprepared_failure(self, monkeypatch):
+        """Should return correct failure reason if database is not setup"""
+        @contextmanager
+        def mock_get_db_session():
+            raise RuntimeError("Database not initialised.")
+            yield
+        monkeypatch.setattr(DatabaseSetup, "get_db_session", mock_get_db_session)
+
+        response = DBUtilsData.create_many(
+            user_id=123456,
+            entries=[(b'fake_name', b'fake_data')]
+        )
+
+        assert response[0] == False
+        assert response[1] == FailureReason.DATABASE_UNINITIALISED
+
+    def test_handles_server_exception(self, monkeypatch):
+        """Should roll back the whole batch if any exception is seen"""
+        def raise_unknown_exception():
+            raise ValueError("Something went wrong")
+        self.mock_session._on_commit = raise_unknown_exception
+
+        response = DBUtilsData.create_many(
+            user_id=123456,
+            entries=[(b'fake_name', b'fake_data')]
+        )
+
+        assert response[0] == False
+        assert response[1] == FailureReason.UNKNOWN_EXCEPTION
+        assert self.mock_session.rollbacks == 1
+
+
 class TestEdit():
     """Test cases for database utils data edit function"""
 
@@ -282,11 +422,15 @@ class TestEdit():
         assert mock_session.rollbacks == 0
         assert mock_session.closed is True
 
-        assert len(mock_query._filters) == 1
+        assert len(mock_query._filters) == 2
         condition = mock_query._filters[0]
         assert isinstance(condition, BinaryExpression)
         assert str(condition.left.name) == "public_id"
         assert condition.right.value == "fake_public_id"
+        condition = mock_query._filters[1]
+        assert isinstance(condition, BinaryExpression)
+        assert str(condition.left.name) == "user_id"
+        assert condition.right.value == 123456
 
         assert secure_data.entry_name == b'new_fake_entry_name'
         assert secure_data.entry_data == b'fake_entry_data'
@@ -346,11 +490,15 @@ class TestEdit():
         assert mock_session.rollbacks == 0
         assert mock_session.closed is True
 
-        assert len(mock_query._filters) == 1
+        assert len(mock_query._filters) == 2
         condition = mock_query._filters[0]
         assert isinstance(condition, BinaryExpression)
         assert str(condition.left.name) == "public_id"
         assert condition.right.value == "fake_public_id"
+        condition = mock_query._filters[1]
+        assert isinstance(condition, BinaryExpression)
+        assert str(condition.left.name) == "user_id"
+        assert condition.right.value == 123456
 
         assert secure_data.entry_name == b'fake_entry_name'
         assert secure_data.entry_data == b'new_fake_entry_data'
@@ -410,11 +558,15 @@ class TestEdit():
         assert mock_session.rollbacks == 0
         assert mock_session.closed is True
 
-        assert len(mock_query._filters) == 1
+        assert len(mock_query._filters) == 2
         condition = mock_query._filters[0]
         assert isinstance(condition, BinaryExpression)
         assert str(condition.left.name) == "public_id"
         assert condition.right.value == "fake_public_id"
+        condition = mock_query._filters[1]
+        assert isinstance(condition, BinaryExpression)
+        assert str(condition.left.name) == "user_id"
+        assert condition.right.value == 123456
 
         assert secure_data.entry_name == b'new_fake_entry_name'
         assert secure_data.entry_data == b'new_fake_entry_data'
@@ -474,11 +626,15 @@ class TestEdit():
         assert mock_session.rollbacks == 0
         assert mock_session.closed is True
 
-        assert len(mock_query._filters) == 1
+        assert len(mock_query._filters) == 2
         condition = mock_query._filters[0]
         assert isinstance(condition, BinaryExpression)
         assert str(condition.left.name) == "public_id"
         assert condition.right.value == "fake_public_id"
+        condition = mock_query._filters[1]
+        assert isinstance(condition, BinaryExpression)
+        assert str(condition.left.name) == "user_id"
+        assert condition.right.value == 123456
 
         assert secure_data.entry_name == b'fake_entry_name'
         assert secure_data.entry_data == b'fake_entry_data'
@@ -577,11 +733,15 @@ class TestEdit():
         assert mock_session.rollbacks == 0
         assert mock_session.closed is True
 
-        assert len(mock_query._filters) == 1
+        assert len(mock_query._filters) == 2
         condition = mock_query._filters[0]
         assert isinstance(condition, BinaryExpression)
         assert str(condition.left.name) == "public_id"
         assert condition.right.value == "fake_public_id"
+        condition = mock_query._filters[1]
+        assert isinstance(condition, BinaryExpression)
+        assert str(condition.left.name) == "user_id"
+        assert condition.right.value == 123456
 
     def test_handles_password_change(self, monkeypatch):
         """Should return correct error if user is in process of password change"""
@@ -665,7 +825,7 @@ class TestEdit():
             entry_data=b'fake_entry_data'
         )
 
-        mock_query = _MockQuery([secure_data])
+        mock_query = _MockQuery([])
         def fake_query(self, model):
             return mock_query
         monkeypatch.setattr(_MockSession, "query", fake_query)
@@ -684,6 +844,162 @@ class TestEdit():
         assert response[0] == False
         assert response[1] == FailureReason.NOT_FOUND
 
+        assert len(mock_query._filters) == 2
+        condition = mock_query._filters[0]
+        assert isinstance(condition, BinaryExpression)
+        assert str(condition.left.name) == "public_id"
+        assert condition.right.value == "fake_public_id"
+        condition = mock_query._filters[1]
+        assert isinstance(condition, BinaryExpression)
+        assert str(condition.left.name) == "user_id"
+        assert condition.right.value == 654321
+
+
+class TestEditMany():
+    """Test cases for database utils data edit many function"""
+
+    @pytest.fixture(autouse=True)
+    def setup_teardown(self, monkeypatch):
+        self.mock_session = _MockSession()
+
+        @contextmanager
+        def mock_get_db_session():
+            try:
+                yield self.mock_session
+                self.mock_session.commit()
+            except Exception:
+                self.mock_session.rollback()
+                raise
+            finally:
+                self.mock_session.close()
+        monkeypatch.setattr(DatabaseSetup, "get_db_session", mock_get_db_session)
+
+        self.mock_query = _MockQuery([
+            (False, "fake_public_id_a", 1),
+            (False, "fake_public_id_b", 2)
+        ])
+        def fake_query(session, *entities):
+            return self.mock_query
+        monkeypatch.setattr(_MockSession, "query", fake_query)
+
+        yield
+
+    def test_nominal_case(self):
+        """Should update every owned entry by primary key, in one statement"""
+        response = DBUtilsData.edit_many(
+            user_id=123456,
+            edits=[
+                ("fake_public_id_a", b'new_name_a', None),
+                ("fake_public_id_b", b'new_name_b', b'new_data_b')
+            ]
+        )
+
+        assert response == (True, None, [("fake_public_id_a", None), ("fake_public_id_b", None)])
+
+        assert len(self.mock_session._executed) == 1
+        statement, rows = self.mock_session._executed[0]
+        assert statement.is_update
+        assert rows == [
+            {"id": 1, "entry_name": b'new_name_a'},
+            {"id": 2, "entry_name": b'new_name_b', "entry_data": b'new_data_b'}
+        ]
+
+        assert self.mock_session.commits == 1
+        assert self.mock_session.closed is True
+
+        assert len(self.mock_query._filters) == 1
+        condition = self.mock_query._filters[0]
+        assert isinstance(condition, BinaryExpression)
+        assert str(condition.left.name) == "id"
+        assert condition.right.value == 123456
+
+    def test_reports_not_found(self):
+        """Should report entries not owned by the user, and still edit the rest"""
+        response = DBUtilsData.edit_many(
+            user_id=123456,
+            edits=[
+                ("fake_public_id_c", b'new_name_c', None),
+                ("fake_public_id_a", b'new_name_a', None)
+            ]
+        )
+
+        assert response == (True, None, [("fake_public_id_c", FailureReason.NOT_FOUND), ("fake_public_id_a", None)])
+        assert self.mock_session._executed[0][1] == [{"id": 1, "entry_name": b'new_name_a'}]
+
+    def test_change_neither_field(self):
+        """Should not issue an update if no edit changes any field"""
+        response = DBUtilsData.edit_many(
+            user_id=123456,
+            edits=[("fake_public_id_a", None, None)]
+        )
+
+        assert response == (True, None, [("fake_public_id_a", None)])
+        assert len(self.mock_session._executed) == 0
+
+    def test_too_many(self):
+        """Should reject more edits than the maximum batch size, without opening a session"""
+        response = DBUtilsData.edit_many(
+            user_id=123456,
+            edits=[("fake_public_id_a", b'new_name', None)] * (DBUtilsData.MAX_BATCH_SIZE + 1)
+        )
+
+        assert response == (False, FailureReason.TOO_MANY, [])
+        assert self.mock_session.commits == 0
+
+    def test_handles_user_not_found(self):
+        """Should return correct failure reason if user is not found"""
+        self.mock_query._results = []
+
+        response = DBUtilsData.edit_many(
+            user_id=123456,
+            edits=[("fake_public_id_a", b'new_name', None)]
+        )
+
+        assert response == (False, FailureReason.NOT_FOUND, [])
+
+    def test_handles_password_change(self):
+        """Should check the password change once, for the whole batch"""
+        self.mock_query._results = [(True, "fake_public_id_a", 1)]
+
+        response = DBUtilsData.edit_many(
+            user_id=123456,
+            edits=[("fake_public_id_a", b'new_name', None)]
+        )
+
+        assert response == (False, FailureReason.PASSWORD_CHANGE, [])
+        assert len(self.mock_session._executed) == 0
+
+    def test_handles_database_unprepared_failure(self, monkeypatch):
+        """Should return correct failure reason if database is not setup"""
+        @contextmanager
+        def mock_get_db_session():
+            raise RuntimeError("Database not initialised.")
+            yield
+        monkeypatch.setattr(DatabaseSetup, "get_db_session", mock_get_db_session)
+
+        response = DBUtilsData.edit_many(
+            user_id=123456,
+            edits=[("fake_public_id_a", b'new_name', None)]
+        )
+
+        assert response[0] == False
+        assert response[1] == FailureReason.DATABASE_UNINITIALISED
+
+    def test_handles_server_exception(self, monkeypatch):
+        """Should roll back the whole batch if any exception is seen"""
+        def raise_unknown_exception():
+            raise ValueError("Something went wrong")
+        self.mock_session._on_commit = raise_unknown_exception
+
+        response = DBUtilsData.edit_many(
+            user_id=123456,
+            edits=[("fake_public_id_a", b'new_name', None)]
+        )
+
+        assert response[0] == False
+        assert response[1] == FailureReason.UNKNOWN_EXCEPTION
+        assert self.mock_session.rollbacks == 1
+
 
 class TestDelete():
     """Test cases for database utils data delete function"""
@@ -742,11 +1058,15 @@ class TestDelete():
         assert mock_session.rollbacks == 0
         assert mock_session.closed is True
 
-        assert len(mock_query._filters) == 1
+        assert len(mock_query._filters) == 2
         condition = mock_query._filters[0]
         assert isinstance(condition, BinaryExpression)
         assert str(condition.left.name) == "public_id"
         assert condition.right.value == "fake_public_id"
+        condition = mock_query._filters[1]
+        assert isinstance(condition, BinaryExpression)
+        assert str(condition.left.name) == "user_id"
+        assert condition.right.value == 123456
 
     def test_handles_database_unprepared_failure(self, monkeypatch):
         """Should return correct failure reason if database is not setup"""
@@ -836,11 +1156,15 @@ class TestDelete():
         assert mock_session.rollbacks == 0
         assert mock_session.closed is True
 
-        assert len(mock_query._filters) == 1
+        assert len(mock_query._filters) == 2
         condition = mock_query._filters[0]
         assert isinstance(condition, BinaryExpression)
         assert str(condition.left.name) == "public_id"
         assert condition.right.value == "fake_public_id"
+        condition = mock_query._filters[1]
+        assert isinstance(condition, BinaryExpression)
+        assert str(condition.left.name) == "user_id"
+        assert condition.right.value == 123456
 
     def test_handles_password_change(self, monkeypatch):
         """Should return correct error if user is in process of password change"""
@@ -922,7 +1246,7 @@ class TestDelete():
             entry_data=b'fake_entry_data'
         )
 
-        mock_query = _MockQuery([secure_data])
+        mock_query = _MockQuery([])
         def fake_query(self, model):
             return mock_query
         monkeypatch.setattr(_MockSession, "query", fake_query)
@@ -939,6 +1263,149 @@ class TestDelete():
         assert response[0] == False
         assert response[1] == FailureReason.NOT_FOUND
 
+        assert len(mock_query._filters) == 2
+        condition = mock_query._filters[0]
+        assert isinstance(condition, BinaryExpression)
+        assert str(condition.left.name) == "public_id"
+        assert condition.right.value == "fake_public_id"
+        condition = mock_query._filters[1]
+        assert isinstance(condition, BinaryExpression)
+        assert str(condition.left.name) == "user_id"
+        assert condition.right.value == 654321
+
+
+class TestDeleteMany():
+    """Test cases for database utils data delete many function"""
+
+    @pytest.fixture(autouse=True)
+    def setup_teardown(self, monkeypatch):
+        self.mock_session = _MockSession()
+
+        @contextmanager
+        def mock_get_db_session():
+            try:
+                yield self.mock_session
+                self.mock_session.commit()
+            except Exception:
+                self.mock_session.rollback()
+                raise
+            finally:
+                self.mock_session.close()
+        monkeypatch.setattr(DatabaseSetup, "get_db_session", mock_get_db_session)
+
+        self.mock_query = _MockQuery([
+            (False, "fake_public_id_a", 1),
+            (False, "fake_public_id_b", 2)
+        ])
+        def fake_query(session, *entities):
+            return self.mock_query
+        monkeypatch.setattr(_MockSession, "query", fake_query)
+
+        yield
+
+    def test_nominal_case(self):
+        """Should delete every owned entry in one statement"""
+        response = DBUtilsData.delete_many(
+            user_id=123456,
+            public_ids=["fake_public_id_a", "fake_public_id_b"]
+        )
+
+        assert response == (True, None, [("fake_public_id_a", None), ("fake_public_id_b", None)])
+
+        assert len(self.mock_session._executed) == 1
+        statement, rows = self.mock_session._executed[0]
+        assert statement.is_delete
+        assert rows is None
+
+        assert self.mock_session.commits == 1
+        assert self.mock_session.closed is True
+
+    def test_reports_not_found(self):
+        """Should report entries not owned by the user, and still delete the rest"""
+        response = DBUtilsData.delete_many(
+            user_id=123456,
+            public_ids=["fake_public_id_c", "fake_public_id_a"]
+        )
+
+        assert response == (True, None, [("fake_public_id_c", FailureReason.NOT_FOUND), ("fake_public_id_a", None)])
+        assert len(self.mock_session._executed) == 1
+
+    def test_none_owned(self):
+        """Should not issue a delete if no entries are owned by the user"""
+        self.mock_query._results = [(False, None, None)]
+
+        response = DBUtilsData.delete_many(
+            user_id=123456,
+            public_ids=["fake_public_id_c"]
+        )
+
+        assert response == (True, None, [("fake_public_id_c", FailureReason.NOT_FOUND)])
+        assert len(self.mock_session._executed) == 0
+
+    def test_too_many(self):
+        """Should reject more deletes than the maximum batch size, without opening a session"""
+        response = DBUtilsData.delete_many(
+            user_id=123456,
+            public_ids=["fake_public_id_a"] * (DBUtilsData.MAX_BATCH_SIZE + 1)
+        )
+
+        assert response == (False, FailureReason.TOO_MANY, [])
+        assert self.mock_session.commits == 0
+
+    def test_handles_user_not_found(self):
+        """Should return correct failure reason if user is not found"""
+        self.mock_query._results = []
+
+        response = DBUtilsData.delete_many(
+            user_id=123456,
+            public_ids=["fake_public_id_a"]
+        )
+
+        assert response == (False, FailureReason.NOT_FOUND, [])
+
+    def test_handles_password_change(self):
+        """Should check the password change once, for the whole batch"""
+        self.mock_query._results = [(True, "fake_public_id_a", 1)]
+
+        response = DBUtilsData.delete_many(
+            user_id=123456,
+            public_ids=["fake_public_id_a"]
+        )
+
+        assert response == (False, FailureReason.PASSWORD_CHANGE, [])
+        assert len(self.mock_session._executed) == 0
+
+    def test_handles_database_unprepared_failure(self, monkeypatch):
+        """Should return correct failure reason if database is not setup"""
+        @contextmanager
+        def mock_get_db_session():
+            raise RuntimeError("Database not initialised.")
+            yield
+        monkeypatch.setattr(DatabaseSetup, "get_db_session", mock_get_db_session)
+
+        response = DBUtilsData.delete_many(
+            user_id=123456,
+            public_ids=["fake_public_id_a"]
+        )
+
+        assert response[0] == False
+        assert response[1] == FailureReason.DATABASE_UNINITIALISED
+
+    def test_handles_server_exception(self, monkeypatch):
+        """Should roll back the whole batch if any exception is seen"""
+        def raise_unknown_exception():
+            raise ValueError("Something went wrong")
+        self.mock_session._on_commit = raise_unknown_exception
+
+        response = DBUtilsData.delete_many(
+            user_id=123456,
+            public_ids=["fake_public_id_a"]
+        )
+
+        assert response[0] == False
+        assert response[1] == FailureReason.UNKNOWN_EXCEPTION
+        assert self.mock_session.rollbacks == 1
+
 
 class TestGetEntry():
     """Test cases for database utils data get entry function"""
@@ -998,11 +1465,15 @@ class TestGetEntry():
         assert mock_session.rollbacks == 0
         assert mock_session.closed is True
 
-        assert len(mock_query._filters) == 1
+        assert len(mock_query._filters) == 2
         condition = mock_query._filters[0]
         assert isinstance(condition, BinaryExpression)
         assert str(condition.left.name) == "public_id"
         assert condition.right.value == "fake_public_id"
+        condition = mock_query._filters[1]
+        assert isinstance(condition, BinaryExpression)
+        assert str(condition.left.name) == "user_id"
+        assert condition.right.value == 123456
 
     def test_handles_database_unprepared_failure(self, monkeypatch):
         """Should return correct failure reason if database is not setup"""
@@ -1092,11 +1563,15 @@ class TestGetEntry():
         assert mock_session.rollbacks == 0
         assert mock_session.closed is True
 
-        assert len(mock_query._filters) == 1
+        assert len(mock_query._filters) == 2
         condition = mock_query._filters[0]
         assert isinstance(condition, BinaryExpression)
         assert str(condition.left.name) == "public_id"
         assert condition.right.value == "fake_public_id"
+        condition = mock_query._filters[1]
+        assert isinstance(condition, BinaryExpression)
+        assert str(condition.left.name) == "user_id"
+        assert condition.right.value == 123456
 
     def test_handles_password_change(self, monkeypatch):
         """Should return correct error if user is in process of password change"""
@@ -1202,11 +1677,15 @@ class TestGetEntry():
         assert mock_session.rollbacks == 0
         assert mock_session.closed is True
 
-        assert len(mock_query._filters) == 1
+        assert len(mock_query._filters) == 2
         condition = mock_query._filters[0]
         assert isinstance(condition, BinaryExpression)
         assert str(condition.left.name) == "public_id"
         assert condition.right.value == "fake_public_id"
+        condition = mock_query._filters[1]
+        assert isinstance(condition, BinaryExpression)
+        assert str(condition.left.name) == "user_id"
+        assert condition.right.value == 123456
 
     def test_user_id_match_fails(self, monkeypatch):
         """Should fail if user id does not match"""
@@ -1240,7 +1719,7 @@ class TestGetEntry():
             entry_data=b'fake_entry_data'
         )
 
-        mock_query = _MockQuery([secure_data])
+        mock_query = _MockQuery([])
         def fake_query(self, model):
             return mock_query
         monkeypatch.setattr(_MockSession, "query", fake_query)
@@ -1257,6 +1736,173 @@ class TestGetEntry():
         assert response[0] == False
         assert response[1] == FailureReason.NOT_FOUND
 
+        assert len(mock_query._filters) == 2
+        condition = mock_query._filters[0]
+        assert isinstance(condition, BinaryExpression)
+        assert str(condition.left.name) == "public_id"
+        assert condition.right.value == "fake_public_id"
+        condition = mock_query._filters[1]
+        assert isinstance(condition, BinaryExpression)
+        assert str(condition.left.name) == "user_id"
+        assert condition.right.value == 654321
+
+
+class TestGetEntries():
+    """Test cases for database utils data get entries function"""
+
+    @pytest.fixture(autouse=True)
+    def setup_teardown(self, monkeypatch):
+        self.mock_session = _MockSession()
+
+        @contextmanager
+        def mock_get_db_session():
+            try:
+                yield self.mock_session
+                self.mock_session.commit()
+            except Exception:
+                self.mock_session.rollback()
+                raise
+            finally:
+                self.mock_session.close()
+        monkeypatch.setattr(DatabaseSetup, "get_db_session", mock_get_db_session)
+
+        self.mock_query = _MockQuery([
+            (False, "fake_public_id_a", b'fake_entry_name_a', b'fake_entry_data_a'),
+            (False, "fake_public_id_b", b'fake_entry_name_b', b'fake_entry_data_b')
+        ])
+        def fake_query(session, *entities):
+            return self.mock_query
+        monkeypatch.setattr(_MockSession, "query", fake_query)
+
+        yield
+
+    def test_nominal_case(self):
+        """Should return the requested entries in the order requested"""
+        response = DBUtilsData.get_entries(
+            user_id=123456,
+            public_ids=["fake_public_id_b", "fake_public_id_a"]
+        )
+
+        assert response[0] == True
+        assert response[1] == None
+        assert response[2] == [
+            ("fake_public_id_b", b'fake_entry_name_b', b'fake_entry_data_b'),
+            ("fake_public_id_a", b'fake_entry_name_a', b'fake_entry_data_a')
+        ]
+        assert response[3] == []
+
+        assert self.mock_session.commits == 1
+        assert self.mock_session.closed is True
+
+        assert len(self.mock_query._filters) == 1
+        condition = self.mock_query._filters[0]
+        assert isinstance(condition, BinaryExpression)
+        assert str(condition.left.name) == "id"
+        assert condition.right.value == 123456
+
+    def test_reports_missing(self):
+        """Should report entries not found for the user as missing"""
+        response = DBUtilsData.get_entries(
+            user_id=123456,
+            public_ids=["fake_public_id_a", "fake_public_id_c"]
+        )
+
+        assert response[0] == True
+        assert [entry[0] for entry in response[2]] == ["fake_public_id_a"]
+        assert response[3] == ["fake_public_id_c"]
+
+    def test_no_entries_found(self):
+        """Should report every entry as missing if none are found for the user"""
+        self.mock_query._results = [(False, None, None, None)]
+
+        response = DBUtilsData.get_entries(
+            user_id=123456,
+            public_ids=["fake_public_id_a", "fake_public_id_b"]
+        )
+
+        assert response[0] == True
+        assert response[2] == []
+        assert response[3] == ["fake_public_id_a", "fake_public_id_b"]
+
+    def test_duplicate_public_ids(self):
+        """Should return each entry once, however many times it was requested"""
+        response = DBUtilsData.get_entries(
+            user_id=123456,
+            public_ids=["fake_public_id_a", "fake_public_id_a", "fake_public_id_c", "fake_public_id_c"]
+        )
+
+        assert len(response[2]) == 1
+        assert response[3] == ["fake_public_id_c"]
+
+    def test_too_many(self):
+        """Should reject more entries than the maximum page size, without opening a session"""
+        response = DBUtilsData.get_entries(
+            user_id=123456,
+            public_ids=[f"fake_public_id_{i}" for i in range(DBUtilsData.MAX_PAGE_SIZE + 1)]
+        )
+
+        assert response[0] == False
+        assert response[1] == FailureReason.TOO_MANY
+        assert self.mock_session.commits == 0
+
+    def test_handles_user_not_found(self):
+        """Should return correct failure reason if user is not found"""
+        self.mock_query._results = []
+
+        response = DBUtilsData.get_entries(
+            user_id=123456,
+            public_ids=["fake_public_id_a"]
+        )
+
+        assert response[0] == False
+        assert response[1] == FailureReason.NOT_FOUND
+
+    def test_handles_password_change(self):
+        """Should return correct error if user is in process of password change"""
+        self.mock_query._results = [
+            (True, "fake_public_id_a", b'fake_entry_name_a', b'fake_entry_data_a')
+        ]
+
+        response = DBUtilsData.get_entries(
+            user_id=123456,
+            public_ids=["fake_public_id_a"]
+        )
+
+        assert response[0] == False
+        assert response[1] == FailureReason.PASSWORD_CHANGE
+        assert response[2] == []
+
+    def test_password_change_fetch(self):
+        """Should return entries during a password change, if called as part of it"""
+        self.mock_query._results = [
+            (True, "fake_public_id_a", b'fake_entry_name_a', b'fake_entry_data_a')
+        ]
+
+        response = DBUtilsData.get_entries(
+            user_id=123456,
+            public_ids=["fake_public_id_a"],
+            password_change=True
+        )
+
+        assert response[0] == True
+        assert len(response[2]) == 1
+
+    def test_handles_database_unprepared_failure(self, monkeypatch):
+        """Should return correct failure reason if database is not setup"""
+        @contextmanager
+        def mock_get_db_session():
+            raise RuntimeError("Database not initialised.")
+            yield
+        monkeypatch.setattr(DatabaseSetup, "get_db_session", mock_get_db_session)
+
+        response = DBUtilsData.get_entries(
+            user_id=123456,
+            public_ids=["fake_public_id_a"]
+        )
+
+        assert response[0] == False
+        assert response[1] == FailureReason.DATABASE_UNINITIALISED
+
 
 class TestGetList():
     """Test cases for database utils data get list function"""
@@ -1287,8 +1933,9 @@ class TestGetList():
         )
 
         mock_query = _MockQuery([fake_user])
-        def fake_query(self, model):
-            return mock_query
+        entry_query = _MockQuery([(data.public_id, data.entry_name) for data in fake_user.secure_data])
+        def fake_query(self, *entities):
+            return mock_query if entities[0] is User else entry_query
         monkeypatch.setattr(_MockSession, "query", fake_query)
 
         response = DBUtilsData.get_list(
@@ -1312,6 +1959,13 @@ class TestGetList():
         assert str(condition.left.name) == "id"
         assert condition.right.value == 123456
 
+        assert len(entry_query._filters) == 1
+        condition = entry_query._filters[0]
+        assert isinstance(condition, BinaryExpression)
+        assert str(condition.left.name) == "user_id"
+        assert condition.right.value == 123456
+        assert entry_query._limit is None
+
     def test_one_data_entry(self, monkeypatch):
         mock_session = _MockSession()
 
@@ -1345,8 +1999,9 @@ class TestGetList():
         )
 
         mock_query = _MockQuery([fake_user])
-        def fake_query(self, model):
-            return mock_query
+        entry_query = _MockQuery([(data.public_id, data.entry_name) for data in fake_user.secure_data])
+        def fake_query(self, *entities):
+            return mock_query if entities[0] is User else entry_query
         monkeypatch.setattr(_MockSession, "query", fake_query)
 
         response = DBUtilsData.get_list(
@@ -1373,6 +2028,13 @@ class TestGetList():
         assert str(condition.left.name) == "id"
         assert condition.right.value == 123456
 
+        assert len(entry_query._filters) == 1
+        condition = entry_query._filters[0]
+        assert isinstance(condition, BinaryExpression)
+        assert str(condition.left.name) == "user_id"
+        assert condition.right.value == 123456
+        assert entry_query._limit is None
+
     def test_multiple_data_entries(self, monkeypatch):
         mock_session = _MockSession()
 
@@ -1436,8 +2098,9 @@ class TestGetList():
         )
 
         mock_query = _MockQuery([fake_user])
-        def fake_query(self, model):
-            return mock_query
+        entry_query = _MockQuery([(data.public_id, data.entry_name) for data in fake_user.secure_data])
+        def fake_query(self, *entities):
+            return mock_query if entities[0] is User else entry_query
         monkeypatch.setattr(_MockSession, "query", fake_query)
 
         response = DBUtilsData.get_list(
@@ -1479,6 +2142,13 @@ class TestGetList():
         assert str(condition.left.name) == "id"
         assert condition.right.value == 123456
 
+        assert len(entry_query._filters) == 1
+        condition = entry_query._filters[0]
+        assert isinstance(condition, BinaryExpression)
+        assert str(condition.left.name) == "user_id"
+        assert condition.right.value == 123456
+        assert entry_query._limit is None
+
     def test_handles_database_unprepared_failure(self, monkeypatch):
         """Should return correct failure reason if database is not setup"""
         @contextmanager
@@ -1604,8 +2274,9 @@ class TestGetList():
         )
 
         mock_query = _MockQuery([fake_user])
-        def fake_query(self, model):
-            return mock_query
+        entry_query = _MockQuery([(data.public_id, data.entry_name) for data in fake_user.secure_data])
+        def fake_query(self, *entities):
+            return mock_query if entities[0] is User else entry_query
         monkeypatch.setattr(_MockSession, "query", fake_query)
 
         response = DBUtilsData.get_list(
@@ -1619,5 +2290,535 @@ class TestGetList():
         assert response[1] == FailureReason.PASSWORD_CHANGE
 
 
+class TestGetPage():
+    """Test cases for database utils data get page function"""
+
+    @pytest.fixture(autouse=True)
+    def setup_teardown(self, monkeypatch):
+        self.mock_session = _MockSession()
+
+        @contextmanager
+        def mock_get_db_session():
+            try:
+                yield self.mock_session
+                self.mock_session.commit()
+            except Exception:
+                self.mock_session.rollback()
+                raise
+            finally:
+                self.mock_session.close()
+        monkeypatch.setattr(DatabaseSetup, "get_db_session", mock_get_db_session)
+
+        fake_user = User(
+            id=123456,
+            username_hash=b'fake_hash',
+            srp_salt=b'fake_srp_salt',
+            srp_verifier=b'fake_srp_verifier',
+            master_key_salt=b'fake_master_key_salt',
+            password_change=False
+        )
+
+        self.user_query = _MockQuery([fake_user])
+        self.entry_query = _MockQuery([
+            ("fake_public_id_a", b'fake_entry_name_a'),
+            ("fake_public_id_b", b'fake_entry_name_b'),
+            ("fake_public_id_c", b'fake_entry_name_c')
+        ])
+        def fake_query(session, *entities):
+            return self.user_query if entities[0] is User else self.entry_query
+        monkeypatch.setattr(_MockSession, "query", fake_query)
+
+        yield
+
+    def test_first_page(self):
+        """Should return the first page, and a cursor after its last entry"""
+        response = DBUtilsData.get_page(
+            user_id=123456,
+            page_size=2
+        )
+
+        assert response[0] == True
+        assert response[1] == None
+        assert response[2] == [
+            ("fake_public_id_a", b'fake_entry_name_a'),
+            ("fake_public_id_b", b'fake_entry_name_b')
+        ]
+        assert response[3] == DBUtilsData._encode_cursor("fake_public_id_b")
+
+        assert self.entry_query._limit == 3
+        assert len(self.entry_query._order_by) == 1
+        assert str(self.entry_query._order_by[0].name) == "public_id"
+
+        assert len(self.entry_query._filters) == 1
+        condition = self.entry_query._filters[0]
+        assert isinstance(condition, BinaryExpression)
+        assert str(condition.left.name) == "user_id"
+        assert condition.right.value == 123456
+
+    def test_last_page(self):
+        """Should return an empty cursor if no entries follow the page"""
+        response = DBUtilsData.get_page(
+            user_id=123456,
+            page_size=3
+        )
+
+        assert response[0] == True
+        assert len(response[2]) == 3
+        assert response[3] == ""
+
+    def test_all_entries(self):
+        """Should return every entry, without a limit, if no page size is given"""
+        response = DBUtilsData.get_page(
+            user_id=123456,
+            page_size=None
+        )
+
+        assert response[0] == True
+        assert len(response[2]) == 3
+        assert response[3] == ""
+        assert self.entry_query._limit is None
+
+    def test_continues_after_cursor(self):
+        """Should only select entries after the public id in the cursor"""
+        cursor = DBUtilsData._encode_cursor("fake_public_id_b")
+
+        response = DBUtilsData.get_page(
+            user_id=123456,
+            page_size=2,
+            cursor=cursor
+        )
+
+        assert response[0] == True
+
+        assert len(self.entry_query._filters) == 2
+        condition = self.entry_query._filters[1]
+        assert isinstance(condition, BinaryExpression)
+        assert str(condition.left.name) == "public_id"
+        assert condition.right.value == "fake_public_id_b"
+
+    def test_caps_page_size(self):
+        """Should not return more than the maximum page size"""
+        response = DBUtilsData.get_page(
+            user_id=123456,
+            page_size=DBUtilsData.MAX_PAGE_SIZE + 100
+        )
+
+        assert response[0] == True
+        assert self.entry_query._limit == DBUtilsData.MAX_PAGE_SIZE + 1
+
+    @pytest.mark.parametrize(
+        "cursor",
+        [
+            "%%%",
+            "_w",
+            "\u00e9"
+        ]
+    )
+    def test_invalid_cursor(self, cursor):
+        """Should reject a cursor which could not have been issued, without opening a session"""
+        response = DBUtilsData.get_page(
+            user_id=123456,
+            page_size=2,
+            cursor=cursor
+        )
+
+        assert response[0] == False
+        assert response[1] == FailureReason.INVALID
+        assert response[2] == []
+        assert self.mock_session.commits == 0
+
+    def test_handles_password_change(self):
+        """Should return correct error if user is in process of password change"""
+        self.user_query._results[0].password_change = True
+
+        response = DBUtilsData.get_page(
+            user_id=123456,
+            page_size=2
+        )
+
+        assert response[0] == False
+        assert response[1] == FailureReason.PASSWORD_CHANGE
+        assert len(self.entry_query._filters) == 0
+
+    def test_handles_user_not_found(self):
+        """Should return correct failure reason if user is not found"""
+        self.user_query._results = []
+
+        response = DBUtilsData.get_page(
+            user_id=123456,
+            page_size=2
+        )
+
+        assert response[0] == False
+        assert response[1] == FailureReason.NOT_FOUND
+
+    def test_cursor_round_trip(self):
+        """Should decode an issued cursor back to its public id"""
+        cursor = DBUtilsData._encode_cursor("0123456789abcdef")
+
+        assert "=" not in cursor
+        assert DBUtilsData._decode_cursor(cursor) == "0123456789abcdef"
+
+
+class _KeysetQuery(_MockQuery):
+    """Mock query applying the public id keyset filter of each streamed chunk"""
+
+    def all(self):
+        results = self._results
+        for condition in self._filters:
+            if str(condition.left.name) == "public_id":
+                results = [row for row in results if row[0] > condition.right.value]
+        if self._limit is not None:
+            results = results[:self._limit]
+        return list(results)
+
+
+class TestStreamList():
+    """Test cases for database utils data stream list function"""
+
+    @pytest.fixture(autouse=True)
+    def setup_teardown(self, monkeypatch):
+        self.mock_session = _MockSession()
+
+        @contextmanager
+        def mock_get_db_session():
+            try:
+                yield self.mock_session
+                self.mock_session.commit()
+            except BaseException:
+                self.mock_session.rollback()
+                raise
+            finally:
+                self.mock_session.close()
+        monkeypatch.setattr(DatabaseSetup, "get_db_session", mock_get_db_session)
+
+        self.fake_user = User(
+            id=123456,
+            username_hash=b'fake_hash',
+            srp_salt=b'fake_srp_salt',
+            srp_verifier=b'fake_srp_verifier',
+            master_key_salt=b'fake_master_key_salt',
+            password_change=False
+        )
+
+        self.user_query = _MockQuery([self.fake_user])
+        self.entries = [
+            ("fake_public_id_a", b'fake_entry_name_a'),
+            ("fake_public_id_b", b'fake_entry_name_b'),
+            ("fake_public_id_c", b'fake_entry_name_c')
+        ]
+        self.entry_queries = []
+        def fake_query(session, *entities):
+            if entities[0] is User:
+                return self.user_query
+            self.entry_queries.append(_KeysetQuery(self.entries))
+            return self.entry_queries[-1]
+        monkeypatch.setattr(_MockSession, "query", fake_query)
+
+        yield
+
+    def test_yields_chunks(self):
+        """Should yield the entries in chunks of the given size"""
+        chunks = list(DBUtilsData.stream_list(
+            user_id=123456,
+            chunk_size=2
+        ))
+
+        assert chunks == [
+            (True, None, [("fake_public_id_a", b'fake_entry_name_a'), ("fake_public_id_b", b'fake_entry_name_b')]),
+            (True, None, [("fake_public_id_c", b'fake_entry_name_c')])
+        ]
+
+        assert len(self.entry_queries) == 2
+        for entry_query in self.entry_queries:
+            assert entry_query._limit == 2
+            assert len(entry_query._order_by) == 1
+            assert str(entry_query._order_by[0].name) == "public_id"
+
+            condition = entry_query._filters[0]
+            assert isinstance(condition, BinaryExpression)
+            assert str(condition.left.name) == "user_id"
+            assert condition.right.value == 123456
+
+        assert len(self.entry_queries[0]._filters) == 1
+        assert str(self.entry_queries[1]._filters[1].left.name) == "public_id"
+        assert self.entry_queries[1]._filters[1].right.value == "fake_public_id_b"
+
+        assert self.mock_session.commits == 2
+        assert self.mock_session.closed is True
+
+    def test_exact_chunks(self):
+        """Should not yield an empty trailing chunk"""
+        chunks = list(DBUtilsData.stream_list(
+            user_id=123456,
+            chunk_size=3
+        ))
+
+        assert len(chunks) == 1
+        assert len(chunks[0][2]) == 3
+
+    def test_no_data_entries(self):
+        """Should yield a single empty chunk if the user has no entries"""
+        self.entries.clear()
+
+        chunks = list(DBUtilsData.stream_list(
+            user_id=123456,
+            chunk_size=2
+        ))
+
+        assert chunks == [(True, None, [])]
+
+    def test_caps_chunk_size(self):
+        """Should not read more than the maximum page size at a time"""
+        list(DBUtilsData.stream_list(
+            user_id=123456,
+            chunk_size=DBUtilsData.MAX_PAGE_SIZE + 100
+        ))
+
+        assert self.entry_queries[0]._limit == DBUtilsData.MAX_PAGE_SIZE
+
+    def test_no_transaction_held_between_chunks(self):
+        """Should end each chunk's transaction before yielding it"""
+        chunks = DBUtilsData.stream_list(
+            user_id=123456,
+            chunk_size=1
+        )
+
+        next(chunks)
+        assert self.mock_session.closed is True
+        assert self.mock_session.commits == 1
+
+        chunks.close()
+        assert len(self.entry_queries) == 1
+
+    def test_handles_password_change(self):
+        """Should yield only the failure if user is in process of password change"""
+        self.fake_user.password_change = True
+
+        chunks = list(DBUtilsData.stream_list(
+            user_id=123456,
+            chunk_size=2
+        ))
+
+        assert chunks == [(False, FailureReason.PASSWORD_CHANGE, [])]
+        assert len(self.entry_queries) == 0
+
+    def test_password_change_started_while_streaming(self):
+        """Should end the stream with the failure if a password change starts between chunks"""
+        chunks = DBUtilsData.stream_list(
+            user_id=123456,
+            chunk_size=1
+        )
+
+        first = next(chunks)
+        self.fake_user.password_change = True
+
+        assert first == (True, None, [("fake_public_id_a", b'fake_entry_name_a')])
+        assert list(chunks) == [(False, FailureReason.PASSWORD_CHANGE, [])]
+
+    def test_handles_user_not_found(self):
+        """Should yield only the failure if user is not found"""
+        self.user_query._results = []
+
+        chunks = list(DBUtilsData.stream_list(
+            user_id=123456,
+            chunk_size=2
+        ))
+
+        assert chunks == [(False, FailureReason.NOT_FOUND, [])]
+
+    def test_handles_database_unprepared_failure(self, monkeypatch):
+        """Should yield correct failure reason if database is not setup"""
+        @contextmanager
+        def mock_get_db_session():
+            raise RuntimeError("Database not initialised.")
+            yield
+        monkeypatch.setattr(DatabaseSetup, "get_db_session", mock_get_db_session)
+
+        chunks = list(DBUtilsData.stream_list(
+            user_id=123456,
+            chunk_size=2
+        ))
+
+        assert chunks == [(False, FailureReason.DATABASE_UNINITIALISED, [])]
+
+
+class TestStreamEntries():
+    """Test cases for database utils data stream entries function"""
+
+    @pytest.fixture(autouse=True)
+    def setup_teardown(self, monkeypatch):
+        self.mock_session = _MockSession()
+
+        @contextmanager
+        def mock_get_db_session():
+            try:
+                yield self.mock_session
+                self.mock_session.commit()
+            except BaseException:
+                self.mock_session.rollback()
+                raise
+            finally:
+                self.mock_session.close()
+        monkeypatch.setattr(DatabaseSetup, "get_db_session", mock_get_db_session)
+
+        fake_user = User(
+            id=123456,
+            username_hash=b'fake_hash',
+            srp_salt=b'fake_srp_salt',
+            srp_verifier=b'fake_srp_verifier',
+            master_key_salt=b'fake_master_key_salt',
+            password_change=True
+        )
+
+        self.user_query = _MockQuery([fake_user])
+        self.entries = [
+            ("fake_public_id_a", b'fake_entry_name_a', b'fake_entry_data_a'),
+            ("fake_public_id_b", b'fake_entry_name_b', b'fake_entry_data_b')
+        ]
+        self.entry_queries = []
+        self.query_entities = []
+        def fake_query(session, *entities):
+            self.query_entities.append(entities)
+            if entities[0] is User:
+                return self.user_query
+            self.entry_queries.append(_KeysetQuery(self.entries))
+            return self.entry_queries[-1]
+        monkeypatch.setattr(_MockSession, "query", fake_query)
+
+        yield
+
+    def test_yields_entries_with_data(self):
+        """Should yield each entry with its data, during a password change if allowed"""
+        chunks = list(DBUtilsData.stream_entries(
+            user_id=123456,
+            chunk_size=1,
+            password_change=True
+        ))
+
+        assert chunks == [
+            (True, None, [("fake_public_id_a", b'fake_entry_name_a', b'fake_entry_data_a')]),
+            (True, None, [("fake_public_id_b", b'fake_entry_name_b', b'fake_entry_data_b')])
+        ]
+        assert [str(column.name) for column in self.query_entities[1]] == ["public_id", "entry_name", "entry_data"]
+        assert [entry_query._limit for entry_query in self.entry_queries] == [1, 1, 1]
+
+    def test_handles_password_change(self):
+        """Should yield only the failure during a password change if not allowed"""
+        chunks = list(DBUtilsData.stream_entries(
+            user_id=123456,
+            chunk_size=1
+        ))
+
+        assert chunks == [(False, FailureReason.PASSWORD_CHANGE, [])]
+
+class TestDBUtilsDataDatabase():
+    """Test cases for the database utils data functions against each real database backend"""
+
+    @pytest.fixture(autouse=True)
+    def setup_teardown(self, real_database):
+        with DatabaseSetup.get_db_session() as session:
+            user = User(
+                username_hash=b'fake_hash',
+                srp_salt=b'fake_srp_salt',
+                srp_verifier=b'fake_srp_verifier',
+                master_key_salt=b'fake_master_key_salt',
+                password_change=False
+            )
+            session.add(user)
+            session.flush()
+            self.user_id = user.id
+
+        # Binary entries, with a NUL byte and a block large enough to be worth compressing
+        self.entries = [(b'entry_name_%d\x00' % i, bytes(range(256)) * (i + 1)) for i in range(5)]
+        ok, reason, self.public_ids = DBUtilsData.create_many(self.user_id, self.entries)
+        assert (ok, reason) == (True, None)
+
+        yield
+
+    def test_create_many(self):
+        """Should return the stored public ids in the order of the entries"""
+        assert len(set(self.public_ids)) == len(self.entries)
+
+        with DatabaseSetup.get_db_session() as session:
+            stored = dict(session.query(SecureData.public_id, SecureData.entry_name).all())
+        assert [stored[public_id] for public_id in self.public_ids] == [entry_name for entry_name, _ in self.entries]
+
+    def test_create(self):
+        """Should store a single entry under a new public id"""
+        ok, reason, public_id = DBUtilsData.create(self.user_id, b'new_entry_name', b'new_entry_data')
+
+        assert (ok, reason) == (True, None)
+        assert public_id not in self.public_ids
+        assert DBUtilsData.get_entry(self.user_id, public_id) == (True, None, b'new_entry_name', b'new_entry_data')
+
+    def test_get_entries(self):
+        """Should read back the binary entries as written, listing the missing public ids"""
+        ok, reason, entries, missing = DBUtilsData.get_entries(self.user_id, self.public_ids + ["missing_public_id"])
+
+        assert (ok, reason) == (True, None)
+        assert entries == [
+            (public_id, entry_name, entry_data)
+            for public_id, (entry_name, entry_data) in zip(self.public_ids, self.entries)
+        ]
+        assert missing == ["missing_public_id"]
+
+    def test_edit_many(self):
+        """Should update the given fields of each entry, reporting those not found"""
+        ok, reason, results = DBUtilsData.edit_many(self.user_id, [
+            (self.public_ids[0], b'edited_name', None),
+            (self.public_ids[1], None, b'edited_data'),
+            ("missing_public_id", b'edited_name', b'edited_data')
+        ])
+
+        assert (ok, reason) == (True, None)
+        assert results == [
+            (self.public_ids[0], None),
+            (self.public_ids[1], None),
+            ("missing_public_id", FailureReason.NOT_FOUND)
+        ]
+        assert DBUtilsData.get_entry(self.user_id, self.public_ids[0]) == (
+            True, None, b'edited_name', self.entries[0][1]
+        )
+        assert DBUtilsData.get_entry(self.user_id, self.public_ids[1]) == (
+            True, None, self.entries[1][0], b'edited_data'
+        )
+
+    def test_delete_many(self):
+        """Should delete only the given entries"""
+        assert DBUtilsData.delete_many(self.user_id, self.public_ids[:2])[:2] == (True, None)
+        assert DBUtilsData.delete(self.user_id, self.public_ids[2]) == (True, None)
+
+        assert set(DBUtilsData.get_list(self.user_id)[2]) == set(self.public_ids[3:])
+
+    def test_get_page(self):
+        """Should page through every entry exactly once"""
+        seen = []
+        cursor = ""
+        while True:
+            ok, reason, entries, cursor = DBUtilsData.get_page(self.user_id, 2, cursor)
+            assert (ok, reason) == (True, None)
+            seen.extend(entries)
+            if not cursor:
+                break
+
+        assert sorted(seen) == sorted(
+            (public_id, entry_name) for public_id, (entry_name, _) in zip(self.public_ids, self.entries)
+        )
+
+    def test_streams(self):
+        """Should stream every entry in chunks"""
+        listed = [entry for _, _, chunk in DBUtilsData.stream_list(self.user_id, 2) for entry in chunk]
+        streamed = [entry for _, _, chunk in DBUtilsData.stream_entries(self.user_id, 2) for entry in chunk]
+
+        assert sorted(listed) == sorted(
+            (public_id, entry_name) for public_id, (entry_name, _) in zip(self.public_ids, self.entries)
+        )
+        assert sorted(streamed) == sorted(
+            (public_id, entry_name, entry_data)
+            for public_id, (entry_name, entry_data) in zip(self.public_ids, self.entries)
+        )
+
+
 if __name__ == '__main__':
     pytest.main(['-v', __file__])
@@ -11,6 +11,7 @@ sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__f
 from mock_classes import _MockSession, _MockQuery
 from enums.failure_reason import FailureReason
 from utils.db_utils_password import DBUtilsPassword
+from utils.db_utils_data import DBUtilsData
 from database.database_setup import DatabaseSetup
 from database.database_models import User, AuthEphemeral, LoginSession, SecureData
 
@@ -18,580 +19,10 @@ from database.database_models import User, AuthEphemeral, LoginSession, SecureDa
 class TestCleanPasswordChange():
     """Test cases for database utils password clean password change function"""
 
-    def test_user_password_change_set_to_false(self):
-        """Should change user password change status to false"""
-        mock_session = _MockSession()
-
-        fake_user = User(
-            id=123456,
-            username_hash=b'fake_hash',
-            srp_salt=b'fake_srp_salt',
-            srp_verifier=b'fake_srp_verifier',
-            master_key_salt=b'fake_master_key_salt',
-            password_change=True,
-            new_srp_salt=b'new_fake_srp_salt',
-            new_srp_verifier=b'new_fake_srp_verifier',
-            new_master_key_salt=b'new_fake_master_key_salt',
-            auth_ephemerals=[],
-            login_sessions=[],
-            secure_data=[]
-        )
-
-        DBUtilsPassword.clean_password_change(
-            db_session=mock_session, # type: ignore
-            user=fake_user
-        )
-
-        assert fake_user.password_change == False
-        assert fake_user.new_srp_salt == None
-        assert fake_user.new_srp_verifier == None
-        assert fake_user.new_master_key_salt == None
-
-    def test_delete_auth_ephemeral(self):
-        """Should delete any password change auth ephemerals"""
-        mock_session = _MockSession()
-
-        ephemeral = AuthEphemeral(
-            user_id=1,
-            public_id="valid_password_ephemeral",
-            eph_private_b=b'fake_eph_private_b',
-            eph_public_b=b'fake_eph_public_b',
-            expiry_time=datetime.now() + timedelta(hours=1),
-            password_change=True
-        )
-
-        fake_user = User(
-            id=123456,
-            username_hash=b'fake_hash',
-            srp_salt=b'fake_srp_salt',
-            srp_verifier=b'fake_srp_verifier',
-            master_key_salt=b'fake_master_key_salt',
-            password_change=True,
-            new_srp_salt=b'new_fake_srp_salt',
-            new_srp_verifier=b'new_fake_srp_verifier',
-            new_master_key_salt=b'new_fake_master_key_salt',
-            auth_ephemerals=[
-                ephemeral
-            ],
-            login_sessions=[],
-            secure_data=[]
-        )
-
-        DBUtilsPassword.clean_password_change(
-            db_session=mock_session, # type: ignore
-            user=fake_user
-        )
-
-        assert len(mock_session._deletes) == 1
-        assert mock_session._deletes[0] == ephemeral
-
-    def test_non_password_ephemerals(self):
-        """Should not delete auth ephemerals that are not password related"""
-        mock_session = _MockSession()
-
-        ephemeral_1 = AuthEphemeral(
-            user_id=1,
-            public_id="valid_password_ephemeral",
-            eph_private_b=b'fake_eph_private_b',
-            eph_public_b=b'fake_eph_public_b',
-            expiry_time=datetime.now() + timedelta(hours=1),
-            password_change=False
-        )
-        ephemeral_2 = AuthEphemeral(
-            user_id=1,
-            public_id="valid_password_ephemeral",
-            eph_private_b=b'fake_eph_private_b',
-            eph_public_b=b'fake_eph_public_b',
-            expiry_time=datetime.now() + timedelta(hours=1),
-            password_change=False
-        )
-        ephemeral_3 = AuthEphemeral(
-            user_id=1,
-            public_id="valid_password_ephemeral",
-            eph_private_b=b'fake_eph_private_b',
-            eph_public_b=b'fake_eph_public_b',
-            expiry_time=datetime.now() + timedelta(hours=1),
-            password_change=False
-        )
-
-        fake_user = User(
-            id=123456,
-            username_hash=b'fake_hash',
-            srp_salt=b'fake_srp_salt',
-            srp_verifier=b'fake_srp_verifier',
-            master_key_salt=b'fake_master_key_salt',
-            password_change=True,
-            new_srp_salt=b'new_fake_srp_salt',
-            new_srp_verifier=b'new_fake_srp_verifier',
-            new_master_key_salt=b'new_fake_master_key_salt',
-            auth_ephemerals=[
-                ephemeral_1,
-                ephemeral_2,
-                ephemeral_3
-            ],
-            login_sessions=[],
-            secure_data=[]
-        )
-
-        DBUtilsPassword.clean_password_change(
-            db_session=mock_session, # type: ignore
-            user=fake_user
-        )
-
-        assert len(mock_session._deletes) == 0
-
-    def test_non_password_ephemeral_among_others(self):
-        """Should delete correct ephemeral in list of others"""
-        mock_session = _MockSession()
-
-        ephemeral_1 = AuthEphemeral(
-            user_id=1,
-            public_id="valid_password_ephemeral",
-            eph_private_b=b'fake_eph_private_b',
-            eph_public_b=b'fake_eph_public_b',
-            expiry_time=datetime.now() + timedelta(hours=1),
-            password_change=False
-        )
-        ephemeral_2 = AuthEphemeral(
-            user_id=1,
-            public_id="valid_password_ephemeral",
-            eph_private_b=b'fake_eph_private_b',
-            eph_public_b=b'fake_eph_public_b',
-            expiry_time=datetime.now() + timedelta(hours=1),
-            password_change=True
-        )
-        ephemeral_3 = AuthEphemeral(
-            user_id=1,
-            public_id="valid_password_ephemeral",
-            eph_private_b=b'fake_eph_private_b',
-            eph_public_b=b'fake_eph_public_b',
-            expiry_time=datetime.now() + timedelta(hours=1),
-            password_change=False
-        )
-
-        fake_user = User(
-            id=123456,
-            username_hash=b'fake_hash',
-            srp_salt=b'fake_srp_salt',
-            srp_verifier=b'fake_srp_verifier',
-            master_key_salt=b'fake_master_key_salt',
-            password_change=True,
-            new_srp_salt=b'new_fake_srp_salt',
-            new_srp_verifier=b'new_fake_srp_verifier',
-            new_master_key_salt=b'new_fake_master_key_salt',
-            auth_ephemerals=[
-                ephemeral_1,
-                ephemeral_2,
-                ephemeral_3
-            ],
-            login_sessions=[],
-            secure_data=[]
-        )
-
-        DBUtilsPassword.clean_password_change(
-            db_session=mock_session, # type: ignore
-            user=fake_user
-        )
-
-        assert len(mock_session._deletes) == 1
-        assert mock_session._deletes[0] == ephemeral_2
-
-    def test_delete_password_session(self):
-        """Should delete any password change login session"""
-        mock_session = _MockSession()
-
-        login_session = LoginSession(
-            user_id=123456,
-            public_id="session_fake_public_id",
-            session_key=b'fake_session_key',
-            request_count=3,
-            last_used=datetime.now() - timedelta(hours=1),
-            maximum_requests=None,
-            expiry_time=datetime.now() + timedelta(hours=1),
-            password_change=True
-        )
-
-        fake_user = User(
-            id=123456,
-            username_hash=b'fake_hash',
-            srp_salt=b'fake_srp_salt',
-            srp_verifier=b'fake_srp_verifier',
-            master_key_salt=b'fake_master_key_salt',
-            password_change=True,
-            new_srp_salt=b'new_fake_srp_salt',
-            new_srp_verifier=b'new_fake_srp_verifier',
-            new_master_key_salt=b'new_fake_master_key_salt',
-            auth_ephemerals=[],
-            login_sessions=[
-                login_session
-            ],
-            secure_data=[]
-        )
-
-        DBUtilsPassword.clean_password_change(
-            db_session=mock_session, # type: ignore
-            user=fake_user
-        )
-
-        assert len(mock_session._deletes) == 1
-        assert mock_session._deletes[0] == login_session
-
-    def test_non_password_sessions(self):
-        """Should not delete login sessions that are not password related"""
-        mock_session = _MockSession()
-
-        login_session_1 = LoginSession(
-            user_id=123456,
-            public_id="session_fake_public_id",
-            session_key=b'fake_session_key',
-            request_count=3,
-            last_used=datetime.now() - timedelta(hours=1),
-            maximum_requests=None,
-            expiry_time=datetime.now() + timedelta(hours=1),
-            password_change=False
-        )
-        login_session_2 = LoginSession(
-            user_id=123456,
-            public_id="session_fake_public_id",
-            session_key=b'fake_session_key',
-            request_count=3,
-            last_used=datetime.now() - timedelta(hours=1),
-            maximum_requests=None,
-            expiry_time=datetime.now() + timedelta(hours=1),
-            password_change=False
-        )
-        login_session_3 = LoginSession(
-            user_id=123456,
-            public_id="session_fake_public_id",
-            session_key=b'fake_session_key',
-            request_count=3,
-            last_used=datetime.now() - timedelta(hours=1),
-            maximum_requests=None,
-            expiry_time=datetime.now() + timedelta(hours=1),
-            password_change=False
-        )
-
-        fake_user = User(
-            id=123456,
-            username_hash=b'fake_hash',
-            srp_salt=b'fake_srp_salt',
-            srp_verifier=b'fake_srp_verifier',
-            master_key_salt=b'fake_master_key_salt',
-            password_change=True,
-            new_srp_salt=b'new_fake_srp_salt',
-            new_srp_verifier=b'new_fake_srp_verifier',
-            new_master_key_salt=b'new_fake_master_key_salt',
-            auth_ephemerals=[],
-            login_sessions=[
-                login_session_1,
-                login_session_2,
-                login_session_3
-            ],
-            secure_data=[]
-        )
-
-        DBUtilsPassword.clean_password_change(
-            db_session=mock_session, # type: ignore
-            user=fake_user
-        )
-
-        assert len(mock_session._deletes) == 0
-
-    def test_non_password_session_among_others(self):
-        """Should delete correct session in list of others"""
-        mock_session = _MockSession()
-
-        login_session_1 = LoginSession(
-            user_id=123456,
-            public_id="session_fake_public_id",
-            session_key=b'fake_session_key',
-            request_count=3,
-            last_used=datetime.now() - timedelta(hours=1),
-            maximum_requests=None,
-            expiry_time=datetime.now() + timedelta(hours=1),
-            password_change=False
-        )
-        login_session_2 = LoginSession(
-            user_id=123456,
-            public_id="session_fake_public_id",
-            session_key=b'fake_session_key',
-            request_count=3,
-            last_used=datetime.now() - timedelta(hours=1),
-            maximum_requests=None,
-            expiry_time=datetime.now() + timedelta(hours=1),
-            password_change=True
-        )
-        login_session_3 = LoginSession(
-            user_id=123456,
-            public_id="session_fake_public_id",
-            session_key=b'fake_session_key',
-            request_count=3,
-            last_used=datetime.now() - timedelta(hours=1),
-            maximum_requests=None,
-            expiry_time=datetime.now() + timedelta(hours=1),
-            password_change=False
-        )
-
-        fake_user = User(
-            id=123456,
-            username_hash=b'fake_hash',
-            srp_salt=b'fake_srp_salt',
-            srp_verifier=b'fake_srp_verifier',
-            master_key_salt=b'fake_master_key_salt',
-            password_change=True,
-            new_srp_salt=b'new_fake_srp_salt',
-            new_srp_verifier=b'new_fake_srp_verifier',
-            new_master_key_salt=b'new_fake_master_key_salt',
-            auth_ephemerals=[],
-            login_sessions=[
-                login_session_1,
-                login_session_2,
-                login_session_3
-            ],
-            secure_data=[]
-        )
-
-        DBUtilsPassword.clean_password_change(
-            db_session=mock_session, # type: ignore
-            user=fake_user
-        )
-
-        assert len(mock_session._deletes) == 1
-        assert mock_session._deletes[0] == login_session_2
-
-    def test_remove_details_from_completed_data(self):
-        """Should remove new password details from all sessions"""
-        mock_session = _MockSession()
-
-        secure_data = SecureData(
-            user_id=123456,
-            public_id="fake_public_id",
-            entry_name=b'fake_entry_name',
-            entry_data=b'fake_entry_data',
-            new_entry_name=b'new_fake_entry_name',
-            new_entry_data=b'new_fake_entry_data'
-        )
-
-        fake_user = User(
-            id=123456,
-            username_hash=b'fake_hash',
-            srp_salt=b'fake_srp_salt',
-            srp_verifier=b'fake_srp_verifier',
-            master_key_salt=b'fake_master_key_salt',
-            password_change=True,
-            new_srp_salt=b'new_fake_srp_salt',
-            new_srp_verifier=b'new_fake_srp_verifier',
-            new_master_key_salt=b'new_fake_master_key_salt',
-            auth_ephemerals=[],
-            login_sessions=[],
-            secure_data=[
-                secure_data
-            ]
-        )
-
-        DBUtilsPassword.clean_password_change(
-            db_session=mock_session, # type: ignore
-            user=fake_user
-        )
-
-        assert len(mock_session._deletes) == 0
-        assert secure_data.new_entry_name == None
-        assert secure_data.new_entry_data == None
-        assert secure_data.user_id == 123456
-        assert secure_data.public_id == "fake_public_id"
-        assert secure_data.entry_name == b'fake_entry_name'
-        assert secure_data.entry_data == b'fake_entry_data'
-
-    def test_multiple_secure_data_entries(self):
-        """Should remove data from all secure data in a list"""
-        mock_session = _MockSession()
-
-        secure_data_1 = SecureData(
-            user_id=123456,
-            public_id="fake_public_id",
-            entry_name=b'fake_entry_name',
-            entry_data=b'fake_entry_data',
-            new_entry_name=b'new_fake_entry_name',
-            new_entry_data=b'new_fake_entry_data'
-        )
-        secure_data_2 = SecureData(
-            user_id=123456,
-            public_id="fake_public_id",
-            entry_name=b'fake_entry_name',
-            entry_data=b'fake_entry_data',
-            new_entry_name=b'new_fake_entry_name',
-            new_entry_data=b'new_fake_entry_data'
-        )
-        secure_data_3 = SecureData(
-            user_id=123456,
-            public_id="fake_public_id",
-            entry_name=b'fake_entry_name',
-            entry_data=b'fake_entry_data',
-            new_entry_name=b'new_fake_entry_name',
-            new_entry_data=b'new_fake_entry_data'
-        )
-
-        fake_user = User(
-            id=123456,
-            username_hash=b'fake_hash',
-            srp_salt=b'fake_srp_salt',
-            srp_verifier=b'fake_srp_verifier',
-            master_key_salt=b'fake_master_key_salt',
-            password_change=True,
-            new_srp_salt=b'new_fake_srp_salt',
-            new_srp_verifier=b'new_fake_srp_verifier',
-            new_master_key_salt=b'new_fake_master_key_salt',
-            auth_ephemerals=[],
-            login_sessions=[],
-            secure_data=[
-                secure_data_1,
-                secure_data_2,
-                secure_data_3
-            ]
-        )
-
-        DBUtilsPassword.clean_password_change(
-            db_session=mock_session, # type: ignore
-            user=fake_user
-        )
-
-        assert len(mock_session._deletes) == 0
-        assert secure_data_1.new_entry_name == None
-        assert secure_data_1.new_entry_data == None
-        assert secure_data_2.new_entry_name == None
-        assert secure_data_2.new_entry_data == None
-        assert secure_data_3.new_entry_name == None
-        assert secure_data_3.new_entry_data == None
-
-    def test_multiple_incomplete_secure_data_entries(self):
-        """Should not adjust data content of non password secure data"""
-        mock_session = _MockSession()
-
-        secure_data = SecureData(
-            user_id=123456,
-            public_id="fake_public_id",
-            entry_name=b'fake_entry_name',
-            entry_data=b'fake_entry_data',
-            new_entry_name=None,
-            new_entry_data=None
-        )
-
-        fake_user = User(
-            id=123456,
-            username_hash=b'fake_hash',
-            srp_salt=b'fake_srp_salt',
-            srp_verifier=b'fake_srp_verifier',
-            master_key_salt=b'fake_master_key_salt',
-            password_change=True,
-            new_srp_salt=b'new_fake_srp_salt',
-            new_srp_verifier=b'new_fake_srp_verifier',
-            new_master_key_salt=b'new_fake_master_key_salt',
-            auth_ephemerals=[],
-            login_sessions=[],
-            secure_data=[
-                secure_data
-            ]
-        )
-
-        DBUtilsPassword.clean_password_change(
-            db_session=mock_session, # type: ignore
-            user=fake_user
-        )
-
-        assert len(mock_session._deletes) == 0
-        assert secure_data.new_entry_name == None
-        assert secure_data.new_entry_data == None
-        assert secure_data.user_id == 123456
-        assert secure_data.public_id == "fake_public_id"
-        assert secure_data.entry_name == b'fake_entry_name'
-        assert secure_data.entry_data == b'fake_entry_data'
-
-    def test_mix_of_details(self):
-        """Should delete the correct entries, ignoring the rest"""
-        mock_session = _MockSession()
-
-        ephemeral_1 = AuthEphemeral(
-            user_id=1,
-            public_id="valid_password_ephemeral",
-            eph_private_b=b'fake_eph_private_b',
-            eph_public_b=b'fake_eph_public_b',
-            expiry_time=datetime.now() + timedelta(hours=1),
-            password_change=False
-        )
-        ephemeral_2 = AuthEphemeral(
-            user_id=1,
-            public_id="valid_password_ephemeral",
-            eph_private_b=b'fake_eph_private_b',
-            eph_public_b=b'fake_eph_public_b',
-            expiry_time=datetime.now() + timedelta(hours=1),
-            password_change=True
-        )
-        ephemeral_3 = AuthEphemeral(
-            user_id=1,
-            public_id="valid_password_ephemeral",
-            eph_private_b=b'fake_eph_private_b',
-            eph_public_b=b'fake_eph_public_b',
-            expiry_time=datetime.now() + timedelta(hours=1),
-            password_change=False
-        )
-
-        login_session_1 = LoginSession(
-            user_id=123456,
-            public_id="session_fake_public_id",
-            session_key=b'fake_session_key',
-            request_count=3,
-            last_used=datetime.now() - timedelta(hours=1),
-            maximum_requests=None,
-            expiry_time=datetime.now() + timedelta(hours=1),
-            password_change=False
-        )
-        login_session_2 = LoginSession(
-            user_id=123456,
-            public_id="session_fake_public_id",
-            session_key=b'fake_session_key',
-            request_count=3,
-            last_used=datetime.now() - timedelta(hours=1),
-            maximum_requests=None,
-            expiry_time=datetime.now() + timedelta(hours=1),
-            password_change=True
-        )
-        login_session_3 = LoginSession(
-            user_id=123456,
-            public_id="session_fake_public_id",
-            session_key=b'fake_session_key',
-            request_count=3,
-            last_used=datetime.now() - timedelta(hours=1),
-            maximum_requests=None,
-            expiry_time=datetime.now() + timedelta(hours=1),
-            password_change=False
-        )
-
-        secure_data_1 = SecureData(
-            user_id=123456,
-            public_id="fake_public_id",
-            entry_name=b'fake_entry_name',
-            entry_data=b'fake_entry_data',
-            new_entry_name=None,
-            new_entry_data=None
-        )
-        secure_data_2 = SecureData(
-            user_id=123456,
-            public_id="fake_public_id",
-            entry_name=b'fake_entry_name',
-            entry_data=b'fake_entry_data',
-            new_entry_name=b'new_fake_entry_name',
-            new_entry_data=b'new_fake_entry_data'
-        )
-        secure_data_3 = SecureData(
-            user_id=123456,
-            public_id="fake_public_id",
-            entry_name=b'fake_entry_name',
-            entry_data=b'fake_entry_data',
-            new_entry_name=b'new_fake_entry_name',
-            new_entry_data=b'new_fake_entry_data'
-        )
-
-        fake_user = User(
+    @pytest.fixture(autouse=True)
+    def setup_teardown(self):
+        self.mock_session = _MockSession()
+        self.fake_user = User(
             id=123456,
             username_hash=b'fake_hash',
             srp_salt=b'fake_srp_salt',
@@ -600,43 +31,152 @@ class TestCleanPasswordChange():
             password_change=True,
             new_srp_salt=b'new_fake_srp_salt',
             new_srp_verifier=b'new_fake_srp_verifier',
-            new_master_key_salt=b'new_fake_master_key_salt',
-            auth_ephemerals=[
-                ephemeral_1,
-                ephemeral_2,
-                ephemeral_3
-            ],
-            login_sessions=[
-                login_session_1,
-                login_session_2,
-                login_session_3
-            ],
-            secure_data=[
-                secure_data_1,
-                secure_data_2,
-                secure_data_3
-            ]
+            new_master_key_salt=b'new_fake_master_key_salt'
         )
 
+        yield
+
+    def test_user_password_change_set_to_false(self):
+        """Should change user password change status to false"""
         DBUtilsPassword.clean_password_change(
-            db_session=mock_session, # type: ignore
-            user=fake_user
+            db_session=self.mock_session, # type: ignore
+            user=self.fake_user
         )
 
-        assert fake_user.password_change == False
-        assert fake_user.new_srp_salt == None
-        assert fake_user.new_srp_verifier == None
-        assert fake_user.new_master_key_salt == None
+        assert self.fake_user.password_change == False
+        assert self.fake_user.new_srp_salt == None
+        assert self.fake_user.new_srp_verifier == None
+        assert self.fake_user.new_master_key_salt == None
+
+    def test_bulk_statements_only(self):
+        """Should clean in three bulk statements, without loading or deleting any object"""
+        DBUtilsPassword.clean_password_change(
+            db_session=self.mock_session, # type: ignore
+            user=self.fake_user
+        )
 
-        assert len(mock_session._deletes) == 2
-        assert ephemeral_2 in mock_session._deletes
-        assert login_session_2 in mock_session._deletes
-        assert secure_data_1.new_entry_name == None
-        assert secure_data_1.new_entry_data == None
-        assert secure_data_2.new_entry_name == None
-        assert secure_data_2.new_entry_data == None
-        assert secure_data_3.new_entry_name == None
-        assert secure_data_3.new_entry_data == None
+        assert len(self.mock_session._deletes) == 0
+        assert len(self.mock_session._executed) == 3
+        assert all(params is None for _, params in self.mock_session._executed)
+
+    def test_expires_user_collections(self):
+        """Should expire the collections of the user, rather than load them"""
+        DBUtilsPassword.clean_password_change(
+            db_session=self.mock_session, # type: ignore
+            user=self.fake_user
+        )
+
+        assert self.mock_session._expired == [
+            (self.fake_user, ["auth_ephemerals", "login_sessions", "secure_data"])
+        ]
+
+
+class TestCleanPasswordChangeDatabase():
+    """Test cases for database utils password clean password change function, against each real database backend"""
+
+    @pytest.fixture(autouse=True)
+    def setup_teardown(self, real_database):
+
+        with DatabaseSetup.get_db_session() as session:
+            for username_hash in (b'fake_hash', b'other_hash'):
+                user = User(
+                    username_hash=username_hash,
+                    srp_salt=b'fake_srp_salt',
+                    srp_verifier=b'fake_srp_verifier',
+                    master_key_salt=b'fake_master_key_salt',
+                    password_change=True,
+                    new_srp_salt=b'new_srp_salt',
+                    new_srp_verifier=b'new_srp_verifier',
+                    new_master_key_salt=b'new_master_key_salt'
+                )
+                for password_change in (True, False):
+                    session.add(AuthEphemeral(
+                        user=user,
+                        eph_private_b=b'fake_eph_private_b',
+                        eph_public_b=b'fake_eph_public_b',
+                        expiry_time=datetime.now() + timedelta(hours=1),
+                        password_change=password_change
+                    ))
+                    session.add(LoginSession(
+                        user=user,
+                        session_key=username_hash + b'_session_key_%d' % password_change,
+                        request_count=0,
+                        last_used=datetime.now(),
+                        password_change=password_change
+                    ))
+                    session.add(SecureData(
+                        user=user,
+                        entry_name=b'entry_name',
+                        entry_data=b'entry_data',
+                        new_entry_name=b'new_entry_name' if password_change else None,
+                        new_entry_data=b'new_entry_data' if password_change else None
+                    ))
+            session.flush()
+            self.user_id, self.other_user_id = (
+                session.query(User.id).filter(User.username_hash == username_hash).scalar()
+                for username_hash in (b'fake_hash', b'other_hash')
+            )
+
+        yield
+
+    def _rows(self, user_id):
+        """Helper function to read the password change state of a user's rows"""
+        with DatabaseSetup.get_db_session() as session:
+            return (
+                sorted(session.query(AuthEphemeral.password_change).filter(AuthEphemeral.user_id == user_id).all()),
+                sorted(session.query(LoginSession.password_change).filter(LoginSession.user_id == user_id).all()),
+                sorted(
+                    session.query(SecureData.new_entry_name, SecureData.new_entry_data)
+                    .filter(SecureData.user_id == user_id)
+                    .all(),
+                    key=lambda row: row[0] or b''
+                )
+            )
+
+    def test_cleans_rows(self):
+        """Should delete the user's password change ephemerals and sessions, and clear their new entry details"""
+        with DatabaseSetup.get_db_session() as session:
+            user = session.query(User).filter(User.id == self.user_id).one()
+            DBUtilsPassword.clean_password_change(session, user)
+
+        assert self._rows(self.user_id) == ([(False,)], [(False,)], [(None, None), (None, None)])
+        with DatabaseSetup.get_db_session() as session:
+            user = session.query(User).filter(User.id == self.user_id).one()
+            assert user.password_change is False
+            assert user.new_srp_salt is None
+            assert user.new_srp_verifier is None
+            assert user.new_master_key_salt is None
+
+    def test_leaves_other_users(self):
+        """Should not change the rows of any other user"""
+        before = self._rows(self.other_user_id)
+
+        with DatabaseSetup.get_db_session() as session:
+            user = session.query(User).filter(User.id == self.user_id).one()
+            DBUtilsPassword.clean_password_change(session, user)
+
+        assert self._rows(self.other_user_id) == before
+        assert before[0] == [(False,), (True,)]
+
+    def test_identity_map_kept_consistent(self):
+        """Should remove the deleted objects from the session, clear the held entries, and reload the collections"""
+        with DatabaseSetup.get_db_session() as session:
+            user = session.query(User).filter(User.id == self.user_id).one()
+            auth_ephemerals = {auth.password_change: auth for auth in user.auth_ephemerals}
+            login_sessions = {login.password_change: login for login in user.login_sessions}
+            secure_data = {bool(data.new_entry_name): data for data in user.secure_data}
+
+            DBUtilsPassword.clean_password_change(session, user)
+
+            assert auth_ephemerals[True] not in session
+            assert login_sessions[True] not in session
+            assert auth_ephemerals[False] in session
+            assert login_sessions[False] in session
+            assert secure_data[True].new_entry_name is None
+            assert secure_data[True].new_entry_data is None
+            assert user.auth_ephemerals == [auth_ephemerals[False]]
+            assert user.login_sessions == [login_sessions[False]]
+            assert len(user.secure_data) == 2
 
 
 class TestStart():
@@ -1488,8 +1028,9 @@ class TestCommit():
         )
 
         mock_query = _MockQuery([fake_user])
-        def fake_query(self, model):
-            return mock_query
+        count_query = _MockQuery([0])
+        def fake_query(self, *entities):
+            return mock_query if entities[0] is User else count_query
         monkeypatch.setattr(_MockSession, "query", fake_query)
 
         response = DBUtilsPassword.commit(
@@ -1515,88 +1056,8 @@ class TestCommit():
         assert str(condition.left.name) == "id"
         assert condition.right.value == 123456
 
-    def test_deletes_password_session(self, monkeypatch):
-        """Should delete the change_password login session"""
-        mock_session = _MockSession()
-
-        @contextmanager
-        def mock_get_db_session():
-            try:
-                yield mock_session
-                mock_session.commit()
-            except Exception:
-                mock_session.rollback()
-                raise
-            finally:
-                mock_session.close()
-        monkeypatch.setattr(DatabaseSetup, "get_db_session", mock_get_db_session)
-
-        login_session_1 = LoginSession(
-            user_id=123456,
-            public_id="session_fake_public_id",
-            session_key=b'fake_session_key',
-            request_count=3,
-            last_used=datetime.now() - timedelta(hours=1),
-            maximum_requests=None,
-            expiry_time=datetime.now() + timedelta(hours=1),
-            password_change=False
-        )
-        login_session_2 = LoginSession(
-            user_id=123456,
-            public_id="session_fake_public_id",
-            session_key=b'fake_session_key',
-            request_count=3,
-            last_used=datetime.now() - timedelta(hours=1),
-            maximum_requests=None,
-            expiry_time=datetime.now() + timedelta(hours=1),
-            password_change=False
-        )
-        login_session_3 = LoginSession(
-            user_id=123456,
-            public_id="session_fake_public_id",
-            session_key=b'fake_session_key',
-            request_count=3,
-            last_used=datetime.now() - timedelta(hours=1),
-            maximum_requests=None,
-            expiry_time=datetime.now() + timedelta(hours=1),
-            password_change=False
-        )
-
-        fake_user = User(
-            id=123456,
-            username_hash=b'fake_hash',
-            srp_salt=b'fake_srp_salt',
-            srp_verifier=b'fake_srp_verifier',
-            master_key_salt=b'fake_master_key_salt',
-            password_change=True,
-            new_srp_salt=b'new_fake_srp_salt',
-            new_srp_verifier=b'new_fake_srp_verifier',
-            new_master_key_salt=b'new_fake_master_key_salt',
-            auth_ephemerals=[],
-            login_sessions=[
-                login_session_1,
-                login_session_2,
-                login_session_3
-            ],
-            secure_data=[]
-        )
-
-        mock_query = _MockQuery([fake_user])
-        def fake_query(self, model):
-            return mock_query
-        monkeypatch.setattr(_MockSession, "query", fake_query)
-
-        response = DBUtilsPassword.commit(
-            user_id=123456
-        )
-
-        assert len(mock_session._deletes) == 3
-        assert login_session_1 in mock_session._deletes
-        assert login_session_2 in mock_session._deletes
-        assert login_session_3 in mock_session._deletes
-
-    def test_updates_secure_data_entries(self, monkeypatch):
-        """Should move new encrypted data into current slots"""
+    def test_deletes_login_sessions(self, monkeypatch):
+        """Should delete every login session of the user in one statement"""
         mock_session = _MockSession()
 
         @contextmanager
@@ -1611,42 +1072,6 @@ class TestCommit():
                 mock_session.close()
         monkeypatch.setattr(DatabaseSetup, "get_db_session", mock_get_db_session)
 
-        login_session = LoginSession(
-            user_id=123456,
-            public_id="session_fake_public_id",
-            session_key=b'fake_session_key',
-            request_count=3,
-            last_used=datetime.now() - timedelta(hours=1),
-            maximum_requests=None,
-            expiry_time=datetime.now() + timedelta(hours=1),
-            password_change=True
-        )
-
-        secure_data_1 = SecureData(
-            user_id=123456,
-            public_id="fake_public_id_1",
-            entry_name=b'fake_entry_name',
-            entry_data=b'fake_entry_data',
-            new_entry_name="new_fake_entry_name_1",
-            new_entry_data="new_fake_entry_data_1"
-        )
-        secure_data_2 = SecureData(
-            user_id=123456,
-            public_id="fake_public_id_2",
-            entry_name=b'fake_entry_name',
-            entry_data=b'fake_entry_data',
-            new_entry_name="new_fake_entry_name_2",
-            new_entry_data="new_fake_entry_data_2"
-        )
-        secure_data_3 = SecureData(
-            user_id=123456,
-            public_id="fake_public_id_3",
-            entry_name=b'fake_entry_name',
-            entry_data=b'fake_entry_data',
-            new_entry_name="new_fake_entry_name_3",
-            new_entry_data="new_fake_entry_data_3"
-        )
-
         fake_user = User(
             id=123456,
             username_hash=b'fake_hash',
@@ -1656,44 +1081,28 @@ class TestCommit():
             password_change=True,
             new_srp_salt=b'new_fake_srp_salt',
             new_srp_verifier=b'new_fake_srp_verifier',
-            new_master_key_salt=b'new_fake_master_key_salt',
-            auth_ephemerals=[],
-            login_sessions=[
-                login_session
-            ],
-            secure_data=[
-                secure_data_1,
-                secure_data_2,
-                secure_data_3
-            ]
+            new_master_key_salt=b'new_fake_master_key_salt'
         )
 
         mock_query = _MockQuery([fake_user])
-        def fake_query(self, model):
-            return mock_query
+        count_query = _MockQuery([0])
+        def fake_query(self, *entities):
+            return mock_query if entities[0] is User else count_query
         monkeypatch.setattr(_MockSession, "query", fake_query)
 
         response = DBUtilsPassword.commit(
             user_id=123456
         )
 
-        assert secure_data_1.public_id == "fake_public_id_1"
-        assert secure_data_1.entry_name == "new_fake_entry_name_1"
-        assert secure_data_1.entry_data == "new_fake_entry_data_1"
-        assert secure_data_1.new_entry_name == None
-        assert secure_data_1.new_entry_data == None
-
-        assert secure_data_2.public_id == "fake_public_id_2"
-        assert secure_data_2.entry_name == "new_fake_entry_name_2"
-        assert secure_data_2.entry_data == "new_fake_entry_data_2"
-        assert secure_data_2.new_entry_name == None
-        assert secure_data_2.new_entry_data == None
+        assert response == (True, None)
+        assert len(mock_session._deletes) == 0
 
-        assert secure_data_3.public_id == "fake_public_id_3"
-        assert secure_data_3.entry_name == "new_fake_entry_name_3"
-        assert secure_data_3.entry_data == "new_fake_entry_data_3"
-        assert secure_data_3.new_entry_name == None
-        assert secure_data_3.new_entry_data == None
+        statement = mock_session._executed[1][0]
+        assert statement.is_delete
+        assert statement.table.name == "login"
+        condition = statement.whereclause
+        assert str(condition.left.name) == "user_id"
+        assert condition.right.value == 123456
 
     def test_password_change_incomplete_srp(self, monkeypatch):
         """Should fail if any srp details yet incomplete, and call clean_password_change"""
@@ -1740,8 +1149,9 @@ class TestCommit():
         )
 
         mock_query = _MockQuery([fake_user])
-        def fake_query(self, model):
-            return mock_query
+        count_query = _MockQuery([0])
+        def fake_query(self, *entities):
+            return mock_query if entities[0] is User else count_query
         monkeypatch.setattr(_MockSession, "query", fake_query)
 
         called = {"cleaned": False, "user": None}
@@ -1837,8 +1247,9 @@ class TestCommit():
         )
 
         mock_query = _MockQuery([fake_user])
-        def fake_query(self, model):
-            return mock_query
+        count_query = _MockQuery([1])
+        def fake_query(self, *entities):
+            return mock_query if entities[0] is User else count_query
         monkeypatch.setattr(_MockSession, "query", fake_query)
 
         called = {"cleaned": False, "user": None}
@@ -1860,6 +1271,9 @@ class TestCommit():
         assert called["cleaned"] == True
         assert called["user"] == fake_user
 
+        assert fake_user.srp_salt == b'fake_srp_salt'
+        assert len(mock_session._executed) == 0
+
     def test_handles_entry_not_found(self, monkeypatch):
         """Should return correct failure reason if entry is not found"""
         mock_session = _MockSession()
@@ -2175,11 +1589,15 @@ class TestUpdate():
         assert secure_data.new_entry_name == b'new_fake_entry_name'
         assert secure_data.new_entry_data == b'new_fake_entry_data'
 
-        assert len(mock_query._filters) == 1
+        assert len(mock_query._filters) == 2
         condition = mock_query._filters[0]
         assert isinstance(condition, BinaryExpression)
         assert str(condition.left.name) == "public_id"
         assert condition.right.value == "fake_public_id"
+        condition = mock_query._filters[1]
+        assert isinstance(condition, BinaryExpression)
+        assert str(condition.left.name) == "user_id"
+        assert condition.right.value == 123456
 
     def test_handles_already_completed_secure_data(self, monkeypatch):
         """Should correctly handle case when secure data is already completed"""
@@ -2284,11 +1702,15 @@ class TestUpdate():
         assert mock_session.rollbacks == 0
         assert mock_session.closed is True
 
-        assert len(mock_query._filters) == 1
+        assert len(mock_query._filters) == 2
         condition = mock_query._filters[0]
         assert isinstance(condition, BinaryExpression)
         assert str(condition.left.name) == "public_id"
         assert condition.right.value == "fake_public_id"
+        condition = mock_query._filters[1]
+        assert isinstance(condition, BinaryExpression)
+        assert str(condition.left.name) == "user_id"
+        assert condition.right.value == 123456
 
     def test_handles_database_unprepared_failure(self, monkeypatch):
         """Should return correct failure reason if database is not setup"""
@@ -2383,7 +1805,7 @@ class TestUpdate():
             user=fake_user
         )
 
-        mock_query = _MockQuery([secure_data])
+        mock_query = _MockQuery([])
         def fake_query(self, model):
             return mock_query
         monkeypatch.setattr(_MockSession, "query", fake_query)
@@ -2402,6 +1824,340 @@ class TestUpdate():
         assert response[0] == False
         assert response[1] == FailureReason.NOT_FOUND
 
+        assert len(mock_query._filters) == 2
+        condition = mock_query._filters[0]
+        assert isinstance(condition, BinaryExpression)
+        assert str(condition.left.name) == "public_id"
+        assert condition.right.value == "fake_public_id"
+        condition = mock_query._filters[1]
+        assert isinstance(condition, BinaryExpression)
+        assert str(condition.left.name) == "user_id"
+        assert condition.right.value == 654321
+
+
+class TestUpdateMany():
+    """Test cases for database utils password update many function"""
+
+    @pytest.fixture(autouse=True)
+    def setup_teardown(self, monkeypatch):
+        self.mock_session = _MockSession()
+
+        @contextmanager
+        def mock_get_db_session():
+            try:
+                yield self.mock_session
+                self.mock_session.commit()
+            except Exception:
+                self.mock_session.rollback()
+                raise
+            finally:
+                self.mock_session.close()
+        monkeypatch.setattr(DatabaseSetup, "get_db_session", mock_get_db_session)
+
+        self.fake_user = User(
+            id=123456,
+            username_hash=b'fake_hash',
+            srp_salt=b'fake_srp_salt',
+            srp_verifier=b'fake_srp_verifier',
+            master_key_salt=b'fake_master_key_salt',
+            password_change=True
+        )
+
+        self.user_query = _MockQuery([self.fake_user])
+        self.entry_query = _MockQuery([
+            (1, "fake_public_id_a", False),
+            (2, "fake_public_id_b", False)
+        ])
+        def fake_query(session, *entities):
+            return self.user_query if entities[0] is User else self.entry_query
+        monkeypatch.setattr(_MockSession, "query", fake_query)
+
+        self.cleaned = []
+        def fake_clean_password(db_session, user):
+            self.cleaned.append(user)
+        monkeypatch.setattr(DBUtilsPassword, "clean_password_change", fake_clean_password)
+
+        yield
+
+    def test_nominal_case(self):
+        """Should set the new entries of every entry by primary key, in one statement"""
+        response = DBUtilsPassword.update_many(
+            user_id=123456,
+            entries=[
+                ("fake_public_id_b", b'new_name_b', b'new_data_b'),
+                ("fake_public_id_a", b'new_name_a', b'new_data_a')
+            ]
+        )
+
+        assert response == (True, None)
+
+        assert len(self.mock_session._executed) == 1
+        statement, rows = self.mock_session._executed[0]
+        assert statement.is_update
+        assert rows == [
+            {"id": 2, "new_entry_name": b'new_name_b', "new_entry_data": b'new_data_b'},
+            {"id": 1, "new_entry_name": b'new_name_a', "new_entry_data": b'new_data_a'}
+        ]
+        assert self.mock_session.commits == 1
+
+        assert len(self.entry_query._filters) == 2
+        condition = self.entry_query._filters[0]
+        assert isinstance(condition, BinaryExpression)
+        assert str(condition.left.name) == "user_id"
+        assert condition.right.value == 123456
+        condition = self.entry_query._filters[1]
+        assert str(condition.left.name) == "public_id"
+        assert sorted(condition.right.value) == ["fake_public_id_a", "fake_public_id_b"]
+
+    def test_handles_entry_not_found(self):
+        """Should update nothing if any entry is not found for the user"""
+        response = DBUtilsPassword.update_many(
+            user_id=123456,
+            entries=[
+                ("fake_public_id_a", b'new_name_a', b'new_data_a'),
+                ("fake_public_id_c", b'new_name_c', b'new_data_c')
+            ]
+        )
+
+        assert response == (False, FailureReason.NOT_FOUND)
+        assert len(self.mock_session._executed) == 0
+        assert len(self.cleaned) == 0
+
+    def test_handles_already_updated_entry(self):
+        """Should cancel the password change if any entry has already been updated"""
+        self.entry_query._results[1] = (2, "fake_public_id_b", True)
+
+        response = DBUtilsPassword.update_many(
+            user_id=123456,
+            entries=[
+                ("fake_public_id_a", b'new_name_a', b'new_data_a'),
+                ("fake_public_id_b", b'new_name_b', b'new_data_b')
+            ]
+        )
+
+        assert response == (False, FailureReason.ENTRY_UPDATED)
+        assert len(self.mock_session._executed) == 0
+        assert self.cleaned == [self.fake_user]
+
+    def test_handles_repeated_entry(self):
+        """Should cancel the password change if an entry is repeated in the batch"""
+        response = DBUtilsPassword.update_many(
+            user_id=123456,
+            entries=[
+                ("fake_public_id_a", b'new_name_a', b'new_data_a'),
+                ("fake_public_id_a", b'new_name_b', b'new_data_b')
+            ]
+        )
+
+        assert response == (False, FailureReason.ENTRY_UPDATED)
+        assert len(self.mock_session._executed) == 0
+        assert self.cleaned == [self.fake_user]
+
+    def test_empty_batch(self):
+        """Should not issue an update for an empty batch"""
+        self.entry_query._results = []
+
+        response = DBUtilsPassword.update_many(
+            user_id=123456,
+            entries=[]
+        )
+
+        assert response == (True, None)
+        assert len(self.mock_session._executed) == 0
+
+    def test_too_many(self):
+        """Should reject more entries than the maximum batch size, without opening a session"""
+        response = DBUtilsPassword.update_many(
+            user_id=123456,
+            entries=[("fake_public_id_a", b'new_name', b'new_data')] * (DBUtilsData.MAX_BATCH_SIZE + 1)
+        )
+
+        assert response == (False, FailureReason.TOO_MANY)
+        assert self.mock_session.commits == 0
+
+    def test_handles_database_unprepared_failure(self, monkeypatch):
+        """Should return correct failure reason if database is not setup"""
+        @contextmanager
+        def mock_get_db_session():
+            raise RuntimeError("Database not initialised.")
+            yield
+        monkeypatch.setattr(DatabaseSetup, "get_db_session", mock_get_db_session)
+
+        response = DBUtilsPassword.update_many(
+            user_id=123456,
+            entries=[("fake_public_id_a", b'new_name', b'new_data')]
+        )
+
+        assert response == (False, FailureReason.DATABASE_UNINITIALISED)
+
+    def test_handles_server_exception(self, monkeypatch):
+        """Should roll back and return correct failure reason if other exception seen"""
+        def raise_unknown_exception():
+            raise ValueError("Something went wrong")
+        self.mock_session._on_commit = raise_unknown_exception
+
+        response = DBUtilsPassword.update_many(
+            user_id=123456,
+            entries=[("fake_public_id_a", b'new_name', b'new_data')]
+        )
+
+        assert response == (False, FailureReason.UNKNOWN_EXCEPTION)
+        assert self.mock_session.rollbacks == 1
+
+
+class TestDBUtilsPasswordDatabase():
+    """Test cases for the database utils password change process against each real database backend"""
+
+    @pytest.fixture(autouse=True)
+    def setup_teardown(self, real_database):
+        with DatabaseSetup.get_db_session() as session:
+            user = User(
+                username_hash=b'fake_hash',
+                srp_salt=b'fake_srp_salt',
+                srp_verifier=b'fake_srp_verifier',
+                master_key_salt=b'fake_master_key_salt',
+                password_change=False
+            )
+            session.add(user)
+            session.add(LoginSession(
+                user=user,
+                session_key=b'fake_session_key',
+                request_count=0,
+                last_used=datetime.now(),
+                password_change=False
+            ))
+            session.flush()
+            self.user_id = user.id
+
+        _, _, self.public_ids = DBUtilsData.create_many(
+            self.user_id, [(b'entry_name_%d' % i, b'entry_data_%d' % i) for i in range(3)]
+        )
+
+        yield
+
+    def _start(self):
+        """Helper function to start a password change, returning the public id of its login session"""
+        ok, reason, public_id, master_key_salt = DBUtilsPassword.start(
+            self.user_id,
+            b'eph_private_b',
+            b'eph_public_b',
+            datetime.now() + timedelta(minutes=5),
+            b'new_srp_salt',
+            b'new_srp_verifier',
+            b'new_master_key_salt'
+        )
+        assert (ok, reason, master_key_salt) == (True, None, b'fake_master_key_salt')
+
+        ok, reason, session_public_id, public_ids = DBUtilsPassword.complete(
+            public_id, b'password_session_key', datetime.now() + timedelta(minutes=5)
+        )
+        assert (ok, reason) == (True, None)
+        assert sorted(public_ids) == sorted(self.public_ids)
+        return session_public_id
+
+    def test_password_change(self):
+        """Should swap in the new details and entries, and end every login session of the user"""
+        self._start()
+
+        assert DBUtilsPassword.update(self.user_id, self.public_ids[0], b'new_name_0', b'new_data_0') == (True, None)
+        assert DBUtilsPassword.update_many(self.user_id, [
+            (public_id, b'new_name_%d' % i, b'new_data_%d' % i)
+            for i, public_id in enumerate(self.public_ids[1:], start=1)
+        ]) == (True, None)
+        assert DBUtilsPassword.commit(self.user_id) == (True, None)
+
+        with DatabaseSetup.get_db_session() as session:
+            user = session.query(User).filter(User.id == self.user_id).one()
+            assert (user.password_change, user.srp_salt, user.srp_verifier, user.master_key_salt) == (
+                False, b'new_srp_salt', b'new_srp_verifier', b'new_master_key_salt'
+            )
+            assert (user.new_srp_salt, user.new_srp_verifier, user.new_master_key_salt) == (None, None, None)
+            assert session.query(LoginSession).count() == 0
+            assert session.query(AuthEphemeral).count() == 0
+
+        assert DBUtilsData.get_entries(self.user_id, self.public_ids)[2] == [
+            (public_id, b'new_name_%d' % i, b'new_data_%d' % i) for i, public_id in enumerate(self.public_ids)
+        ]
+
+    def test_commit_swaps_stored_entries(self):
+        """Should store the new ciphertext of every entry and delete the user's login sessions, leaving other users alone"""
+        with DatabaseSetup.get_db_session() as session:
+            other_user = User(
+                username_hash=b'other_hash',
+                srp_salt=b'fake_srp_salt',
+                srp_verifier=b'fake_srp_verifier',
+                master_key_salt=b'fake_master_key_salt',
+                password_change=False
+            )
+            session.add(SecureData(
+                user=other_user,
+                entry_name=b'other_entry_name',
+                entry_data=b'other_entry_data'
+            ))
+            session.add(LoginSession(
+                user=other_user,
+                session_key=b'other_session_key',
+                request_count=0,
+                last_used=datetime.now(),
+                password_change=False
+            ))
+
+            user = session.query(User).filter(User.id == self.user_id).one()
+            user.password_change = True
+            user.new_srp_salt = b'new_srp_salt'
+            user.new_srp_verifier = b'new_srp_verifier'
+            user.new_master_key_salt = b'new_master_key_salt'
+            for secure_data in session.query(SecureData).filter(SecureData.user_id == self.user_id):
+                secure_data.new_entry_name = b'new_' + secure_data.entry_name
+                secure_data.new_entry_data = b'new_' + secure_data.entry_data
+
+        assert DBUtilsPassword.commit(self.user_id) == (True, None)
+
+        with DatabaseSetup.get_db_session() as session:
+            stored = session.query(
+                SecureData.public_id,
+                SecureData.entry_name,
+                SecureData.entry_data,
+                SecureData.new_entry_name,
+                SecureData.new_entry_data
+            ).filter(SecureData.user_id == self.user_id).all()
+            assert sorted(stored) == sorted(
+                (public_id, b'new_entry_name_%d' % i, b'new_entry_data_%d' % i, None, None)
+                for i, public_id in enumerate(self.public_ids)
+            )
+            assert session.query(SecureData.entry_name, SecureData.entry_data).filter(
+                SecureData.user_id != self.user_id
+            ).all() == [(b'other_entry_name', b'other_entry_data')]
+
+            assert session.query(LoginSession).filter(LoginSession.user_id == self.user_id).count() == 0
+            assert [session_key for session_key, in session.query(LoginSession.session_key).all()] == [b'other_session_key']
+
+    def test_commit_incomplete(self):
+        """Should cancel the password change if an entry was not updated"""
+        self._start()
+        DBUtilsPassword.update(self.user_id, self.public_ids[0], b'new_name_0', b'new_data_0')
+
+        assert DBUtilsPassword.commit(self.user_id) == (False, FailureReason.INCOMPLETE)
+
+        with DatabaseSetup.get_db_session() as session:
+            user = session.query(User).filter(User.id == self.user_id).one()
+            assert (user.password_change, user.srp_salt) == (False, b'fake_srp_salt')
+            assert session.query(SecureData).filter(SecureData.new_entry_name.isnot(None)).count() == 0
+            assert [session_key for session_key, in session.query(LoginSession.session_key).all()] == [b'fake_session_key']
+
+    def test_abort(self):
+        """Should cancel the password change, leaving the entries as they were"""
+        self._start()
+        DBUtilsPassword.update(self.user_id, self.public_ids[0], b'new_name_0', b'new_data_0')
+
+        assert DBUtilsPassword.abort(self.user_id) == (True, None)
+
+        with DatabaseSetup.get_db_session() as session:
+            user = session.query(User).filter(User.id == self.user_id).one()
+            assert (user.password_change, user.new_srp_salt) == (False, None)
+            assert session.query(AuthEphemeral).count() == 0
+        assert DBUtilsData.get_entry(self.user_id, self.public_ids[0]) == (True, None, b'entry_name_0', b'entry_data_0')
+
 
 if __name__ == '__main__':
     pytest.main(['-v', __file__])
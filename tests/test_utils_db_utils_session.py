@@ -12,6 +12,8 @@ from mock_classes import _MockSession, _MockQuery
 from enums.failure_reason import FailureReason
 from utils.db_utils_session import DBUtilsSession
 from utils.db_utils_password import DBUtilsPassword
+from utils.session_cache import SessionCache
+from utils.request_counter import RequestCounter
 from database.database_setup import DatabaseSetup
 from database.database_models import User, LoginSession, AuthEphemeral
 
@@ -2154,5 +2156,307 @@ class TestCleanAll():
         assert mock_session.closed is True
 
 
+class TestSessionCaching():
+    """Test cases for database utils session use of the session cache"""
+
+    @pytest.fixture(autouse=True)
+    def setup_teardown(self, monkeypatch):
+        SessionCache.configure(10)
+
+        self.mock_session = _MockSession()
+
+        @contextmanager
+        def mock_get_db_session():
+            try:
+                yield self.mock_session
+                self.mock_session.commit()
+            except Exception:
+                self.mock_session.rollback()
+                raise
+            finally:
+                self.mock_session.close()
+        monkeypatch.setattr(DatabaseSetup, "get_db_session", mock_get_db_session)
+
+        self.fake_user = User(
+            id=123456,
+            username_hash=b'fake_hash',
+            srp_salt=b'fake_srp_salt',
+            srp_verifier=b'fake_srp_verifier',
+            master_key_salt=b'fake_master_key_salt',
+            password_change=False
+        )
+        self.fake_login_session = LoginSession(
+            id=789123,
+            user=self.fake_user,
+            public_id="session_fake_public_id",
+            session_key=b'fake_session_key',
+            request_count=3,
+            last_used=datetime.now(),
+            maximum_requests=5,
+            expiry_time=None,
+            password_change=False
+        )
+
+        self.queries = []
+        def fake_query(_, model):
+            mock_query = _MockQuery([self.fake_login_session] if self.fake_login_session else [])
+            self.queries.append(mock_query)
+            return mock_query
+        monkeypatch.setattr(_MockSession, "query", fake_query)
+
+        yield
+
+        SessionCache._reset()
+
+    def test_get_details_populates_cache(self):
+        """Should only query the database on the first request for a session"""
+        first = DBUtilsSession.get_details(public_id="session_fake_public_id")
+        second = DBUtilsSession.get_details(public_id="session_fake_public_id")
+
+        assert first == second
+        assert second == (True, None, 123456, b'fake_hash', 789123, b'fake_session_key', 3, False)
+        assert len(self.queries) == 1
+
+    def test_get_details_skips_cache_when_disabled(self):
+        """Should query the database every time if the cache is disabled"""
+        SessionCache._reset()
+
+        DBUtilsSession.get_details(public_id="session_fake_public_id")
+        DBUtilsSession.get_details(public_id="session_fake_public_id")
+
+        assert len(self.queries) == 2
+
+    def test_log_use_cached_session(self):
+        """Should increment without reading the session from the database"""
+        DBUtilsSession.get_details(public_id="session_fake_public_id")
+
+        response = DBUtilsSession.log_use(session_id=789123)
+
+        assert response == (True, None, b'fake_session_key')
+        assert len(self.queries) == 2
+        assert len(self.queries[1]._updates) == 1
+        condition = self.queries[1]._filters[0]
+        assert str(condition.left.name) == "id"
+        assert condition.right.value == 789123
+
+        details = DBUtilsSession.get_details(public_id="session_fake_public_id")
+        assert details[6] == 4
+        assert len(self.queries) == 2
+
+    def test_log_use_cached_session_budget(self):
+        """Should fall back to the database once the cached budget is used"""
+        DBUtilsSession.get_details(public_id="session_fake_public_id")
+
+        assert DBUtilsSession.log_use(session_id=789123)[0] == True
+        assert DBUtilsSession.log_use(session_id=789123)[0] == True
+
+        self.fake_login_session.request_count = 5
+        response = DBUtilsSession.log_use(session_id=789123)
+
+        assert response[0] == False
+        assert response[1] == FailureReason.NOT_FOUND
+        assert self.fake_login_session in self.mock_session._deletes
+
+    def test_log_use_cached_session_missing(self):
+        """Should drop the cached session if the database row is gone"""
+        DBUtilsSession.get_details(public_id="session_fake_public_id")
+        self.fake_login_session = None
+
+        response = DBUtilsSession.log_use(session_id=789123)
+
+        assert response[0] == False
+        assert response[1] == FailureReason.NOT_FOUND
+        assert SessionCache.get("session_fake_public_id") is None
+
+    def test_log_use_deferred_with_request_counter(self, monkeypatch):
+        """Should defer the increment of a cached session without touching the database"""
+        monkeypatch.setattr(RequestCounter, "enabled", lambda: True)
+        DBUtilsSession.get_details(public_id="session_fake_public_id")
+
+        response = DBUtilsSession.log_use(session_id=789123)
+
+        assert response == (True, None, b'fake_session_key')
+        assert len(self.queries) == 1
+        assert RequestCounter.pending(789123) == 1
+        assert self.fake_login_session.request_count == 3
+
+        RequestCounter._reset()
+
+    def test_log_use_deferred_budget(self, monkeypatch):
+        """Should enforce the request budget including deferred increments"""
+        monkeypatch.setattr(RequestCounter, "enabled", lambda: True)
+        DBUtilsSession.get_details(public_id="session_fake_public_id")
+
+        assert DBUtilsSession.log_use(session_id=789123)[0] == True
+        assert DBUtilsSession.log_use(session_id=789123)[0] == True
+        response = DBUtilsSession.log_use(session_id=789123)
+
+        assert response[0] == False
+        assert response[1] == FailureReason.NOT_FOUND
+        assert self.fake_login_session in self.mock_session._deletes
+        assert self.fake_login_session.request_count == 3
+
+        RequestCounter._reset()
+
+    def test_get_details_includes_pending(self):
+        """Should report request count including deferred increments"""
+        RequestCounter.add(789123)
+
+        response = DBUtilsSession.get_details(public_id="session_fake_public_id")
+
+        assert response[6] == 4
+        assert SessionCache.get("session_fake_public_id").request_count == 4 # type: ignore
+
+        RequestCounter._reset()
+
+    def test_log_use_uncached_budget_with_request_counter(self, monkeypatch):
+        """Should not let a request past the budget if a concurrent request used it after the expiry check"""
+        SessionCache.configure(0)
+        monkeypatch.setattr(RequestCounter, "enabled", lambda: True)
+        RequestCounter.add(789123)
+
+        request_count = RequestCounter.request_count
+        def concurrent_use(db_session, login_session, sequence):
+            count = request_count(db_session, login_session, sequence)
+            RequestCounter.add(login_session.id)
+            return count
+        monkeypatch.setattr(RequestCounter, "request_count", concurrent_use)
+
+        response = DBUtilsSession.log_use(session_id=789123)
+
+        assert response[0] == False
+        assert response[1] == FailureReason.NOT_FOUND
+        assert RequestCounter.pending(789123) == 2
+        assert self.mock_session._refreshed == []
+
+        RequestCounter._reset()
+
+    def test_delete_invalidates_cache(self):
+        """Should remove the session from the cache when deleted"""
+        DBUtilsSession.get_details(public_id="session_fake_public_id")
+
+        DBUtilsSession.delete(user_id=123456, public_id="session_fake_public_id")
+
+        assert SessionCache.get("session_fake_public_id") is None
+
+    def test_clean_user_invalidates_cache(self, monkeypatch):
+        """Should remove all sessions for the user from the cache"""
+        DBUtilsSession.get_details(public_id="session_fake_public_id")
+
+        def fake_query(_, model):
+            return _MockQuery([self.fake_user])
+        monkeypatch.setattr(_MockSession, "query", fake_query)
+
+        DBUtilsSession.clean_user(user_id=123456)
+
+        assert SessionCache.get("session_fake_public_id") is None
+
+    def test_clean_password_change_invalidates_cache(self):
+        """Should remove all sessions for the user when cleaning a password change"""
+        DBUtilsSession.get_details(public_id="session_fake_public_id")
+
+        DBUtilsPassword.clean_password_change(self.mock_session, self.fake_user) # type: ignore
+
+        assert SessionCache.get("session_fake_public_id") is None
+
+
+class TestDBUtilsSessionDatabase():
+    """Test cases for the database utils session functions against each real database backend"""
+
+    @pytest.fixture(autouse=True)
+    def setup_teardown(self, real_database):
+        with DatabaseSetup.get_db_session() as session:
+            user = User(
+                username_hash=b'fake_hash',
+                srp_salt=b'fake_srp_salt',
+                srp_verifier=b'fake_srp_verifier',
+                master_key_salt=b'fake_master_key_salt',
+                password_change=False
+            )
+            session.add(user)
+            session.flush()
+            self.user_id = user.id
+
+        self.session_id, self.public_id = self._add_login_session(maximum_requests=2)
+
+        yield
+
+        RequestCounter.stop()
+        RequestCounter._reset()
+        SessionCache._reset()
+
+    def _add_login_session(self, session_key=b'fake_session_key', maximum_requests=None, expiry_time=None):
+        """Helper function to add a login session for the test user, returning its id and public id"""
+        with DatabaseSetup.get_db_session() as session:
+            login_session = LoginSession(
+                user_id=self.user_id,
+                session_key=session_key,
+                request_count=0,
+                last_used=datetime.now(),
+                maximum_requests=maximum_requests,
+                expiry_time=expiry_time,
+                password_change=False
+            )
+            session.add(login_session)
+            session.flush()
+            return login_session.id, login_session.public_id
+
+    def _request_count(self):
+        """Helper function to read the stored request count of the test login session, or None once deleted"""
+        with DatabaseSetup.get_db_session() as session:
+            return session.query(LoginSession.request_count).filter(LoginSession.id == self.session_id).scalar()
+
+    def test_get_details(self):
+        """Should read the login session along with its user"""
+        assert DBUtilsSession.get_details(self.public_id) == (
+            True, None, self.user_id, b'fake_hash', self.session_id, b'fake_session_key', 0, False
+        )
+        assert DBUtilsSession.get_details("missing_public_id")[:2] == (False, FailureReason.NOT_FOUND)
+
+    def test_log_use_budget(self):
+        """Should count each use, deleting the session once its budget is spent"""
+        assert DBUtilsSession.log_use(self.session_id) == (True, None, b'fake_session_key')
+        assert DBUtilsSession.log_use(self.session_id) == (True, None, b'fake_session_key')
+        assert self._request_count() == 2
+
+        assert DBUtilsSession.log_use(self.session_id) == (False, FailureReason.NOT_FOUND, b'')
+        assert self._request_count() is None
+
+    def test_log_use_budget_deferred(self):
+        """Should keep to the budget with cached sessions and deferred counting, and flush every use"""
+        SessionCache.configure(10)
+        RequestCounter.start(3600)
+
+        results = []
+        for _ in range(3):
+            DBUtilsSession.get_details(self.public_id)
+            results.append(DBUtilsSession.log_use(self.session_id))
+
+        assert results == [
+            (True, None, b'fake_session_key'),
+            (True, None, b'fake_session_key'),
+            (False, FailureReason.NOT_FOUND, b'')
+        ]
+        RequestCounter.flush()
+        assert self._request_count() in (2, None)
+
+    def test_delete(self):
+        """Should only delete a login session for its own user"""
+        assert DBUtilsSession.delete(self.user_id + 1, self.public_id)[0] == False
+        assert self._request_count() == 0
+
+        assert DBUtilsSession.delete(self.user_id, self.public_id) == (True, None)
+        assert self._request_count() is None
+
+    def test_clean_all(self):
+        """Should remove only the expired login sessions"""
+        self._add_login_session(session_key=b'expired_session_key', expiry_time=datetime.now() - timedelta(minutes=5))
+
+        DBUtilsSession.clean_all()
+
+        with DatabaseSetup.get_db_session() as session:
+            assert [session_id for session_id, in session.query(LoginSession.id).all()] == [self.session_id]
+
+
 if __name__ == '__main__':
     pytest.main(['-v', __file__])
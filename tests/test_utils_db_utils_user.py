@@ -2,6 +2,7 @@ import os
 import sys
 import pytest
 from contextlib import contextmanager
+from datetime import datetime, timedelta
 
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.sql.elements import BinaryExpression
@@ -12,7 +13,7 @@ from mock_classes import _MockSession, _MockQuery
 from enums.failure_reason import FailureReason
 from utils.db_utils_user import DBUtilsUser
 from database.database_setup import DatabaseSetup
-from database.database_models import User
+from database.database_models import User, AuthEphemeral, LoginSession, SecureData
 
 
 class TestCreate():
@@ -618,5 +619,86 @@ class TestDelete():
         assert condition.right.value == 123456
 
 
+class TestDBUtilsUserDatabase():
+    """Test cases for the database utils user functions against each real database backend"""
+
+    @pytest.fixture(autouse=True)
+    def setup_teardown(self, real_database):
+        ok, _ = DBUtilsUser.create(
+            username_hash=b'fake_hash',
+            srp_salt=b'fake_srp_salt',
+            srp_verifier=b'fake_srp_verifier',
+            master_key_salt=b'fake_master_key_salt'
+        )
+        assert ok
+
+        with DatabaseSetup.get_db_session() as session:
+            self.user_id = session.query(User.id).filter(User.username_hash == b'fake_hash').scalar()
+
+        yield
+
+    def test_create(self):
+        """Should store the user with no password change in progress"""
+        with DatabaseSetup.get_db_session() as session:
+            user = session.query(User).filter(User.id == self.user_id).one()
+            assert user.srp_salt == b'fake_srp_salt'
+            assert user.srp_verifier == b'fake_srp_verifier'
+            assert user.master_key_salt == b'fake_master_key_salt'
+            assert user.password_change == False
+
+    def test_create_existing_user(self):
+        """Should refuse a second user with the same username hash"""
+        response = DBUtilsUser.create(
+            username_hash=b'fake_hash',
+            srp_salt=b'other_srp_salt',
+            srp_verifier=b'other_srp_verifier',
+            master_key_salt=b'other_master_key_salt'
+        )
+
+        assert response == (False, FailureReason.USER_EXISTS)
+        with DatabaseSetup.get_db_session() as session:
+            assert session.query(User).count() == 1
+
+    def test_change_username(self):
+        """Should replace the username hash, and refuse one already taken"""
+        assert DBUtilsUser.change_username(self.user_id, b'new_hash') == (True, None)
+        assert DBUtilsUser.create(b'fake_hash', b'salt', b'verifier', b'master_key_salt') == (True, None)
+        assert DBUtilsUser.change_username(self.user_id, b'fake_hash') == (False, FailureReason.USER_EXISTS)
+
+        with DatabaseSetup.get_db_session() as session:
+            user = session.query(User).filter(User.id == self.user_id).one()
+            assert user.username_hash == b'new_hash'
+
+    def test_delete_cascades(self):
+        """Should delete the user along with their entries, sessions and ephemerals"""
+        with DatabaseSetup.get_db_session() as session:
+            session.add(SecureData(user_id=self.user_id, entry_name=b'entry_name', entry_data=b'entry_data'))
+            session.add(AuthEphemeral(
+                user_id=self.user_id,
+                eph_private_b=b'eph_private_b',
+                eph_public_b=b'eph_public_b',
+                expiry_time=datetime.now() + timedelta(minutes=5),
+                password_change=False
+            ))
+            session.add(LoginSession(
+                user_id=self.user_id,
+                session_key=b'session_key',
+                request_count=0,
+                last_used=datetime.now(),
+                maximum_requests=None,
+                expiry_time=None,
+                password_change=False
+            ))
+
+        assert DBUtilsUser.delete(self.user_id) == (True, None)
+        assert DBUtilsUser.delete(self.user_id) == (False, FailureReason.NOT_FOUND)
+
+        with DatabaseSetup.get_db_session() as session:
+            assert session.query(User).count() == 0
+            assert session.query(SecureData).count() == 0
+            assert session.query(AuthEphemeral).count() == 0
+            assert session.query(LoginSession).count() == 0
+
+
 if __name__ == '__main__':
     pytest.main(['-v', __file__])
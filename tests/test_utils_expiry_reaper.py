@@ -0,0 +1,204 @@
+import os
+import sys
+import time
+import pytest
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from utils.expiry_reaper import ExpiryReaper
+from utils.db_utils_session import DBUtilsSession
+from utils.session_cache import SessionCache, CachedSession
+from database.database_setup import DatabaseSetup
+from database.query_stats import QueryStats
+from database.database_models import User, AuthEphemeral, LoginSession, SecureData
+from enums import FailureReason
+
+
+class TestExpiryReaper():
+    """Test cases for the background expiry reaper"""
+
+    @pytest.fixture(autouse=True)
+    def setup_teardown(self, real_database):
+        past = datetime.now() - timedelta(minutes=5)
+        future = datetime.now() + timedelta(minutes=5)
+
+        with DatabaseSetup.get_db_session() as session:
+            user = User(
+                username_hash=b'fake_hash',
+                srp_salt=b'fake_srp_salt',
+                srp_verifier=b'fake_srp_verifier',
+                master_key_salt=b'fake_master_key_salt',
+                password_change=False
+            )
+            password_user = User(
+                username_hash=b'password_hash',
+                srp_salt=b'fake_srp_salt',
+                srp_verifier=b'fake_srp_verifier',
+                master_key_salt=b'fake_master_key_salt',
+                password_change=True,
+                new_srp_salt=b'new_srp_salt',
+                new_srp_verifier=b'new_srp_verifier',
+                new_master_key_salt=b'new_master_key_salt'
+            )
+            for i, expiry_time in enumerate([past] * 5 + [future, None]):
+                session.add(AuthEphemeral(
+                    user=user,
+                    eph_private_b=b'fake_eph_private_b',
+                    eph_public_b=b'fake_eph_public_b',
+                    expiry_time=expiry_time or future,
+                    password_change=False
+                ))
+                session.add(LoginSession(
+                    user=user,
+                    session_key=b'fake_session_key_%d' % i,
+                    request_count=0,
+                    last_used=datetime.now(),
+                    expiry_time=expiry_time,
+                    password_change=False
+                ))
+            session.add(LoginSession(
+                user=password_user,
+                session_key=b'password_session_key',
+                request_count=0,
+                last_used=datetime.now(),
+                expiry_time=past,
+                password_change=True
+            ))
+            session.add(SecureData(
+                user=password_user,
+                entry_name=b'entry_name',
+                entry_data=b'entry_data',
+                new_entry_name=b'new_entry_name',
+                new_entry_data=b'new_entry_data'
+            ))
+            session.flush()
+            self.password_user_id = password_user.id
+
+        yield
+
+        ExpiryReaper._reset()
+        SessionCache._reset()
+        QueryStats._reset()
+
+    def _row_counts(self):
+        with DatabaseSetup.get_db_session() as session:
+            return session.query(AuthEphemeral).count(), session.query(LoginSession).count()
+
+    def test_disabled_by_default(self):
+        """Should not be enabled unless started with an interval"""
+        ExpiryReaper.start(0)
+        assert ExpiryReaper.enabled() is False
+
+    @pytest.mark.parametrize(
+        "interval, chunk_size",
+        [
+            (-1,    500),
+            (60,    0)
+        ]
+    )
+    def test_start_rejects_invalid(self, interval, chunk_size):
+        """Should raise exception if given invalid settings"""
+        with pytest.raises(ValueError):
+            ExpiryReaper.start(interval, chunk_size)
+
+    def test_reap_deletes_expired_rows(self):
+        """Should delete only the expired rows, and report how many"""
+        counts = ExpiryReaper.reap()
+
+        assert counts == {"auth_ephemerals": 5, "login_sessions": 5, "password_changes": 1}
+        assert self._row_counts() == (2, 2)
+
+    def test_reap_in_chunks(self):
+        """Should delete expired rows in bounded chunks until none are left"""
+        ExpiryReaper._chunk_size = 2
+        QueryStats._reset()
+
+        counts = ExpiryReaper.reap()
+
+        assert counts["auth_ephemerals"] == 5
+        assert counts["login_sessions"] == 5
+        assert self._row_counts() == (2, 2)
+        assert QueryStats.totals()["DBUtilsAuth.reap_expired"]["statements"] >= 3
+
+    def test_reap_invalidates_cached_sessions(self):
+        """Should remove reaped Login Sessions from the session cache"""
+        SessionCache.configure(10)
+        with DatabaseSetup.get_db_session() as session:
+            login_sessions = session.query(LoginSession).filter(LoginSession.password_change == False).all()
+            cached = [(login_session.public_id, login_session.expiry_time) for login_session in login_sessions]
+        generation = SessionCache.generation()
+        for public_id, expiry_time in cached:
+            SessionCache.put(CachedSession(
+                public_id=public_id,
+                user_id=1,
+                username_hash=b'fake_hash',
+                session_id=1,
+                session_key=b'fake_session_key',
+                request_count=0,
+                maximum_requests=None,
+                expiry_time=expiry_time,
+                password_change=False
+            ), generation)
+
+        ExpiryReaper.reap()
+
+        for public_id, expiry_time in cached:
+            if expiry_time is not None and expiry_time < datetime.now():
+                assert SessionCache.get(public_id) is None
+            else:
+                assert SessionCache.get(public_id) is not None
+
+    def test_reap_cancels_password_change(self):
+        """Should route expired password change sessions to the password change cleanup"""
+        ExpiryReaper.reap()
+
+        with DatabaseSetup.get_db_session() as session:
+            user = session.query(User).filter(User.id == self.password_user_id).one()
+            assert user.password_change is False
+            assert user.new_srp_salt is None
+            assert user.secure_data[0].new_entry_name is None
+            assert user.secure_data[0].entry_name == b'entry_name'
+            assert session.query(LoginSession).filter(LoginSession.password_change == True).count() == 0
+
+    def test_reap_nothing_expired(self):
+        """Should report nothing once every expired row is gone"""
+        ExpiryReaper.reap()
+
+        assert ExpiryReaper.reap() == {"auth_ephemerals": 0, "login_sessions": 0, "password_changes": 0}
+
+    def test_metrics_totals(self):
+        """Should total the rows reaped over every run"""
+        ExpiryReaper.reap()
+        ExpiryReaper.reap()
+
+        assert ExpiryReaper.metrics() == {
+            "runs": 2,
+            "auth_ephemerals_reaped": 5,
+            "login_sessions_reaped": 5,
+            "password_changes_reaped": 1
+        }
+
+    def test_reap_database_uninitialised(self):
+        """Should report nothing reaped, without raising, if the database is not setup"""
+        DatabaseSetup.close_db()
+
+        assert ExpiryReaper.reap() == {"auth_ephemerals": 0, "login_sessions": 0, "password_changes": 0}
+        assert DBUtilsSession.reap_expired(10) == (False, FailureReason.DATABASE_UNINITIALISED, 0, 0)
+
+    def test_background_reap(self):
+        """Should reap in the background once started"""
+        ExpiryReaper.start(0.01)
+        assert ExpiryReaper.enabled() is True
+
+        deadline = time.monotonic() + 5
+        while self._row_counts() != (2, 2) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        ExpiryReaper.stop()
+
+        assert self._row_counts() == (2, 2)
+        assert ExpiryReaper.enabled() is False
+
+
+if __name__ == '__main__':
+    pytest.main(['-v', __file__])
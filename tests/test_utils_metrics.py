@@ -0,0 +1,68 @@
+import os
+import sys
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from utils.metrics import MetricsRegistry, LATENCY_BUCKETS
+
+
+class TestMetricsRegistry():
+    """Test cases for the metrics registry"""
+
+    @pytest.fixture(autouse=True)
+    def setup_teardown(self):
+        MetricsRegistry._reset()
+        yield
+        MetricsRegistry._reset()
+
+    def test_render_empty(self):
+        """Should render only the metric headers if nothing observed"""
+        lines = MetricsRegistry.render().splitlines()
+        assert all(line.startswith("#") for line in lines)
+
+    def test_counts_by_method_and_outcome(self):
+        """Should count requests for each method and outcome"""
+        MetricsRegistry.observe_rpc("/data/Get", "OK", 0.001)
+        MetricsRegistry.observe_rpc("/data/Get", "OK", 0.001)
+        MetricsRegistry.observe_rpc("/data/Get", "NOT_FOUND", 0.001)
+
+        text = MetricsRegistry.render()
+
+        assert 'passmanager_rpc_requests_total{method="/data/Get",outcome="OK"} 2' in text
+        assert 'passmanager_rpc_requests_total{method="/data/Get",outcome="NOT_FOUND"} 1' in text
+
+    def test_latency_histogram(self):
+        """Should place latencies in cumulative buckets, with an inclusive upper bound"""
+        MetricsRegistry.observe_rpc("/data/Get", "OK", 0.001)
+        MetricsRegistry.observe_rpc("/data/Get", "OK", 0.02)
+        MetricsRegistry.observe_rpc("/data/Get", "OK", 60.0)
+
+        text = MetricsRegistry.render()
+
+        assert 'passmanager_rpc_latency_seconds_bucket{method="/data/Get",le="0.0005"} 0' in text
+        assert 'passmanager_rpc_latency_seconds_bucket{method="/data/Get",le="0.001"} 1' in text
+        assert 'passmanager_rpc_latency_seconds_bucket{method="/data/Get",le="0.025"} 2' in text
+        assert f'passmanager_rpc_latency_seconds_bucket{{method="/data/Get",le="{LATENCY_BUCKETS[-1]!r}"}} 2' in text
+        assert 'passmanager_rpc_latency_seconds_bucket{method="/data/Get",le="+Inf"} 3' in text
+        assert 'passmanager_rpc_latency_seconds_count{method="/data/Get"} 3' in text
+        assert 'passmanager_rpc_latency_seconds_sum{method="/data/Get"} 60.021' in text
+
+    def test_gauges(self):
+        """Should collect registered gauges on every render"""
+        values = {"available": 3}
+        MetricsRegistry.register_gauges("passmanager_pool", lambda: dict(values))
+
+        assert "passmanager_pool_available 3" in MetricsRegistry.render()
+        values["available"] = 5
+        assert "passmanager_pool_available 5" in MetricsRegistry.render()
+
+    def test_collectors(self):
+        """Should include the lines of registered collectors"""
+        MetricsRegistry.register_collector("stages", lambda: ["passmanager_stage_seconds 0.5"])
+
+        assert "passmanager_stage_seconds 0.5" in MetricsRegistry.render().splitlines()
+
+
+if __name__ == '__main__':
+    pytest.main(['-v', __file__])
@@ -0,0 +1,328 @@
+import os
+import sys
+import pytest
+from datetime import datetime, timedelta
+from pathlib import Path
+from threading import Thread, Barrier
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from mock_classes import _MockSession
+from utils.request_counter import RequestCounter
+from utils.db_utils_session import DBUtilsSession
+from utils.db_utils_user import DBUtilsUser
+from database.database_setup import DatabaseSetup
+from database.database_models import Base, User, LoginSession
+
+
+class TestRequestCounter():
+    """Test cases for the write-behind request counter"""
+
+    @pytest.fixture(autouse=True)
+    def setup_teardown(self, real_database):
+        self.database = real_database
+
+        with DatabaseSetup.get_db_session() as session:
+            user = User(
+                username_hash=b'fake_hash',
+                srp_salt=b'fake_srp_salt',
+                srp_verifier=b'fake_srp_verifier',
+                master_key_salt=b'fake_master_key_salt',
+                password_change=False
+            )
+            self.session_ids = []
+            for i in range(2):
+                login_session = LoginSession(
+                    user=user,
+                    session_key=f"fake_session_key_{i}".encode(),
+                    request_count=i,
+                    last_used=datetime.now(),
+                    password_change=False
+                )
+                session.add(login_session)
+                session.flush()
+                self.session_ids.append(login_session.id)
+            self.user_id = user.id
+            self.public_id = login_session.public_id
+
+        yield
+
+        RequestCounter._reset()
+
+    def _request_counts(self):
+        with DatabaseSetup.get_db_session() as session:
+            return [
+                session.query(LoginSession).filter(LoginSession.id == session_id).one().request_count
+                for session_id in self.session_ids
+            ]
+
+    def test_disabled_by_default(self):
+        """Should not be enabled unless started with an interval"""
+        RequestCounter.start(0)
+        assert RequestCounter.enabled() is False
+
+    def test_start_rejects_invalid(self):
+        """Should raise exception if given negative settings"""
+        with pytest.raises(ValueError):
+            RequestCounter.start(-1)
+
+    def test_add_is_pending(self):
+        """Should report increments as pending until flushed"""
+        RequestCounter.add(self.session_ids[0])
+        RequestCounter.add(self.session_ids[0])
+
+        assert RequestCounter.pending(self.session_ids[0]) == 2
+        assert RequestCounter.pending(self.session_ids[1]) == 0
+        assert RequestCounter.pending(None) == 0
+        assert self._request_counts() == [0, 1]
+
+    def test_flush_applies_increments(self):
+        """Should apply all pending increments in one flush"""
+        for _ in range(3):
+            RequestCounter.add(self.session_ids[0])
+        RequestCounter.add(self.session_ids[1])
+
+        updated = RequestCounter.flush()
+
+        assert updated == 2
+        assert self._request_counts() == [3, 2]
+        assert RequestCounter.pending(self.session_ids[0]) == 0
+
+    def test_discard(self):
+        """Should drop the pending increments of the login session only"""
+        RequestCounter.add(self.session_ids[0])
+        RequestCounter.add(self.session_ids[1])
+        RequestCounter.add(self.session_ids[1])
+
+        RequestCounter.discard(self.session_ids[1])
+
+        assert RequestCounter.pending(self.session_ids[1]) == 0
+        assert RequestCounter.flush() == 1
+        assert self._request_counts() == [1, 1]
+
+    def _expire_and_reap(self):
+        with DatabaseSetup.get_db_session() as session:
+            login_session = session.query(LoginSession).filter(LoginSession.id == self.session_ids[1]).one()
+            login_session.expiry_time = datetime.now() - timedelta(minutes=5)
+        DBUtilsSession.reap_expired(10)
+
+    @pytest.mark.parametrize(
+        "delete_session",
+        [
+            lambda self: DBUtilsSession.delete(self.user_id, self.public_id),
+            lambda self: DBUtilsSession.clean_user(self.user_id),
+            lambda self: DBUtilsUser.delete(self.user_id),
+            lambda self: self._expire_and_reap()
+        ]
+    )
+    def test_deleted_session_id_reused(self, delete_session):
+        """Should not count a deleted login session's increments against a new session given its id"""
+        RequestCounter.start(60)
+        for _ in range(4):
+            for session_id in self.session_ids:
+                assert DBUtilsSession.log_use(session_id)[0] is True
+
+        delete_session(self)
+
+        with DatabaseSetup.get_db_session() as session:
+            login_session = LoginSession(
+                user=User(
+                    username_hash=b'new_hash',
+                    srp_salt=b'fake_srp_salt',
+                    srp_verifier=b'fake_srp_verifier',
+                    master_key_salt=b'fake_master_key_salt',
+                    password_change=False
+                ),
+                session_key=b'new_session_key',
+                request_count=0,
+                last_used=datetime.now(),
+                maximum_requests=5,
+                password_change=False
+            )
+            session.add(login_session)
+            session.flush()
+            session_id, public_id = login_session.id, login_session.public_id
+
+        # SQLite gives a freed rowid to the next row
+        if isinstance(self.database, Path):
+            assert session_id in self.session_ids
+        assert RequestCounter.pending(session_id) == 0
+        assert DBUtilsSession.get_details(public_id)[6] == 0
+
+        RequestCounter.stop()
+        with DatabaseSetup.get_db_session() as session:
+            assert session.query(LoginSession).filter(LoginSession.id == session_id).one().request_count == 0
+
+    def test_flush_empty(self):
+        """Should do nothing if there are no pending increments"""
+        assert RequestCounter.flush() == 0
+        assert self._request_counts() == [0, 1]
+
+    def test_flush_failure_keeps_increments(self):
+        """Should keep increments pending if the flush fails"""
+        RequestCounter.add(self.session_ids[0])
+        DatabaseSetup.close_db()
+
+        assert RequestCounter.flush() == 0
+        assert RequestCounter.pending(self.session_ids[0]) == 1
+
+        DatabaseSetup.init_db(self.database, Base)
+
+    def test_stop_flushes(self):
+        """Should apply remaining increments when stopped"""
+        RequestCounter.start(60)
+        assert RequestCounter.enabled() is True
+
+        RequestCounter.add(self.session_ids[1])
+        RequestCounter.stop()
+
+        assert RequestCounter.enabled() is False
+        assert self._request_counts() == [0, 2]
+
+    def test_batch_size_triggers_flush(self):
+        """Should flush early once the batch size is reached"""
+        RequestCounter.start(60, batch_size=2)
+
+        RequestCounter.add(self.session_ids[0])
+        RequestCounter.add(self.session_ids[0])
+
+        for _ in range(100):
+            if RequestCounter.pending(self.session_ids[0]) == 0:
+                break
+            RequestCounter._stopping.wait(0.01)
+
+        assert self._request_counts() == [2, 1]
+
+
+    def _read_request_count(self, session_id, counts):
+        """Helper function to read a request count through the counter"""
+        sequence = RequestCounter.sequence()
+        with DatabaseSetup.get_db_session() as session:
+            login_session = session.query(LoginSession).filter(LoginSession.id == session_id).one()
+            counts.append(RequestCounter.request_count(session, login_session, sequence))
+
+    def _detached_session(self, request_count, maximum_requests=None):
+        """Helper function to build a login session, as loaded from the database"""
+        return LoginSession(
+            id=self.session_ids[0],
+            session_key=b'fake_session_key',
+            request_count=request_count,
+            maximum_requests=maximum_requests,
+            last_used=datetime.now(),
+            password_change=False
+        )
+
+    def test_request_count_includes_pending(self):
+        """Should report the stored count plus any pending increments"""
+        RequestCounter.add(self.session_ids[1])
+        RequestCounter.add(self.session_ids[1])
+        counts = []
+
+        self._read_request_count(self.session_ids[0], counts)
+        self._read_request_count(self.session_ids[1], counts)
+        RequestCounter.flush()
+        self._read_request_count(self.session_ids[1], counts)
+
+        assert counts == [0, 3, 3]
+
+    def test_request_count_uses_loaded_count(self):
+        """Should use the count already loaded, without reading it again, if no flush has committed since"""
+        mock_session = _MockSession()
+        sequence = RequestCounter.sequence()
+        RequestCounter.add(self.session_ids[0])
+
+        assert RequestCounter.request_count(mock_session, self._detached_session(5), sequence) == 6 # type: ignore
+        assert mock_session._refreshed == []
+
+    def test_request_count_loaded_before_flush(self):
+        """Should read the stored count again if a flush committed after it was loaded"""
+        RequestCounter.add(self.session_ids[0])
+        RequestCounter.add(self.session_ids[0])
+        sequence = RequestCounter.sequence()
+
+        with DatabaseSetup.get_db_session() as session:
+            login_session = session.query(LoginSession).filter(LoginSession.id == self.session_ids[0]).one()
+            assert RequestCounter.flush() == 1
+
+            assert RequestCounter.request_count(session, login_session, sequence) == 2
+
+    def test_request_count_read_during_flush(self):
+        """Should count a batch once if read after the flush commits, but before it stops being pending"""
+        RequestCounter.add(self.session_ids[0])
+        RequestCounter.add(self.session_ids[0])
+        counts = []
+        reader = Thread(target=self._read_request_count, args=(self.session_ids[0], counts))
+
+        def read_after_commit(session):
+            reader.start()
+            reader.join(0.2)
+        event.listen(Session, "after_commit", read_after_commit, once=True)
+
+        try:
+            assert RequestCounter.flush() == 1
+            reader.join()
+        finally:
+            if event.contains(Session, "after_commit", read_after_commit):
+                event.remove(Session, "after_commit", read_after_commit)
+
+        assert counts == [2]
+        assert self._request_counts() == [2, 1]
+
+    def test_try_add(self):
+        """Should record a use while the stored and pending requests are below the maximum"""
+        mock_session = _MockSession()
+        login_session = self._detached_session(1, maximum_requests=3)
+        sequence = RequestCounter.sequence()
+
+        assert RequestCounter.try_add(mock_session, login_session, sequence) is True # type: ignore
+        assert RequestCounter.try_add(mock_session, login_session, sequence) is True # type: ignore
+        assert RequestCounter.try_add(mock_session, login_session, sequence) is False # type: ignore
+        assert RequestCounter.pending(self.session_ids[0]) == 2
+        assert mock_session._refreshed == []
+
+    def test_try_add_without_maximum(self):
+        """Should always record a use of a session without a maximum"""
+        login_session = self._detached_session(100)
+
+        assert RequestCounter.try_add(_MockSession(), login_session, RequestCounter.sequence()) is True # type: ignore
+        assert RequestCounter.pending(self.session_ids[0]) == 1
+
+    def test_try_add_concurrent(self):
+        """Should let concurrent uses of a session take it to its maximum, and no further"""
+        login_session = self._detached_session(2, maximum_requests=7)
+        sequence = RequestCounter.sequence()
+        start = Barrier(20)
+        results = []
+
+        def use():
+            start.wait()
+            results.append(RequestCounter.try_add(_MockSession(), login_session, sequence)) # type: ignore
+        threads = [Thread(target=use) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results.count(True) == 5
+        assert RequestCounter.pending(self.session_ids[0]) == 5
+
+    def test_try_add_loaded_before_flush(self):
+        """Should check against the stored count again if a flush committed after it was loaded"""
+        RequestCounter.add(self.session_ids[0])
+        RequestCounter.add(self.session_ids[0])
+        sequence = RequestCounter.sequence()
+
+        with DatabaseSetup.get_db_session() as session:
+            login_session = session.query(LoginSession).filter(LoginSession.id == self.session_ids[0]).one()
+            login_session.maximum_requests = 3
+            RequestCounter.flush()
+
+            assert RequestCounter.try_add(session, login_session, sequence) is True
+            assert RequestCounter.try_add(session, login_session, sequence) is False
+
+
+if __name__ == '__main__':
+    pytest.main(['-v', __file__])
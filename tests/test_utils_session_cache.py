@@ -0,0 +1,214 @@
+import os
+import sys
+import pytest
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from utils.session_cache import SessionCache, CachedSession
+
+
+def _make_entry(
+    public_id: str = "fake_public_id",
+    session_id: int = 1,
+    user_id: int = 10,
+    request_count: int = 0,
+    maximum_requests = None,
+    expiry_time = None
+) -> CachedSession:
+    return CachedSession(
+        public_id=public_id,
+        session_id=session_id,
+        user_id=user_id,
+        username_hash=b'fake_hash',
+        session_key=b'fake_session_key',
+        request_count=request_count,
+        maximum_requests=maximum_requests,
+        expiry_time=expiry_time,
+        password_change=False
+    )
+
+
+class TestCachedSession():
+    """Test cases for the cached session expiry check"""
+
+    def test_not_expired(self):
+        """Should not be expired with remaining time and requests"""
+        entry = _make_entry(
+            request_count=1,
+            maximum_requests=2,
+            expiry_time=datetime.now() + timedelta(hours=1)
+        )
+        assert entry.is_expired() is False
+
+    def test_no_limits(self):
+        """Should not be expired with no limits set"""
+        assert _make_entry(request_count=1000).is_expired() is False
+
+    def test_expired_time(self):
+        """Should be expired once expiry time has passed"""
+        entry = _make_entry(expiry_time=datetime.now() - timedelta(seconds=1))
+        assert entry.is_expired() is True
+
+    def test_expired_requests(self):
+        """Should be expired once request budget is used"""
+        entry = _make_entry(request_count=5, maximum_requests=5)
+        assert entry.is_expired() is True
+
+
+class TestSessionCache():
+    """Test cases for the session cache"""
+
+    @pytest.fixture(autouse=True)
+    def setup_teardown(self):
+        SessionCache.configure(3)
+        yield
+        SessionCache._reset()
+
+    def test_disabled_by_default(self):
+        """Should not cache anything if not configured"""
+        SessionCache._reset()
+
+        SessionCache.put(_make_entry(), SessionCache.generation())
+
+        assert SessionCache.enabled() is False
+        assert SessionCache.get("fake_public_id") is None
+
+    def test_configure_rejects_negative(self):
+        """Should raise exception if given a negative size"""
+        with pytest.raises(ValueError):
+            SessionCache.configure(-1)
+
+    def test_put_and_get(self):
+        """Should return a copy of a cached session"""
+        SessionCache.put(_make_entry(), SessionCache.generation())
+
+        entry = SessionCache.get("fake_public_id")
+
+        assert entry == _make_entry()
+        entry.request_count = 50
+        assert SessionCache.get("fake_public_id").request_count == 0 # type: ignore
+
+    def test_get_missing(self):
+        """Should return None if session not cached"""
+        assert SessionCache.get("missing_public_id") is None
+
+    def test_put_stale_generation(self):
+        """Should not cache a session read before it was invalidated"""
+        generation = SessionCache.generation()
+        SessionCache.invalidate("fake_public_id")
+
+        SessionCache.put(_make_entry(), generation)
+
+        assert SessionCache.get("fake_public_id") is None
+
+    def test_put_stale_user_generation(self):
+        """Should not cache a session read before its user was invalidated"""
+        generation = SessionCache.generation()
+        SessionCache.invalidate_user(10)
+
+        SessionCache.put(_make_entry(), generation)
+
+        assert SessionCache.get("fake_public_id") is None
+
+    def test_put_after_invalidation(self):
+        """Should cache a session read after it was invalidated"""
+        SessionCache.invalidate("fake_public_id")
+        SessionCache.invalidate_user(10)
+
+        SessionCache.put(_make_entry(), SessionCache.generation())
+
+        assert SessionCache.get("fake_public_id") is not None
+
+    def test_put_unrelated_invalidation(self):
+        """Should cache a session read before another session or user was invalidated"""
+        generation = SessionCache.generation()
+        SessionCache.invalidate("other_public_id")
+        SessionCache.invalidate_user(11)
+
+        SessionCache.put(_make_entry(), generation)
+
+        assert SessionCache.get("fake_public_id") is not None
+
+    def test_put_forgotten_invalidation(self):
+        """Should not cache a session read before an invalidation that has since been forgotten"""
+        generation = SessionCache.generation()
+        SessionCache.invalidate("fake_public_id")
+        for i in range(3):
+            SessionCache.invalidate(f"other_public_id_{i}")
+
+        SessionCache.put(_make_entry(), generation)
+        SessionCache.put(_make_entry(public_id="id_0", session_id=0), SessionCache.generation())
+
+        assert SessionCache.get("fake_public_id") is None
+        assert SessionCache.get("id_0") is not None
+
+    def test_put_before_configure(self):
+        """Should not cache a session read before the cache was configured"""
+        generation = SessionCache.generation()
+        SessionCache.configure(3)
+
+        SessionCache.put(_make_entry(), generation)
+
+        assert SessionCache.get("fake_public_id") is None
+
+    def test_evicts_least_recently_used(self):
+        """Should evict the least recently used session once full"""
+        for i in range(3):
+            SessionCache.put(_make_entry(public_id=f"id_{i}", session_id=i), SessionCache.generation())
+
+        SessionCache.get("id_0")
+        SessionCache.put(_make_entry(public_id="id_3", session_id=3), SessionCache.generation())
+
+        assert SessionCache.get("id_0") is not None
+        assert SessionCache.get("id_1") is None
+        assert SessionCache.get("id_2") is not None
+        assert SessionCache.get("id_3") is not None
+        assert SessionCache.consume(1) is None
+
+    def test_consume_increments(self):
+        """Should increment the request count of the cached session"""
+        SessionCache.put(_make_entry(session_id=7, request_count=2), SessionCache.generation())
+
+        entry = SessionCache.consume(7)
+
+        assert entry is not None
+        assert entry.request_count == 3
+        assert SessionCache.get("fake_public_id").request_count == 3 # type: ignore
+
+    def test_consume_missing(self):
+        """Should return None if session not cached"""
+        assert SessionCache.consume(7) is None
+
+    def test_consume_enforces_budget(self):
+        """Should refuse and drop a session once its budget is used"""
+        SessionCache.put(_make_entry(session_id=7, request_count=1, maximum_requests=2), SessionCache.generation())
+
+        assert SessionCache.consume(7) is not None
+        assert SessionCache.consume(7) is None
+        assert SessionCache.get("fake_public_id") is None
+
+    def test_invalidate(self):
+        """Should remove the given session"""
+        SessionCache.put(_make_entry(), SessionCache.generation())
+
+        SessionCache.invalidate("fake_public_id")
+
+        assert SessionCache.get("fake_public_id") is None
+        assert SessionCache.consume(1) is None
+
+    def test_invalidate_user(self):
+        """Should remove all sessions for the given user only"""
+        SessionCache.put(_make_entry(public_id="id_0", session_id=0, user_id=1), SessionCache.generation())
+        SessionCache.put(_make_entry(public_id="id_1", session_id=1, user_id=1), SessionCache.generation())
+        SessionCache.put(_make_entry(public_id="id_2", session_id=2, user_id=2), SessionCache.generation())
+
+        SessionCache.invalidate_user(1)
+
+        assert SessionCache.get("id_0") is None
+        assert SessionCache.get("id_1") is None
+        assert SessionCache.get("id_2") is not None
+
+
+if __name__ == '__main__':
+    pytest.main(['-v', __file__])
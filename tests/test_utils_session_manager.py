@@ -2,6 +2,7 @@ import os
 import sys
 import pytest
 import datetime
+from concurrent.futures import Future
 
 sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
 
@@ -13,6 +14,12 @@ from enums.failure_reason import FailureReason
 from cryptography.srp_utils import SRPUtils
 
 
+def _completed(value) -> Future:
+    future: Future = Future()
+    future.set_result(value)
+    return future
+
+
 class TestStartNewSession():
     """Test cases for the start new session function"""
 
@@ -30,8 +37,8 @@ class TestStartNewSession():
         self.generate_ephemeral_response = b'fake_public_ephemeral', b'fake_private_ephemeral'
         def fake_generate_ephemeral(srp_verifier_v):
             self.generate_ephemeral_called.append(srp_verifier_v)
-            return self.generate_ephemeral_response
-        monkeypatch.setattr(SRPUtils, "generate_ephemeral", fake_generate_ephemeral)
+            return _completed(self.generate_ephemeral_response)
+        monkeypatch.setattr(SRPUtils, "submit_generate_ephemeral", fake_generate_ephemeral)
 
         self.start_called = []
         self.start_response = True, None, "fake_public_id", b'fake_master_key_salt'
@@ -207,8 +214,8 @@ class TestAuthNewSession():
         self.compute_session_key_response = b''
         def fake_compute_session_key(eph_val_a, eph_public_b, eph_private_b, srp_verifier_v):
             self.compute_session_key_called.append((eph_val_a, eph_public_b, eph_private_b, srp_verifier_v))
-            return self.compute_session_key_response
-        monkeypatch.setattr(SRPUtils, "compute_session_key", fake_compute_session_key)
+            return _completed(self.compute_session_key_response)
+        monkeypatch.setattr(SRPUtils, "submit_compute_session_key", fake_compute_session_key)
 
         self.verify_proof_called = []
         self.verify_proof_response  = True, b'fake_server_proof'
@@ -522,8 +529,8 @@ class TestStartPasswordSession():
         self.generate_ephemeral_response = b'fake_public_ephemeral', b'fake_private_ephemeral'
         def fake_generate_ephemeral(srp_verifier_v):
             self.generate_ephemeral_called.append(srp_verifier_v)
-            return self.generate_ephemeral_response
-        monkeypatch.setattr(SRPUtils, "generate_ephemeral", fake_generate_ephemeral)
+            return _completed(self.generate_ephemeral_response)
+        monkeypatch.setattr(SRPUtils, "submit_generate_ephemeral", fake_generate_ephemeral)
 
         self.start_called = []
         self.start_response = True, None, "fake_public_id", b'fake_master_key_salt'
@@ -760,8 +767,8 @@ class TestAuthPasswordSession():
         self.compute_session_key_response = b''
         def fake_compute_session_key(eph_val_a, eph_public_b, eph_private_b, srp_verifier_v):
             self.compute_session_key_called.append((eph_val_a, eph_public_b, eph_private_b, srp_verifier_v))
-            return self.compute_session_key_response
-        monkeypatch.setattr(SRPUtils, "compute_session_key", fake_compute_session_key)
+            return _completed(self.compute_session_key_response)
+        monkeypatch.setattr(SRPUtils, "submit_compute_session_key", fake_compute_session_key)
 
         self.verify_proof_called = []
         self.verify_proof_response  = True, b'fake_server_proof'
@@ -0,0 +1,79 @@
+import os
+import sys
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from utils.stage_timer import StageTimer
+
+
+class TestStageTimer():
+    """Test cases for the handler stage timer"""
+
+    @pytest.fixture(autouse=True)
+    def setup_teardown(self):
+        StageTimer._reset()
+        yield
+        StageTimer._reset()
+
+    def test_disabled_by_default(self):
+        """Should not record anything if not enabled"""
+        timer = StageTimer.start("Handler.call")
+        timer.mark("open")
+
+        assert StageTimer.percentiles() == {}
+
+    def test_rejects_invalid_window(self):
+        """Should raise exception if given an empty window"""
+        with pytest.raises(ValueError):
+            StageTimer.configure(True, 0)
+
+    def test_records_each_stage(self):
+        """Should record each stage against its RPC"""
+        StageTimer.configure(True)
+
+        timer = StageTimer.start("Handler.call")
+        timer.mark("open")
+        timer.mark("decode")
+
+        stages = StageTimer.percentiles()
+        assert set(stages) == {("Handler.call", "open"), ("Handler.call", "decode")}
+        assert stages[("Handler.call", "open")]["count"] == 1
+
+    def test_percentiles(self):
+        """Should report percentiles over the recent window, with totals over all samples"""
+        StageTimer.configure(True, window=100)
+
+        for nanoseconds in range(1, 201):
+            StageTimer._record("Handler.call", "database", nanoseconds)
+
+        summary = StageTimer.percentiles()[("Handler.call", "database")]
+        assert summary["count"] == 200
+        assert summary["sum"] == sum(range(1, 201))
+        assert summary["p50"] == 151
+        assert summary["p90"] == 191
+        assert summary["p99"] == 200
+        assert summary["max"] == 200
+
+    def test_render(self):
+        """Should render the percentiles as a summary in seconds"""
+        StageTimer.configure(True)
+        StageTimer._record("Handler.call", "seal", 2_000_000)
+
+        lines = StageTimer.render()
+
+        assert 'passmanager_handler_stage_seconds{rpc="Handler.call",stage="seal",quantile="0.5"} 0.002' in lines
+        assert 'passmanager_handler_stage_seconds_count{rpc="Handler.call",stage="seal"} 1' in lines
+
+    def test_configure_clears_samples(self):
+        """Should discard recorded samples when reconfigured"""
+        StageTimer.configure(True)
+        StageTimer._record("Handler.call", "seal", 1)
+
+        StageTimer.configure(True)
+
+        assert StageTimer.percentiles() == {}
+
+
+if __name__ == '__main__':
+    pytest.main(['-v', __file__])